@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark the GraphQL parser used by schema validation.
+
+Times GraphQLParser.parse on toady's largest real documents and on synthetic
+queries of growing nesting depth and width. Pass --baseline with a git
+revision to time that revision's parser on the same documents, for example
+to compare against the previous regex-based implementation:
+
+    python scripts/benchmark_graphql_parser.py --baseline fcf770c
+"""
+
+import argparse
+from pathlib import Path
+import subprocess
+import sys
+import time
+import types
+from typing import Callable
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from toady.parsers.graphql_parser import GraphQLParser  # noqa: E402
+from toady.parsers.graphql_queries import (  # noqa: E402
+    build_open_prs_query,
+    build_review_threads_query,
+)
+from toady.services.github_service import build_bulk_reply_mutation  # noqa: E402
+from toady.validators.schema_validator import GitHubSchemaValidator  # noqa: E402
+
+PARSER_PATH = "src/toady/parsers/graphql_parser.py"
+
+
+def nested_query(depth: int) -> str:
+    """Build a query whose selections are nested ``depth`` levels deep."""
+    opening = "".join(f'f{level}(arg: "v{level}") {{ id ' for level in range(depth))
+    return f"query Nested {{ {opening}leaf{' }' * depth} }}"
+
+
+def wide_query(width: int) -> str:
+    """Build a query selecting ``width`` aliased fields with sub-selections."""
+    fields = " ".join(
+        f"a{i}: node(id: $id{i}) {{ id ... on Comment {{ body }} }}"
+        for i in range(width)
+    )
+    return f"query Wide {{ {fields} }}"
+
+
+def documents() -> dict[str, str]:
+    """Collect the documents to benchmark, keyed by a short label."""
+    docs = {
+        "review threads query": build_review_threads_query().build_query(),
+        "open PRs query": build_open_prs_query().build_query(),
+        "bulk reply mutation x50": build_bulk_reply_mutation(50, range(50)),
+        "introspection query": GitHubSchemaValidator.INTROSPECTION_QUERY,
+    }
+    for depth in (25, 50, 100, 200):
+        docs[f"nested depth {depth}"] = nested_query(depth)
+    for width in (250, 500, 1000):
+        docs[f"wide x{width}"] = wide_query(width)
+    return docs
+
+
+def load_baseline_parser(revision: str) -> type:
+    """Load the GraphQLParser class from another git revision."""
+    source = subprocess.run(
+        ["git", "show", f"{revision}:{PARSER_PATH}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    module = types.ModuleType("baseline_graphql_parser")
+    exec(compile(source, f"{revision}:{PARSER_PATH}", "exec"), module.__dict__)
+    return module.GraphQLParser  # type: ignore[no-any-return]
+
+
+def best_time(parse: Callable[[str], object], document: str, repeat: int) -> float:
+    """Return the fastest of ``repeat`` parses, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(document)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--baseline", help="git revision whose parser to compare against"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="runs per document (default: 20)"
+    )
+    args = parser.parse_args()
+
+    parsers: dict[str, type] = {"current": GraphQLParser}
+    if args.baseline:
+        parsers[args.baseline] = load_baseline_parser(args.baseline)
+
+    header = f"{'document':<26}{'size':>9}" + "".join(
+        f"{name + ' ms':>16}" for name in parsers
+    )
+    print(header)
+    print("-" * len(header))
+    for label, document in documents().items():
+        row = f"{label:<26}{len(document):>9}"
+        for parser_class in parsers.values():
+            try:
+                elapsed = best_time(parser_class().parse, document, args.repeat)
+                row += f"{elapsed:>16.3f}"
+            except (ValueError, RecursionError) as e:
+                row += f"{type(e).__name__:>16}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Benchmark toady's import time and CLI startup latency against budgets.
+
+Every measurement runs in a fresh interpreter:
+
+* Import cost of each module loaded by ``import toady.cli`` (or the modules
+  given with --module), parsed from ``python -X importtime``. The report
+  lists the modules with the highest self time, which are the candidates to
+  defer.
+* Wall time of ``toady`` subcommands, run against a stub ``gh`` placed first
+  on PATH that answers every call with canned JSON, so no network access or
+  GitHub login is needed.
+
+The script exits with status 1 when a budget is exceeded or a command fails.
+Budgets are in milliseconds; override them with --budget:
+
+    python scripts/benchmark_startup.py --budget import=80 --budget resolve=300
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+from typing import NamedTuple, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = PROJECT_ROOT / "src"
+
+# Milliseconds. "import" is the cumulative cost of importing the measured
+# modules (toady.cli by default); the rest are the best wall time of the
+# scenario with the same name. Command scenarios include starting the stub
+# gh, and --help imports every command to list their descriptions.
+DEFAULT_BUDGETS = {
+    "import": 100.0,
+    "version": 250.0,
+    "help": 500.0,
+    "fetch": 600.0,
+    "reply": 600.0,
+    "resolve": 600.0,
+    "schema check": 600.0,
+}
+
+# Arguments passed to toady for each startup scenario
+SCENARIOS = {
+    "version": ["--version"],
+    "help": ["--help"],
+    "fetch": ["fetch", "--pr", "1"],
+    "reply": ["reply", "--id", "PRRT_kwDOAbc123", "--body", "Thanks, fixed"],
+    "resolve": ["resolve", "--thread-id", "PRRT_kwDOAbc123"],
+    "schema check": ["schema", "check", "query { viewer { login } }"],
+}
+
+# Stand-in for the GitHub CLI. Every API call gets one response holding the
+# payload each command looks for, including a tiny schema for `schema check`.
+GH_STUB = """\
+import json
+import sys
+
+args = sys.argv[1:]
+if args[:1] == ["--version"]:
+    print("gh version 2.40.0 (2024-01-01)")
+    sys.exit(0)
+if args[:1] == ["auth"]:
+    print("Logged in to github.com")
+    sys.exit(0)
+
+thread = {"id": "PRRT_kwDOAbc123", "isResolved": True}
+comment = {
+    "id": "PRRC_kwDOAbc123",
+    "databaseId": 1,
+    "body": "Thanks, fixed",
+    "url": "https://github.com/octo/repo/pull/1#discussion_r1",
+    "createdAt": "2024-01-01T00:00:00Z",
+    "updatedAt": "2024-01-01T00:00:00Z",
+    "author": {"login": "octo"},
+}
+page = {"hasNextPage": False, "endCursor": None}
+field = lambda name, type_name, kind="OBJECT": {
+    "name": name, "args": [], "type": {"kind": kind, "name": type_name}
+}
+print(json.dumps({
+    "nameWithOwner": "octo/repo",
+    "name": "repo",
+    "data": {
+        "repository": {
+            "pullRequest": {
+                "number": 1,
+                "title": "Benchmark",
+                "url": "https://github.com/octo/repo/pull/1",
+                "reviewThreads": {"totalCount": 0, "nodes": [], "pageInfo": page},
+            },
+            "pullRequests": {"nodes": [], "pageInfo": page},
+        },
+        "resolveReviewThread": {"thread": thread},
+        "unresolveReviewThread": {"thread": dict(thread, isResolved=False)},
+        "addPullRequestReviewThreadReply": {"comment": comment},
+        "node": dict(thread, comments={"nodes": [comment]}),
+        "__schema": {
+            "queryType": {"name": "Query"},
+            "mutationType": None,
+            "types": [
+                {"kind": "OBJECT", "name": "Query",
+                 "fields": [field("viewer", "User")]},
+                {"kind": "OBJECT", "name": "User",
+                 "fields": [field("login", "String", "SCALAR")]},
+                {"kind": "SCALAR", "name": "String"},
+            ],
+        },
+    },
+}))
+"""
+
+
+class ImportRecord(NamedTuple):
+    """Cost of importing one module, in microseconds."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """Parse the stderr of ``python -X importtime``.
+
+    Args:
+        output: Lines such as ``import time:   120 |   450 |   json.decoder``
+
+    Returns:
+        One record per imported module, in import order
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # column header
+        records.append(ImportRecord(module.strip(), int(self_us), int(cumulative_us)))
+    return records
+
+
+def measure_imports(modules: list[str], repeat: int) -> dict[str, ImportRecord]:
+    """Import modules in fresh interpreters and keep each module's best run.
+
+    Args:
+        modules: Modules to import
+        repeat: Number of interpreters to start
+
+    Returns:
+        Mapping of module name to its fastest self and cumulative times
+    """
+    code = "; ".join(f"import {module}" for module in modules)
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    best: dict[str, ImportRecord] = {}
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for record in parse_importtime(result.stderr):
+            previous = best.get(record.module)
+            best[record.module] = (
+                record
+                if previous is None
+                else ImportRecord(
+                    record.module,
+                    min(previous.self_us, record.self_us),
+                    min(previous.cumulative_us, record.cumulative_us),
+                )
+            )
+    return best
+
+
+def stub_environment(directory: Path) -> dict[str, str]:
+    """Install the stub gh in a directory and build an environment using it.
+
+    Args:
+        directory: Scratch directory, also used as HOME so caches start empty
+
+    Returns:
+        Environment variables for running toady
+    """
+    bin_dir = directory / "bin"
+    bin_dir.mkdir()
+    gh = bin_dir / "gh"
+    gh.write_text(f"#!{sys.executable}\n{GH_STUB}")
+    gh.chmod(0o755)
+    return dict(
+        os.environ,
+        HOME=str(directory),
+        PATH=f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+        PYTHONPATH=str(SRC_DIR),
+        TOADY_NO_CACHE="1",
+    )
+
+
+def time_command(args: list[str], env: dict[str, str], repeat: int) -> float:
+    """Run toady once to warm up, then return its fastest run.
+
+    Args:
+        args: Arguments for toady
+        env: Environment with the stub gh on PATH
+        repeat: Number of timed runs
+
+    Returns:
+        Best wall time in milliseconds
+
+    Raises:
+        RuntimeError: If the command exits with an error
+    """
+    command = [sys.executable, "-c", "from toady.cli import main; main()", *args]
+    best = float("inf")
+    for run in range(repeat + 1):
+        start = time.perf_counter()
+        result = subprocess.run(command, env=env, capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"toady {' '.join(args)} exited with {result.returncode}: "
+                f"{result.stderr.strip()[-500:]}"
+            )
+        if run:
+            best = min(best, elapsed)
+    return best * 1000
+
+
+def parse_budgets(overrides: list[str]) -> dict[str, float]:
+    """Apply NAME=MS overrides to the default budgets.
+
+    Args:
+        overrides: Values of --budget
+
+    Returns:
+        Budgets in milliseconds
+    """
+    budgets = dict(DEFAULT_BUDGETS)
+    for override in overrides:
+        name, _, value = override.partition("=")
+        if name not in budgets:
+            raise SystemExit(f"Unknown budget {name!r}; known: {', '.join(budgets)}")
+        budgets[name] = float(value)
+    return budgets
+
+
+def check_budget(
+    name: str, elapsed: float, budgets: dict[str, float], failures: list[str]
+) -> str:
+    """Compare a measurement with its budget, recording overruns.
+
+    Returns:
+        Status column for the report
+    """
+    if elapsed <= budgets[name]:
+        return "ok"
+    failures.append(f"{name}: {elapsed:.1f} ms exceeds budget {budgets[name]:.0f} ms")
+    return "OVER"
+
+
+def main() -> None:
+    """Run the benchmark, print the report and exit 1 on budget overruns."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--module",
+        action="append",
+        dest="modules",
+        help="module whose import to measure (default: toady.cli; repeatable)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="runs per measurement (default: 10)"
+    )
+    parser.add_argument(
+        "--top", type=int, default=20, help="modules to list in the import report"
+    )
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="NAME=MS",
+        help=f"override a budget; names: {', '.join(DEFAULT_BUDGETS)}",
+    )
+    parser.add_argument(
+        "--skip-startup", action="store_true", help="only measure import time"
+    )
+    parser.add_argument("--json", type=Path, help="also write the report as JSON")
+    args = parser.parse_args()
+
+    budgets = parse_budgets(args.budget)
+    modules = args.modules or ["toady.cli"]
+    failures: list[str] = []
+
+    imports = measure_imports(modules, args.repeat)
+    import_total = sum(
+        imports[module].cumulative_us for module in modules if module in imports
+    )
+    import_ms = import_total / 1000
+    status = check_budget("import", import_ms, budgets, failures)
+    print(f"import {', '.join(modules)}: {import_ms:.1f} ms [{status}]\n")
+
+    ranked = sorted(imports.values(), key=lambda record: -record.self_us)
+    print(f"{'module':<48}{'self ms':>10}{'cumul. ms':>11}")
+    print("-" * 69)
+    for record in ranked[: args.top]:
+        print(
+            f"{record.module:<48}{record.self_us / 1000:>10.2f}"
+            f"{record.cumulative_us / 1000:>11.2f}"
+        )
+    toady_ms = sum(r.self_us for r in ranked if r.module.startswith("toady")) / 1000
+    print(f"\n{len(ranked)} modules, {toady_ms:.1f} ms self time in toady modules")
+
+    startup: dict[str, Optional[float]] = {}
+    if not args.skip_startup:
+        print(f"\n{'command':<16}{'best ms':>10}{'budget':>9}  status")
+        print("-" * 43)
+        with tempfile.TemporaryDirectory() as scratch:
+            env = stub_environment(Path(scratch))
+            for name, command in SCENARIOS.items():
+                try:
+                    elapsed = time_command(command, env, args.repeat)
+                except RuntimeError as e:
+                    failures.append(str(e))
+                    startup[name] = None
+                    print(f"{name:<16}{'-':>10}{budgets[name]:>9.0f}  FAILED")
+                    continue
+                startup[name] = elapsed
+                status = check_budget(name, elapsed, budgets, failures)
+                print(f"{name:<16}{elapsed:>10.1f}{budgets[name]:>9.0f}  {status}")
+
+    if args.json:
+        report = {
+            "python": sys.version.split()[0],
+            "budgets": budgets,
+            "import_ms": import_ms,
+            "imports": [record._asdict() for record in ranked],
+            "startup_ms": startup,
+            "failures": failures,
+        }
+        args.json.write_text(json.dumps(report, indent=2))
+
+    if failures:
+        print("\nBudget check failed:", file=sys.stderr)
+        for failure in failures:
+            print(f"  - {failure}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
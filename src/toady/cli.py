@@ -1,17 +1,78 @@
 """Main CLI interface for Toady."""
 
+import importlib
+from typing import Any, Optional
+
 import click
 
 from toady import __version__
-from toady.commands.fetch import fetch
-from toady.commands.reply import reply
-from toady.commands.resolve import resolve
-from toady.commands.schema import schema
 from toady.error_handling import handle_error
 from toady.exceptions import ToadyError
 
+# Subcommands, as "module:attribute" paths imported only when a command runs
+LAZY_COMMANDS = {
+    "fetch": "toady.commands.fetch:fetch",
+    "reply": "toady.commands.reply:reply",
+    "resolve": "toady.commands.resolve:resolve",
+    "schema": "toady.commands.schema:schema",
+    "serve": "toady.commands.serve:serve",
+}
+
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports each subcommand's module on first use.
+
+    Importing a command module pulls in the services, formatters and
+    validators it needs, so ``toady --version`` or a single ``toady resolve``
+    should not pay for every other command's imports.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: Optional[dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the group.
+
+        Args:
+            *args: Positional arguments for click.Group
+            lazy_commands: Mapping of command name to "module:attribute" path
+            **kwargs: Keyword arguments for click.Group
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List loaded and lazy command names in sorted order."""
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get a command, importing its module if it has not been loaded yet."""
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(self._load_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """Import a lazy command.
+
+        Args:
+            cmd_name: Name of the command
+
+        Returns:
+            The imported command
+
+        Raises:
+            TypeError: If the path does not name a click command
+        """
+        module_name, attribute = self.lazy_commands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{self.lazy_commands[cmd_name]} is not a click command")
+        return command
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.version_option(version=__version__, prog_name="toady")
 @click.option(
     "--debug",
@@ -91,11 +152,17 @@ def cli(ctx: click.Context, debug: bool) -> None:
     ctx.obj["debug"] = debug
 
 
-# Register commands
-cli.add_command(fetch)
-cli.add_command(reply)
-cli.add_command(resolve)
-cli.add_command(schema)
+def __getattr__(name: str) -> click.Command:
+    """Load a subcommand on attribute access, e.g. ``from toady.cli import fetch``.
+
+    Raises:
+        AttributeError: If the name is not a subcommand
+    """
+    if name in LAZY_COMMANDS:
+        command = cli.get_command(click.Context(cli), name)
+        if command is not None:
+            return command
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
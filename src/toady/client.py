@@ -0,0 +1,27 @@
+"""Entry point of the ``toady`` command.
+
+Sends the invocation to a running ``toady serve`` daemon when possible and
+otherwise runs the CLI in this process. Only the daemon client is imported
+before that decision, so forwarded calls skip importing the CLI.
+"""
+
+import sys
+
+
+def main() -> None:
+    """Run toady through the daemon if one is serving, else in-process."""
+    from .services.daemon import forward_to_daemon, should_forward
+
+    argv = sys.argv[1:]
+    if should_forward(argv):
+        exit_code = forward_to_daemon(argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from .cli import main as run_cli
+
+    run_cli()
+
+
+if __name__ == "__main__":
+    main()
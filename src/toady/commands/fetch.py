@@ -1,6 +1,6 @@
 """Fetch command implementation."""
 
-from typing import Optional
+from typing import Any, Optional
 
 import click
 
@@ -14,9 +14,25 @@ from toady.formatters.format_selection import (
     format_threads_output,
     resolve_format_from_options,
 )
+from toady.services.code_context import CodeContextError, attach_code_context
+from toady.services.comment_index import CommentIndex
 from toady.services.fetch_service import FetchService
 
 
+def _attach_code_context(threads: list[Any], revision: str, context_lines: int) -> None:
+    """Attach local code context to threads, warning if git is unavailable.
+
+    Args:
+        threads: Review threads to update in place.
+        revision: Revision the thread line numbers refer to.
+        context_lines: Number of lines of context around each thread.
+    """
+    try:
+        attach_code_context(threads, revision, context_lines=context_lines)
+    except CodeContextError as e:
+        click.echo(f"Warning: could not read code context: {e}", err=True)
+
+
 @click.command()
 @click.option(
     "--pr",
@@ -43,6 +59,27 @@ from toady.services.fetch_service import FetchService
     "Use to control API usage and response size for large PRs.",
     metavar="COUNT",
 )
+@click.option(
+    "--context",
+    "context_lines",
+    type=click.IntRange(0, 50),
+    default=0,
+    help="Attach this many lines of surrounding code to each thread, read from "
+    "the local git repository at the PR's head commit (default: 0, no context).",
+    metavar="LINES",
+)
+@click.option(
+    "--columns",
+    help="Comma-separated columns for csv/tsv output, e.g. "
+    "'thread_id,status,file_path'. Comment columns (comment_*) require "
+    "--comment-rows.",
+    metavar="NAMES",
+)
+@click.option(
+    "--comment-rows",
+    is_flag=True,
+    help="For csv/tsv output, write one row per comment instead of one per thread.",
+)
 @click.pass_context
 def fetch(
     ctx: click.Context,
@@ -51,6 +88,9 @@ def fetch(
     pretty: bool,
     resolved: bool,
     limit: int,
+    context_lines: int,
+    columns: Optional[str],
+    comment_rows: bool,
 ) -> None:
     """Fetch review threads from a GitHub pull request.
 
@@ -98,6 +138,13 @@ def fetch(
       Limit results:
         toady fetch --limit 50
 
+      Include 3 lines of local code around each thread:
+        toady fetch --context 3
+
+      Spreadsheet/warehouse export:
+        toady fetch --format csv --columns thread_id,status,file_path,line
+        toady fetch --format tsv --comment-rows
+
       Pipeline with other tools:
         toady fetch | jq '.[].thread_id' | xargs -I {} toady resolve --thread-id {}
 
@@ -134,6 +181,20 @@ def fetch(
         click.echo(f"Error: {e}", err=True)
         ctx.exit(1)
 
+    # Tabular options only apply to the delimiter-separated formats
+    formatter_options: dict[str, Any] = {}
+    if columns is not None or comment_rows:
+        if output_format not in ("csv", "tsv"):
+            raise click.UsageError(
+                "--columns and --comment-rows can only be used with "
+                "--format csv or --format tsv"
+            )
+        if columns is not None:
+            formatter_options["columns"] = [
+                name.strip() for name in columns.split(",") if name.strip()
+            ]
+        formatter_options["comment_rows"] = comment_rows
+
     # Prepare thread type description for user feedback
     thread_type = "all threads" if resolved else "unresolved threads"
 
@@ -141,7 +202,10 @@ def fetch(
     selected_pr_number = pr_number  # Initialize with provided value for error handling
     try:
         # Create fetch service and retrieve threads using integrated PR selection
-        fetch_service = FetchService(output_format=output_format)
+        # PR selection messages only distinguish interactive (pretty) output
+        # from machine-readable formats, which all behave like JSON
+        selection_format = "pretty" if output_format == "pretty" else "json"
+        fetch_service = FetchService(output_format=selection_format)
         threads, selected_pr_number = (
             fetch_service.fetch_review_threads_with_pr_selection(
                 pr_number=pr_number,
@@ -154,10 +218,20 @@ def fetch(
         if not threads and selected_pr_number is None:
             ctx.exit(0)
 
+        # Remember each thread's repository so later replies skip the lookup
+        if threads:
+            CommentIndex().record_threads(threads)
+
+        if context_lines and threads:
+            _attach_code_context(
+                threads, fetch_service.head_commit_oid or "HEAD", context_lines
+            )
+
         # Use new format selection system to display output
         format_threads_output(
             threads=threads,
             format_name=output_format,
+            formatter_options=formatter_options,
             show_progress=True,
             pr_number=selected_pr_number,
             thread_type=thread_type,
@@ -1,7 +1,9 @@
 """Reply command implementation."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import hashlib
 import json
-from typing import Any, Optional
+from typing import IO, Any, Optional
 
 import click
 
@@ -10,6 +12,7 @@ from toady.exceptions import (
     GitHubAuthenticationError,
     GitHubRateLimitError,
     GitHubTimeoutError,
+    ValidationError,
 )
 from toady.formatters.format_selection import (
     create_format_option,
@@ -17,12 +20,19 @@ from toady.formatters.format_selection import (
     format_object_output,
     resolve_format_from_options,
 )
+from toady.services.journal import JournalError, JournalItem, OperationJournal
 from toady.services.reply_service import (
+    REPLY_BATCH_SIZE,
+    THREAD_ID_PREFIXES,
     CommentNotFoundError,
     ReplyRequest,
     ReplyService,
 )
 from toady.validators.node_id_validation import create_universal_validator
+from toady.validators.validation import validate_reply_body
+
+# Number of invalid batch lines listed before the rest are summarized
+MAX_BATCH_ERRORS_SHOWN = 10
 
 
 def _show_id_help(ctx: click.Context) -> None:
@@ -157,6 +167,23 @@ def validate_reply_target_id(reply_to_id: str) -> str:
         raise click.BadParameter(enhanced_msg, param_hint="--id") from e
 
 
+def _validate_resolve_target(reply_to_id: str) -> None:
+    """Check that a reply target can be resolved along with the reply.
+
+    Args:
+        reply_to_id: The validated reply target ID
+
+    Raises:
+        click.BadParameter: If the ID is not a thread ID
+    """
+    if not reply_to_id.startswith(THREAD_ID_PREFIXES):
+        raise click.BadParameter(
+            "--resolve requires a thread ID (PRRT_, PRT_ or RT_).\n"
+            "\n💡 Run: toady fetch --format pretty to find the thread ID",
+            param_hint="--id",
+        )
+
+
 def _validate_reply_args(reply_to_id: str, body: str) -> tuple[str, str]:
     """Validate reply command arguments.
 
@@ -246,6 +273,15 @@ def _print_pretty_reply(reply_info: dict[str, Any], verbose: bool) -> None:
         if reply_info.get("author"):
             click.echo(f"   • Posted by: @{reply_info['author']}")
 
+    if reply_info.get("thread_resolved"):
+        click.echo("🔒 Thread resolved")
+    elif "thread_resolved" in reply_info:
+        click.echo(
+            f"⚠️  Reply posted but the thread was not resolved: "
+            f"{reply_info.get('resolve_error', 'unknown error')}",
+            err=True,
+        )
+
 
 def _build_json_reply(
     id: str, reply_info: dict[str, Any], verbose: bool
@@ -285,6 +321,13 @@ def _build_json_reply(
         if reply_info.get(field):
             result[field] = reply_info[field]
 
+    # With --resolve, the command only succeeds if the thread was resolved too
+    if "thread_resolved" in reply_info:
+        result["thread_resolved"] = reply_info["thread_resolved"]
+        if not reply_info["thread_resolved"]:
+            result["success"] = False
+            result["resolve_error"] = reply_info.get("resolve_error", "")
+
     # Include verbose flag in output to indicate extended info
     if verbose:
         result["verbose"] = True
@@ -461,6 +504,320 @@ def _handle_reply_error(
     ctx.exit(1)
 
 
+def _validate_batch_line(line: str, resolve: bool = False) -> ReplyRequest:
+    """Parse and validate one NDJSON line of a reply batch.
+
+    Args:
+        line: JSON object with "id" and "body" keys and an optional
+            boolean "resolve" key
+        resolve: Whether every reply in the batch resolves its thread
+
+    Returns:
+        ReplyRequest with the validated ID, body and resolve flag
+
+    Raises:
+        ValueError: If the line is not a valid reply request
+    """
+    try:
+        entry = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON: {e.msg}") from e
+    if not isinstance(entry, dict):
+        raise ValueError('expected an object with "id" and "body"')
+
+    reply_to_id = entry.get("id")
+    body = entry.get("body")
+    if not isinstance(reply_to_id, str) or not reply_to_id.strip():
+        raise ValueError('"id" must be a non-empty string')
+    if not isinstance(body, str):
+        raise ValueError('"body" must be a string')
+    if not isinstance(entry.get("resolve", False), bool):
+        raise ValueError('"resolve" must be true or false')
+    resolve = resolve or entry.get("resolve", False)
+
+    reply_to_id = reply_to_id.strip()
+    entity_type = create_universal_validator().validate_id(
+        reply_to_id, "Reply target ID"
+    )
+    if entity_type and entity_type.value == "PRRC_":
+        raise ValueError(
+            f"{reply_to_id}: PRRC_ comment IDs cannot be replied to directly; "
+            "use the thread ID instead"
+        )
+    if resolve and not reply_to_id.startswith(THREAD_ID_PREFIXES):
+        raise ValueError(
+            f"{reply_to_id}: only thread IDs (PRRT_, PRT_, RT_) can be resolved"
+        )
+    try:
+        body = validate_reply_body(body)
+    except ValidationError as e:
+        raise ValueError(e.message) from e
+
+    return ReplyRequest(comment_id=reply_to_id, reply_body=body, resolve=resolve)
+
+
+def _load_batch_requests(
+    batch_file: IO[str], resolve: bool = False
+) -> list[tuple[int, ReplyRequest]]:
+    """Read and validate every reply in a batch before anything is posted.
+
+    Args:
+        batch_file: NDJSON input, one {"id": ..., "body": ...} object per line
+        resolve: Whether every reply in the batch resolves its thread
+
+    Returns:
+        List of (line number, request) pairs; blank lines are skipped
+
+    Raises:
+        click.BadParameter: If any line is invalid or the batch is empty
+    """
+    requests: list[tuple[int, ReplyRequest]] = []
+    errors: list[str] = []
+    for line_number, line in enumerate(batch_file.read().splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            requests.append((line_number, _validate_batch_line(line, resolve)))
+        except ValueError as e:
+            errors.append(f"line {line_number}: {e}")
+
+    if errors:
+        shown = errors[:MAX_BATCH_ERRORS_SHOWN]
+        if len(errors) > len(shown):
+            shown.append(f"... and {len(errors) - len(shown)} more")
+        raise click.BadParameter(
+            f"{len(errors)} invalid line(s), nothing was posted:\n  "
+            + "\n  ".join(shown),
+            param_hint="--batch",
+        )
+    if not requests:
+        raise click.BadParameter("Batch contains no replies", param_hint="--batch")
+    return requests
+
+
+def _batch_journal(requests: list[tuple[int, ReplyRequest]]) -> OperationJournal:
+    """Create the journal that tracks a reply batch.
+
+    The journal is keyed by the batch contents, so rerunning the same input
+    with --resume finds the journal of the interrupted run.
+
+    Args:
+        requests: Validated (line number, request) pairs
+
+    Returns:
+        OperationJournal for the batch
+    """
+    contents = json.dumps(
+        [
+            [line, request.comment_id, request.reply_body, request.resolve]
+            for line, request in requests
+        ]
+    )
+    digest = hashlib.sha256(contents.encode("utf-8")).hexdigest()
+    return OperationJournal({"command": "reply", "batch": digest})
+
+
+def _emit_batch_result(line: int, result: dict[str, Any], pretty: bool) -> None:
+    """Print the outcome of one batch reply as soon as it is known.
+
+    Args:
+        line: Input line number of the reply
+        result: Result from ReplyService.post_replies
+        pretty: Whether to use pretty output format
+    """
+    if not pretty:
+        click.echo(json.dumps({"line": line, **result}))
+    elif result.get("outcome_unknown"):
+        click.echo(
+            f"❓ line {line}: {result['id']}: may have been posted: {result['error']}",
+            err=True,
+        )
+    elif result["success"] and "resolve_error" in result:
+        click.echo(
+            f"⚠️  line {line}: {result['id']} → {result.get('reply_url', '')} "
+            f"(not resolved: {result['resolve_error']})",
+            err=True,
+        )
+    elif result["success"]:
+        resolved = " 🔒" if result.get("thread_resolved") else ""
+        click.echo(
+            f"✅ line {line}: {result['id']} → {result.get('reply_url', '')}{resolved}"
+        )
+    else:
+        click.echo(f"❌ line {line}: {result['id']}: {result['error']}", err=True)
+
+
+def _post_batch_replies(
+    requests: list[tuple[int, ReplyRequest]],
+    concurrency: int,
+    pretty: bool,
+    journal: Optional[OperationJournal] = None,
+) -> tuple[int, int]:
+    """Post batch replies with aliased mutations and bounded concurrency.
+
+    Replies are split into chunks of REPLY_BATCH_SIZE, each posted as one
+    request, with at most ``concurrency`` requests in flight. Results are
+    streamed as each chunk completes. A reply whose thread could not be
+    resolved counts as failed, but is journaled as posted so that --resume
+    never posts it twice. When a chunk's request fails as a whole, for
+    example on a timeout, GitHub may still have applied it, so its replies
+    are journaled with an unknown outcome that --resume reports instead of
+    posting them again.
+
+    Args:
+        requests: Validated (line number, request) pairs to post
+        concurrency: Maximum number of concurrent requests
+        pretty: Whether to use pretty output format
+        journal: Optional journal recording each reply's outcome
+
+    Returns:
+        Tuple of (succeeded, failed) counts
+    """
+    reply_service = ReplyService()
+    chunks = [
+        requests[start : start + REPLY_BATCH_SIZE]
+        for start in range(0, len(requests), REPLY_BATCH_SIZE)
+    ]
+    succeeded = failed = 0
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(
+                reply_service.post_replies, [request for _, request in chunk]
+            ): chunk
+            for chunk in chunks
+        }
+        for future in as_completed(futures):
+            chunk = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                results = [
+                    {
+                        "id": request.comment_id,
+                        "success": False,
+                        "error": str(e),
+                        "outcome_unknown": True,
+                    }
+                    for _, request in chunk
+                ]
+
+            for (line, _), result in zip(chunk, results):
+                if journal is not None and result.get("outcome_unknown"):
+                    journal.record_unknown(str(line), result["error"])
+                elif journal is not None:
+                    journal.record(
+                        str(line), result["success"], result.get("error", "")
+                    )
+                if result["success"] and "resolve_error" not in result:
+                    succeeded += 1
+                else:
+                    failed += 1
+                _emit_batch_result(line, result, pretty)
+
+    return succeeded, failed
+
+
+def _handle_batch_reply(
+    ctx: click.Context,
+    batch_file: IO[str],
+    concurrency: int,
+    resume: bool,
+    pretty: bool,
+    resolve: bool = False,
+) -> None:
+    """Post every reply in an NDJSON batch.
+
+    All lines are validated before anything is posted. Progress is journaled
+    under ~/.toady/journals, so rerunning the same batch with resume=True
+    posts only the replies that failed or were not attempted. Replies whose
+    outcome is unknown are reported and not posted again.
+
+    Args:
+        ctx: Click context for exit handling
+        batch_file: NDJSON input, one {"id": ..., "body": ...} object per line
+        concurrency: Maximum number of concurrent requests
+        resume: Whether to skip replies a previous run already posted
+        pretty: Whether to use pretty output format
+        resolve: Whether every reply in the batch resolves its thread
+    """
+    requests = _load_batch_requests(batch_file, resolve)
+    journal: Optional[OperationJournal] = _batch_journal(requests)
+    pending = requests
+    unknown: list[tuple[int, ReplyRequest]] = []
+    errors: dict[str, str] = {}
+
+    try:
+        if resume and journal is not None and journal.exists():
+            try:
+                state = journal.resume()
+            except JournalError as e:
+                click.echo(f"Warning: {e}; starting fresh", err=True)
+            else:
+                remaining = {item.item_id for item in state.pending_items}
+                unposted = {item.item_id for item in state.unknown_items}
+                pending = [
+                    (line, request)
+                    for line, request in requests
+                    if str(line) in remaining
+                ]
+                unknown = [
+                    (line, request)
+                    for line, request in requests
+                    if str(line) in unposted
+                ]
+                errors = state.errors
+                if pretty:
+                    click.echo(
+                        f"📒 Resuming: {state.succeeded_count} of "
+                        f"{len(state.items)} reply(s) already posted"
+                    )
+        if pending is requests and journal is not None:
+            try:
+                journal.start(
+                    [
+                        JournalItem(str(line), request.comment_id)
+                        for line, request in requests
+                    ]
+                )
+            except JournalError as e:
+                click.echo(f"Warning: {e}; --resume will not be available", err=True)
+                journal = None
+
+        # A previous run cannot tell whether these were posted; never repost
+        for line, request in unknown:
+            error = errors.get(str(line), "request failed")
+            _emit_batch_result(
+                line,
+                {
+                    "id": request.comment_id,
+                    "success": False,
+                    "error": f"{error}; not posted again by --resume",
+                    "outcome_unknown": True,
+                },
+                pretty,
+            )
+
+        if pretty:
+            click.echo(f"💬 Posting {len(pending)} reply(s)")
+        succeeded, failed = _post_batch_replies(pending, concurrency, pretty, journal)
+
+        if pretty:
+            click.echo(f"\n📊 Posted {succeeded} of {len(pending)} reply(s)")
+        if failed > 0 or unknown:
+            if pretty and journal is not None:
+                click.echo(
+                    "💡 Rerun with --resume to retry only the failed replies; "
+                    "check the pull request for replies marked ❓"
+                )
+            ctx.exit(1)
+        elif journal is not None:
+            journal.complete()
+    finally:
+        if journal is not None:
+            journal.close()
+
+
 @click.command()
 @click.option(
     "--id",
@@ -486,7 +843,37 @@ def _handle_reply_error(
     "-v",
     is_flag=True,
     help="Include additional context in output: PR title, parent comment author, "
-    "thread details. Increases API calls but provides richer response data.",
+    "thread details. Thread and comment node ID replies return it from the same "
+    "request; numeric ID replies need one extra query.",
+)
+@click.option(
+    "--resolve",
+    is_flag=True,
+    help="Resolve the thread in the same request as the reply. Requires a thread "
+    "ID (PRRT_/PRT_/RT_). With --batch, applies to every line; single lines can "
+    'also set "resolve": true.',
+)
+@click.option(
+    "--batch",
+    "batch_file",
+    type=click.File("r", encoding="utf-8"),
+    help='Post many replies from an NDJSON file ("-" for stdin) with one '
+    '{"id": ..., "body": ...} object per line. Cannot be used with --id or --body.',
+    metavar="FILE",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(1, 8),
+    default=4,
+    show_default=True,
+    help="Maximum number of concurrent requests for --batch.",
+    metavar="N",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="With --batch, skip replies a previous run of the same batch already "
+    "posted, and report instead of reposting replies that may have been posted.",
 )
 @click.option(
     "--help-ids",
@@ -501,6 +888,10 @@ def reply(
     format: Optional[str],
     pretty: bool,
     verbose: bool,
+    resolve: bool,
+    batch_file: Optional[IO[str]],
+    concurrency: int,
+    resume: bool,
     help_ids: bool,
 ) -> None:
     """Post a reply to a specific review comment or thread.
@@ -546,18 +937,27 @@ def reply(
       Human-readable output:
         toady reply --id "PRT_kwDOABcD12MAAAABcDE3fg" --body "Updated" --format pretty
 
+      Reply and resolve the thread in one request:
+        toady reply --id "PRRT_kwDOO3WQIc5Rv3_r" --body "Fixed in abc123" --resolve
+
       Get help with ID types:
         toady reply --help-ids
 
+      Post many replies from a file, or from stdin with "-":
+        toady reply --batch replies.ndjson
+        jq -c '.[] | {id: .thread_id, body: "Fixed"}' threads.json \\
+          | toady reply --batch -
+
+      Retry only the replies a failed batch did not post:
+        toady reply --batch replies.ndjson --resume
+
     \b
     Agent usage patterns:
       # Standard reply to thread
       toady reply --id "PRRT_kwDOO3WQIc5Rv3_r" --body "Fixed in commit abc123"
 
-      # Automated responses
-      cat responses.txt | while read line; do
-        toady reply --id "$thread_id" --body "$line"
-      done
+      # Automated responses, posted in batched requests
+      toady reply --batch responses.ndjson
 
       # Bulk replies with error handling
       toady reply --id "$id" --body "$response" || echo "Failed: $id"
@@ -582,6 +982,21 @@ def reply(
         _show_id_help(ctx)
         return
 
+    if batch_file is not None:
+        if id or body:
+            raise click.UsageError("--batch cannot be used with --id or --body.")
+        try:
+            output_format = resolve_format_from_options(format, pretty)
+        except Exception as e:
+            click.echo(f"Error: {e}", err=True)
+            ctx.exit(1)
+        _handle_batch_reply(
+            ctx, batch_file, concurrency, resume, output_format == "pretty", resolve
+        )
+        return
+    if resume:
+        raise click.UsageError("--resume can only be used with --batch.")
+
     # Check for required arguments
     if not id:
         raise click.UsageError("Missing option '--id'.")
@@ -597,6 +1012,8 @@ def reply(
 
     # Validate arguments using helper function
     reply_to_id, body = _validate_reply_args(id, body)
+    if resolve:
+        _validate_resolve_target(reply_to_id)
 
     # Show warnings if needed
     _show_warnings(body, output_format == "pretty")
@@ -607,7 +1024,7 @@ def reply(
     # Post the reply using the reply service
     reply_service = ReplyService()
     try:
-        request = ReplyRequest(comment_id=reply_to_id, reply_body=body)
+        request = ReplyRequest(comment_id=reply_to_id, reply_body=body, resolve=resolve)
         # Only fetch context if verbose mode is requested (reduces API calls)
         reply_info = reply_service.post_reply(request, fetch_context=verbose)
 
@@ -619,3 +1036,6 @@ def reply(
 
     except Exception as e:
         _handle_reply_error(ctx, e, reply_to_id, output_format == "pretty")
+
+    if resolve and not reply_info.get("thread_resolved"):
+        ctx.exit(1)
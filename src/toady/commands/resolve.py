@@ -2,7 +2,7 @@
 
 import json
 import time
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
 import click
 
@@ -21,12 +21,29 @@ from toady.formatters.format_selection import (
     resolve_format_from_options,
 )
 from toady.services.fetch_service import FetchService, FetchServiceError
-from toady.services.resolve_service import ResolveService
+from toady.services.github_service import (
+    GitHubServiceError,
+    get_shared_github_service,
+)
+from toady.services.journal import JournalError, JournalItem, OperationJournal
+from toady.services.resolve_service import RESOLVE_BATCH_SIZE, ResolveService
+from toady.services.thread_filter import ThreadFilter
 from toady.validators.node_id_validation import validate_thread_id
 
 
+class _PlannedThread(NamedTuple):
+    """A thread restored from a journal, carrying what progress output needs."""
+
+    thread_id: str
+    title: str
+
+
 def _fetch_and_filter_threads(
-    pr_number: int, undo: bool, pretty: bool, limit: int
+    pr_number: int,
+    undo: bool,
+    pretty: bool,
+    limit: int,
+    thread_filter: Optional[ThreadFilter] = None,
 ) -> list[Any]:
     """Fetch and filter threads based on resolution action.
 
@@ -35,6 +52,7 @@ def _fetch_and_filter_threads(
         undo: Whether to fetch resolved threads (for unresolve) or unresolved (resolve)
         pretty: Whether to show pretty progress messages
         limit: Maximum number of threads to fetch
+        thread_filter: Optional --where predicates threads must also match
 
     Returns:
         List of filtered threads ready for processing
@@ -57,6 +75,13 @@ def _fetch_and_filter_threads(
     else:
         target_threads = [t for t in threads if not t.is_resolved]
 
+    if thread_filter is not None:
+        target_threads = thread_filter.apply(target_threads)
+        if pretty:
+            click.echo(
+                f"🔎 {len(target_threads)} thread(s) match: {thread_filter.describe()}"
+            )
+
     return target_threads
 
 
@@ -106,14 +131,20 @@ def _handle_confirmation_prompt(
         ctx.exit(1)
 
 
-def _process_threads(
+def _process_threads_batched(
     target_threads: list[Any],
     undo: bool,
     action_present: str,
     action_symbol: str,
     pretty: bool,
+    journal: Optional[OperationJournal] = None,
+    verify_in: Optional[tuple[str, int]] = None,
 ) -> tuple[int, int, list[dict[str, str]]]:
-    """Process threads for resolution/unresolve with error handling.
+    """Process threads with batched mutations, one request per batch.
+
+    Up to RESOLVE_BATCH_SIZE threads are sent as aliased mutations in a single
+    GraphQL document, so a bulk operation costs one request per batch instead
+    of one per thread.
 
     Args:
         target_threads: List of threads to process
@@ -121,53 +152,100 @@ def _process_threads(
         action_present: Present tense action description
         action_symbol: Emoji symbol for the action
         pretty: Whether to show pretty progress messages
+        journal: Optional journal recording each thread's outcome
+        verify_in: Optional repository in owner/repo format and PR number the
+            threads must belong to, for threads that were not just fetched
+            from that PR. Checked with one lookup per 100 threads; threads
+            elsewhere fail without being changed.
 
     Returns:
         Tuple of (succeeded_count, failed_count, failed_threads_list)
     """
     if pretty:
         click.echo(
-            f"\n{action_symbol} {action_present} {len(target_threads)} " "thread(s)..."
+            f"\n{action_symbol} {action_present} {len(target_threads)} thread(s) "
+            f"in batches of up to {RESOLVE_BATCH_SIZE}..."
         )
 
     resolve_service = ResolveService()
     succeeded = 0
     failed = 0
-    failed_threads = []
+    failed_threads: list[dict[str, str]] = []
+    rate_limited = 0
+
+    if verify_in is not None:
+        repository, pr_number = verify_in
+        owner, _, repo = repository.partition("/")
+        belongs = resolve_service.validate_threads_exist(
+            owner, repo, pr_number, [thread.thread_id for thread in target_threads]
+        )
+        foreign = [thread for thread in target_threads if not belongs[thread.thread_id]]
+        target_threads = [
+            thread for thread in target_threads if belongs[thread.thread_id]
+        ]
+        for thread in foreign:
+            error = f"Thread not found in {repository}#{pr_number}"
+            failed += 1
+            failed_threads.append({"thread_id": thread.thread_id, "error": error})
+            if journal is not None:
+                journal.record(thread.thread_id, False, error)
+            if pretty:
+                click.echo(f"     ❌ {thread.thread_id}: {error}", err=True)
 
-    for i, thread in enumerate(target_threads, 1):
+    for start in range(0, len(target_threads), RESOLVE_BATCH_SIZE):
+        batch_ids = [
+            thread.thread_id
+            for thread in target_threads[start : start + RESOLVE_BATCH_SIZE]
+        ]
         if pretty:
             click.echo(
-                f"   {action_symbol} {action_present} thread {i} of "
-                f"{len(target_threads)}: {thread.thread_id}"
+                f"   {action_symbol} {action_present} threads {start + 1}-"
+                f"{start + len(batch_ids)} of {len(target_threads)}"
             )
 
         try:
-            if undo:
-                resolve_service.unresolve_thread(thread.thread_id)
-            else:
-                resolve_service.resolve_thread(thread.thread_id)
-            succeeded += 1
-
-            # Add small delay to avoid rate limits
-            if i < len(target_threads):  # Don't sleep after the last request
-                time.sleep(0.1)
-
+            results = resolve_service.resolve_threads(batch_ids, undo=undo)
         except GitHubRateLimitError as e:
-            failed += 1
-            failed_threads.append({"thread_id": thread.thread_id, "error": str(e)})
+            results = [
+                {"thread_id": thread_id, "success": False, "error": str(e)}
+                for thread_id in batch_ids
+            ]
+            rate_limited += 1
             if pretty:
                 click.echo(f"     ❌ Failed: {e}", err=True)
                 click.echo(
                     "     ⏳ Rate limit detected, waiting before continuing...",
                     err=True,
                 )
-            time.sleep(min(2.0 ** min(failed, 5), 60))  # Exponential backoff, max 60s
+            time.sleep(min(2.0 ** min(rate_limited, 5), 60))
         except (ResolveServiceError, GitHubAPIError) as e:
-            failed += 1
-            failed_threads.append({"thread_id": thread.thread_id, "error": str(e)})
+            results = [
+                {"thread_id": thread_id, "success": False, "error": str(e)}
+                for thread_id in batch_ids
+            ]
             if pretty:
                 click.echo(f"     ❌ Failed: {e}", err=True)
+        else:
+            if pretty:
+                for result in results:
+                    if not result["success"]:
+                        click.echo(
+                            f"     ❌ {result['thread_id']}: {result['error']}",
+                            err=True,
+                        )
+
+        for result in results:
+            if journal is not None:
+                journal.record(
+                    result["thread_id"], result["success"], result.get("error", "")
+                )
+            if result["success"]:
+                succeeded += 1
+            else:
+                failed += 1
+                failed_threads.append(
+                    {"thread_id": result["thread_id"], "error": result["error"]}
+                )
 
     return succeeded, failed, failed_threads
 
@@ -231,7 +309,11 @@ def _get_action_labels(undo: bool) -> tuple[str, str, str, str]:
 
 
 def _handle_empty_threads(
-    pr_number: int, action: str, undo: bool, pretty: bool
+    pr_number: int,
+    action: str,
+    undo: bool,
+    pretty: bool,
+    thread_filter: Optional[ThreadFilter] = None,
 ) -> None:
     """Handle the case when no threads are found for bulk operations.
 
@@ -240,9 +322,30 @@ def _handle_empty_threads(
         action: Action being performed (resolve/unresolve)
         undo: Whether this is an undo operation
         pretty: Whether to use pretty output format
+        thread_filter: The --where predicates that were applied, if any
     """
+    status = "resolved" if undo else "unresolved"
+    if thread_filter is not None:
+        message = f"No {status} threads match: {thread_filter.describe()}"
+        if pretty:
+            click.echo(f"✅ {message} in PR #{pr_number}")
+        else:
+            click.echo(
+                json.dumps(
+                    {
+                        "pr_number": pr_number,
+                        "action": action,
+                        "threads_processed": 0,
+                        "threads_succeeded": 0,
+                        "threads_failed": 0,
+                        "success": True,
+                        "message": message,
+                    }
+                )
+            )
+        return
+
     if pretty:
-        status = "resolved" if undo else "unresolved"
         click.echo(f"✅ No {status} threads found in PR #{pr_number}")
     else:
         result = {
@@ -323,11 +426,98 @@ def _handle_bulk_resolve_error(
     ctx.exit(1)
 
 
+def _current_repository() -> Optional[str]:
+    """Get the repository of the working directory.
+
+    Returns:
+        Repository in owner/repo format, or None if it cannot be determined
+    """
+    try:
+        return get_shared_github_service().get_current_repo()
+    except GitHubServiceError:
+        return None
+
+
+def _bulk_resolve_journal(
+    repository: str,
+    pr_number: int,
+    action: str,
+    thread_filter: Optional[ThreadFilter],
+) -> OperationJournal:
+    """Create the journal that tracks a bulk resolve operation.
+
+    The journal is keyed by the repository, the PR, the action and the --where
+    predicates, so rerunning the same command with --resume in the same
+    repository finds the journal of the interrupted run.
+
+    Args:
+        repository: Repository in owner/repo format
+        pr_number: Pull request number
+        action: Action being performed (resolve/unresolve)
+        thread_filter: The --where predicates, if any
+
+    Returns:
+        OperationJournal for the operation
+    """
+    return OperationJournal(
+        {
+            "command": "resolve",
+            "repository": repository.lower(),
+            "pr_number": pr_number,
+            "action": action,
+            "where": thread_filter.describe() if thread_filter is not None else "",
+        }
+    )
+
+
+def _load_resumed_threads(
+    journal: OperationJournal, pretty: bool
+) -> Optional[list[_PlannedThread]]:
+    """Load the threads an interrupted bulk operation has not finished.
+
+    Args:
+        journal: Journal of the interrupted operation
+        pretty: Whether to show pretty progress messages
+
+    Returns:
+        Pending threads from the journal, or None if there is no usable
+        journal and threads must be fetched again
+    """
+    if not journal.exists():
+        if pretty:
+            click.echo("📒 No interrupted operation to resume; starting fresh")
+        return None
+
+    try:
+        state = journal.resume()
+    except JournalError as e:
+        click.echo(f"Warning: {e}; starting fresh", err=True)
+        return None
+
+    if pretty:
+        click.echo(
+            f"📒 Resuming: {state.succeeded_count} of {len(state.items)} "
+            "thread(s) already done"
+        )
+    return [_PlannedThread(item.item_id, item.label) for item in state.pending_items]
+
+
 def _handle_bulk_resolve(
-    ctx: click.Context, pr_number: int, undo: bool, yes: bool, pretty: bool, limit: int
+    ctx: click.Context,
+    pr_number: int,
+    undo: bool,
+    yes: bool,
+    pretty: bool,
+    limit: int,
+    thread_filter: Optional[ThreadFilter] = None,
+    resume: bool = False,
 ) -> None:
     """Handle bulk resolution of all threads in a pull request.
 
+    Progress is journaled under ~/.toady/journals. If the run is interrupted
+    or some threads fail, rerunning with resume=True processes only the
+    threads that have not succeeded, without fetching the PR again.
+
     Args:
         ctx: Click context for exit handling
         pr_number: Pull request number
@@ -335,16 +525,36 @@ def _handle_bulk_resolve(
         yes: Whether to skip confirmation prompt
         pretty: Whether to use pretty output format
         limit: Maximum number of threads to process
+        thread_filter: Optional --where predicates selecting the threads
+        resume: Whether to continue an interrupted operation from its journal
     """
     action, action_past, action_present, action_symbol = _get_action_labels(undo)
+    # Without a repository the fetch below fails anyway, so skip the journal
+    repository = _current_repository()
+    journal: Optional[OperationJournal] = (
+        _bulk_resolve_journal(repository, pr_number, action, thread_filter)
+        if repository
+        else None
+    )
 
     try:
-        # Fetch and filter threads
-        target_threads = _fetch_and_filter_threads(pr_number, undo, pretty, limit)
+        target_threads: Optional[list[Any]] = None
+        resumed = False
+        if resume and journal is not None:
+            target_threads = _load_resumed_threads(journal, pretty)
+            resumed = target_threads is not None
+
+        if target_threads is None:
+            # Fetch and filter threads
+            target_threads = _fetch_and_filter_threads(
+                pr_number, undo, pretty, limit, thread_filter
+            )
 
         # Handle empty result
         if not target_threads:
-            _handle_empty_threads(pr_number, action, undo, pretty)
+            if resumed and journal is not None:
+                journal.complete()
+            _handle_empty_threads(pr_number, action, undo, pretty, thread_filter)
             return
 
         # Handle confirmation prompt
@@ -352,9 +562,27 @@ def _handle_bulk_resolve(
             ctx, target_threads, action, action_symbol, pr_number, yes, pretty
         )
 
-        # Process threads
-        succeeded, failed, failed_threads = _process_threads(
-            target_threads, undo, action_present, action_symbol, pretty
+        if not resumed and journal is not None:
+            try:
+                journal.start(
+                    [
+                        JournalItem(thread.thread_id, thread.title)
+                        for thread in target_threads
+                    ]
+                )
+            except JournalError as e:
+                click.echo(f"Warning: {e}; --resume will not be available", err=True)
+                journal = None
+
+        # Process threads; resumed ones come from the journal, not a fresh fetch
+        succeeded, failed, failed_threads = _process_threads_batched(
+            target_threads,
+            undo,
+            action_present,
+            action_symbol,
+            pretty,
+            journal=journal,
+            verify_in=(repository, pr_number) if resumed and repository else None,
         )
 
         # Display summary
@@ -371,10 +599,20 @@ def _handle_bulk_resolve(
 
         # Exit with error code if any threads failed
         if failed > 0:
+            if pretty and journal is not None:
+                click.echo("\n💡 Rerun with --resume to retry only the failed threads")
             ctx.exit(1)
+        elif journal is not None:
+            journal.complete()
 
+    except KeyboardInterrupt:
+        click.echo("\n⚠️  Interrupted; rerun with --resume to continue", err=True)
+        ctx.exit(130)
     except Exception as e:
         _handle_bulk_resolve_error(ctx, e, pr_number, action, pretty)
+    finally:
+        if journal is not None:
+            journal.close()
 
 
 def _validate_resolve_parameters(
@@ -414,6 +652,43 @@ def _validate_resolve_parameters(
     validate_limit(limit, max_limit=1000)
 
 
+def _parse_where_filter(
+    where: tuple[str, ...], thread_id: Optional[str], pr_number: Optional[int]
+) -> Optional[ThreadFilter]:
+    """Parse --where clauses into a thread filter.
+
+    Args:
+        where: Raw --where clauses
+        thread_id: Thread ID for single resolution, which --where cannot be
+            combined with
+        pr_number: Pull request number, required with --where
+
+    Returns:
+        ThreadFilter, or None if no clauses were given
+
+    Raises:
+        click.BadParameter: If the clauses are invalid or conflict with other
+            options
+    """
+    if not where:
+        return None
+
+    if thread_id:
+        raise click.BadParameter(
+            "Cannot use --where and --thread-id together. Choose one.",
+            param_hint="--where",
+        )
+    if pr_number is None:
+        raise click.BadParameter(
+            "--pr is required when using --where", param_hint="--pr"
+        )
+
+    try:
+        return ThreadFilter.from_clauses(where)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--where") from e
+
+
 def _validate_and_prepare_thread_id(thread_id: str) -> str:
     """Validate and prepare thread ID for single resolution.
 
@@ -542,7 +817,11 @@ def _handle_single_resolve_error(
 
 
 def _handle_single_resolve(
-    ctx: click.Context, thread_id: str, undo: bool, pretty: bool
+    ctx: click.Context,
+    thread_id: str,
+    undo: bool,
+    pretty: bool,
+    pr_number: Optional[int] = None,
 ) -> None:
     """Handle single thread resolution.
 
@@ -551,6 +830,8 @@ def _handle_single_resolve(
         thread_id: Thread ID to resolve/unresolve
         undo: Whether to unresolve instead of resolve
         pretty: Whether to use pretty output format
+        pr_number: Optional pull request the thread must belong to, checked
+            together with the current repository before the thread is changed
     """
     # Validate and prepare thread ID
     thread_id = _validate_and_prepare_thread_id(thread_id)
@@ -562,7 +843,13 @@ def _handle_single_resolve(
     try:
         resolve_service = ResolveService()
 
-        if undo:
+        if pr_number is not None:
+            current_repo = resolve_service.github_service.get_current_repo()
+            owner, _, repo = (current_repo or "").partition("/")
+            result = resolve_service.resolve_thread_in_pull_request(
+                thread_id, pr_number, owner=owner or None, repo=repo or None, undo=undo
+            )
+        elif undo:
             result = resolve_service.unresolve_thread(thread_id)
         else:
             result = resolve_service.resolve_thread(thread_id)
@@ -588,11 +875,20 @@ def _handle_single_resolve(
     help="Resolve all unresolved threads in the PR. Requires --pr option. "
     "Cannot be used with --thread-id. Use --yes to skip confirmation.",
 )
+@click.option(
+    "--where",
+    multiple=True,
+    help="Resolve only threads matching a filter: path=GLOB, author=LOGIN[,LOGIN], "
+    "outdated[=false] or older-than=DURATION (e.g. 7d). Repeat to combine. "
+    "Implies --all and requires --pr.",
+    metavar="FILTER",
+)
 @click.option(
     "--pr",
     "pr_number",
     type=int,
     help="Pull request number for bulk operations. Required when using --all. "
+    "With --thread-id, the thread is checked to belong to this PR. "
     "Must be a positive integer representing an existing open PR.",
     metavar="NUMBER",
 )
@@ -608,6 +904,12 @@ def _handle_single_resolve(
     help="Skip confirmation prompt for bulk operations. Use for automated scripts. "
     "Has no effect on single thread operations which never prompt.",
 )
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Continue an interrupted bulk operation, processing only threads that "
+    "have not succeeded yet. Requires --all or --where with the same --pr.",
+)
 @create_format_option()
 @create_legacy_pretty_option()
 @click.option(
@@ -622,9 +924,11 @@ def resolve(
     ctx: click.Context,
     thread_id: str,
     bulk_resolve: bool,
+    where: tuple[str, ...],
     pr_number: int,
     undo: bool,
     yes: bool,
+    resume: bool,
     format: Optional[str],
     pretty: bool,
     limit: int,
@@ -638,6 +942,7 @@ def resolve(
     Operation modes:
       • Single thread: Use --thread-id to resolve/unresolve one thread
       • Bulk operation: Use --all --pr to process all threads in a PR
+      • Filtered bulk operation: Use --where --pr to process matching threads
       • Unresolve: Add --undo flag to unresolve instead of resolve
 
     \b
@@ -680,6 +985,9 @@ def resolve(
       Unresolve thread:
         toady resolve --thread-id "PRT_kwDOABcD12MAAAABcDE3fg" --undo
 
+      Resolve a thread and check it belongs to PR #123:
+        toady resolve --thread-id "PRRT_kwDOO3WQIc5RvXMO" --pr 123
+
       Resolve all threads in PR:
         toady resolve --all --pr 123
 
@@ -692,6 +1000,15 @@ def resolve(
       Limited bulk operation:
         toady resolve --all --pr 123 --limit 50
 
+      Resolve outdated threads under docs/ in one batched request:
+        toady resolve --pr 123 --where outdated --where "path=docs/**" --yes
+
+      Resolve a bot's threads with no activity for two weeks:
+        toady resolve --pr 123 --where author=lint-bot --where older-than=2w
+
+      Continue an interrupted bulk operation:
+        toady resolve --all --pr 123 --yes --resume
+
     \b
     Agent usage patterns:
       # Resolve specific thread
@@ -700,15 +1017,14 @@ def resolve(
       # Bulk resolve with error handling
       toady resolve --all --pr 123 --yes || echo "Some threads failed"
 
-      # Pipeline: fetch then resolve all
-      toady fetch | jq -r '.[].thread_id' | while read id; do
-        toady resolve --thread-id "$id"
-      done
+      # Resolve by predicate instead of piping IDs through jq
+      toady resolve --pr 123 --where "path=docs/**" --yes
 
     \b
     Validation & safety:
       • Single operations: No confirmation required
       • Bulk operations: Confirmation prompt unless --yes flag used
+      • Interrupted bulk operations: Rerun with --resume to skip finished threads
       • Thread ID validation: Must match supported format patterns
       • Permissions: Requires write access to repository
 
@@ -732,17 +1048,28 @@ def resolve(
     # with existing functions
     pretty_mode = output_format == "pretty"
 
+    # --where selects threads for a bulk operation
+    thread_filter = _parse_where_filter(where, thread_id, pr_number)
+    if thread_filter is not None:
+        bulk_resolve = True
+
     # Validate all parameters
     _validate_resolve_parameters(bulk_resolve, thread_id, pr_number, limit)
+    if resume and not bulk_resolve:
+        raise click.BadParameter(
+            "--resume requires --all or --where", param_hint="--resume"
+        )
 
     # Handle bulk resolution mode
     if bulk_resolve:
         try:
-            _handle_bulk_resolve(ctx, pr_number, undo, yes, pretty_mode, limit)
+            _handle_bulk_resolve(
+                ctx, pr_number, undo, yes, pretty_mode, limit, thread_filter, resume
+            )
         except SystemExit:
             # Re-raise SystemExit to avoid being caught by outer exception handlers
             raise
         return
 
     # Handle single thread resolution mode
-    _handle_single_resolve(ctx, thread_id, undo, pretty_mode)
+    _handle_single_resolve(ctx, thread_id, undo, pretty_mode, pr_number)
@@ -74,7 +74,7 @@ def validate(cache_dir: Optional[Path], force_refresh: bool, output: str) -> Non
         # Fetch schema with enhanced error handling
         try:
             click.echo("Fetching GitHub GraphQL schema...", err=True)
-            validator.fetch_schema(force_refresh=force_refresh)
+            validator.load_schema(force_refresh=force_refresh)
         except (ConnectionError, TimeoutError) as e:
             raise NetworkError(
                 message=f"Network error fetching GitHub schema: {e!s}",
@@ -391,6 +391,12 @@ def _display_summary_report(report: dict[str, Any]) -> None:
             else:
                 click.echo(f"  ✓ {mutation_name}: valid")
 
+    # Validation timing
+    timings = report.get("timings", {})
+    if isinstance(timings, dict) and "total_ms" in timings:
+        count = len(timings.get("queries", {})) + len(timings.get("mutations", {}))
+        click.echo(f"\nValidated {count} operation(s) in {timings['total_ms']:.1f} ms")
+
     # Recommendations
     recommendations = report.get("recommendations", [])
     if recommendations:
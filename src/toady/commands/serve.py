@@ -0,0 +1,78 @@
+"""Serve command implementation."""
+
+import signal
+from typing import Any, Optional
+
+import click
+
+from toady.services.daemon import DaemonError, DaemonServer, stop_daemon
+
+
+@click.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="Socket to listen on (default: $TOADY_SOCKET or ~/.toady/daemon.sock)",
+)
+@click.option(
+    "--idle-timeout",
+    type=click.FloatRange(min=0),
+    default=0,
+    show_default=True,
+    help="Exit after this many seconds without a request (0 never exits)",
+)
+@click.option(
+    "--stop",
+    is_flag=True,
+    help="Stop the daemon listening on the socket",
+)
+@click.pass_context
+def serve(
+    ctx: click.Context, socket_path: Optional[str], idle_timeout: float, stop: bool
+) -> None:
+    """Keep a warm toady process serving commands over a Unix socket.
+
+    While the daemon runs, every toady invocation forwards its arguments to
+    it and prints the output, so commands skip Python startup, imports and
+    gh probing. The daemon runs commands in the caller's directory with the
+    caller's environment, one at a time.
+
+    \b
+    Commands still run in-process when:
+      • stdin is a terminal, so prompts keep working
+      • an argument is "-" (the command reads stdin)
+      • TOADY_NO_DAEMON=1 is set
+
+    \b
+    Examples:
+      toady serve &                     Start the daemon in the background
+      toady serve --idle-timeout 600    Exit after 10 idle minutes
+      toady serve --stop                Stop the daemon
+    """
+    if stop:
+        if not stop_daemon(socket_path):
+            click.echo("No toady daemon is running", err=True)
+            ctx.exit(1)
+        click.echo("toady daemon stopped", err=True)
+        return
+
+    server = DaemonServer(socket_path, idle_timeout=idle_timeout)
+    try:
+        server.bind()
+    except (DaemonError, OSError) as e:
+        click.echo(f"Error: {e}", err=True)
+        ctx.exit(1)
+
+    def handle_sigterm(signum: int, frame: Any) -> None:
+        server.stop()
+
+    server.warm_up()
+    click.echo(f"toady daemon listening on {server.socket_path}", err=True)
+    previous_handler = signal.signal(signal.SIGTERM, handle_sigterm)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass  # serve_forever has already removed the socket
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
@@ -0,0 +1,355 @@
+"""CSV and TSV formatter implementations for toady CLI output.
+
+This module provides delimiter-separated formatters for loading review data
+into spreadsheets and databases. Threads are written as one row each, or as
+one row per comment when ``comment_rows`` is enabled. Rows are produced
+incrementally by ``iter_threads`` so large result sets can be streamed to
+stdout without building the whole table in memory.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+import csv
+from datetime import datetime
+import io
+import json
+from typing import Any, Callable, Optional, Union
+
+from ..models.models import Comment, ReviewThread
+from .format_interfaces import BaseFormatter, FormatterError
+
+# Column extractors for thread-level fields
+THREAD_COLUMNS: dict[str, Callable[[ReviewThread], Any]] = {
+    "thread_id": lambda t: t.thread_id,
+    "title": lambda t: t.title,
+    "status": lambda t: t.status,
+    "author": lambda t: t.author,
+    "file_path": lambda t: t.file_path,
+    "line": lambda t: t.line,
+    "original_line": lambda t: t.original_line,
+    "start_line": lambda t: t.start_line,
+    "original_start_line": lambda t: t.original_start_line,
+    "diff_side": lambda t: t.diff_side,
+    "is_outdated": lambda t: t.is_outdated,
+    "created_at": lambda t: t.created_at,
+    "updated_at": lambda t: t.updated_at,
+    "comment_count": lambda t: len(t.comments),
+}
+
+# Column extractors for comment-level fields, available in comment rows
+COMMENT_COLUMNS: dict[str, Callable[[Comment], Any]] = {
+    "comment_id": lambda c: c.comment_id,
+    "comment_author": lambda c: c.author,
+    "comment_author_name": lambda c: c.author_name,
+    "comment_content": lambda c: c.content,
+    "comment_created_at": lambda c: c.created_at,
+    "comment_updated_at": lambda c: c.updated_at,
+    "comment_parent_id": lambda c: c.parent_id,
+    "comment_review_id": lambda c: c.review_id,
+    "comment_review_state": lambda c: c.review_state,
+    "comment_url": lambda c: c.url,
+}
+
+DEFAULT_THREAD_COLUMNS = (
+    "thread_id",
+    "status",
+    "title",
+    "author",
+    "file_path",
+    "line",
+    "is_outdated",
+    "comment_count",
+    "created_at",
+    "updated_at",
+)
+
+DEFAULT_COMMENT_COLUMNS = (
+    "thread_id",
+    "status",
+    "file_path",
+    "line",
+    "comment_id",
+    "comment_author",
+    "comment_created_at",
+    "comment_review_state",
+    "comment_url",
+    "comment_content",
+)
+
+
+def _cell(value: Any) -> Any:
+    """Convert a field value to its CSV cell representation.
+
+    Args:
+        value: Field value to convert.
+
+    Returns:
+        Value suitable for csv.writer.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class CSVFormatter(BaseFormatter):
+    """Formatter that produces comma-separated rows.
+
+    Columns are selected by name from THREAD_COLUMNS, plus COMMENT_COLUMNS
+    when ``comment_rows`` is enabled.
+    """
+
+    delimiter = ","
+    streams_threads = True
+
+    def __init__(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        comment_rows: bool = False,
+        include_header: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the CSV formatter.
+
+        Args:
+            columns: Column names to output, in order. Defaults depend on
+                whether ``comment_rows`` is enabled.
+            comment_rows: Write one row per comment instead of per thread.
+            include_header: Whether to write a header row.
+            **kwargs: Additional options passed to the base formatter.
+
+        Raises:
+            FormatterError: If an unknown column is requested.
+        """
+        super().__init__(**kwargs)
+        self.comment_rows = comment_rows
+        self.include_header = include_header
+
+        if columns is None:
+            columns = (
+                DEFAULT_COMMENT_COLUMNS if comment_rows else DEFAULT_THREAD_COLUMNS
+            )
+        self.columns = list(columns)
+        self._validate_columns()
+
+        # A single buffer and writer are reused for every row
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(
+            self._buffer, delimiter=self.delimiter, lineterminator="\n"
+        )
+
+    def _validate_columns(self) -> None:
+        """Check that all requested columns are known.
+
+        Raises:
+            FormatterError: If a column is unknown or empty.
+        """
+        if not self.columns:
+            raise FormatterError("At least one column must be selected")
+
+        available = set(THREAD_COLUMNS)
+        if self.comment_rows:
+            available.update(COMMENT_COLUMNS)
+
+        unknown = [column for column in self.columns if column not in available]
+        if unknown:
+            hint = "" if self.comment_rows else " (comment columns need comment rows)"
+            raise FormatterError(
+                f"Unknown column(s): {', '.join(unknown)}{hint}. "
+                f"Available columns: {', '.join(sorted(available))}"
+            )
+
+    def format_threads(self, threads: list[ReviewThread]) -> str:
+        """Format review threads as delimited rows.
+
+        Args:
+            threads: List of ReviewThread objects to format.
+
+        Returns:
+            Delimited text with one row per thread or comment.
+
+        Raises:
+            FormatterError: If formatting fails.
+        """
+        return "".join(self.iter_threads(threads))
+
+    def iter_threads(self, threads: Iterable[ReviewThread]) -> Iterator[str]:
+        """Render rows incrementally, one thread at a time.
+
+        Args:
+            threads: ReviewThread objects to format.
+
+        Yields:
+            The header row, then the newline-terminated rows for each thread.
+
+        Raises:
+            FormatterError: If formatting fails.
+        """
+        try:
+            if self.include_header:
+                yield self._render_rows([self.columns])
+
+            if not self.comment_rows:
+                getters = [THREAD_COLUMNS[column] for column in self.columns]
+                for thread in threads:
+                    yield self._render_rows(
+                        [[_cell(getter(thread)) for getter in getters]]
+                    )
+                return
+
+            # Comment rows repeat the thread's cells next to each comment's
+            thread_getters = [THREAD_COLUMNS.get(column) for column in self.columns]
+            comment_getters = [COMMENT_COLUMNS.get(column) for column in self.columns]
+            for thread in threads:
+                thread_cells = [
+                    _cell(getter(thread)) if getter is not None else None
+                    for getter in thread_getters
+                ]
+                rows = []
+                for comment in thread.comments:
+                    row = list(thread_cells)
+                    for index, comment_getter in enumerate(comment_getters):
+                        if comment_getter is not None:
+                            row[index] = _cell(comment_getter(comment))
+                    rows.append(row)
+                yield self._render_rows(rows)
+
+        except Exception as e:
+            if isinstance(e, FormatterError):
+                raise
+            raise FormatterError(
+                f"Failed to format threads as {self._format_name}: {e!s}",
+                original_error=e,
+            ) from e
+
+    def format_comments(self, comments: list[Comment]) -> str:
+        """Format comments as delimited rows.
+
+        Args:
+            comments: List of Comment objects to format.
+
+        Returns:
+            Delimited text with one row per comment.
+        """
+        return self.format_array([comment.to_dict() for comment in comments])
+
+    def format_object(self, obj: Any) -> str:
+        """Format a single object as delimited rows.
+
+        Dictionaries become a single-row table; other values are written as
+        a single cell.
+
+        Args:
+            obj: Object to format.
+
+        Returns:
+            Delimited text representation of the object.
+
+        Raises:
+            FormatterError: If formatting fails.
+        """
+        serialized = self._safe_serialize(obj)
+        if isinstance(serialized, dict):
+            return self.format_array([serialized])
+        return self.format_primitive(serialized)
+
+    def format_array(self, items: list[Any]) -> str:
+        """Format an array as delimited rows.
+
+        Lists of dictionaries become a table whose columns are the union of
+        their keys in first-seen order; other items are written one per row.
+
+        Args:
+            items: List of items to format.
+
+        Returns:
+            Delimited text representation of the items.
+
+        Raises:
+            FormatterError: If formatting fails.
+        """
+        try:
+            serialized = [self._safe_serialize(item) for item in items]
+            if serialized and all(isinstance(item, dict) for item in serialized):
+                headers: dict[str, None] = {}
+                for item in serialized:
+                    headers.update(dict.fromkeys(item))
+                rows: list[list[Any]] = [list(headers)] if self.include_header else []
+                rows.extend(
+                    [self._flatten(item.get(key)) for key in headers]
+                    for item in serialized
+                )
+                return self._render_rows(rows)
+
+            return self._render_rows([[self._flatten(item)] for item in serialized])
+        except Exception as e:
+            raise FormatterError(
+                f"Failed to format array as {self._format_name}: {e!s}",
+                original_error=e,
+            ) from e
+
+    def format_primitive(self, value: Union[str, float, bool, None]) -> str:
+        """Format a primitive value as a single cell.
+
+        Args:
+            value: Primitive value to format.
+
+        Returns:
+            Delimited text with a single cell.
+        """
+        return self._render_rows([[_cell(value)]])
+
+    def format_error(self, error: dict[str, Any]) -> str:
+        """Format an error object as a single-row table.
+
+        Args:
+            error: Error dictionary with error details.
+
+        Returns:
+            Delimited text representation of the error.
+        """
+        error_dict = dict(error)
+        error_dict.setdefault("error", True)
+        error_dict.setdefault("success", False)
+        return self.format_array([error_dict])
+
+    @property
+    def _format_name(self) -> str:
+        """Name of the output format used in error messages."""
+        return "TSV" if self.delimiter == "\t" else "CSV"
+
+    def _flatten(self, value: Any) -> Any:
+        """Convert a serialized value to a cell, encoding nested data.
+
+        Args:
+            value: Serialized value.
+
+        Returns:
+            Cell value; lists and dictionaries are JSON encoded.
+        """
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False)
+        return _cell(value)
+
+    def _render_rows(self, rows: Iterable[Iterable[Any]]) -> str:
+        """Render rows using the shared CSV writer buffer.
+
+        Args:
+            rows: Rows of cell values.
+
+        Returns:
+            Newline-terminated delimited text for the rows.
+        """
+        self._writer.writerows(rows)
+        text = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return text
+
+
+class TSVFormatter(CSVFormatter):
+    """Formatter that produces tab-separated rows."""
+
+    delimiter = "\t"
@@ -9,6 +9,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Optional, Union
 
 from ..models.models import Comment, ReviewThread
+from .serializers import default_registry
 
 
 class IFormatter(ABC):
@@ -128,6 +129,10 @@ class BaseFormatter(IFormatter):
     and helper methods that can be used by concrete formatter implementations.
     """
 
+    # Formatters that set this provide iter_threads(threads), yielding
+    # newline-terminated chunks that can be written as they are produced
+    streams_threads: bool = False
+
     def __init__(self, **options: Any) -> None:
         """Initialize the formatter with options.
 
@@ -139,6 +144,20 @@ class BaseFormatter(IFormatter):
     def _safe_serialize(self, obj: Any) -> Any:
         """Safely serialize an object, handling non-serializable types.
 
+        Known types are encoded through the shared serializer registry; only
+        unknown objects go through reflective serialization.
+
+        Args:
+            obj: Object to serialize.
+
+        Returns:
+            Serializable representation of the object.
+        """
+        return default_registry.serialize(obj, self._reflective_serialize)
+
+    def _reflective_serialize(self, obj: Any) -> Any:
+        """Serialize an object of unknown type by inspecting its attributes.
+
         Args:
             obj: Object to serialize.
 
@@ -150,10 +169,6 @@ class BaseFormatter(IFormatter):
                 return obj.to_dict()
             except Exception:
                 return str(obj)
-        if isinstance(obj, (list, tuple)):
-            return [self._safe_serialize(item) for item in obj]
-        if isinstance(obj, dict):
-            return {key: self._safe_serialize(value) for key, value in obj.items()}
         if hasattr(obj, "__dict__"):
             return self._safe_serialize(obj.__dict__)
         # For primitive types and other serializable objects
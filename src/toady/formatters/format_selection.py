@@ -91,6 +91,26 @@ def _ensure_formatters_registered() -> None:
         except ImportError:
             pass
 
+    # Register delimiter-separated formatters if not present
+    if "csv" not in current_formatters or "tsv" not in current_formatters:
+        try:
+            from .csv_formatter import CSVFormatter, TSVFormatter
+
+            FormatterFactory.register("csv", CSVFormatter)
+            FormatterFactory.register("tsv", TSVFormatter)
+        except ImportError:
+            pass
+
+    # Register msgpack formatter if its optional dependency is installed
+    if "msgpack" not in current_formatters:
+        try:
+            from .msgpack_formatter import MsgpackFormatter, is_msgpack_available
+
+            if is_msgpack_available():
+                FormatterFactory.register("msgpack", MsgpackFormatter)
+        except ImportError:
+            pass
+
 
 # Call registration on module import
 _ensure_formatters_registered()
@@ -254,12 +274,19 @@ def create_legacy_pretty_option(**kwargs: Any) -> Callable[[F], F]:
 # Format-specific output functions
 
 
-def format_threads_output(threads: Any, format_name: str, **kwargs: Any) -> None:
+def format_threads_output(
+    threads: Any,
+    format_name: str,
+    formatter_options: Optional[dict[str, Any]] = None,
+    **kwargs: Any,
+) -> None:
     """Format and output threads using the specified format.
 
     Args:
         threads: List of thread objects to format.
         format_name: Name of the format to use.
+        formatter_options: Options passed to the formatter constructor for
+            formats other than json and pretty.
         **kwargs: Additional options for formatting.
     """
     if format_name == "json":
@@ -270,9 +297,27 @@ def format_threads_output(threads: Any, format_name: str, **kwargs: Any) -> None
         format_fetch_output(threads=threads, pretty=True, **kwargs)
     else:
         # Use new formatter interface for other formats
-        formatter = create_formatter(format_name)
+        formatter = create_formatter(format_name, **(formatter_options or {}))
+        if getattr(formatter, "streams_threads", False) is True:
+            # Write each chunk as soon as it is rendered
+            for chunk in formatter.iter_threads(threads):
+                click.echo(chunk, nl=False)
+            return
         output = formatter.format_threads(threads)
-        click.echo(output)
+        _echo_output(output)
+
+
+def _echo_output(output: Any, **kwargs: Any) -> None:
+    """Write formatter output, leaving binary payloads unterminated.
+
+    Args:
+        output: Text or bytes produced by a formatter.
+        **kwargs: Additional arguments for click.echo.
+    """
+    # Binary formats (e.g. msgpack) must not get a trailing newline appended
+    if isinstance(output, bytes):
+        kwargs["nl"] = False
+    click.echo(output, **kwargs)
 
 
 def format_object_output(obj: Any, format_name: str) -> None:
@@ -295,7 +340,7 @@ def format_object_output(obj: Any, format_name: str) -> None:
         # Use formatter interface for other formats
         formatter = create_formatter(format_name)
         output = formatter.format_object(obj)
-        click.echo(output)
+        _echo_output(output)
 
 
 def format_success_message(
@@ -319,7 +364,7 @@ def format_success_message(
         # Use formatter interface
         formatter = create_formatter(format_name)
         output = formatter.format_success_message(message, details)
-        click.echo(output)
+        _echo_output(output)
 
 
 def format_error_message(error: dict[str, Any], format_name: str) -> None:
@@ -337,4 +382,4 @@ def format_error_message(error: dict[str, Any], format_name: str) -> None:
         # Use formatter interface
         formatter = create_formatter(format_name)
         output = formatter.format_error(error)
-        click.echo(output, err=True)
+        _echo_output(output, err=True)
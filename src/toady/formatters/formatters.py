@@ -4,7 +4,11 @@ This module provides both the legacy formatter implementations and integration
 with the new formatter interface system.
 """
 
+from collections.abc import Iterator
 import json
+import os
+import shutil
+import sys
 import textwrap
 from typing import Optional
 
@@ -124,6 +128,40 @@ class PrettyFormatter:
 
         return "\n   ".join(context_parts)
 
+    @staticmethod
+    def _format_code_context(thread: ReviewThread, indent: str = "   ") -> list[str]:
+        """Format the code context attached to a thread.
+
+        Commented lines are marked with ">".
+
+        Args:
+            thread: ReviewThread that may carry code context
+            indent: Base indentation level
+
+        Returns:
+            Formatted lines, or an empty list if there is no context
+        """
+        context = thread.code_context
+        if not context or not context.get("lines"):
+            return []
+
+        first_marked = thread.start_line or thread.line
+        last_marked = thread.line
+        start = context["start_line"]
+        number_width = len(str(start + len(context["lines"]) - 1))
+
+        lines = [f"{indent}📄 Code @ {str(context.get('commit', ''))[:7]}:"]
+        for offset, text in enumerate(context["lines"]):
+            number = start + offset
+            marked = (
+                first_marked is not None
+                and last_marked is not None
+                and first_marked <= number <= last_marked
+            )
+            marker = ">" if marked else " "
+            lines.append(f"{indent} {marker} {number:>{number_width}} │ {text}")
+        return lines
+
     @staticmethod
     def _format_comment(
         comment: Comment, is_first: bool = False, indent: str = "   "
@@ -193,73 +231,38 @@ class PrettyFormatter:
         Returns:
             Pretty formatted string with enhanced comment preview
         """
-        if not threads:
-            return "No review threads found."
-
-        lines = []
-
-        # Header
-        lines.append("📋 Review Threads:")
-        lines.append("=" * 80)
+        return "\n".join(PrettyFormatter.iter_threads(threads))
 
-        for i, thread in enumerate(threads, 1):
-            # Thread header with enhanced status indicator
-            if thread.status == "RESOLVED":
-                status_emoji = "✅"
-                status_color = "green"
-            elif thread.status == "OUTDATED" or thread.is_outdated:
-                status_emoji = "⏰"
-                status_color = "yellow"
-            else:
-                status_emoji = "❌"
-                status_color = "red"
-
-            # Thread title with status
-            status_text = click.style(thread.status, fg=status_color, bold=True)
-            lines.append(f"\n{i}. {status_emoji} {thread.title} ({status_text})")
-
-            # File context
-            file_context = PrettyFormatter._format_file_context(thread)
-            if file_context:
-                lines.append(f"   {file_context}")
-
-            # Thread metadata
-            lines.append(f"   📝 ID: {thread.thread_id}")
-            lines.append(f"   👤 Author: {thread.author}")
-            lines.append(
-                f"   📅 Created: {thread.created_at.strftime('%Y-%m-%d %H:%M:%S')}"
-            )
-            lines.append(
-                f"   🔄 Updated: {thread.updated_at.strftime('%Y-%m-%d %H:%M:%S')}"
-            )
-            lines.append(f"   💬 Comments: {len(thread.comments)}")
+    @staticmethod
+    def iter_threads(threads: list[ReviewThread]) -> Iterator[str]:
+        """Render threads one block at a time for streaming output.
 
-            # Status with color
-            status_text_colored = click.style(thread.status, fg=status_color, bold=True)
-            lines.append(f"   🏷️  Status: {status_text_colored}")
+        Joining the yielded chunks with newlines produces the same text as
+        format_threads.
 
-            # Show full comment content if there are comments
-            if thread.comments:
-                lines.append("")
-                lines.append("   📝 Comment Details:")
+        Args:
+            threads: List of ReviewThread objects
 
-                # Sort comments by creation date to show conversation flow
-                sorted_comments = sorted(thread.comments, key=lambda c: c.created_at)
+        Yields:
+            Header, per-thread and summary chunks of pretty output
+        """
+        if not threads:
+            yield "No review threads found."
+            return
 
-                for j, comment in enumerate(sorted_comments):
-                    is_first = j == 0
-                    comment_text = PrettyFormatter._format_comment(comment, is_first)
-                    lines.append(comment_text)
+        # Header
+        yield "📋 Review Threads:\n" + "=" * 80
 
-                    # Add spacing between comments
-                    if j < len(sorted_comments) - 1:
-                        lines.append("")
+        for i, thread in enumerate(threads, 1):
+            lines = PrettyFormatter._format_thread_lines(i, thread)
 
             # Separator between threads (except for last one)
             if i < len(threads):
                 lines.append("")
                 lines.append("   " + "─" * 76)
 
+            yield "\n".join(lines)
+
         # Summary footer
         resolved_count = sum(1 for t in threads if t.status == "RESOLVED")
         unresolved_count = len(threads) - resolved_count
@@ -267,7 +270,7 @@ class PrettyFormatter:
             1 for t in threads if t.is_outdated or t.status == "OUTDATED"
         )
 
-        lines.append("\n" + "=" * 80)
+        lines = ["\n" + "=" * 80]
         lines.append(f"📊 Summary: {len(threads)} total threads")
         if resolved_count > 0:
             lines.append(f"   ✅ Resolved: {resolved_count}")
@@ -276,7 +279,76 @@ class PrettyFormatter:
         if outdated_count > 0:
             lines.append(f"   ⏰ Outdated: {outdated_count}")
 
-        return "\n".join(lines)
+        yield "\n".join(lines)
+
+    @staticmethod
+    def _format_thread_lines(index: int, thread: ReviewThread) -> list[str]:
+        """Render the lines for a single numbered thread.
+
+        Args:
+            index: 1-based position of the thread in the output
+            thread: ReviewThread to render
+
+        Returns:
+            List of rendered lines for the thread
+        """
+        lines = []
+
+        # Thread header with enhanced status indicator
+        if thread.status == "RESOLVED":
+            status_emoji = "✅"
+            status_color = "green"
+        elif thread.status == "OUTDATED" or thread.is_outdated:
+            status_emoji = "⏰"
+            status_color = "yellow"
+        else:
+            status_emoji = "❌"
+            status_color = "red"
+
+        # Thread title with status
+        status_text = click.style(thread.status, fg=status_color, bold=True)
+        lines.append(f"\n{index}. {status_emoji} {thread.title} ({status_text})")
+
+        # File context
+        file_context = PrettyFormatter._format_file_context(thread)
+        if file_context:
+            lines.append(f"   {file_context}")
+
+        # Local code context, when loaded
+        lines.extend(PrettyFormatter._format_code_context(thread))
+
+        # Thread metadata
+        lines.append(f"   📝 ID: {thread.thread_id}")
+        lines.append(f"   👤 Author: {thread.author}")
+        lines.append(
+            f"   📅 Created: {thread.created_at.strftime('%Y-%m-%d %H:%M:%S')}"
+        )
+        lines.append(
+            f"   🔄 Updated: {thread.updated_at.strftime('%Y-%m-%d %H:%M:%S')}"
+        )
+        lines.append(f"   💬 Comments: {len(thread.comments)}")
+
+        # Status with color
+        lines.append(f"   🏷️  Status: {status_text}")
+
+        # Show full comment content if there are comments
+        if thread.comments:
+            lines.append("")
+            lines.append("   📝 Comment Details:")
+
+            # Sort comments by creation date to show conversation flow
+            sorted_comments = sorted(thread.comments, key=lambda c: c.created_at)
+
+            for j, comment in enumerate(sorted_comments):
+                is_first = j == 0
+                comment_text = PrettyFormatter._format_comment(comment, is_first)
+                lines.append(comment_text)
+
+                # Add spacing between comments
+                if j < len(sorted_comments) - 1:
+                    lines.append("")
+
+        return lines
 
     @staticmethod
     def format_progress_message(pr_number: int, thread_type: str, limit: int) -> str:
@@ -306,6 +378,48 @@ class PrettyFormatter:
         return f"📝 Found {count} {thread_type}"
 
 
+# Rough lower bound on rendered lines per thread, used to decide on paging
+_MIN_LINES_PER_THREAD = 8
+
+
+def _should_page(thread_count: int) -> bool:
+    """Decide whether pretty output should be streamed through a pager.
+
+    Paging is used only when stdout is an interactive terminal and the
+    threads will not fit on one screen. Set TOADY_NO_PAGER to disable it.
+
+    Args:
+        thread_count: Number of threads that will be displayed
+
+    Returns:
+        True if output should be sent to a pager
+    """
+    if os.environ.get("TOADY_NO_PAGER") or not thread_count:
+        return False
+    if not sys.stdout.isatty():
+        return False
+    terminal_lines = shutil.get_terminal_size().lines
+    return thread_count * _MIN_LINES_PER_THREAD > terminal_lines
+
+
+def _iter_paged_output(
+    threads: list[ReviewThread], summary_msg: Optional[str]
+) -> Iterator[str]:
+    """Yield newline-terminated pretty output chunks for a pager.
+
+    Args:
+        threads: List of ReviewThread objects to display
+        summary_msg: Optional result summary to append after the threads
+
+    Yields:
+        Rendered output chunks
+    """
+    for chunk in PrettyFormatter.iter_threads(threads):
+        yield chunk + "\n"
+    if summary_msg is not None:
+        yield summary_msg + "\n"
+
+
 def format_fetch_output(
     threads: list[ReviewThread],
     pretty: bool = False,
@@ -332,15 +446,23 @@ def format_fetch_output(
             )
             click.echo(progress_msg)
 
+        summary_msg = None
+        if show_progress:
+            summary_msg = PrettyFormatter.format_result_summary(
+                len(threads), thread_type
+            )
+
+        if _should_page(len(threads)):
+            # Stream rendered threads so the pager starts before rendering ends
+            click.echo_via_pager(_iter_paged_output(threads, summary_msg))
+            return
+
         # Show formatted threads
         output = PrettyFormatter.format_threads(threads)
         click.echo(output)
 
         # Show summary if we showed progress
-        if show_progress:
-            summary_msg = PrettyFormatter.format_result_summary(
-                len(threads), thread_type
-            )
+        if summary_msg is not None:
             click.echo(summary_msg)
     else:
         # JSON output - no progress messages
@@ -359,3 +481,15 @@ try:
 except ImportError:
     # PrettyFormatter not available - this is expected during initial module loading
     pass
+
+# Register the delimiter-separated formatters
+from .csv_formatter import CSVFormatter, TSVFormatter  # noqa: E402
+
+FormatterFactory.register("csv", CSVFormatter)
+FormatterFactory.register("tsv", TSVFormatter)
+
+# Register the MessagePack formatter when the optional dependency is installed
+from .msgpack_formatter import MsgpackFormatter, is_msgpack_available  # noqa: E402
+
+if is_msgpack_available():
+    FormatterFactory.register("msgpack", MsgpackFormatter)
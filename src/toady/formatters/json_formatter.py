@@ -10,6 +10,7 @@ from typing import Any, Optional, Union
 
 from ..models.models import Comment, ReviewThread
 from .format_interfaces import BaseFormatter, FormatterError, FormatterOptions
+from .serializers import default_registry
 
 
 class JSONFormatter(BaseFormatter):
@@ -62,10 +63,7 @@ class JSONFormatter(BaseFormatter):
             thread_dicts = []
             for thread in threads:
                 try:
-                    if hasattr(thread, "to_dict"):
-                        thread_dict = thread.to_dict()
-                    else:
-                        thread_dict = self._safe_serialize(thread)
+                    thread_dict = self._serialize_item(thread)
                     thread_dicts.append(thread_dict)
                 except Exception as e:
                     thread_id = getattr(thread, "thread_id", "unknown")
@@ -104,10 +102,7 @@ class JSONFormatter(BaseFormatter):
             comment_dicts = []
             for comment in comments:
                 try:
-                    if hasattr(comment, "to_dict"):
-                        comment_dict = comment.to_dict()
-                    else:
-                        comment_dict = self._safe_serialize(comment)
+                    comment_dict = self._serialize_item(comment)
                     comment_dicts.append(comment_dict)
                 except Exception as e:
                     comment_id = getattr(comment, "comment_id", "unknown")
@@ -166,10 +161,7 @@ class JSONFormatter(BaseFormatter):
             serializable_items = []
             for i, item in enumerate(items):
                 try:
-                    if hasattr(item, "to_dict"):
-                        serializable_item = item.to_dict()
-                    else:
-                        serializable_item = self._safe_serialize(item)
+                    serializable_item = self._serialize_item(item)
                     serializable_items.append(serializable_item)
                 except Exception as e:
                     raise FormatterError(
@@ -322,8 +314,27 @@ class JSONFormatter(BaseFormatter):
         """
         return self.format_object(resolve_info)
 
-    def _safe_serialize(self, obj: Any) -> Any:
-        """Safely serialize an object with enhanced error handling.
+    def _serialize_item(self, item: Any) -> Any:
+        """Serialize a top-level collection item.
+
+        Items of registered types use their precomputed encoder; other items
+        prefer their own ``to_dict`` before falling back to reflection.
+
+        Args:
+            item: Item to serialize.
+
+        Returns:
+            Serializable representation of the item.
+        """
+        encoder = default_registry.lookup(type(item))
+        if encoder is not None:
+            return encoder(item, self._safe_serialize)
+        if hasattr(item, "to_dict"):
+            return item.to_dict()
+        return self._safe_serialize(item)
+
+    def _reflective_serialize(self, obj: Any) -> Any:
+        """Serialize an object of unknown type with enhanced error handling.
 
         Args:
             obj: Object to serialize.
@@ -0,0 +1,271 @@
+"""MessagePack formatter implementation for toady CLI output.
+
+This module provides a compact binary formatter for machine consumers that
+would otherwise parse indented JSON. It requires the optional ``msgpack``
+package (``pip install toady-cli[msgpack]``) and is only registered with the
+FormatterFactory when that package is importable.
+
+Schema:
+    The payload is a single MessagePack value with the same shape as the JSON
+    output, so consumers can switch formats without remapping fields.
+
+    ``toady fetch --format msgpack`` writes an array of thread maps mirroring
+    ``ReviewThread.to_dict``::
+
+        thread_id            str
+        title                str
+        created_at           str   (ISO 8601)
+        updated_at           str   (ISO 8601)
+        status               str   (RESOLVED | UNRESOLVED | PENDING | OUTDATED
+                                    | DISMISSED)
+        author               str
+        comments             array of comment maps (see below)
+        file_path            str | nil
+        line                 int | nil
+        original_line        int | nil
+        start_line           int | nil
+        original_start_line  int | nil
+        diff_side            str | nil
+        is_outdated          bool
+        code_context         map, only present with ``fetch --context``:
+                             commit (str), start_line (int), end_line (int),
+                             lines (array of str)
+
+    Comment maps mirror ``Comment.to_dict``::
+
+        comment_id    str
+        content       str
+        author        str
+        created_at    str   (ISO 8601)
+        updated_at    str   (ISO 8601)
+        parent_id     str | nil
+        thread_id     str
+        review_id     str | nil
+        review_state  str | nil
+        url           str | nil
+        author_name   str | nil
+
+    Strings are UTF-8 encoded using the MessagePack str type. No trailing
+    newline is written after the payload.
+
+Use ``read_msgpack`` or ``read_threads_msgpack`` to decode output in Python.
+"""
+
+from typing import Any, BinaryIO, Optional, Union
+
+from ..models.models import Comment, ReviewThread
+from .format_interfaces import BaseFormatter, FormatterError
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - exercised when msgpack is missing
+    msgpack = None
+
+
+def is_msgpack_available() -> bool:
+    """Check whether the optional msgpack dependency is installed.
+
+    Returns:
+        True if msgpack can be used for formatting and reading.
+    """
+    return msgpack is not None
+
+
+def _require_msgpack() -> None:
+    """Raise a FormatterError if msgpack is not installed.
+
+    Raises:
+        FormatterError: If the msgpack package cannot be imported.
+    """
+    if msgpack is None:
+        raise FormatterError(
+            "The msgpack format requires the 'msgpack' package. "
+            "Install it with: pip install toady-cli[msgpack]"
+        )
+
+
+class MsgpackFormatter(BaseFormatter):
+    """Formatter that produces compact MessagePack binary output.
+
+    Output mirrors the JSON formatter's structure but is returned as
+    ``bytes`` instead of ``str``. Callers writing to stdout should pass the
+    bytes to ``click.echo`` with ``nl=False``.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the MessagePack formatter.
+
+        Args:
+            **kwargs: Additional options passed to the base formatter.
+
+        Raises:
+            FormatterError: If msgpack is not installed.
+        """
+        _require_msgpack()
+        super().__init__(**kwargs)
+
+    def format_threads(self, threads: list[ReviewThread]) -> bytes:  # type: ignore[override]
+        """Format a list of review threads as MessagePack.
+
+        Args:
+            threads: List of ReviewThread objects to format.
+
+        Returns:
+            MessagePack encoded array of thread maps.
+
+        Raises:
+            FormatterError: If serialization fails.
+        """
+        return self._pack(threads, "threads")
+
+    def format_comments(self, comments: list[Comment]) -> bytes:  # type: ignore[override]
+        """Format a list of comments as MessagePack.
+
+        Args:
+            comments: List of Comment objects to format.
+
+        Returns:
+            MessagePack encoded array of comment maps.
+
+        Raises:
+            FormatterError: If serialization fails.
+        """
+        return self._pack(comments, "comments")
+
+    def format_object(self, obj: Any) -> bytes:  # type: ignore[override]
+        """Format a single object as MessagePack.
+
+        Args:
+            obj: Object to format.
+
+        Returns:
+            MessagePack encoded representation of the object.
+
+        Raises:
+            FormatterError: If serialization fails.
+        """
+        return self._pack(obj, "object")
+
+    def format_array(self, items: list[Any]) -> bytes:  # type: ignore[override]
+        """Format an array of items as MessagePack.
+
+        Args:
+            items: List of items to format.
+
+        Returns:
+            MessagePack encoded array.
+
+        Raises:
+            FormatterError: If serialization fails.
+        """
+        return self._pack(items, "array")
+
+    def format_primitive(  # type: ignore[override]
+        self, value: Union[str, float, bool, None]
+    ) -> bytes:
+        """Format a primitive value as MessagePack.
+
+        Args:
+            value: Primitive value to format.
+
+        Returns:
+            MessagePack encoded value.
+
+        Raises:
+            FormatterError: If serialization fails.
+        """
+        return self._pack(value, "primitive value")
+
+    def format_error(self, error: dict[str, Any]) -> bytes:  # type: ignore[override]
+        """Format an error object as MessagePack.
+
+        Args:
+            error: Error dictionary with error details.
+
+        Returns:
+            MessagePack encoded error map.
+
+        Raises:
+            FormatterError: If serialization fails.
+        """
+        error_dict = dict(error)
+        error_dict.setdefault("error", True)
+        error_dict.setdefault("success", False)
+        return self._pack(error_dict, "error")
+
+    def _pack(self, obj: Any, description: str) -> bytes:
+        """Serialize an object and encode it as MessagePack.
+
+        Args:
+            obj: Object to encode.
+            description: Description of the object used in error messages.
+
+        Returns:
+            MessagePack encoded bytes.
+
+        Raises:
+            FormatterError: If serialization or encoding fails.
+        """
+        try:
+            packed: bytes = msgpack.packb(self._safe_serialize(obj), use_bin_type=True)
+            return packed
+        except Exception as e:
+            raise FormatterError(
+                f"Failed to format {description} as msgpack: {e!s}", original_error=e
+            ) from e
+
+
+def read_msgpack(source: Union[bytes, BinaryIO]) -> Any:
+    """Decode toady MessagePack output.
+
+    Args:
+        source: Encoded bytes or a binary file object such as
+            ``sys.stdin.buffer``.
+
+    Returns:
+        Decoded payload using plain Python lists, dicts and strings.
+
+    Raises:
+        FormatterError: If msgpack is not installed or the data is invalid.
+    """
+    _require_msgpack()
+
+    data = source if isinstance(source, (bytes, bytearray)) else source.read()
+    try:
+        return msgpack.unpackb(data, raw=False)
+    except Exception as e:
+        raise FormatterError(
+            f"Failed to read msgpack data: {e!s}", original_error=e
+        ) from e
+
+
+def read_threads_msgpack(
+    source: Union[bytes, BinaryIO], as_models: bool = False
+) -> list[Any]:
+    """Decode the output of ``toady fetch --format msgpack``.
+
+    Args:
+        source: Encoded bytes or a binary file object.
+        as_models: If True, return ReviewThread objects instead of dicts.
+
+    Returns:
+        List of thread dictionaries, or ReviewThread objects if requested.
+
+    Raises:
+        FormatterError: If the payload is not an array of threads.
+    """
+    payload = read_msgpack(source)
+    if not isinstance(payload, list):
+        raise FormatterError(
+            f"Expected an array of threads, got {type(payload).__name__}"
+        )
+
+    if as_models:
+        return [ReviewThread.from_dict(thread) for thread in payload]
+    return payload
+
+
+# Default instance for convenience, when msgpack is available
+default_msgpack_formatter: Optional[MsgpackFormatter] = (
+    MsgpackFormatter() if msgpack is not None else None
+)
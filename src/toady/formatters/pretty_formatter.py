@@ -5,6 +5,7 @@ interface, offering colorized output with table formatting and visual enhancemen
 for better readability in terminal environments.
 """
 
+from collections.abc import Iterator
 import re
 import textwrap
 from typing import Any, Optional, Union
@@ -14,6 +15,9 @@ import click
 from ..models.models import Comment, ReviewThread
 from .format_interfaces import BaseFormatter, FormatterError, FormatterOptions
 
+# ANSI escape sequence pattern, compiled once for all width calculations
+ANSI_ESCAPE_PATTERN = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
 
 class PrettyFormatter(BaseFormatter):
     """Pretty formatter that produces human-readable colorized output.
@@ -52,88 +56,114 @@ class PrettyFormatter(BaseFormatter):
         Raises:
             FormatterError: If formatting fails.
         """
-        try:
-            if not threads:
-                return self._style("No review threads found.", "yellow")
+        return "\n".join(self.iter_threads(threads))
 
-            lines = []
-
-            # Header
-            header = "📋 Review Threads"
-            lines.append(self._style(header, "bright_blue", bold=True))
-            lines.append("=" * self.table_width)
+    def iter_threads(self, threads: list[ReviewThread]) -> Iterator[str]:
+        """Render review threads one block at a time.
 
-            for i, thread in enumerate(threads, 1):
-                # Thread status styling
-                status_color = self._get_status_color(thread.status)
-                status_emoji = self._get_status_emoji(thread.status, thread.is_outdated)
-
-                # Thread title with status
-                status_text = self._style(thread.status, status_color, bold=True)
-                title_line = f"\n{i}. {status_emoji} {thread.title} ({status_text})"
-                lines.append(title_line)
-
-                # File context
-                file_context = self._format_file_context(thread)
-                if file_context:
-                    lines.append(f"{self.indent}{file_context}")
-
-                # Thread metadata
-                lines.append(
-                    f"{self.indent}📝 ID: {self._style(thread.thread_id, 'cyan')}"
-                )
-                lines.append(
-                    f"{self.indent}👤 Author: {self._style(thread.author, 'green')}"
-                )
+        Yields the header, each thread and the summary footer as separate
+        chunks so callers can stream output (for example into a pager) before
+        all threads have been rendered. Joining the chunks with newlines gives
+        the same text as ``format_threads``.
 
-                created_str = thread.created_at.strftime("%Y-%m-%d %H:%M:%S")
-                lines.append(
-                    f"{self.indent}📅 Created: {self._style(created_str, 'blue')}"
-                )
-
-                updated_str = thread.updated_at.strftime("%Y-%m-%d %H:%M:%S")
-                lines.append(
-                    f"{self.indent}🔄 Updated: {self._style(updated_str, 'blue')}"
-                )
-
-                comment_count = str(len(thread.comments))
-                lines.append(
-                    f"{self.indent}💬 Comments: {self._style(comment_count, 'magenta')}"
-                )
+        Args:
+            threads: List of ReviewThread objects to format.
 
-                # Show comments if present
-                if thread.comments:
-                    lines.append("")
-                    lines.append(f"{self.indent}📝 Comment Details:")
+        Yields:
+            Rendered chunks of pretty formatted output.
 
-                    sorted_comments = sorted(
-                        thread.comments, key=lambda c: c.created_at
-                    )
-                    for j, comment in enumerate(sorted_comments):
-                        is_first = j == 0
-                        comment_text = self._format_comment(comment, is_first)
-                        lines.append(comment_text)
+        Raises:
+            FormatterError: If formatting fails.
+        """
+        try:
+            if not threads:
+                yield self._style("No review threads found.", "yellow")
+                return
 
-                        if j < len(sorted_comments) - 1:
-                            lines.append("")
+            header = "📋 Review Threads"
+            yield "\n".join(
+                [
+                    self._style(header, "bright_blue", bold=True),
+                    "=" * self.table_width,
+                ]
+            )
+
+            separator = f"{self.indent}" + "─" * (self.table_width - len(self.indent))
+            for i, thread in enumerate(threads, 1):
+                lines = self._format_thread_lines(i, thread)
 
                 # Separator between threads
                 if i < len(threads):
                     lines.append("")
-                    lines.append(
-                        f"{self.indent}" + "─" * (self.table_width - len(self.indent))
-                    )
+                    lines.append(separator)
 
-            # Summary footer
-            lines.append(self._format_summary(threads))
+                yield "\n".join(lines)
 
-            return "\n".join(lines)
+            # Summary footer
+            yield self._format_summary(threads)
 
         except Exception as e:
             raise FormatterError(
                 f"Failed to format threads in pretty format: {e!s}", original_error=e
             ) from e
 
+    def _format_thread_lines(self, index: int, thread: ReviewThread) -> list[str]:
+        """Render the lines for a single numbered thread.
+
+        Args:
+            index: 1-based position of the thread in the output.
+            thread: ReviewThread to render.
+
+        Returns:
+            List of rendered lines for the thread.
+        """
+        lines = []
+
+        # Thread status styling
+        status_color = self._get_status_color(thread.status)
+        status_emoji = self._get_status_emoji(thread.status, thread.is_outdated)
+
+        # Thread title with status
+        status_text = self._style(thread.status, status_color, bold=True)
+        lines.append(f"\n{index}. {status_emoji} {thread.title} ({status_text})")
+
+        # File context
+        file_context = self._format_file_context(thread)
+        if file_context:
+            lines.append(f"{self.indent}{file_context}")
+
+        # Local code context, when loaded
+        lines.extend(self._format_code_context(thread))
+
+        # Thread metadata
+        lines.append(f"{self.indent}📝 ID: {self._style(thread.thread_id, 'cyan')}")
+        lines.append(f"{self.indent}👤 Author: {self._style(thread.author, 'green')}")
+
+        created_str = thread.created_at.strftime("%Y-%m-%d %H:%M:%S")
+        lines.append(f"{self.indent}📅 Created: {self._style(created_str, 'blue')}")
+
+        updated_str = thread.updated_at.strftime("%Y-%m-%d %H:%M:%S")
+        lines.append(f"{self.indent}🔄 Updated: {self._style(updated_str, 'blue')}")
+
+        comment_count = str(len(thread.comments))
+        lines.append(
+            f"{self.indent}💬 Comments: {self._style(comment_count, 'magenta')}"
+        )
+
+        # Show comments if present
+        if thread.comments:
+            lines.append("")
+            lines.append(f"{self.indent}📝 Comment Details:")
+
+            sorted_comments = sorted(thread.comments, key=lambda c: c.created_at)
+            for j, comment in enumerate(sorted_comments):
+                lines.append(self._format_comment(comment, is_first=j == 0))
+
+                if j < len(sorted_comments) - 1:
+                    lines.append("")
+
+        return lines
+
     def format_comments(self, comments: list[Comment]) -> str:
         """Format a list of comments in pretty format.
 
@@ -339,6 +369,9 @@ class PrettyFormatter(BaseFormatter):
         if not self.use_colors:
             return text
 
+        # "dim" is a text attribute rather than a foreground color in click
+        if color == "dim":
+            return click.style(text, dim=True, bold=bold)
         return click.style(text, fg=color, bold=bold)
 
     def _strip_ansi_codes(self, text: str) -> str:
@@ -350,9 +383,7 @@ class PrettyFormatter(BaseFormatter):
         Returns:
             Text with ANSI codes removed.
         """
-        # ANSI escape sequence pattern
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        return ansi_escape.sub("", text)
+        return ANSI_ESCAPE_PATTERN.sub("", text)
 
     def _display_width(self, text: str) -> int:
         """Get the display width of text, excluding ANSI escape codes.
@@ -363,6 +394,8 @@ class PrettyFormatter(BaseFormatter):
         Returns:
             Display width of the text.
         """
+        if "\x1b" not in text:
+            return len(text)
         return len(self._strip_ansi_codes(text))
 
     def _pad_to_width(self, text: str, width: int, fill_char: str = " ") -> str:
@@ -376,12 +409,26 @@ class PrettyFormatter(BaseFormatter):
         Returns:
             Padded text with correct display width.
         """
-        current_width = self._display_width(text)
-        if current_width >= width:
-            return text
+        return self._pad_visible(text, self._display_width(text), width, fill_char)
+
+    @staticmethod
+    def _pad_visible(
+        text: str, visible_width: int, width: int, fill_char: str = " "
+    ) -> str:
+        """Pad text whose visible width is already known.
 
-        padding_needed = width - current_width
-        return text + (fill_char * padding_needed)
+        Args:
+            text: Text to pad (may contain ANSI codes).
+            visible_width: Display width of ``text`` excluding ANSI codes.
+            width: Target display width.
+            fill_char: Character to use for padding.
+
+        Returns:
+            Padded text with correct display width.
+        """
+        if visible_width >= width:
+            return text
+        return text + (fill_char * (width - visible_width))
 
     def _get_status_color(self, status: str) -> str:
         """Get color for thread status.
@@ -455,6 +502,41 @@ class PrettyFormatter(BaseFormatter):
 
         return f"\n{self.indent}".join(context_parts)
 
+    def _format_code_context(self, thread: ReviewThread) -> list[str]:
+        """Format the code context attached to a thread.
+
+        Args:
+            thread: ReviewThread that may carry code context.
+
+        Returns:
+            Formatted lines with commented lines highlighted, or an empty list
+            if there is no context.
+        """
+        context = thread.code_context
+        if not context or not context.get("lines"):
+            return []
+
+        first_marked = thread.start_line or thread.line
+        last_marked = thread.line
+        start = context["start_line"]
+        number_width = len(str(start + len(context["lines"]) - 1))
+
+        commit = self._style(str(context.get("commit", ""))[:7], "cyan")
+        lines = [f"{self.indent}📄 Code @ {commit}:"]
+        for offset, text in enumerate(context["lines"]):
+            number = start + offset
+            if (
+                first_marked is not None
+                and last_marked is not None
+                and first_marked <= number <= last_marked
+            ):
+                gutter = self._style(f"> {number:>{number_width}} │", "yellow")
+                lines.append(f"{self.indent} {gutter} {text}")
+            else:
+                gutter = self._style(f"  {number:>{number_width}} │", "dim")
+                lines.append(f"{self.indent} {gutter} {self._style(text, 'dim')}")
+        return lines
+
     def _format_comment(self, comment: Comment, is_first: bool = False) -> str:
         """Format a single comment with proper styling.
 
@@ -497,6 +579,19 @@ class PrettyFormatter(BaseFormatter):
 
         return "\n".join(lines)
 
+    def _get_text_wrapper(self) -> textwrap.TextWrapper:
+        """Get a text wrapper for comment content, reused between comments.
+
+        Returns:
+            TextWrapper sized for the current text width and indentation.
+        """
+        width = self.text_width - len(self.indent) - 3
+        wrapper = getattr(self, "_text_wrapper", None)
+        if wrapper is None or wrapper.width != width:
+            wrapper = textwrap.TextWrapper(width=width)
+            self._text_wrapper = wrapper
+        return wrapper
+
     def _wrap_comment_content(self, content: str) -> list[str]:
         """Wrap comment content with proper formatting.
 
@@ -509,28 +604,28 @@ class PrettyFormatter(BaseFormatter):
         lines = []
         content_lines = content.split("\n")
         in_code_block = False
+        prefix = f"{self.indent}   "
+        wrapper = self._get_text_wrapper()
 
         for line in content_lines:
-            if line.strip().startswith("```"):
+            stripped = line.strip()
+            if stripped.startswith("```"):
                 in_code_block = not in_code_block
-                lines.append(f"{self.indent}   {self._style(line, 'dim')}")
+                lines.append(f"{prefix}{self._style(line, 'dim')}")
             elif in_code_block:
                 # Preserve code formatting
-                lines.append(f"{self.indent}   {self._style(line, 'white')}")
+                lines.append(f"{prefix}{self._style(line, 'white')}")
+            elif not stripped:
+                lines.append("")
+            elif len(stripped) <= wrapper.width and stripped.isprintable():
+                # Short lines without tabs or control characters wrap to
+                # themselves, so skip the wrapper entirely
+                lines.append(f"{prefix}{stripped}")
             else:
                 # Wrap regular text
-                if line.strip():
-                    wrapped = textwrap.fill(
-                        line.strip(),
-                        width=self.text_width - len(self.indent) - 3,
-                        initial_indent="",
-                        subsequent_indent="",
-                    )
-                    for wrapped_line in wrapped.split("\n"):
-                        if wrapped_line.strip():
-                            lines.append(f"{self.indent}   {wrapped_line}")
-                else:
-                    lines.append("")
+                for wrapped_line in wrapper.wrap(stripped):
+                    if wrapped_line.strip():
+                        lines.append(f"{prefix}{wrapped_line}")
 
         return lines
 
@@ -577,15 +672,20 @@ class PrettyFormatter(BaseFormatter):
 
         headers = sorted(all_keys)
 
-        # Calculate column widths based on display width (excluding ANSI codes)
-        col_widths = {}
-        for header in headers:
-            col_widths[header] = len(header)
-            for item in items:
+        # Render each cell's plain text and visible width once; the widths
+        # drive both column sizing and padding so styled text is never
+        # re-stripped of ANSI codes.
+        rows = []
+        col_widths = {header: len(header) for header in headers}
+        for item in items:
+            row = []
+            for header in headers:
                 value = str(item.get(header, ""))
-                # Use display width in case value contains ANSI codes
                 display_width = self._display_width(value)
-                col_widths[header] = max(col_widths[header], display_width)
+                if display_width > col_widths[header]:
+                    col_widths[header] = display_width
+                row.append((value, display_width))
+            rows.append(row)
 
         # Limit column widths
         max_col_width = max(10, (self.table_width - len(headers) * 3) // len(headers))
@@ -599,8 +699,11 @@ class PrettyFormatter(BaseFormatter):
         for header in headers:
             truncated_header = header[: col_widths[header]]
             header_text = self._style(truncated_header, "bright_blue", bold=True)
-            padded_header = self._pad_to_width(header_text, col_widths[header])
-            header_parts.append(padded_header)
+            header_parts.append(
+                self._pad_visible(
+                    header_text, len(truncated_header), col_widths[header]
+                )
+            )
         lines.append(" | ".join(header_parts))
 
         # Separator
@@ -608,30 +711,51 @@ class PrettyFormatter(BaseFormatter):
         lines.append("-|-".join(sep_parts))
 
         # Data rows
-        for item in items:
+        column_styles = [self._get_column_style(header) for header in headers]
+        for row in rows:
             row_parts = []
-            for header in headers:
-                value = str(item.get(header, ""))
-                if len(value) > col_widths[header]:
-                    value = value[: col_widths[header] - 3] + "..."
+            for header, style, (value, display_width) in zip(
+                headers, column_styles, row
+            ):
+                col_width = col_widths[header]
+                if display_width > col_width:
+                    value = self._strip_ansi_codes(value)[: col_width - 3] + "..."
+                    display_width = len(value)
 
                 # Style different data types
-                if header.lower() in ["id", "number"]:
-                    styled_value = self._style(value, "cyan")
-                elif header.lower() in ["status", "state"]:
-                    color = self._get_status_color(value)
-                    styled_value = self._style(value, color)
-                elif header.lower() in ["author", "user"]:
-                    styled_value = self._style(value, "green")
+                if style == "status":
+                    styled_value = self._style(value, self._get_status_color(value))
+                elif style:
+                    styled_value = self._style(value, style)
                 else:
                     styled_value = value
 
-                padded_value = self._pad_to_width(styled_value, col_widths[header])
-                row_parts.append(padded_value)
+                row_parts.append(
+                    self._pad_visible(styled_value, display_width, col_width)
+                )
             lines.append(" | ".join(row_parts))
 
         return "\n".join(lines)
 
+    @staticmethod
+    def _get_column_style(header: str) -> Optional[str]:
+        """Get the style applied to values in a table column.
+
+        Args:
+            header: Column header name.
+
+        Returns:
+            Color name, "status" for status-colored columns, or None.
+        """
+        name = header.lower()
+        if name in ["id", "number"]:
+            return "cyan"
+        if name in ["status", "state"]:
+            return "status"
+        if name in ["author", "user"]:
+            return "green"
+        return None
+
     def _format_summary(self, threads: list[ReviewThread]) -> str:
         """Format summary footer for threads.
 
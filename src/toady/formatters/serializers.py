@@ -0,0 +1,242 @@
+"""Type-dispatched serializers for converting toady objects to JSON-ready data.
+
+This module provides a registry that maps known types to precomputed encoding
+functions. Model encoders are generated once from the dataclass field
+definitions, so serializing large thread lists is a dictionary lookup plus
+direct attribute access instead of repeated ``hasattr`` probing. Objects of
+unknown types are handed to a caller-supplied fallback, which keeps the
+formatters' existing reflection-based behavior for anything unregistered.
+"""
+
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+import typing
+from typing import Any, Callable, Optional
+
+from ..models.models import Comment, PullRequest, ReviewThread
+
+# An encoder receives the object and a callback for serializing nested values.
+Encoder = Callable[[Any, Callable[[Any], Any]], Any]
+
+
+def _passthrough(value: Any) -> Any:
+    """Return a value unchanged."""
+    return value
+
+
+def _encode_identity(obj: Any, _serialize: Callable[[Any], Any]) -> Any:
+    """Return JSON-native values unchanged."""
+    return obj
+
+
+def _encode_temporal(obj: Any, _serialize: Callable[[Any], Any]) -> Any:
+    """Encode datetime and date objects as ISO 8601 strings."""
+    return obj.isoformat()
+
+
+def _encode_dict(obj: Any, serialize: Callable[[Any], Any]) -> Any:
+    """Encode a mapping by serializing each of its values."""
+    return {key: serialize(value) for key, value in obj.items()}
+
+
+def _encode_sequence(obj: Any, serialize: Callable[[Any], Any]) -> Any:
+    """Encode a list or tuple by serializing each of its items."""
+    return [serialize(item) for item in obj]
+
+
+class SerializerRegistry:
+    """Registry of per-type encoders with cached lookup.
+
+    Encoders are resolved by exact type first. Types registered with
+    ``subclasses=True`` also match their subclasses; the result of walking the
+    MRO is cached so each concrete type is only resolved once.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._exact: dict[type, Encoder] = {}
+        self._inheritable: dict[type, Encoder] = {}
+        self._cache: dict[type, Optional[Encoder]] = {}
+
+    def register(self, cls: type, encoder: Encoder, subclasses: bool = False) -> None:
+        """Register an encoder for a type.
+
+        Args:
+            cls: Type the encoder handles.
+            encoder: Function called as ``encoder(obj, serialize)``.
+            subclasses: Whether subclasses of ``cls`` should use the encoder.
+        """
+        self._exact[cls] = encoder
+        if subclasses:
+            self._inheritable[cls] = encoder
+        self._cache.clear()
+
+    def register_model(self, model_cls: type) -> None:
+        """Generate and register an encoder for a dataclass model.
+
+        Args:
+            model_cls: Dataclass type to generate an encoder for.
+
+        Raises:
+            TypeError: If ``model_cls`` is not a dataclass.
+        """
+        self.register(model_cls, self._build_model_encoder(model_cls))
+
+    def lookup(self, cls: type) -> Optional[Encoder]:
+        """Find the encoder for a type.
+
+        Args:
+            cls: Type to look up.
+
+        Returns:
+            The registered encoder, or None if the type is unknown.
+        """
+        encoder = self._exact.get(cls)
+        if encoder is not None:
+            return encoder
+
+        try:
+            return self._cache[cls]
+        except KeyError:
+            pass
+
+        resolved: Optional[Encoder] = None
+        for base in cls.__mro__[1:]:
+            if base in self._inheritable:
+                resolved = self._inheritable[base]
+                break
+        self._cache[cls] = resolved
+        return resolved
+
+    def serialize(self, obj: Any, fallback: Callable[[Any], Any]) -> Any:
+        """Serialize an object, delegating unknown types to ``fallback``.
+
+        Args:
+            obj: Object to serialize.
+            fallback: Function used for objects without a registered encoder.
+
+        Returns:
+            JSON-ready representation of the object.
+        """
+
+        def serialize_value(value: Any) -> Any:
+            encoder = self.lookup(type(value))
+            if encoder is None:
+                return fallback(value)
+            return encoder(value, serialize_value)
+
+        return serialize_value(obj)
+
+    def _build_model_encoder(self, model_cls: type) -> Encoder:
+        """Generate a direct encoder from a dataclass's field definitions.
+
+        The encoder is compiled from source built once per model, in the same
+        way ``dataclasses`` generates ``__init__``, so encoding an instance is
+        a single dict display with no per-field dispatch. Datetime fields are
+        converted with ``isoformat`` and list fields holding other dataclass
+        models are encoded with those models' encoders. Keys follow field
+        declaration order, matching the models' ``to_dict`` output; fields
+        whose metadata sets ``omit_if_none`` are left out when they are None.
+
+        Args:
+            model_cls: Dataclass type to build an encoder for.
+
+        Returns:
+            Encoder for instances of ``model_cls``.
+
+        Raises:
+            TypeError: If ``model_cls`` is not a dataclass.
+        """
+        if not is_dataclass(model_cls):
+            raise TypeError(f"{model_cls.__name__} is not a dataclass")
+
+        hints = typing.get_type_hints(model_cls)
+        namespace: dict[str, Any] = {"_isoformat_or_none": _isoformat_or_none}
+        entries = []
+        optional_entries = []
+
+        for model_field in fields(model_cls):
+            name = model_field.name
+            hint = hints.get(name)
+            value = f"obj.{name}"
+
+            if hint is datetime:
+                value = f"_isoformat_or_none({value})"
+            elif typing.get_origin(hint) is list:
+                (item_type,) = typing.get_args(hint) or (Any,)
+                if isinstance(item_type, type) and is_dataclass(item_type):
+                    converter = f"_convert_{name}"
+                    namespace[converter] = self._list_converter(item_type)
+                    value = f"{converter}({value})"
+
+            if model_field.metadata.get("omit_if_none"):
+                optional_entries.append((name, value))
+            else:
+                entries.append(f"{name!r}: {value}")
+
+        lines = [
+            "def encode_model(obj, _serialize):",
+            f"    data = {{{', '.join(entries)}}}",
+        ]
+        for name, value in optional_entries:
+            lines.append(f"    if obj.{name} is not None:")
+            lines.append(f"        data[{name!r}] = {value}")
+        lines.append("    return data")
+        source = "\n".join(lines) + "\n"
+        exec(source, namespace)  # noqa: S102 - source built from field names
+        encoder: Encoder = namespace["encode_model"]
+        encoder.__qualname__ = f"encode_{model_cls.__name__}"
+        return encoder
+
+    def _list_converter(self, item_type: type) -> Callable[[Any], Any]:
+        """Create a converter for lists of a nested dataclass model.
+
+        The nested encoder is resolved on first use so models can be
+        registered in any order.
+        """
+        resolved: list[Encoder] = []
+
+        def convert(items: Any) -> Any:
+            if not resolved:
+                encoder = self.lookup(item_type)
+                if encoder is None:
+                    return [item.to_dict() for item in items]
+                resolved.append(encoder)
+            encode_item = resolved[0]
+            # Generated model encoders never call back into serialize
+            return [encode_item(item, _passthrough) for item in items]
+
+        return convert
+
+
+def _isoformat_or_none(value: Any) -> Any:
+    """Convert a datetime to ISO format, passing None through."""
+    return value.isoformat() if value is not None else None
+
+
+def create_default_registry() -> SerializerRegistry:
+    """Create a registry preloaded with toady's models and builtin types.
+
+    Returns:
+        Configured SerializerRegistry instance.
+    """
+    registry = SerializerRegistry()
+
+    for primitive in (str, int, float, bool, type(None)):
+        registry.register(primitive, _encode_identity)
+
+    registry.register(datetime, _encode_temporal, subclasses=True)
+    registry.register(date, _encode_temporal, subclasses=True)
+    registry.register(dict, _encode_dict, subclasses=True)
+    registry.register(list, _encode_sequence, subclasses=True)
+    registry.register(tuple, _encode_sequence, subclasses=True)
+
+    registry.register_model(Comment)
+    registry.register_model(ReviewThread)
+    registry.register_model(PullRequest)
+
+    return registry
+
+
+# Shared registry used by the formatters
+default_registry = create_default_registry()
@@ -54,6 +54,9 @@ class ReviewThread:
         original_start_line: Original start line before diff (optional)
         diff_side: Side of diff (LEFT, RIGHT) (optional)
         is_outdated: Whether the thread is outdated (optional)
+        code_context: Source lines around the thread's location, read from the
+            local repository; omitted from serialization when not loaded
+            (optional)
     """
 
     thread_id: str
@@ -70,6 +73,9 @@ class ReviewThread:
     original_start_line: Optional[int] = None
     diff_side: Optional[str] = None
     is_outdated: bool = False
+    code_context: Optional[dict[str, Any]] = field(
+        default=None, metadata={"omit_if_none": True}
+    )
 
     # Valid status values
     VALID_STATUSES = {"RESOLVED", "UNRESOLVED", "PENDING", "OUTDATED", "DISMISSED"}
@@ -204,7 +210,7 @@ class ReviewThread:
         # Convert Comment objects to dictionaries
         serialized_comments = [comment.to_dict() for comment in self.comments]
 
-        return {
+        data: dict[str, Any] = {
             "thread_id": self.thread_id,
             "title": self.title,
             "created_at": self.created_at.isoformat(),
@@ -221,6 +227,12 @@ class ReviewThread:
             "is_outdated": self.is_outdated,
         }
 
+        # Code context is only present when it was loaded for this thread
+        if self.code_context is not None:
+            data["code_context"] = self.code_context
+
+        return data
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ReviewThread":
         """Create a ReviewThread from a dictionary.
@@ -298,6 +310,7 @@ class ReviewThread:
             original_start_line=data.get("original_start_line"),
             diff_side=data.get("diff_side"),
             is_outdated=bool(data.get("is_outdated", False)),
+            code_context=data.get("code_context"),
         )
 
     @property
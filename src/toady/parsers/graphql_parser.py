@@ -2,11 +2,18 @@
 
 This module provides basic GraphQL query parsing functionality
 to extract fields, arguments, and structure for validation.
+
+:func:`tokenize` splits a document into tokens in a single regex-driven scan
+and :class:`GraphQLParser` builds the operation from them by recursive
+descent, so parsing takes time linear in the size of the document however
+deeply its selections are nested. Syntax errors report the line and column
+where they were found.
 """
 
 from dataclasses import dataclass, field
+import json
 import re
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
 
 @dataclass
@@ -30,79 +37,200 @@ class GraphQLOperation:
     selections: list[GraphQLField] = field(default_factory=list)
 
 
-class GraphQLParser:
-    """Simple GraphQL query parser for validation."""
+OPERATION_TYPES = ("query", "mutation", "subscription")
+
+# Each match skips ignored text (whitespace, commas, comments) and captures one
+# token in the group named after its kind. "error" catches anything invalid and
+# \Z ends the scan after trailing ignored text, so matches never backtrack.
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?:[\s,\ufeff]+|\#[^\n\r]*)*
+    (?:
+        (?P<spread>\.\.\.)
+        |(?P<punctuator>[!$&():=@\[\]{|}])
+        |(?P<float>-?(?:0|[1-9][0-9]*)
+            (?:\.[0-9]+(?:[eE][+-]?[0-9]+)?|[eE][+-]?[0-9]+))
+        |(?P<int>-?(?:0|[1-9][0-9]*))
+        |(?P<block_string>\"\"\"(?:[^"\\]|\\[\s\S]|"(?!""))*\"\"\")
+        |(?P<string>"(?:[^"\\\n\r]|\\.)*")
+        |(?P<name>[_A-Za-z][_0-9A-Za-z]*)
+        |(?P<error>[\s\S])
+        |\Z
+    )
+    """,
+    re.VERBOSE,
+)
+
+
+class GraphQLSyntaxError(ValueError):
+    """Raised when a GraphQL document cannot be parsed."""
+
+    def __init__(self, message: str, source: str, position: int) -> None:
+        """Initialize the error with the location it refers to.
 
-    def __init__(self) -> None:
-        """Initialize the parser."""
-        self._type_stack: list[str] = []
+        Args:
+            message: Description of the problem
+            source: The document being parsed
+            position: Offset of the problem in the document
+        """
+        self.line = source.count("\n", 0, position) + 1
+        self.column = position - source.rfind("\n", 0, position)
+        super().__init__(f"{message} at line {self.line}, column {self.column}")
 
-    def parse(self, query: str) -> GraphQLOperation:
-        """Parse a GraphQL query string.
 
-        Args:
-            query: GraphQL query string
+class Token(NamedTuple):
+    """A lexical token of a GraphQL document."""
 
-        Returns:
-            Parsed GraphQL operation
+    kind: str  # "spread", "punctuator", "name", "int", "float", "string", ...
+    value: str  # Source text of the token
+    start: int  # Offset of the token in the document
 
-        Raises:
-            ValueError: If query is invalid
-        """
-        # Clean up the query
-        query = self._clean_query(query)
 
-        # Extract operation
-        operation = self._parse_operation(query)
+def tokenize(source: str) -> list[Token]:
+    """Split a GraphQL document into tokens.
 
-        return operation
+    Whitespace, commas and comments are dropped. The result always ends
+    with an "eof" token.
 
-    def _clean_query(self, query: str) -> str:
-        """Clean up GraphQL query by removing comments and extra whitespace."""
-        # Remove single-line comments
-        query = re.sub(r"#.*$", "", query, flags=re.MULTILINE)
+    Args:
+        source: GraphQL document
 
-        # Remove extra whitespace while preserving structure
-        query = re.sub(r"\s+", " ", query)
-        query = query.strip()
+    Returns:
+        Tokens in document order
 
-        return query
+    Raises:
+        GraphQLSyntaxError: If the document contains an invalid character or
+            an unterminated string
+    """
+    tokens = []
+    for token_match in _TOKEN_PATTERN.finditer(source):
+        kind = token_match.lastgroup
+        if kind is None:
+            continue
+        value = token_match.group(kind)
+        position = token_match.start(kind)
+        if kind == "error":
+            if value == '"':
+                raise GraphQLSyntaxError("Unterminated string", source, position)
+            raise GraphQLSyntaxError(
+                f"Unexpected character {value!r}", source, position
+            )
+        tokens.append(Token(kind, value, position))
+    tokens.append(Token("eof", "", len(source)))
+    return tokens
 
-    def _parse_operation(self, query: str) -> GraphQLOperation:
-        """Parse the main operation from the query."""
-        # Match operation type and name - support subscriptions and shorthand queries
-        op_match = re.match(
-            r"^(query|mutation|subscription)?\s*(\w+)?\s*(\([^)]*\))?\s*{",
-            query,
-            re.IGNORECASE,
-        )
 
-        if not op_match:
-            raise ValueError("Invalid GraphQL operation format")
+class GraphQLParser:
+    """Simple GraphQL query parser for validation."""
 
-        op_type = (
-            op_match.group(1) or "query"
-        ).lower()  # Default to query for shorthand
-        op_name = op_match.group(2)
-        variables_str = op_match.group(3)
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        self._source = ""
+        self._tokens: list[Token] = []
+        self._index = 0
+        self._fragments: dict[str, GraphQLField] = {}
+        self._spreads: list[tuple[GraphQLField, Token]] = []
+        self._fragment_spreads: dict[str, list[Token]] = {}
+        self._current_fragment: Optional[str] = None
 
-        # Parse variables if present
-        variables = {}
-        if variables_str:
-            variables = self._parse_variables(variables_str)
+    def parse(self, query: str) -> GraphQLOperation:
+        """Parse a GraphQL query string.
 
-        # Find the main selection set
-        selection_start = query.find("{", op_match.end() - 1)
-        selection_end = self._find_matching_brace(query, selection_start)
+        The first operation in the document is returned. Named fragment
+        spreads are resolved against the document's fragment definitions and
+        appear, like inline fragments, as ``__fragment_<Type>`` pseudo-fields.
 
-        if selection_end == -1:
-            raise ValueError("Unmatched braces in query")
+        Args:
+            query: GraphQL query string
 
-        selection_str = query[selection_start + 1 : selection_end]
+        Returns:
+            Parsed GraphQL operation
 
-        # Parse selections
-        selections = self._parse_selections(selection_str, op_type.capitalize())
+        Raises:
+            ValueError: If query is invalid (a GraphQLSyntaxError carrying
+                the line and column of the problem)
+        """
+        self._source = query
+        self._tokens = tokenize(query)
+        self._index = 0
+        self._fragments = {}
+        self._spreads = []
+        self._fragment_spreads = {}
+
+        operation = None
+        while self._tokens[self._index].kind != "eof":
+            if self._tokens[self._index].value == "fragment":
+                self._parse_fragment_definition()
+            else:
+                parsed = self._parse_operation()
+                if operation is None:
+                    operation = parsed
+
+        if operation is None:
+            raise self._error(
+                "Invalid GraphQL operation format", self._tokens[self._index]
+            )
+        self._resolve_spreads()
+        return operation
 
+    def _error(self, message: str, token: Token) -> GraphQLSyntaxError:
+        """Create a syntax error located at a token."""
+        return GraphQLSyntaxError(message, self._source, token.start)
+
+    def _describe(self, token: Token) -> str:
+        """Describe a token for error messages."""
+        return "end of query" if token.kind == "eof" else repr(token.value)
+
+    def _at(self, value: str) -> bool:
+        """Check whether the current token is the given punctuator."""
+        return self._tokens[self._index].value == value
+
+    def _advance(self) -> Token:
+        """Consume and return the current token."""
+        token = self._tokens[self._index]
+        if token.kind != "eof":
+            self._index += 1
+        return token
+
+    def _expect(self, value: str) -> Token:
+        """Consume the given punctuator or fail."""
+        token = self._tokens[self._index]
+        if token.value != value or token.kind not in ("punctuator", "spread"):
+            raise self._error(
+                f"Expected {value!r} but found {self._describe(token)}", token
+            )
+        self._index += 1
+        return token
+
+    def _expect_name(self) -> Token:
+        """Consume a name or fail."""
+        token = self._tokens[self._index]
+        if token.kind != "name":
+            raise self._error(
+                f"Expected a name but found {self._describe(token)}", token
+            )
+        self._index += 1
+        return token
+
+    def _parse_operation(self) -> GraphQLOperation:
+        """Parse an operation definition, possibly in shorthand form."""
+        token = self._tokens[self._index]
+        op_name = None
+        variables: dict[str, str] = {}
+        if token.value == "{" and token.kind == "punctuator":
+            op_type = "query"  # Shorthand query
+        elif token.kind == "name" and token.value.lower() in OPERATION_TYPES:
+            self._index += 1
+            op_type = token.value.lower()
+            if self._tokens[self._index].kind == "name":
+                op_name = self._advance().value
+            if self._at("("):
+                variables = self._parse_variable_definitions()
+            self._skip_directives()
+        else:
+            raise self._error("Invalid GraphQL operation format", token)
+
+        selections = self._parse_selection_set(op_type.capitalize())
         return GraphQLOperation(
             type=op_type,
             name=op_name,
@@ -110,103 +238,127 @@ class GraphQLParser:
             selections=selections,
         )
 
-    def _parse_variables(self, variables_str: str) -> dict[str, str]:
+    def _parse_fragment_definition(self) -> None:
+        """Parse a named fragment definition and remember it."""
+        self._advance()  # "fragment"
+        name_token = self._expect_name()
+        on_token = self._expect_name()
+        if on_token.value != "on":
+            raise self._error(
+                f"Expected 'on' but found {self._describe(on_token)}", on_token
+            )
+        type_name = self._expect_name().value
+        self._skip_directives()
+
+        self._current_fragment = name_token.value
+        self._fragment_spreads[name_token.value] = []
+        try:
+            selections = self._parse_selection_set(type_name)
+        finally:
+            self._current_fragment = None
+        self._fragments[name_token.value] = GraphQLField(
+            name=f"__fragment_{type_name}", selections=selections
+        )
+
+    def _parse_variable_definitions(self) -> dict[str, str]:
         """Parse variable declarations."""
         variables = {}
-
-        # Remove parentheses
-        variables_str = variables_str.strip("()")
-
-        # Simple variable parsing (doesn't handle all cases)
-        var_pattern = r"\$(\w+)\s*:\s*([^,\s]+)"
-        for match in re.finditer(var_pattern, variables_str):
-            var_name = match.group(1)
-            var_type = match.group(2)
-            variables[var_name] = var_type
-
+        self._expect("(")
+        while not self._at(")"):
+            self._expect("$")
+            var_name = self._expect_name().value
+            self._expect(":")
+            variables[var_name] = self._parse_type()
+            if self._at("="):
+                self._advance()
+                self._parse_value()
+            self._skip_directives()
+        self._advance()
         return variables
 
-    def _parse_selections(
-        self, selection_str: str, parent_type: str
-    ) -> list[GraphQLField]:
+    def _parse_type(self) -> str:
+        """Parse a type reference such as ``[String!]!``."""
+        if self._at("["):
+            self._advance()
+            type_ref = f"[{self._parse_type()}]"
+            self._expect("]")
+        else:
+            type_ref = self._expect_name().value
+        if self._at("!"):
+            self._advance()
+            type_ref += "!"
+        return type_ref
+
+    def _skip_directives(self) -> None:
+        """Skip directives such as ``@include(if: $flag)``."""
+        while self._at("@"):
+            self._advance()
+            self._expect_name()
+            if self._at("("):
+                self._parse_arguments()
+
+    def _parse_selection_set(self, parent_type: str) -> list[GraphQLField]:
         """Parse a selection set."""
-        selections = []
-        current_pos = 0
-
-        while current_pos < len(selection_str):
-            # Skip whitespace
-            while (
-                current_pos < len(selection_str)
-                and selection_str[current_pos].isspace()
-            ):
-                current_pos += 1
-
-            if current_pos >= len(selection_str):
-                break
-
-            # Parse field
-            field, next_pos = self._parse_field(selection_str, current_pos, parent_type)
-            if field:
-                selections.append(field)
-
-            current_pos = next_pos
-
+        opening = self._expect("{")
+        selections: list[GraphQLField] = []
+        while not self._at("}"):
+            if self._tokens[self._index].kind == "eof":
+                raise self._error("Unmatched braces: '{' is never closed", opening)
+            self._parse_selection(parent_type, selections)
+        self._advance()
         return selections
 
-    def _parse_field(
-        self, selection_str: str, start_pos: int, parent_type: str
-    ) -> tuple[Optional[GraphQLField], int]:
-        """Parse a single field from the selection set."""
-        # Skip whitespace
-        while start_pos < len(selection_str) and selection_str[start_pos].isspace():
-            start_pos += 1
-
-        if start_pos >= len(selection_str):
-            return None, start_pos
-
-        # Check for inline fragment (... on Type)
-        if selection_str[start_pos : start_pos + 3] == "...":
-            return self._parse_inline_fragment(selection_str, start_pos, parent_type)
-
-        # Match field pattern: [alias:] fieldName [(args)] [{selections}]
-        field_pattern = r"(\w+\s*:\s*)?(\w+)\s*(\([^)]*\))?\s*({)?"
-
-        match = re.match(field_pattern, selection_str[start_pos:])
-        if not match:
-            return None, start_pos + 1
-
-        alias_part = match.group(1)
-        field_name = match.group(2)
-        args_part = match.group(3)
-        has_selections = match.group(4) is not None
-
-        # Extract alias if present
+    def _parse_selection(
+        self, parent_type: str, selections: list[GraphQLField]
+    ) -> None:
+        """Parse one field or fragment and append it to a selection set."""
+        if not self._at("..."):
+            selections.append(self._parse_field(parent_type))
+            return
+
+        self._advance()
+        token = self._tokens[self._index]
+        if token.kind == "name" and token.value != "on":
+            # Named fragment spread, resolved once the whole document is read
+            self._advance()
+            self._skip_directives()
+            spread = GraphQLField(name=f"...{token.value}", parent_type=parent_type)
+            self._spreads.append((spread, token))
+            if self._current_fragment is not None:
+                self._fragment_spreads[self._current_fragment].append(token)
+            selections.append(spread)
+        elif token.kind == "name":
+            # Inline fragment (... on Type)
+            self._advance()
+            type_name = self._expect_name().value
+            self._skip_directives()
+            # Treat it as a pseudo-field with a special name
+            selections.append(
+                GraphQLField(
+                    name=f"__fragment_{type_name}",
+                    selections=self._parse_selection_set(type_name),
+                    parent_type=parent_type,
+                )
+            )
+        else:
+            # Inline fragment without a type condition selects from the parent
+            self._skip_directives()
+            selections.extend(self._parse_selection_set(parent_type))
+
+    def _parse_field(self, parent_type: str) -> GraphQLField:
+        """Parse a single field: [alias:] name [(args)] [{selections}]."""
+        field_name = self._expect_name().value
         alias = None
-        if alias_part:
-            alias = alias_part.strip().rstrip(":")
-
-        # Parse arguments
-        arguments = {}
-        if args_part:
-            arguments = self._parse_arguments(args_part)
-
-        # Parse nested selections if present
-        selections = []
-        next_pos = start_pos + match.end()
-
-        if has_selections:
-            # Find matching brace
-            selection_start = start_pos + match.end() - 1
-            selection_end = self._find_matching_brace(selection_str, selection_start)
+        if self._at(":"):
+            self._advance()
+            alias = field_name
+            field_name = self._expect_name().value
 
-            if selection_end == -1:
-                raise ValueError(f"Unmatched braces for field {field_name}")
+        arguments = self._parse_arguments() if self._at("(") else {}
+        self._skip_directives()
+        selections = self._parse_selection_set(field_name) if self._at("{") else []
 
-            nested_str = selection_str[selection_start + 1 : selection_end]
-            selections = self._parse_selections(nested_str, field_name)
-            next_pos = selection_end + 1
-
-        field = GraphQLField(
+        return GraphQLField(
             name=field_name,
             alias=alias,
             arguments=arguments,
@@ -214,118 +366,94 @@ class GraphQLParser:
             parent_type=parent_type,
         )
 
-        return field, next_pos
-
-    def _parse_inline_fragment(
-        self, selection_str: str, start_pos: int, parent_type: str
-    ) -> tuple[Optional[GraphQLField], int]:
-        """Parse an inline fragment (... on Type)."""
-        # Pattern for inline fragment: ... on TypeName { selections }
-        fragment_pattern = r"\.\.\.\s+on\s+(\w+)\s*{"
-
-        match = re.match(fragment_pattern, selection_str[start_pos:])
-        if not match:
-            # Skip this fragment for now
-            next_brace = selection_str.find("{", start_pos)
-            if next_brace == -1:
-                return None, len(selection_str)
-
-            end_brace = self._find_matching_brace(selection_str, next_brace)
-            if end_brace == -1:
-                return None, len(selection_str)
-
-            return None, end_brace + 1
-
-        type_name = match.group(1)
-
-        # Find the opening brace
-        selection_start = start_pos + match.end() - 1
-        selection_end = self._find_matching_brace(selection_str, selection_start)
-
-        if selection_end == -1:
-            raise ValueError(f"Unmatched braces for inline fragment on {type_name}")
-
-        # Parse the fragment's selections
-        nested_str = selection_str[selection_start + 1 : selection_end]
-        selections = self._parse_selections(nested_str, type_name)
-
-        # Create a pseudo-field for the inline fragment
-        # We'll treat it as a field with a special name
-        field = GraphQLField(
-            name=f"__fragment_{type_name}",
-            alias=None,
-            arguments={},
-            selections=selections,
-            parent_type=parent_type,
-        )
-
-        return field, selection_end + 1
-
-    def _parse_arguments(self, args_str: str) -> dict[str, Any]:
+    def _parse_arguments(self) -> dict[str, Any]:
         """Parse field arguments."""
         arguments = {}
+        self._expect("(")
+        while not self._at(")"):
+            arg_name = self._expect_name().value
+            self._expect(":")
+            arguments[arg_name] = self._parse_value()
+        self._advance()
+        return arguments
 
-        # Remove parentheses
-        args_str = args_str.strip("()")
-
-        # Simple argument parsing
-        arg_pattern = r"(\w+)\s*:\s*([^,]+)"
-        for match in re.finditer(arg_pattern, args_str):
-            arg_name = match.group(1)
-            arg_value = match.group(2).strip()
-
-            # Handle different value types
-            parsed_value: Any
-            if arg_value.startswith("$"):
-                # Variable reference
-                parsed_value = {"variable": arg_value[1:]}
-            elif arg_value.startswith('"') or arg_value.startswith("'"):
-                # String literal
-                parsed_value = arg_value.strip("\"'")
-            elif arg_value.isdigit():
-                # Number
-                parsed_value = int(arg_value)
-            else:
-                # Other (boolean, enum, etc.)
-                parsed_value = arg_value
-
-            arguments[arg_name] = parsed_value
+    def _parse_value(self) -> Any:
+        """Parse an argument value.
 
-        return arguments
+        Variables become ``{"variable": name}``, numbers and strings their
+        Python values, lists and input objects lists and dicts. Booleans,
+        null and enum values are kept as their source text.
+        """
+        token = self._advance()
+        kind = token.kind
+        if kind == "punctuator":
+            if token.value == "$":
+                return {"variable": self._expect_name().value}
+            if token.value == "[":
+                values = []
+                while not self._at("]"):
+                    if self._tokens[self._index].kind == "eof":
+                        raise self._error("Unmatched brackets", token)
+                    values.append(self._parse_value())
+                self._advance()
+                return values
+            if token.value == "{":
+                fields = {}
+                while not self._at("}"):
+                    field_name = self._expect_name().value
+                    self._expect(":")
+                    fields[field_name] = self._parse_value()
+                self._advance()
+                return fields
+        elif kind == "name":
+            return token.value
+        elif kind == "int":
+            return int(token.value)
+        elif kind == "float":
+            return float(token.value)
+        elif kind == "string":
+            try:
+                return json.loads(token.value)
+            except ValueError as e:
+                raise self._error("Invalid string escape", token) from e
+        elif kind == "block_string":
+            return token.value[3:-3].replace('\\"""', '"""')
+        raise self._error(f"Expected a value but found {self._describe(token)}", token)
+
+    def _resolve_spreads(self) -> None:
+        """Replace named fragment spreads with the fragments they refer to.
 
-    def _find_matching_brace(self, text: str, start_pos: int, offset: int = 0) -> int:
-        """Find the matching closing brace for an opening brace."""
-        if start_pos >= len(text) or text[start_pos] != "{":
-            return -1
-
-        count = 0
-        in_string = False
-        escape_next = False
-
-        for i in range(start_pos, len(text)):
-            char = text[i]
-
-            if escape_next:
-                escape_next = False
-                continue
-
-            if char == "\\":
-                escape_next = True
-                continue
-
-            if char == '"' and not in_string:
-                in_string = True
-            elif char == '"' and in_string:
-                in_string = False
-            elif not in_string:
-                if char == "{":
-                    count += 1
-                elif char == "}":
-                    count -= 1
-                    if count == 0:
-                        return i + offset
-
-        return -1
+        Raises:
+            GraphQLSyntaxError: If a spread names an unknown fragment or
+                fragments spread each other in a cycle
+        """
+        for spread, token in self._spreads:
+            fragment = self._fragments.get(token.value)
+            if fragment is None:
+                raise self._error(f"Unknown fragment {token.value!r}", token)
+            spread.name = fragment.name
+            spread.selections = fragment.selections
+
+        # Fragment spreads must not form cycles, or the result would be
+        # infinitely deep
+        done: set[str] = set()
+        for root in self._fragment_spreads:
+            stack = [(root, iter(self._fragment_spreads[root]))]
+            active = {root}
+            while stack:
+                name, children = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    stack.pop()
+                    active.discard(name)
+                    done.add(name)
+                elif child.value in active:
+                    raise self._error(f"Fragment {child.value!r} spreads itself", child)
+                elif child.value not in done:
+                    active.add(child.value)
+                    stack.append(
+                        (child.value, iter(self._fragment_spreads[child.value]))
+                    )
 
     def extract_all_fields(self, operation: GraphQLOperation) -> set[str]:
         """Extract all field names from an operation.
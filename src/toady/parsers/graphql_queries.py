@@ -113,6 +113,7 @@ class ReviewThreadQueryBuilder:
               number
               title
               url
+              headRefOid
               reviewThreads(first: {self._limit}) {{
                 pageInfo {{
                   hasNextPage
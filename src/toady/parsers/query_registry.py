@@ -0,0 +1,204 @@
+"""Registry of the GraphQL queries toady sends to GitHub.
+
+The query builders in :mod:`.graphql_queries` and the mutation documents of
+the services are written readable and indented. Services send the registered
+form instead: each document or builder configuration is rendered once per
+process, minified and given a stable hash, and every later request with the
+same document reuses it. Minifying drops the indentation, which is most of
+the payload.
+
+:func:`registered_queries` and :func:`registered_mutations` list the
+documents toady sends with its default configuration; ``toady schema
+validate`` checks each of them against GitHub's schema.
+"""
+
+from dataclasses import dataclass
+from functools import cache, lru_cache
+import hashlib
+
+from .graphql_parser import tokenize
+from .graphql_queries import PullRequestQueryBuilder, ReviewThreadQueryBuilder
+
+# Token kinds that need a space between them to stay separate tokens
+_WORD_TOKENS = frozenset({"name", "int", "float"})
+
+
+@dataclass(frozen=True)
+class RegisteredQuery:
+    """A GraphQL document rendered once and minified."""
+
+    name: str
+    document: str
+    hash: str
+
+
+def minify_query(query: str) -> str:
+    """Remove whitespace, commas and comments that GraphQL ignores.
+
+    Args:
+        query: GraphQL document
+
+    Returns:
+        Equivalent document with a single space only where two tokens would
+        otherwise merge.
+
+    Raises:
+        GraphQLSyntaxError: If the document cannot be tokenized
+    """
+    parts = []
+    previous_kind = ""
+    for token in tokenize(query):
+        if token.kind in _WORD_TOKENS and previous_kind in _WORD_TOKENS:
+            parts.append(" ")
+        parts.append(token.value)
+        previous_kind = token.kind
+    return "".join(parts)
+
+
+def _register(name: str, query: str) -> RegisteredQuery:
+    """Minify a rendered document and compute its hash."""
+    document = minify_query(query)
+    digest = hashlib.sha256(document.encode("utf-8")).hexdigest()[:16]
+    return RegisteredQuery(name=name, document=document, hash=digest)
+
+
+@cache
+def review_threads_query(limit: int = 100, comment_limit: int = 10) -> RegisteredQuery:
+    """Get the review threads query for a builder configuration.
+
+    Args:
+        limit: Maximum number of threads to fetch (1-100)
+        comment_limit: Maximum number of comments per thread (1-50)
+
+    Returns:
+        The registered query
+
+    Raises:
+        ValueError: If a limit is out of range
+    """
+    builder = ReviewThreadQueryBuilder().limit(limit).comment_limit(comment_limit)
+    return _register("reviewThreads", builder.build_query())
+
+
+@cache
+def open_pull_requests_query(limit: int = 100) -> RegisteredQuery:
+    """Get the open pull requests query for a builder configuration.
+
+    Args:
+        limit: Maximum number of pull requests to fetch (1-100)
+
+    Returns:
+        The registered query
+
+    Raises:
+        ValueError: If the limit is out of range
+    """
+    builder = PullRequestQueryBuilder().limit(limit)
+    return _register("pullRequests", builder.build_query())
+
+
+@cache
+def registered_document(name: str, document: str) -> RegisteredQuery:
+    """Get the registered form of a fixed document, such as a mutation.
+
+    Args:
+        name: Name to register the document under
+        document: GraphQL document
+
+    Returns:
+        The registered query
+    """
+    return _register(name, document)
+
+
+@cache
+def bulk_resolve_mutation(count: int, undo: bool = False) -> RegisteredQuery:
+    """Get the mutation resolving a batch of ``count`` threads.
+
+    Args:
+        count: Number of threads in the batch
+        undo: If True, unresolve the threads instead
+
+    Returns:
+        The registered mutation
+
+    Raises:
+        ValueError: If count is not positive
+    """
+    from ..services.github_service import build_bulk_resolve_mutation
+
+    return _register(
+        "bulkUnresolveReviewThreads" if undo else "bulkResolveReviewThreads",
+        build_bulk_resolve_mutation(count, undo=undo),
+    )
+
+
+# Which replies of a batch also resolve their thread varies, so only the most
+# recently used combinations are kept
+@lru_cache(maxsize=128)
+def bulk_reply_mutation(
+    count: int, resolve: frozenset[int] = frozenset()
+) -> RegisteredQuery:
+    """Get the mutation posting a batch of ``count`` replies.
+
+    Args:
+        count: Number of replies in the batch
+        resolve: Indexes of replies whose thread is also resolved
+
+    Returns:
+        The registered mutation
+
+    Raises:
+        ValueError: If count is not positive
+    """
+    from ..services.github_service import build_bulk_reply_mutation
+
+    return _register(
+        "bulkAddPullRequestReviewThreadReplies",
+        build_bulk_reply_mutation(count, resolve),
+    )
+
+
+def registered_queries() -> dict[str, RegisteredQuery]:
+    """List the queries toady sends with its default configuration.
+
+    Returns:
+        Mapping of query name to registered query
+    """
+    from ..services.reply_service import REPLY_CONTEXT_QUERY
+    from ..services.resolve_service import VALIDATE_THREADS_QUERY
+
+    queries = [
+        review_threads_query(),
+        open_pull_requests_query(),
+        registered_document("replyContext", REPLY_CONTEXT_QUERY),
+        registered_document("validateThreadsExist", VALIDATE_THREADS_QUERY),
+    ]
+    return {query.name: query for query in queries}
+
+
+def registered_mutations() -> dict[str, RegisteredQuery]:
+    """List the mutations toady sends for single threads and comments.
+
+    Returns:
+        Mapping of mutation name to registered mutation
+    """
+    from ..services.github_service import (
+        REPLY_AND_RESOLVE_THREAD_MUTATION,
+        REPLY_COMMENT_MUTATION,
+        REPLY_THREAD_MUTATION,
+        RESOLVE_THREAD_MUTATION,
+        UNRESOLVE_THREAD_MUTATION,
+    )
+
+    mutations = {
+        "resolveReviewThread": RESOLVE_THREAD_MUTATION,
+        "unresolveReviewThread": UNRESOLVE_THREAD_MUTATION,
+        "addPullRequestReviewThreadReply": REPLY_THREAD_MUTATION,
+        "addPullRequestReviewComment": REPLY_COMMENT_MUTATION,
+        "replyAndResolveReviewThread": REPLY_AND_RESOLVE_THREAD_MUTATION,
+    }
+    return {
+        name: registered_document(name, document)
+        for name, document in mutations.items()
+    }
@@ -0,0 +1,183 @@
+"""Storage primitives for cache files shared by concurrent toady processes.
+
+Many toady processes (for example several agents working on one machine) can
+share ``~/.toady/cache``. Files there are written with :func:`atomic_write_bytes`
+or :func:`atomic_write_text`, so readers only ever see a complete old or new
+file. Read-modify-write cycles and expensive refreshes are serialized with
+:class:`FileLock`, an advisory lock on a separate ``.lock`` file that the
+operating system releases when its holder exits, even after a crash.
+
+On Windows the lock uses ``msvcrt``, where shared locks are exclusive.
+"""
+
+import os
+from pathlib import Path
+import sys
+import time
+from types import TracebackType
+from typing import IO, Optional
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+else:
+    import fcntl
+
+# Seconds between attempts while waiting for a lock held by another process
+LOCK_POLL_INTERVAL = 0.05
+
+
+class LockTimeoutError(Exception):
+    """Raised when a lock cannot be acquired in time."""
+
+
+def atomic_write_bytes(path: Path, contents: bytes) -> None:
+    """Replace a file's contents so readers never see a partial write.
+
+    The data is written to a temporary file in the same directory, flushed
+    to disk and renamed over the destination.
+
+    Args:
+        path: Destination file. Its directory is created if needed.
+        contents: Data to write.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    # Deferred: tempfile is slow to import and most runs never write a cache
+    import tempfile
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}-", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(contents)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_text(path: Path, contents: str) -> None:
+    """Replace a text file's contents atomically, encoded as UTF-8.
+
+    Args:
+        path: Destination file. Its directory is created if needed.
+        contents: Text to write.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    atomic_write_bytes(path, contents.encode("utf-8"))
+
+
+class FileLock:
+    """Advisory inter-process lock held on a lock file.
+
+    Use as a context manager for a blocking exclusive lock, or call
+    :meth:`acquire` with ``blocking=False`` to find out whether another
+    process already holds it.
+    """
+
+    def __init__(self, path: Path, shared: bool = False) -> None:
+        """Initialize the lock without acquiring it.
+
+        Args:
+            path: Lock file, created on first use.
+            shared: Take a shared (reader) lock instead of an exclusive one.
+        """
+        self.path = path
+        self.shared = shared
+        self._file: Optional[IO[bytes]] = None
+
+    @property
+    def locked(self) -> bool:
+        """Whether this instance currently holds the lock."""
+        return self._file is not None
+
+    def acquire(self, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        """Acquire the lock.
+
+        Args:
+            blocking: Wait until the lock is free. If False, return at once.
+            timeout: Maximum seconds to wait when blocking; None waits forever.
+
+        Returns:
+            True if the lock was acquired, False if it is held elsewhere and
+            blocking is False.
+
+        Raises:
+            LockTimeoutError: If the lock is still held after ``timeout``.
+            OSError: If the lock file cannot be opened.
+        """
+        if self._file is not None:
+            return True
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.path, "a+b")  # noqa: SIM115
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._try_lock(lock_file):
+                self._file = lock_file
+                return True
+            if not blocking:
+                lock_file.close()
+                return False
+            if deadline is not None and time.monotonic() >= deadline:
+                lock_file.close()
+                raise LockTimeoutError(f"Timed out waiting for lock {self.path}")
+            time.sleep(LOCK_POLL_INTERVAL)
+
+    def release(self) -> None:
+        """Release the lock if held."""
+        if self._file is None:
+            return
+        try:
+            if sys.platform == "win32":  # pragma: no cover
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def _try_lock(self, lock_file: IO[bytes]) -> bool:
+        """Make one non-blocking attempt to lock the file.
+
+        Args:
+            lock_file: Open lock file.
+
+        Returns:
+            True if the lock was acquired.
+        """
+        try:
+            if sys.platform == "win32":  # pragma: no cover
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                mode = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+                fcntl.flock(lock_file.fileno(), mode | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        return True
+
+    def __enter__(self) -> "FileLock":
+        """Acquire the lock, waiting as long as needed."""
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Release the lock."""
+        self.release()
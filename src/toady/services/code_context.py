@@ -0,0 +1,302 @@
+"""Local code context for review threads read from the git object store.
+
+Review threads only carry a file path and line numbers. This module reads the
+referenced file contents from the local repository with a single long-lived
+``git cat-file --batch`` process, so context for hundreds of threads costs one
+subprocess and no API calls.
+"""
+
+import subprocess
+from typing import IO, Any, Optional
+
+from ..models.models import ReviewThread
+
+
+class CodeContextError(Exception):
+    """Raised when code context cannot be read from the local repository."""
+
+
+class GitBlobReader:
+    """Reads file contents at a revision through ``git cat-file --batch``.
+
+    The git process is started on first use and kept open until ``close`` is
+    called. Blobs are cached by revision and path. Reading from a revision that
+    is not in the local repository, such as a pull request head that has not
+    been fetched, raises ``CodeContextError`` instead of returning None.
+    """
+
+    def __init__(self, repo_path: Optional[str] = None, timeout: int = 10) -> None:
+        """Initialize the blob reader.
+
+        Args:
+            repo_path: Path inside the git repository. Defaults to the current
+                working directory.
+            timeout: Seconds to wait for the git process to exit on close.
+        """
+        self.repo_path = repo_path
+        self.timeout = timeout
+        self._process: Optional[subprocess.Popen[bytes]] = None
+        self._cache: dict[tuple[str, str], Optional[bytes]] = {}
+        self._revisions: dict[str, bool] = {}
+
+    def __enter__(self) -> "GitBlobReader":
+        """Enter the runtime context."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit the runtime context, stopping the git process."""
+        self.close()
+
+    def _start(self) -> "subprocess.Popen[bytes]":
+        """Start the ``git cat-file --batch`` process if needed.
+
+        Returns:
+            The running git process.
+
+        Raises:
+            CodeContextError: If git cannot be started.
+        """
+        if self._process is None or self._process.poll() is not None:
+            try:
+                self._process = subprocess.Popen(
+                    ["git", "cat-file", "--batch"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    cwd=self.repo_path,
+                )
+            except OSError as e:
+                raise CodeContextError(f"Could not start git: {e}") from e
+        return self._process
+
+    def read(self, revision: str, path: str) -> Optional[bytes]:
+        """Read a file's contents at a revision.
+
+        Args:
+            revision: Commit SHA or other git revision.
+            path: Repository-relative file path.
+
+        Returns:
+            File contents, or None if the object is missing or not a file.
+
+        Raises:
+            CodeContextError: If communication with git fails or the revision
+                is not in the local repository.
+        """
+        key = (revision, path)
+        if key in self._cache:
+            return self._cache[key]
+
+        if "\n" in revision or "\n" in path:
+            self._cache[key] = None
+            return None
+
+        found = self._request(f"{revision}:{path}")
+        if found is None and not self._has_revision(revision):
+            raise CodeContextError(
+                f"commit {revision} is not in the local repository; "
+                "run git fetch to get code context"
+            )
+
+        contents = found[1] if found is not None and found[0] == "blob" else None
+        self._cache[key] = contents
+        return contents
+
+    def _has_revision(self, revision: str) -> bool:
+        """Check whether a revision names a commit in the local repository.
+
+        Args:
+            revision: Commit SHA or other git revision.
+
+        Returns:
+            True if the commit is available locally.
+
+        Raises:
+            CodeContextError: If communication with git fails.
+        """
+        if revision not in self._revisions:
+            self._revisions[revision] = (
+                self._request(f"{revision}^{{commit}}") is not None
+            )
+        return self._revisions[revision]
+
+    def _request(self, name: str) -> Optional[tuple[str, bytes]]:
+        """Look up one object by name in the git object store.
+
+        Args:
+            name: Object name understood by ``git cat-file``.
+
+        Returns:
+            The object's type and contents, or None if it is missing.
+
+        Raises:
+            CodeContextError: If communication with git fails.
+        """
+        process = self._start()
+        stdin: IO[bytes] = process.stdin  # type: ignore[assignment]
+        stdout: IO[bytes] = process.stdout  # type: ignore[assignment]
+
+        try:
+            stdin.write(f"{name}\n".encode())
+            stdin.flush()
+            header = stdout.readline().decode("utf-8", errors="replace").split()
+        except (OSError, ValueError) as e:
+            raise CodeContextError(f"Failed to query git object store: {e}") from e
+
+        if not header:
+            raise CodeContextError("git cat-file exited unexpectedly")
+
+        # "<oid> <type> <size>" for found objects, "<name> missing" otherwise
+        if len(header) != 3 or not header[2].isdigit():
+            return None
+        data = stdout.read(int(header[2]))
+        stdout.read(1)  # trailing newline after the object contents
+        return header[1], data
+
+    def close(self) -> None:
+        """Stop the git process."""
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        try:
+            if process.stdin:
+                process.stdin.close()
+            process.wait(timeout=self.timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+        finally:
+            if process.stdout:
+                process.stdout.close()
+
+
+class CodeContextProvider:
+    """Attaches surrounding source lines to review threads."""
+
+    def __init__(
+        self, context_lines: int = 3, reader: Optional[GitBlobReader] = None
+    ) -> None:
+        """Initialize the context provider.
+
+        Args:
+            context_lines: Number of lines to include before and after the
+                commented line range.
+            reader: Blob reader to use. Defaults to a reader for the current
+                repository.
+        """
+        self.context_lines = max(0, context_lines)
+        self.reader = reader or GitBlobReader()
+        self._lines_cache: dict[tuple[str, str], Optional[list[str]]] = {}
+
+    def get_context(
+        self, thread: ReviewThread, revision: str
+    ) -> Optional[dict[str, Any]]:
+        """Build code context for a thread at a revision.
+
+        Only threads on the new side of the diff with a current line number
+        have context, since the lines refer to the head revision.
+
+        Args:
+            thread: Review thread to build context for.
+            revision: Revision the thread's line numbers refer to.
+
+        Returns:
+            Dictionary with ``commit``, ``start_line``, ``end_line`` and
+            ``lines`` keys, or None if no context is available.
+
+        Raises:
+            CodeContextError: If communication with git fails.
+        """
+        if not thread.file_path or thread.line is None or thread.diff_side == "LEFT":
+            return None
+
+        file_lines = self._get_file_lines(revision, thread.file_path)
+        if not file_lines:
+            return None
+
+        first_line = thread.start_line or thread.line
+        start = max(1, min(first_line, thread.line) - self.context_lines)
+        end = min(len(file_lines), thread.line + self.context_lines)
+        if start > end:
+            return None
+
+        return {
+            "commit": revision,
+            "start_line": start,
+            "end_line": end,
+            "lines": file_lines[start - 1 : end],
+        }
+
+    def attach(self, threads: list[ReviewThread], revision: str) -> int:
+        """Attach code context to each thread where it is available.
+
+        Args:
+            threads: Review threads to update in place.
+            revision: Revision the threads' line numbers refer to.
+
+        Returns:
+            Number of threads that received code context.
+
+        Raises:
+            CodeContextError: If communication with git fails.
+        """
+        attached = 0
+        for thread in threads:
+            context = self.get_context(thread, revision)
+            if context is not None:
+                thread.code_context = context
+                attached += 1
+        return attached
+
+    def close(self) -> None:
+        """Release the underlying git process."""
+        self.reader.close()
+
+    def _get_file_lines(self, revision: str, path: str) -> Optional[list[str]]:
+        """Get the decoded lines of a file, cached per revision and path.
+
+        Args:
+            revision: Revision to read the file at.
+            path: Repository-relative file path.
+
+        Returns:
+            List of lines without line endings, or None if unavailable.
+        """
+        key = (revision, path)
+        if key not in self._lines_cache:
+            contents = self.reader.read(revision, path)
+            self._lines_cache[key] = (
+                contents.decode("utf-8", errors="replace").splitlines()
+                if contents is not None
+                else None
+            )
+        return self._lines_cache[key]
+
+
+def attach_code_context(
+    threads: list[ReviewThread],
+    revision: str,
+    context_lines: int = 3,
+    repo_path: Optional[str] = None,
+) -> int:
+    """Attach local code context to threads using one git process.
+
+    Args:
+        threads: Review threads to update in place.
+        revision: Revision the threads' line numbers refer to, normally the
+            pull request's head commit.
+        context_lines: Number of lines before and after the commented lines.
+        repo_path: Path inside the git repository. Defaults to the current
+            working directory.
+
+    Returns:
+        Number of threads that received code context.
+
+    Raises:
+        CodeContextError: If git cannot be run or read from, or the revision
+            has not been fetched into the local repository.
+    """
+    provider = CodeContextProvider(context_lines, GitBlobReader(repo_path))
+    try:
+        return provider.attach(threads, revision)
+    finally:
+        provider.close()
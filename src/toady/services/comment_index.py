@@ -0,0 +1,189 @@
+"""Local index of the repository and thread of fetched reply targets.
+
+``toady reply`` accepts thread node IDs and numeric comment IDs. Without
+knowing which repository such an ID belongs to, every reply first asks
+``gh`` for the current repository. ``toady fetch`` already knows the
+repository of every thread and comment it returns, so it records them here
+under those ID forms and the reply path consults the index first: a reply to
+a fetched thread or comment then needs exactly one request.
+
+The index is a JSON file at ``~/.toady/comment_index.json``::
+
+    {"version": 2, "targets": {"<thread or numeric comment id>": {
+        "repository": "owner/repo", "thread_id": "..."}}}
+
+It is a cache: a missing, unreadable or corrupt index behaves as empty, and
+the oldest entries are dropped once it holds MAX_ENTRIES IDs. Concurrent
+fetches merge their entries under a file lock.
+"""
+
+from collections.abc import Iterable
+import json
+import logging
+from pathlib import Path
+import re
+from typing import Any, NamedTuple, Optional
+
+from ..models.models import ReviewThread
+from .cache_storage import FileLock, atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+
+# Upper bound on indexed IDs; older entries are evicted first
+MAX_ENTRIES = 20000
+
+# Review comment URLs name the repository and the comment's numeric ID
+COMMENT_URL_PATTERN = re.compile(
+    r"^https?://[^/]+/([^/]+/[^/]+)/pull/\d+#discussion_r(\d+)$"
+)
+
+
+class CommentLocation(NamedTuple):
+    """Where a reply target lives.
+
+    Attributes:
+        repository: Repository in owner/repo format.
+        thread_id: ID of the review thread containing the target.
+    """
+
+    repository: str
+    thread_id: str
+
+
+class CommentIndex:
+    """Persistent reply target ID to repository/thread map."""
+
+    def __init__(self, index_path: Optional[Path] = None) -> None:
+        """Initialize the index.
+
+        The index file is read lazily on first use.
+
+        Args:
+            index_path: Location of the index file. Defaults to
+                ~/.toady/comment_index.json.
+        """
+        self.index_path = index_path or Path.home() / ".toady" / "comment_index.json"
+        self._entries: Optional[dict[str, dict[str, Any]]] = None
+
+    def lookup(self, target_id: str) -> Optional[CommentLocation]:
+        """Find the repository and thread of a reply target.
+
+        Args:
+            target_id: Thread node ID or numeric comment ID.
+
+        Returns:
+            CommentLocation, or None if the ID has not been indexed.
+        """
+        entry = self._load().get(target_id)
+        if not entry or not entry.get("repository"):
+            return None
+        return CommentLocation(
+            repository=str(entry["repository"]),
+            thread_id=str(entry.get("thread_id", "")),
+        )
+
+    def record_threads(self, threads: Iterable[ReviewThread]) -> int:
+        """Index the threads and comments of fetched threads and save the index.
+
+        Threads are indexed by node ID and comments by their numeric ID, the
+        forms ``toady reply`` accepts. The repository is taken from the
+        comment URLs, so threads without comments are skipped.
+
+        Args:
+            threads: Fetched review threads.
+
+        Returns:
+            Number of IDs added or updated.
+        """
+        found: dict[str, dict[str, Any]] = {}
+        for thread in threads:
+            entry: Optional[dict[str, Any]] = None
+            for comment in thread.comments:
+                match = COMMENT_URL_PATTERN.match(comment.url or "")
+                if match is None:
+                    continue
+                entry = {"repository": match.group(1), "thread_id": thread.thread_id}
+                found[match.group(2)] = entry
+            if entry is not None:
+                found[thread.thread_id] = entry
+
+        entries = self._load()
+        if all(entries.get(target_id) == entry for target_id, entry in found.items()):
+            return 0
+
+        changed = 0
+        try:
+            # Re-read under the lock so entries other fetches saved are kept
+            with FileLock(self.index_path.with_name(self.index_path.name + ".lock")):
+                self._entries = None
+                changed = self._merge(self._load(), found)
+                atomic_write_text(
+                    self.index_path,
+                    json.dumps(
+                        {"version": INDEX_VERSION, "targets": self._load()},
+                        separators=(",", ":"),
+                    ),
+                )
+        except OSError as e:
+            logger.warning("Cannot write comment index %s: %s", self.index_path, e)
+            changed = changed or self._merge(self._load(), found)
+        return changed
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Load the index file once, treating any problem as an empty index.
+
+        Returns:
+            Mapping of reply target ID to index entry, oldest first.
+        """
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return self._entries
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Ignoring unreadable comment index %s: %s", self.index_path, e
+            )
+            return self._entries
+
+        if (
+            isinstance(data, dict)
+            and data.get("version") == INDEX_VERSION
+            and isinstance(data.get("targets"), dict)
+        ):
+            self._entries = {
+                str(target_id): entry
+                for target_id, entry in data["targets"].items()
+                if isinstance(entry, dict)
+            }
+        return self._entries
+
+    @staticmethod
+    def _merge(
+        entries: dict[str, dict[str, Any]], found: dict[str, dict[str, Any]]
+    ) -> int:
+        """Add entries, most recent last, evicting the oldest beyond MAX_ENTRIES.
+
+        Args:
+            entries: Current entries, oldest first. Updated in place.
+            found: Entries to add or update.
+
+        Returns:
+            Number of IDs added or updated.
+        """
+        changed = 0
+        for target_id, entry in found.items():
+            if entries.get(target_id) != entry:
+                # Re-insert so the entry counts as the most recent
+                entries.pop(target_id, None)
+                entries[target_id] = entry
+                changed += 1
+        for target_id in list(entries)[: max(0, len(entries) - MAX_ENTRIES)]:
+            del entries[target_id]
+        return changed
@@ -0,0 +1,426 @@
+"""Long-lived toady process serving CLI invocations over a Unix socket.
+
+``toady serve`` imports every command once, keeps the shared GitHubService
+and its caches warm and listens on a Unix socket. When the socket exists, the
+``toady`` entry point (:mod:`toady.client`) sends its arguments, working
+directory and environment to the daemon instead of starting the CLI itself,
+then copies the command's output to its own stdout and stderr and exits with
+the command's exit code.
+
+Protocol, one request per connection::
+
+    request  4-byte big-endian length, then a JSON object with
+             "version", "argv", "cwd" and "env" (or "op": "stop")
+    reply    frames of 1-byte kind, 4-byte big-endian length, payload:
+             "o" stdout bytes, "e" stderr bytes, "x" exit code (ASCII),
+             "r" refused, e.g. because the daemon runs another version
+
+Commands run one at a time, because each takes over the process's working
+directory, environment and standard streams while it runs.
+
+This module is imported on every ``toady`` invocation, so the client side
+only uses cheap standard library modules; the server imports the rest when
+it starts.
+"""
+
+import io
+import json
+import os
+import socket
+import struct
+import sys
+from typing import Any, BinaryIO, Optional
+
+from .. import __version__
+
+_LENGTH = struct.Struct(">I")
+
+FRAME_STDOUT = b"o"
+FRAME_STDERR = b"e"
+FRAME_EXIT = b"x"
+FRAME_REFUSED = b"r"
+
+# Seconds a client waits to connect before running the command itself
+CONNECT_TIMEOUT = 1.0
+
+
+class DaemonError(Exception):
+    """Raised when the daemon cannot be started or reached."""
+
+
+def default_socket_path() -> str:
+    """Get the socket the daemon listens on.
+
+    Returns:
+        ``$TOADY_SOCKET`` if set, otherwise ``~/.toady/daemon.sock``
+    """
+    return os.environ.get("TOADY_SOCKET") or os.path.join(
+        os.path.expanduser("~"), ".toady", "daemon.sock"
+    )
+
+
+def _send_message(sock: socket.socket, payload: bytes) -> None:
+    """Send a length-prefixed message."""
+    sock.sendall(_LENGTH.pack(len(payload)) + payload)
+
+
+def _send_frame(sock: socket.socket, kind: bytes, payload: bytes) -> None:
+    """Send one reply frame."""
+    sock.sendall(kind + _LENGTH.pack(len(payload)) + payload)
+
+
+def _recv_exact(stream: BinaryIO, size: int) -> bytes:
+    """Read exactly ``size`` bytes.
+
+    Raises:
+        EOFError: If the connection closes first
+    """
+    data = stream.read(size)
+    if len(data) != size:
+        raise EOFError("connection closed")
+    return data
+
+
+def _recv_message(stream: BinaryIO) -> bytes:
+    """Read a length-prefixed message."""
+    (length,) = _LENGTH.unpack(_recv_exact(stream, _LENGTH.size))
+    return _recv_exact(stream, length)
+
+
+def _recv_frame(stream: BinaryIO) -> tuple[bytes, bytes]:
+    """Read one reply frame.
+
+    Returns:
+        Tuple of (kind, payload)
+    """
+    kind = _recv_exact(stream, 1)
+    (length,) = _LENGTH.unpack(_recv_exact(stream, _LENGTH.size))
+    return kind, _recv_exact(stream, length)
+
+
+def _connect(socket_path: str) -> Optional[socket.socket]:
+    """Connect to a daemon socket.
+
+    Returns:
+        The connected socket, or None if no daemon is listening
+    """
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+
+def should_forward(argv: list[str]) -> bool:
+    """Decide whether an invocation may run in the daemon.
+
+    Interactive sessions and commands reading stdin run in-process, since the
+    daemon gives commands an empty stdin. ``TOADY_NO_DAEMON=1`` disables
+    forwarding.
+
+    Args:
+        argv: Command line arguments, without the program name
+
+    Returns:
+        True if the invocation should be sent to a running daemon
+    """
+    if os.environ.get("TOADY_NO_DAEMON", "").lower() in ("1", "true", "yes"):
+        return False
+    if argv[:1] == ["serve"] or "-" in argv:
+        return False
+    try:
+        return not sys.stdin.isatty()
+    except (AttributeError, ValueError):
+        return True
+
+
+def forward_to_daemon(
+    argv: list[str], socket_path: Optional[str] = None
+) -> Optional[int]:
+    """Run a toady invocation in the daemon, copying its output to ours.
+
+    Args:
+        argv: Command line arguments, without the program name
+        socket_path: Daemon socket (defaults to default_socket_path())
+
+    Returns:
+        The command's exit code, or None if no daemon accepted the command
+        and it should run in this process instead
+    """
+    sock = _connect(socket_path or default_socket_path())
+    if sock is None:
+        return None
+
+    request = {
+        "version": __version__,
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+    }
+    outputs = {FRAME_STDOUT: sys.stdout, FRAME_STDERR: sys.stderr}
+    with sock, sock.makefile("rb") as stream:
+        try:
+            _send_message(sock, json.dumps(request).encode("utf-8"))
+            kind, payload = _recv_frame(stream)
+        except (OSError, EOFError):
+            # Nothing has run yet, so running locally is safe
+            return None
+        if kind == FRAME_REFUSED:
+            return None
+
+        try:
+            while kind != FRAME_EXIT:
+                output = outputs.get(kind)
+                if output is not None:
+                    output.flush()
+                    buffer = getattr(output, "buffer", None)
+                    if buffer is not None:
+                        buffer.write(payload)
+                        buffer.flush()
+                    else:
+                        output.write(payload.decode("utf-8", errors="replace"))
+                kind, payload = _recv_frame(stream)
+        except (OSError, EOFError):
+            # The command may have had side effects; do not run it again
+            sys.stderr.write("Error: lost connection to the toady daemon\n")
+            return 1
+        return int(payload)
+
+
+def stop_daemon(socket_path: Optional[str] = None) -> bool:
+    """Ask a running daemon to exit.
+
+    Args:
+        socket_path: Daemon socket (defaults to default_socket_path())
+
+    Returns:
+        True if a daemon acknowledged the request
+    """
+    sock = _connect(socket_path or default_socket_path())
+    if sock is None:
+        return False
+    with sock, sock.makefile("rb") as stream:
+        try:
+            _send_message(sock, json.dumps({"op": "stop"}).encode("utf-8"))
+            kind, _ = _recv_frame(stream)
+        except (OSError, EOFError):
+            return False
+    return kind == FRAME_EXIT
+
+
+class _FrameWriter(io.RawIOBase):
+    """Binary stream sending everything written to it as reply frames."""
+
+    name = "<toady client>"
+
+    def __init__(self, sock: socket.socket, kind: bytes) -> None:
+        """Initialize the writer.
+
+        Args:
+            sock: Client connection
+            kind: Frame kind to send, FRAME_STDOUT or FRAME_STDERR
+        """
+        super().__init__()
+        self._sock = sock
+        self._kind = kind
+
+    def writable(self) -> bool:
+        """Return True; the stream is write-only."""
+        return True
+
+    def write(self, data: Any) -> int:
+        """Send data to the client."""
+        payload = bytes(data)
+        if payload:
+            try:
+                _send_frame(self._sock, self._kind, payload)
+            except OSError:
+                pass  # the client went away; let the command finish
+        return len(payload)
+
+
+def _text_stream(sock: socket.socket, kind: bytes) -> io.TextIOWrapper:
+    """Wrap a frame writer for use as sys.stdout or sys.stderr."""
+    return io.TextIOWrapper(
+        _FrameWriter(sock, kind), encoding="utf-8", errors="replace", write_through=True
+    )
+
+
+def _exit_code(code: Any, stderr: io.TextIOWrapper) -> int:
+    """Convert a SystemExit code the way the interpreter does."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    stderr.write(f"{code}\n")
+    return 1
+
+
+class DaemonServer:
+    """Serve toady invocations from clients connecting to a Unix socket."""
+
+    def __init__(self, socket_path: Optional[str] = None, idle_timeout: float = 0):
+        """Initialize the server.
+
+        Args:
+            socket_path: Socket to listen on (defaults to default_socket_path())
+            idle_timeout: Exit after this many seconds without a request;
+                0 keeps serving until stopped
+        """
+        import threading
+
+        self.socket_path = socket_path or default_socket_path()
+        self.idle_timeout = idle_timeout
+        self._run_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._listener: Optional[socket.socket] = None
+
+    def bind(self) -> None:
+        """Create the listening socket, replacing a stale one.
+
+        Raises:
+            DaemonError: If another daemon is already listening, or the
+                platform has no Unix sockets
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise DaemonError("toady serve requires Unix domain sockets")
+
+        existing = _connect(self.socket_path)
+        if existing is not None:
+            existing.close()
+            raise DaemonError(f"A toady daemon is already serving {self.socket_path}")
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        directory = os.path.dirname(self.socket_path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Only the owner may connect: commands run with the owner's gh login
+        previous_umask = os.umask(0o177)
+        try:
+            listener.bind(self.socket_path)
+        except OSError as e:
+            listener.close()
+            raise DaemonError(f"Cannot listen on {self.socket_path}: {e}") from e
+        finally:
+            os.umask(previous_umask)
+        listener.listen()
+        listener.settimeout(0.5)
+        self._listener = listener
+
+    def warm_up(self) -> None:
+        """Import every command and create the shared services up front."""
+        import click
+
+        from ..cli import cli
+        from .github_service import get_shared_github_service
+
+        context = click.Context(cli)
+        for name in cli.list_commands(context):
+            cli.get_command(context, name)
+        get_shared_github_service().check_gh_installation()
+
+    def serve_forever(self) -> None:
+        """Accept connections until stopped or idle for idle_timeout seconds."""
+        import threading
+        import time
+
+        if self._listener is None:
+            self.bind()
+        assert self._listener is not None
+
+        last_request = time.monotonic()
+        try:
+            while not self._stopping.is_set():
+                try:
+                    conn, _ = self._listener.accept()
+                except socket.timeout:
+                    idle = time.monotonic() - last_request
+                    if self.idle_timeout and idle > self.idle_timeout:
+                        break
+                    continue
+                last_request = time.monotonic()
+                conn.settimeout(None)
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        """Make serve_forever return after the current accept timeout."""
+        self._stopping.set()
+
+    def close(self) -> None:
+        """Close the listening socket and remove its file."""
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+
+    def _handle(self, conn: socket.socket) -> None:
+        """Serve one client connection."""
+        with conn, conn.makefile("rb") as stream:
+            try:
+                request = json.loads(_recv_message(stream))
+                if request.get("op") == "stop":
+                    self.stop()
+                    _send_frame(conn, FRAME_EXIT, b"0")
+                elif request.get("version") != __version__:
+                    _send_frame(conn, FRAME_REFUSED, b"version mismatch")
+                else:
+                    code = self._run(conn, request)
+                    _send_frame(conn, FRAME_EXIT, str(code).encode("ascii"))
+            except (OSError, EOFError, ValueError, AttributeError):
+                return  # malformed request or client gone
+
+    def _run(self, conn: socket.socket, request: dict[str, Any]) -> int:
+        """Run one toady invocation with the client's context and streams.
+
+        Args:
+            conn: Client connection receiving the output
+            request: Decoded request
+
+        Returns:
+            The command's exit code
+        """
+        import traceback
+
+        from ..cli import main
+
+        with self._run_lock:
+            saved_cwd = os.getcwd()
+            saved_env = dict(os.environ)
+            saved = (sys.argv, sys.stdin, sys.stdout, sys.stderr)
+            stdout = _text_stream(conn, FRAME_STDOUT)
+            stderr = _text_stream(conn, FRAME_STDERR)
+            code = 0
+            try:
+                os.chdir(request["cwd"])
+                os.environ.clear()
+                os.environ.update(request["env"])
+                sys.argv = ["toady", *request["argv"]]
+                sys.stdin = io.StringIO()
+                sys.stdout, sys.stderr = stdout, stderr
+                main()
+            except SystemExit as e:
+                code = _exit_code(e.code, stderr)
+            except Exception:
+                traceback.print_exc(file=stderr)
+                code = 1
+            finally:
+                stdout.flush()
+                stderr.flush()
+                sys.argv, sys.stdin, sys.stdout, sys.stderr = saved
+                os.environ.clear()
+                os.environ.update(saved_env)
+                os.chdir(saved_cwd)
+            return code
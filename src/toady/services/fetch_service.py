@@ -8,7 +8,11 @@ from ..parsers.graphql_queries import (
     build_review_threads_query,
 )
 from ..parsers.parsers import GraphQLResponseParser
-from .github_service import GitHubService, GitHubServiceError
+from .github_service import (
+    GitHubService,
+    GitHubServiceError,
+    get_shared_github_service,
+)
 from .pr_selector import PRSelectionResult, PRSelector
 
 
@@ -27,7 +31,8 @@ class FetchService:
         """Initialize the fetch service.
 
         Args:
-            github_service: Optional GitHubService instance. If None, creates a new one.
+            github_service: Optional GitHubService instance. If None, uses the shared
+                client.
             output_format: Output format for PR selection messages ("json" or "pretty").
         """
         allowed = {"json", "pretty"}
@@ -38,9 +43,11 @@ class FetchService:
                 f"Allowed: {', '.join(sorted(allowed))}"
             )
 
-        self.github_service = github_service or GitHubService()
+        self.github_service = github_service or get_shared_github_service()
         self.parser = GraphQLResponseParser()
         self.pr_selector = PRSelector(output_format=output_format)
+        # Head commit of the most recently fetched pull request, if known
+        self.head_commit_oid: Optional[str] = None
 
     def fetch_review_threads(
         self,
@@ -67,14 +74,17 @@ class FetchService:
             GitHubAPIError: If the GitHub API call fails.
             GitHubAuthenticationError: If authentication fails.
         """
+        # Deferred: rendering the registry needs the GraphQL tokenizer
+        from ..parsers.query_registry import review_threads_query
+
         try:
             # Build the GraphQL query
             query_builder = build_review_threads_query(
                 include_resolved=include_resolved, limit=limit
             )
 
-            # Build query and variables
-            query = query_builder.build_query()
+            # Use the precomputed query and build variables
+            query = review_threads_query(limit=limit).document
             variables = query_builder.build_variables(owner, repo, pr_number)
 
             # Execute the GraphQL query
@@ -82,6 +92,8 @@ class FetchService:
 
             # Parse the response and filter if needed
             threads = self.parser.parse_review_threads_response(response)
+            pull_request = response["data"]["repository"]["pullRequest"]
+            self.head_commit_oid = pull_request.get("headRefOid")
 
             # Filter resolved threads if not including them
             if query_builder.should_filter_resolved():
@@ -175,12 +187,14 @@ class FetchService:
             GitHubAPIError: If the GitHub API call fails.
             GitHubAuthenticationError: If authentication fails.
         """
+        from ..parsers.query_registry import open_pull_requests_query
+
         try:
             # Build the GraphQL query
             query_builder = build_open_prs_query(
                 include_drafts=include_drafts, limit=limit
             )
-            query = query_builder.build_query()
+            query = open_pull_requests_query(limit=limit).document
             variables = query_builder.build_variables(owner, repo)
 
             # Execute the GraphQL query
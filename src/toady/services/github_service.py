@@ -1,9 +1,15 @@
 """GitHub CLI integration service for toady."""
 
+from collections.abc import Collection
 import json
+import os
 import subprocess
+import threading
 from typing import Any, Optional
 
+from .response_cache import ResponseCache, mutated_node_ids
+from .single_flight import SingleFlight
+
 # GraphQL mutation constants
 REPLY_THREAD_MUTATION = """
 mutation AddPullRequestReviewThreadReply($threadId: ID!, $body: String!) {
@@ -22,9 +28,19 @@ mutation AddPullRequestReviewThreadReply($threadId: ID!, $body: String!) {
             url
             pullRequestReview {
                 id
+                databaseId
             }
             replyTo {
                 id
+                url
+                author {
+                    login
+                }
+            }
+            pullRequest {
+                number
+                title
+                url
             }
         }
     }
@@ -51,15 +67,67 @@ mutation AddPullRequestReviewComment(
             url
             pullRequestReview {
                 id
+                databaseId
             }
             replyTo {
                 id
+                url
+                author {
+                    login
+                }
+            }
+            pullRequest {
+                number
+                title
+                url
             }
         }
     }
 }
 """.strip()
 
+REPLY_AND_RESOLVE_THREAD_MUTATION = """
+mutation ReplyAndResolveReviewThread($threadId: ID!, $body: String!) {
+    addPullRequestReviewThreadReply(input: {
+        pullRequestReviewThreadId: $threadId,
+        body: $body
+    }) {
+        comment {
+            id
+            body
+            createdAt
+            updatedAt
+            author {
+                login
+            }
+            url
+            pullRequestReview {
+                id
+                databaseId
+            }
+            replyTo {
+                id
+                url
+                author {
+                    login
+                }
+            }
+            pullRequest {
+                number
+                title
+                url
+            }
+        }
+    }
+    resolveReviewThread(input: {threadId: $threadId}) {
+        thread {
+            id
+            isResolved
+        }
+    }
+}
+""".strip()
+
 RESOLVE_THREAD_MUTATION = """
 mutation ResolveReviewThread($threadId: ID!) {
     resolveReviewThread(input: {threadId: $threadId}) {
@@ -95,6 +163,78 @@ mutation UnresolveReviewThread($threadId: ID!) {
 """.strip()
 
 
+def build_bulk_resolve_mutation(count: int, undo: bool = False) -> str:
+    """Build one mutation document that resolves several threads.
+
+    Each thread gets an aliased field ``t0``, ``t1``, ... bound to the
+    variable of the same name, so the whole batch is a single request.
+
+    Args:
+        count: Number of threads in the batch.
+        undo: If True, unresolve the threads instead.
+
+    Returns:
+        GraphQL mutation document.
+
+    Raises:
+        ValueError: If count is not positive.
+    """
+    if count <= 0:
+        raise ValueError("Batch must contain at least one thread")
+
+    field = "unresolveReviewThread" if undo else "resolveReviewThread"
+    operation = "BulkUnresolveReviewThreads" if undo else "BulkResolveReviewThreads"
+    variables = ", ".join(f"$t{index}: ID!" for index in range(count))
+    selections = "\n".join(
+        f"    t{index}: {field}(input: {{threadId: $t{index}}}) "
+        "{ thread { id isResolved } }"
+        for index in range(count)
+    )
+    return f"mutation {operation}({variables}) {{\n{selections}\n}}"
+
+
+def build_bulk_reply_mutation(count: int, resolve: Collection[int] = ()) -> str:
+    """Build one mutation document that replies to several threads.
+
+    Each reply gets an aliased field ``r0``, ``r1``, ... bound to the thread
+    variable ``$t<n>`` and body variable ``$b<n>``. Replies listed in
+    ``resolve`` are followed by a ``s<n>`` field resolving the same thread.
+    GitHub runs the fields of a mutation in order, so replies to the same
+    thread keep their order and each thread is resolved after its reply.
+
+    Args:
+        count: Number of replies in the batch.
+        resolve: Indexes of replies whose thread should also be resolved.
+
+    Returns:
+        GraphQL mutation document.
+
+    Raises:
+        ValueError: If count is not positive.
+    """
+    if count <= 0:
+        raise ValueError("Batch must contain at least one reply")
+
+    variables = ", ".join(
+        f"$t{index}: ID!, $b{index}: String!" for index in range(count)
+    )
+    fields = []
+    for index in range(count):
+        fields.append(
+            f"    r{index}: addPullRequestReviewThreadReply(input: "
+            f"{{pullRequestReviewThreadId: $t{index}, body: $b{index}}}) "
+            "{ comment { id url createdAt author { login } } }"
+        )
+        if index in resolve:
+            fields.append(
+                f"    s{index}: resolveReviewThread(input: {{threadId: $t{index}}}) "
+                "{ thread { id isResolved } }"
+            )
+    selections = "\n".join(fields)
+    operation = "BulkAddPullRequestReviewThreadReplies"
+    return f"mutation {operation}({variables}) {{\n{selections}\n}}"
+
+
 class GitHubServiceError(Exception):
     """Base exception for GitHub service errors."""
 
@@ -119,14 +259,47 @@ class GitHubRateLimitError(GitHubServiceError):
     """Raised when GitHub API rate limit is exceeded."""
 
 
+_shared_service: Optional["GitHubService"] = None
+_shared_service_lock = threading.Lock()
+
+
+def get_shared_github_service() -> "GitHubService":
+    """Get the process-wide GitHubService used by services by default.
+
+    Returns:
+        The shared GitHubService instance, created on first use.
+    """
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = GitHubService()
+        return _shared_service
+
+
 class GitHubService:
-    """Service for interacting with GitHub through the gh CLI."""
+    """Service for interacting with GitHub through the gh CLI.
+
+    Read-only commands are coalesced across all instances: while a command is
+    running, identical commands issued by other threads wait for it and share
+    its result instead of starting another gh process. Mutations always run.
+
+    Responses to read-only GraphQL queries are also kept in a short-lived
+    on-disk cache (see ``toady.services.response_cache``), which mutations
+    performed through this class invalidate.
+    """
 
-    def __init__(self, timeout: int = 30) -> None:
+    # Shared by every instance, since each service constructs its own client
+    _in_flight: SingleFlight[Any] = SingleFlight()
+
+    def __init__(
+        self, timeout: int = 30, response_cache: Optional[ResponseCache] = None
+    ) -> None:
         """Initialize the GitHub service.
 
         Args:
             timeout: Command timeout in seconds (default: 30)
+            response_cache: Cache for GraphQL query responses. Defaults to the
+                cache under ~/.toady/cache/graphql.
 
         Raises:
             ValueError: If timeout is not a positive integer.
@@ -136,6 +309,10 @@ class GitHubService:
 
         self.gh_command = "gh"
         self.timeout = timeout
+        self.response_cache = response_cache or ResponseCache()
+        # PATH on which gh was last found, so long-lived processes such as
+        # `toady serve` probe for it once rather than before every command
+        self._gh_found_on_path: Optional[str] = None
 
     def check_gh_installation(self) -> bool:
         """Check if gh CLI is installed and accessible.
@@ -143,6 +320,10 @@ class GitHubService:
         Returns:
             True if gh CLI is installed, False otherwise.
         """
+        search_path = os.environ.get("PATH", "")
+        if self._gh_found_on_path == search_path:
+            return True
+
         try:
             result = subprocess.run(
                 [self.gh_command, "--version"],
@@ -150,9 +331,12 @@ class GitHubService:
                 text=True,
                 check=False,
             )
-            return result.returncode == 0
         except FileNotFoundError:
             return False
+        if result.returncode != 0:
+            return False
+        self._gh_found_on_path = search_path
+        return True
 
     def get_gh_version(self) -> Optional[str]:
         """Get the installed gh CLI version.
@@ -300,6 +484,21 @@ class GitHubService:
                 "gh CLI is not installed or not accessible"
             ) from e
 
+    def _run_read_command(self, args: list[str]) -> Any:
+        """Run a read-only gh command, sharing identical in-flight calls.
+
+        Args:
+            args: List of command arguments (excluding 'gh').
+
+        Returns:
+            CompletedProcess result, possibly shared with concurrent callers.
+
+        Raises:
+            GitHubServiceError: Any error run_gh_command raises.
+        """
+        key = (self.gh_command, tuple(args))
+        return self._in_flight.do(key, lambda: self.run_gh_command(args))
+
     def get_json_output(self, args: list[str]) -> Any:
         """Run a gh CLI command and parse JSON output.
 
@@ -321,6 +520,22 @@ class GitHubService:
         except json.JSONDecodeError as e:
             raise GitHubAPIError(f"Failed to parse JSON response: {e}") from e
 
+    def invalidate_cached_pull_request(
+        self, owner: str, repo: str, number: int
+    ) -> None:
+        """Drop cached responses about a pull request changed outside GraphQL.
+
+        Mutations sent with execute_graphql_query invalidate the cache
+        themselves; callers changing a pull request through the REST API
+        call this afterwards.
+
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            number: Pull request number.
+        """
+        self.response_cache.invalidate_pull_request(owner, repo, number)
+
     def get_current_repo(self) -> Optional[str]:
         """Get the current repository name (owner/repo format).
 
@@ -332,7 +547,7 @@ class GitHubService:
             GitHubAuthenticationError: If authentication fails.
         """
         try:
-            result = self.run_gh_command(["repo", "view", "--json", "nameWithOwner"])
+            result = self._run_read_command(["repo", "view", "--json", "nameWithOwner"])
             data = json.loads(result.stdout)
             name_with_owner = data.get("nameWithOwner")
             return name_with_owner if isinstance(name_with_owner, str) else None
@@ -340,13 +555,27 @@ class GitHubService:
             return None
 
     def execute_graphql_query(
-        self, query: str, variables: Optional[dict[str, Any]] = None
+        self,
+        query: str,
+        variables: Optional[dict[str, Any]] = None,
+        allow_partial_errors: bool = False,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """Execute a GraphQL query using gh CLI.
 
+        Concurrent identical queries (same document and variables) share one
+        request, and recent responses are served from the response cache.
+        Mutations are never shared or cached; they drop cached responses that
+        mention the nodes they change.
+
         Args:
             query: GraphQL query string.
             variables: Optional variables for the query.
+            allow_partial_errors: Return responses that contain both ``data`` and
+                ``errors`` instead of raising, so batched documents can report
+                per-alias failures.
+            use_cache: Whether a cached response may be returned and this
+                response stored.
 
         Returns:
             Parsed JSON response from GraphQL API.
@@ -364,15 +593,34 @@ class GitHubService:
         # Use -F for proper type conversion (strings, integers, booleans)
         if variables:
             for key, value in variables.items():
-                args.extend(["-F", f"{key}={value}"])
-
-        result = self.run_gh_command(args)
+                if isinstance(value, (list, tuple)):
+                    # gh builds array variables from repeated key[]=value fields
+                    for item in value:
+                        args.extend(["-F", f"{key}[]={item}"])
+                else:
+                    args.extend(["-F", f"{key}={value}"])
+
+        is_mutation = query.lstrip().startswith("mutation")
+        if is_mutation:
+            try:
+                result = self.run_gh_command(args)
+            finally:
+                # Even a failed mutation may have changed something
+                self.response_cache.invalidate(mutated_node_ids(variables))
+        else:
+            if use_cache:
+                cached = self.response_cache.get(query, variables)
+                if isinstance(cached, dict):
+                    return cached
+            result = self._run_read_command(args)
 
         try:
             response = json.loads(result.stdout)
 
             # Check for GraphQL errors
-            if "errors" in response:
+            if "errors" in response and not (
+                allow_partial_errors and response.get("data")
+            ):
                 error_messages = [
                     error.get("message", str(error)) for error in response["errors"]
                 ]
@@ -380,6 +628,8 @@ class GitHubService:
                     f"GraphQL query failed: {'; '.join(error_messages)}"
                 )
 
+            if use_cache and not is_mutation and "errors" not in response:
+                self.response_cache.put(query, variables, response)
             return response  # type: ignore[no-any-return]
         except json.JSONDecodeError as e:
             raise GitHubAPIError(f"Failed to parse GraphQL response: {e}") from e
@@ -429,7 +679,9 @@ class GitHubService:
             GitHubTimeoutError: If the command times out.
         """
         try:
-            self.run_gh_command(["repo", "view", f"{owner}/{repo}", "--json", "name"])
+            self._run_read_command(
+                ["repo", "view", f"{owner}/{repo}", "--json", "name"]
+            )
             return True
         except GitHubRateLimitError:
             # Re-raise rate limit errors - these are systemic issues
@@ -453,7 +705,7 @@ class GitHubService:
             True if the PR exists, False otherwise.
         """
         try:
-            self.run_gh_command(
+            self._run_read_command(
                 [
                     "pr",
                     "view",
@@ -469,7 +721,11 @@ class GitHubService:
             return False
 
     def post_reply(
-        self, comment_id: str, body: str, review_id: Optional[str] = None
+        self,
+        comment_id: str,
+        body: str,
+        review_id: Optional[str] = None,
+        resolve: bool = False,
     ) -> dict[str, Any]:
         """Post a reply to a review comment or thread.
 
@@ -477,6 +733,9 @@ class GitHubService:
             comment_id: The comment or thread ID to reply to.
             body: The reply message body.
             review_id: The review ID (required for comment replies to numeric IDs).
+            resolve: Also resolve the thread in the same request. Requires a
+                thread ID. The response may then contain both the new comment
+                and errors from resolving the thread.
 
         Returns:
             The GraphQL response containing the new comment data.
@@ -493,6 +752,9 @@ class GitHubService:
         comment_id = comment_id.strip()
         body = body.strip()
 
+        # Deferred: rendering the registry needs the GraphQL tokenizer
+        from ..parsers.query_registry import registered_mutations
+
         # Determine reply strategy based on comment ID format
         strategy = self._determine_reply_strategy(comment_id)
 
@@ -504,7 +766,18 @@ class GitHubService:
             validator.validate_id(comment_id, "Thread ID")
 
             variables = {"threadId": comment_id, "body": body}
-            return self.execute_graphql_query(REPLY_THREAD_MUTATION, variables)
+            if resolve:
+                return self.execute_graphql_query(
+                    registered_mutations()["replyAndResolveReviewThread"].document,
+                    variables,
+                    allow_partial_errors=True,
+                )
+            return self.execute_graphql_query(
+                registered_mutations()["addPullRequestReviewThreadReply"].document,
+                variables,
+            )
+        if resolve:
+            raise ValueError("Resolving a thread requires a thread ID")
         # Use comment reply mutation for numeric/node IDs needing review context
         from ..validators.node_id_validation import validate_comment_id
 
@@ -521,7 +794,9 @@ class GitHubService:
             )
 
         variables = {"reviewId": review_id, "commentId": comment_id, "body": body}
-        return self.execute_graphql_query(REPLY_COMMENT_MUTATION, variables)
+        return self.execute_graphql_query(
+            registered_mutations()["addPullRequestReviewComment"].document, variables
+        )
 
     def resolve_thread(self, thread_id: str, undo: bool = False) -> dict[str, Any]:
         """Resolve or unresolve a review thread.
@@ -547,9 +822,13 @@ class GitHubService:
 
         validate_thread_id(thread_id)
 
+        from ..parsers.query_registry import registered_mutations
+
         variables = {"threadId": thread_id}
-        mutation = UNRESOLVE_THREAD_MUTATION if undo else RESOLVE_THREAD_MUTATION
-        return self.execute_graphql_query(mutation, variables)
+        name = "unresolveReviewThread" if undo else "resolveReviewThread"
+        return self.execute_graphql_query(
+            registered_mutations()[name].document, variables
+        )
 
     def _determine_reply_strategy(self, comment_id: str) -> str:
         """Determine the best reply strategy based on the comment ID format.
@@ -657,11 +936,12 @@ class GitHubService:
             raise ValueError("Limit must be between 1 and 100")
 
         # Import here to avoid circular imports
-        from .graphql_queries import build_open_prs_query
+        from ..parsers.graphql_queries import build_open_prs_query
+        from ..parsers.query_registry import open_pull_requests_query
 
-        # Build the query
+        # Use the precomputed query
         query_builder = build_open_prs_query(include_drafts=include_drafts, limit=limit)
-        query = query_builder.build_query()
+        query = open_pull_requests_query(limit=limit).document
         variables = query_builder.build_variables(owner, repo)
 
         # Execute the query
@@ -0,0 +1,291 @@
+"""Append-only journals that make bulk operations resumable.
+
+A journal records the items a bulk operation planned to process and the
+outcome of each one as it completes, one JSON object per line::
+
+    {"type": "plan", "operation": {...}, "items": [...], "created_at": "..."}
+    {"type": "result", "id": "PRRT_...", "status": "succeeded"}
+    {"type": "result", "id": "PRRT_...", "status": "failed", "error": "..."}
+    {"type": "result", "id": "7", "status": "unknown", "error": "..."}
+
+An ``unknown`` outcome marks an item whose request failed in a way that does
+not tell whether it was applied, such as a timeout. Those items are not
+pending: resuming reports them instead of processing them again, because
+repeating a non-idempotent change such as posting a reply would duplicate it.
+
+Journals live under ``~/.toady/journals`` and are named after a hash of the
+operation description, so rerunning the same command finds the same journal.
+Lines are flushed as they are written, so an interrupted run loses at most the
+item in flight. A journal is removed once every planned item has succeeded.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import IO, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JournalError(Exception):
+    """Raised when a journal cannot be read or written."""
+
+
+@dataclass
+class JournalItem:
+    """A planned item in a bulk operation.
+
+    Attributes:
+        item_id: Identifier of the item, such as a thread ID.
+        label: Short human-readable description shown in progress output.
+    """
+
+    item_id: str
+    label: str = ""
+
+
+@dataclass
+class JournalState:
+    """State of a bulk operation reconstructed from its journal.
+
+    Attributes:
+        operation: Description of the operation the journal belongs to.
+        items: Planned items in their original order.
+        outcomes: Latest recorded status for each item ID.
+        errors: Latest recorded error for each failed item ID.
+    """
+
+    operation: dict[str, Any]
+    items: list[JournalItem]
+    outcomes: dict[str, str] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def pending_items(self) -> list[JournalItem]:
+        """Items to process again: not succeeded yet and not of unknown outcome."""
+        return [
+            item
+            for item in self.items
+            if self.outcomes.get(item.item_id) not in ("succeeded", "unknown")
+        ]
+
+    @property
+    def unknown_items(self) -> list[JournalItem]:
+        """Items that may or may not have been processed."""
+        return [
+            item for item in self.items if self.outcomes.get(item.item_id) == "unknown"
+        ]
+
+    @property
+    def succeeded_count(self) -> int:
+        """Number of planned items that have succeeded."""
+        return sum(
+            1 for item in self.items if self.outcomes.get(item.item_id) == "succeeded"
+        )
+
+
+class OperationJournal:
+    """Journal for one bulk operation."""
+
+    def __init__(
+        self, operation: dict[str, Any], journal_dir: Optional[Path] = None
+    ) -> None:
+        """Initialize the journal.
+
+        Args:
+            operation: JSON-serializable description of the operation, e.g.
+                the command, pull request number and action. Identical
+                descriptions share a journal.
+            journal_dir: Directory for journal files. Defaults to
+                ~/.toady/journals.
+        """
+        self.operation = operation
+        self.journal_dir = journal_dir or Path.home() / ".toady" / "journals"
+        key = hashlib.sha256(
+            json.dumps(operation, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:16]
+        command = str(operation.get("command", "operation"))
+        self.path = self.journal_dir / f"{command}-{key}.jsonl"
+        self._file: Optional[IO[str]] = None
+
+    def exists(self) -> bool:
+        """Check whether a journal from a previous run exists.
+
+        Returns:
+            True if the journal file exists.
+        """
+        return self.path.exists()
+
+    def start(self, items: list[JournalItem]) -> None:
+        """Begin a new journal, replacing any previous one.
+
+        Args:
+            items: Items the operation plans to process.
+
+        Raises:
+            JournalError: If the journal cannot be written.
+        """
+        self.close()
+        try:
+            self.journal_dir.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w", encoding="utf-8")
+        except OSError as e:
+            raise JournalError(f"Cannot create journal {self.path}: {e}") from e
+
+        self._write(
+            {
+                "type": "plan",
+                "operation": self.operation,
+                "items": [{"id": item.item_id, "label": item.label} for item in items],
+                "created_at": datetime.now().isoformat(),
+            }
+        )
+
+    def resume(self) -> JournalState:
+        """Load the journal and reopen it for appending outcomes.
+
+        Returns:
+            State of the previous run.
+
+        Raises:
+            JournalError: If the journal is missing, unreadable or belongs to a
+                different operation.
+        """
+        state = self.load()
+        self.close()
+        try:
+            self._file = open(self.path, "a", encoding="utf-8")
+        except OSError as e:
+            raise JournalError(f"Cannot open journal {self.path}: {e}") from e
+        return state
+
+    def load(self) -> JournalState:
+        """Read the journal without modifying it.
+
+        A truncated final line, left by an interrupted write, is ignored.
+
+        Returns:
+            State of the previous run.
+
+        Raises:
+            JournalError: If the journal is missing, unreadable or belongs to a
+                different operation.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError as e:
+            raise JournalError(f"Cannot read journal {self.path}: {e}") from e
+
+        state: Optional[JournalState] = None
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                if number == len(lines):
+                    break
+                raise JournalError(
+                    f"Corrupt journal {self.path} at line {number}: {e}"
+                ) from e
+
+            if entry.get("type") == "plan":
+                if entry.get("operation") != self.operation:
+                    raise JournalError(
+                        f"Journal {self.path} belongs to a different operation"
+                    )
+                state = JournalState(
+                    operation=entry["operation"],
+                    items=[
+                        JournalItem(str(item["id"]), str(item.get("label", "")))
+                        for item in entry.get("items", [])
+                    ],
+                )
+            elif entry.get("type") == "result" and state is not None:
+                item_id = str(entry.get("id"))
+                state.outcomes[item_id] = str(entry.get("status"))
+                if entry.get("error"):
+                    state.errors[item_id] = str(entry["error"])
+                else:
+                    state.errors.pop(item_id, None)
+
+        if state is None:
+            raise JournalError(f"Journal {self.path} has no plan entry")
+        return state
+
+    def record(self, item_id: str, succeeded: bool, error: str = "") -> None:
+        """Append the outcome of one item.
+
+        Failures to write are logged rather than raised so that journaling
+        never interrupts the operation itself.
+
+        Args:
+            item_id: Identifier of the processed item.
+            succeeded: Whether the item was processed successfully.
+            error: Error message for failed items.
+        """
+        self._record(item_id, "succeeded" if succeeded else "failed", error)
+
+    def record_unknown(self, item_id: str, error: str = "") -> None:
+        """Record an item that may or may not have been processed.
+
+        Resuming does not process such items again; see JournalState.
+
+        Args:
+            item_id: Identifier of the item.
+            error: Error that left the outcome unknown.
+        """
+        self._record(item_id, "unknown", error)
+
+    def _record(self, item_id: str, status: str, error: str) -> None:
+        """Append one result line, logging write failures.
+
+        Args:
+            item_id: Identifier of the item.
+            status: Outcome status.
+            error: Optional error message.
+        """
+        entry: dict[str, Any] = {"type": "result", "id": item_id, "status": status}
+        if error:
+            entry["error"] = error
+        try:
+            self._write(entry)
+        except JournalError as e:
+            logger.warning("%s", e)
+
+    def complete(self) -> None:
+        """Close the journal and remove it, once every item has succeeded."""
+        self.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Cannot remove journal %s: %s", self.path, e)
+
+    def close(self) -> None:
+        """Close the journal file, keeping it on disk."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        """Write and flush one journal line.
+
+        Args:
+            entry: JSON-serializable journal entry.
+
+        Raises:
+            JournalError: If the journal is not open or the write fails.
+        """
+        if self._file is None:
+            raise JournalError(f"Journal {self.path} is not open")
+        try:
+            self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self._file.flush()
+        except OSError as e:
+            raise JournalError(f"Cannot write journal {self.path}: {e}") from e
@@ -4,7 +4,44 @@ from dataclasses import dataclass
 import json
 from typing import Any, Optional
 
-from .github_service import GitHubAPIError, GitHubService, GitHubServiceError
+from .comment_index import CommentIndex
+from .github_service import (
+    GitHubAPIError,
+    GitHubService,
+    GitHubServiceError,
+    get_shared_github_service,
+)
+
+# Maximum number of replies sent as aliased mutations in one request
+REPLY_BATCH_SIZE = 20
+
+# Replies to these IDs can be batched; comment IDs need a review lookup each
+THREAD_ID_PREFIXES = ("PRRT_", "PRT_", "RT_")
+
+# Context for a reply posted through REST, fetched in one follow-up query
+REPLY_CONTEXT_QUERY = """
+query GetReplyContext($replyId: ID!) {
+    node(id: $replyId) {
+        ... on PullRequestReviewComment {
+            url
+            pullRequestReview {
+                databaseId
+            }
+            replyTo {
+                url
+                author {
+                    login
+                }
+            }
+            pullRequest {
+                number
+                title
+                url
+            }
+        }
+    }
+}
+""".strip()
 
 
 class ReplyServiceError(GitHubServiceError):
@@ -23,18 +60,27 @@ class ReplyRequest:
     reply_body: str
     owner: Optional[str] = None
     repo: Optional[str] = None
+    resolve: bool = False
 
 
 class ReplyService:
     """Service for posting replies to GitHub pull request review comments."""
 
-    def __init__(self, github_service: Optional[GitHubService] = None) -> None:
+    def __init__(
+        self,
+        github_service: Optional[GitHubService] = None,
+        comment_index: Optional[CommentIndex] = None,
+    ) -> None:
         """Initialize the reply service.
 
         Args:
-            github_service: Optional GitHubService instance. If None, creates a new one.
+            github_service: Optional GitHubService instance. If None, uses the shared
+                client.
+            comment_index: Optional index of fetched reply targets. If None, uses the
+                default index written by ``toady fetch``.
         """
-        self.github_service = github_service or GitHubService()
+        self.github_service = github_service or get_shared_github_service()
+        self.comment_index = comment_index or CommentIndex()
 
     def post_reply(
         self, request: ReplyRequest, fetch_context: bool = False
@@ -63,6 +109,9 @@ class ReplyService:
             - thread_url: URL to the entire review thread
             - body_preview: First 100 characters of the reply body
             - parent_comment_author: Author of the comment being replied to
+            - thread_resolved: Whether the thread was resolved (only when
+              request.resolve is set)
+            - resolve_error: Why resolving failed, if it did
 
         Raises:
             ReplyServiceError: If the reply fails to post.
@@ -70,9 +119,15 @@ class ReplyService:
             GitHubAPIError: If the GitHub API call fails.
             GitHubAuthenticationError: If authentication fails.
         """
-        # Get repository info if not provided
+        # Get repository info if not provided. Threads and comments seen by an
+        # earlier fetch have a known repository, which saves the lookup.
         if not request.owner or not request.repo:
-            repo_info = self._get_repository_info()
+            location = self.comment_index.lookup(request.comment_id)
+            repo_info = (
+                self._get_repository_info()
+                if location is None
+                else self._split_repository(location.repository)
+            )
             owner = request.owner or repo_info[0]
             repo = request.repo or repo_info[1]
         else:
@@ -95,10 +150,15 @@ class ReplyService:
                 comment_id=request.comment_id,
                 body=request.reply_body,
                 review_id=review_id,
+                resolve=request.resolve,
             )
 
-            # Check for GraphQL errors first to preserve specialized error handling
-            if "errors" in result:
+            # Check for GraphQL errors first to preserve specialized error handling.
+            # When the thread is resolved in the same request, errors that only
+            # concern the resolve leave the posted reply intact.
+            if "errors" in result and not (
+                request.resolve and self._has_reply_comment(result)
+            ):
                 self._handle_graphql_errors(result["errors"], request.comment_id)
 
             # Extract comment data from the response
@@ -120,9 +180,12 @@ class ReplyService:
                     "No comment data returned from GraphQL mutation"
                 )
 
-            return self._build_reply_info_from_graphql(
+            reply_info = self._build_reply_info_from_graphql(
                 comment_data, request, fetch_context, owner, repo
             )
+            if request.resolve:
+                reply_info.update(self._resolve_outcome(result))
+            return reply_info
 
         except ValueError as e:
             raise ReplyServiceError(f"Invalid comment ID: {e}") from e
@@ -134,6 +197,166 @@ class ReplyService:
                 ) from e
             raise ReplyServiceError(f"Failed to post reply: {e}") from e
 
+    def post_replies(self, requests: list[ReplyRequest]) -> list[dict[str, Any]]:
+        """Post several replies, sending thread replies in a single request.
+
+        Replies to thread IDs are sent as aliased mutations of one document, so
+        callers should pass at most REPLY_BATCH_SIZE requests per call. Replies
+        to comment IDs need their review looked up first and are posted one at
+        a time. A failure on one reply does not affect the others. Requests
+        with ``resolve`` set also resolve their thread in the same document.
+
+        Args:
+            requests: Reply requests to post.
+
+        Returns:
+            One result per request, in input order, with ``id`` and ``success``
+            keys plus ``reply_id``, ``reply_url``, ``created_at`` and ``author``
+            on success or ``error`` on failure. ``success`` reflects the reply
+            only; requests with ``resolve`` set also carry ``thread_resolved``
+            and, if resolving failed, ``resolve_error``.
+
+        Raises:
+            ReplyServiceError: If the response cannot be interpreted.
+            GitHubAPIError: If the batched request as a whole fails.
+        """
+        results: list[dict[str, Any]] = [
+            {"id": request.comment_id, "success": False} for request in requests
+        ]
+
+        batch: list[int] = []
+        for index, request in enumerate(requests):
+            if request.comment_id.startswith(THREAD_ID_PREFIXES):
+                batch.append(index)
+                continue
+            try:
+                reply_info = self.post_reply(request)
+            except GitHubServiceError as e:
+                results[index]["error"] = str(e)
+            else:
+                results[index].update(
+                    success=True,
+                    **{
+                        key: reply_info.get(key, "")
+                        for key in ("reply_id", "reply_url", "created_at", "author")
+                    },
+                )
+                if request.resolve:
+                    results[index]["thread_resolved"] = reply_info.get(
+                        "thread_resolved", False
+                    )
+                    if "resolve_error" in reply_info:
+                        results[index]["resolve_error"] = reply_info["resolve_error"]
+
+        if not batch:
+            return results
+
+        from ..parsers.query_registry import bulk_reply_mutation
+
+        variables: dict[str, Any] = {}
+        for alias_index, index in enumerate(batch):
+            variables[f"t{alias_index}"] = requests[index].comment_id
+            variables[f"b{alias_index}"] = requests[index].reply_body
+        resolve = {
+            alias_index
+            for alias_index, index in enumerate(batch)
+            if requests[index].resolve
+        }
+        response = self.github_service.execute_graphql_query(
+            bulk_reply_mutation(len(batch), frozenset(resolve)).document,
+            variables,
+            allow_partial_errors=True,
+        )
+        if not isinstance(response, dict):
+            raise ReplyServiceError("Invalid response from bulk reply mutation")
+
+        # Errors name the alias they belong to in their path
+        alias_errors: dict[str, list[str]] = {}
+        for error in response.get("errors") or []:
+            if not isinstance(error, dict):
+                continue
+            path = error.get("path") or []
+            alias = str(path[0]) if path else ""
+            alias_errors.setdefault(alias, []).append(str(error.get("message", error)))
+
+        data = response.get("data") or {}
+        for alias_index, index in enumerate(batch):
+            alias = f"r{alias_index}"
+            payload = data.get(alias) if isinstance(data, dict) else None
+            comment = payload.get("comment") if isinstance(payload, dict) else None
+            if isinstance(comment, dict):
+                results[index].update(
+                    success=True,
+                    reply_id=str(comment.get("id", "")),
+                    reply_url=comment.get("url", ""),
+                    created_at=comment.get("createdAt", ""),
+                    author=(comment.get("author") or {}).get("login", ""),
+                )
+            else:
+                messages = alias_errors.get(alias) or alias_errors.get("") or []
+                results[index]["error"] = (
+                    "; ".join(messages)
+                    if messages
+                    else "No comment data returned from GraphQL mutation"
+                )
+                continue
+
+            if alias_index in resolve:
+                payload = (
+                    data.get(f"s{alias_index}") if isinstance(data, dict) else None
+                )
+                thread = payload.get("thread") if isinstance(payload, dict) else None
+                resolved = isinstance(thread, dict) and bool(thread.get("isResolved"))
+                results[index]["thread_resolved"] = resolved
+                if not resolved:
+                    messages = alias_errors.get(f"s{alias_index}") or []
+                    results[index]["resolve_error"] = (
+                        "; ".join(messages) if messages else "Thread was not resolved"
+                    )
+        return results
+
+    @staticmethod
+    def _has_reply_comment(result: dict[str, Any]) -> bool:
+        """Check whether a reply mutation response contains the posted comment.
+
+        Args:
+            result: GraphQL response of a reply mutation.
+
+        Returns:
+            True if the reply was posted.
+        """
+        data = result.get("data") or {}
+        payload = data.get("addPullRequestReviewThreadReply") or {}
+        return bool(payload.get("comment"))
+
+    @staticmethod
+    def _resolve_outcome(result: dict[str, Any]) -> dict[str, Any]:
+        """Extract the outcome of resolving a thread alongside a reply.
+
+        Args:
+            result: GraphQL response of the reply-and-resolve mutation.
+
+        Returns:
+            Dictionary with ``thread_resolved`` and, if resolving failed,
+            ``resolve_error``.
+        """
+        data = result.get("data") or {}
+        thread = (data.get("resolveReviewThread") or {}).get("thread") or {}
+        if thread.get("isResolved"):
+            return {"thread_resolved": True}
+
+        messages = [
+            str(error.get("message", error))
+            for error in result.get("errors") or []
+            if isinstance(error, dict)
+        ]
+        return {
+            "thread_resolved": False,
+            "resolve_error": (
+                "; ".join(messages) if messages else "Thread was not resolved"
+            ),
+        }
+
     def _handle_graphql_errors(
         self, errors: list[dict[str, Any]], comment_id: str
     ) -> None:
@@ -197,14 +420,83 @@ class ReplyService:
             if "id" in review_data:
                 reply_info["review_id"] = str(review_data["id"])
 
-        # Try to get parent comment info for context only if requested
+        # The mutation selects the reply's PR and parent comment, so context
+        # normally comes from the same response
         if fetch_context:
-            parent_info = self._get_parent_comment_info(owner, repo, request.comment_id)
-            if parent_info:
-                reply_info.update(parent_info)
+            if "pullRequest" in comment_data:
+                reply_info.update(self._context_from_comment_node(comment_data))
+            else:
+                parent_info = self._get_parent_comment_info(
+                    owner, repo, request.comment_id
+                )
+                if parent_info:
+                    reply_info.update(parent_info)
 
         return reply_info
 
+    def _context_from_comment_node(
+        self, comment_data: dict[str, Any]
+    ) -> dict[str, str]:
+        """Extract verbose reply context from a GraphQL comment node.
+
+        Args:
+            comment_data: Comment node selecting pullRequest, replyTo and
+                pullRequestReview.
+
+        Returns:
+            Dictionary with whichever of pr_number, pr_title, pr_url,
+            parent_comment_author and thread_url are available.
+        """
+        context: dict[str, str] = {}
+
+        pull_request = comment_data.get("pullRequest") or {}
+        if pull_request.get("number") is not None:
+            context["pr_number"] = str(pull_request["number"])
+        if pull_request.get("title"):
+            context["pr_title"] = pull_request["title"]
+        if pull_request.get("url"):
+            context["pr_url"] = pull_request["url"]
+
+        parent = comment_data.get("replyTo") or {}
+        parent_author = (parent.get("author") or {}).get("login")
+        if parent_author:
+            context["parent_comment_author"] = parent_author
+
+        review = comment_data.get("pullRequestReview") or {}
+        comment_url = comment_data.get("url") or parent.get("url") or ""
+        if comment_url and review.get("databaseId"):
+            context["thread_url"] = (
+                f"{comment_url.split('#')[0]}"
+                f"#pullrequestreview-{review['databaseId']}"
+            )
+
+        return context
+
+    def _get_reply_context(self, reply_node_id: str) -> Optional[dict[str, str]]:
+        """Fetch verbose context for a posted reply in a single query.
+
+        Args:
+            reply_node_id: Node ID of the posted reply.
+
+        Returns:
+            Dictionary with reply context, or None if it is not available.
+        """
+        from ..parsers.query_registry import registered_document
+
+        try:
+            result = self.github_service.execute_graphql_query(
+                registered_document("replyContext", REPLY_CONTEXT_QUERY).document,
+                {"replyId": reply_node_id},
+            )
+        except GitHubAPIError:
+            # Don't fail the whole operation if we can't get the context
+            return None
+
+        node = (result.get("data") or {}).get("node")
+        if not isinstance(node, dict):
+            return None
+        return self._context_from_comment_node(node) or None
+
     def _post_reply_fallback_rest(
         self, request: ReplyRequest, fetch_context: bool, owner: str, repo: str
     ) -> dict[str, Any]:
@@ -239,6 +531,15 @@ class ReplyService:
             result = self.github_service.run_gh_command(args)
             response_data = json.loads(result.stdout)
 
+            # The REST response has no thread node ID, so drop everything
+            # cached about the pull request instead
+            pr_url = str(response_data.get("pull_request_url", ""))
+            pr_number = pr_url.rstrip("/").rsplit("/", 1)[-1]
+            if pr_number.isdigit():
+                self.github_service.invalidate_cached_pull_request(
+                    owner, repo, int(pr_number)
+                )
+
             # Extract comprehensive information from the response
             reply_info = {
                 "reply_id": str(response_data.get("id", "")),
@@ -254,11 +555,15 @@ class ReplyService:
             if "pull_request_review_id" in response_data:
                 reply_info["review_id"] = str(response_data["pull_request_review_id"])
 
-            # Try to get parent comment info for context only if requested
+            # Fetch context only if requested, in one query when the reply's
+            # node ID is known
             if fetch_context:
-                parent_info = self._get_parent_comment_info(
-                    owner, repo, request.comment_id
-                )
+                if response_data.get("node_id"):
+                    parent_info = self._get_reply_context(response_data["node_id"])
+                else:
+                    parent_info = self._get_parent_comment_info(
+                        owner, repo, request.comment_id
+                    )
                 if parent_info:
                     reply_info.update(parent_info)
 
@@ -356,7 +661,21 @@ class ReplyService:
                 "Could not determine repository information. "
                 "Make sure you're in a git repository with GitHub remote."
             )
+        return self._split_repository(repo_info)
+
+    @staticmethod
+    def _split_repository(repo_info: str) -> tuple[str, str]:
+        """Split a repository in owner/repo format.
 
+        Args:
+            repo_info: Repository in owner/repo format.
+
+        Returns:
+            Tuple of (owner, repo_name).
+
+        Raises:
+            ReplyServiceError: If the repository format is invalid.
+        """
         parts = repo_info.split("/")
         if len(parts) != 2:
             raise ReplyServiceError(f"Invalid repository format: {repo_info}")
@@ -13,11 +13,29 @@ from ..exceptions import (
     create_validation_error,
 )
 from ..validators.node_id_validation import validate_thread_id
-from .github_service import (
-    RESOLVE_THREAD_MUTATION,
-    UNRESOLVE_THREAD_MUTATION,
-    GitHubService,
-)
+from .github_service import GitHubService, get_shared_github_service
+
+# Maximum number of aliased mutations sent in one request
+RESOLVE_BATCH_SIZE = 50
+
+# Maximum number of IDs GitHub accepts in a single nodes(ids:) lookup
+VALIDATION_BATCH_SIZE = 100
+
+VALIDATE_THREADS_QUERY = """
+query ValidateThreadsExist($ids: [ID!]!) {
+    nodes(ids: $ids) {
+        ... on PullRequestReviewThread {
+            id
+            pullRequest {
+                number
+                repository {
+                    nameWithOwner
+                }
+            }
+        }
+    }
+}
+""".strip()
 
 
 class ResolveService:
@@ -27,9 +45,10 @@ class ResolveService:
         """Initialize the resolve service.
 
         Args:
-            github_service: Optional GitHubService instance. If None, creates a new one.
+            github_service: Optional GitHubService instance. If None, uses the shared
+                client.
         """
-        self.github_service = github_service or GitHubService()
+        self.github_service = github_service or get_shared_github_service()
 
     def resolve_thread(self, thread_id: str) -> dict[str, Any]:
         """Resolve a review thread.
@@ -47,170 +66,211 @@ class ResolveService:
             ValidationError: If the thread ID is invalid.
             GitHubAPIError: If the GitHub API call fails.
         """
-        try:
-            # Validate thread ID with enhanced error handling
-            try:
-                validate_thread_id(thread_id)
-            except ValueError as e:
-                raise create_validation_error(
-                    field_name="thread_id",
-                    invalid_value=thread_id,
-                    expected_format="valid GitHub thread ID",
-                    message=f"Invalid thread ID format: {e!s}",
-                ) from e
+        result, _ = self._mutate_thread(thread_id, undo=False)
+        return result
 
-            # Execute GraphQL mutation with error handling
-            variables = {"threadId": thread_id}
-            try:
-                result = self.github_service.execute_graphql_query(
-                    RESOLVE_THREAD_MUTATION, variables
-                )
-            except GitHubAPIError:
-                raise
-            except Exception as e:
-                raise create_github_error(
-                    message=f"Failed to execute resolve mutation: {e!s}",
-                    api_endpoint="GraphQL resolve mutation",
-                ) from e
+    def unresolve_thread(self, thread_id: str) -> dict[str, Any]:
+        """Unresolve a review thread.
 
-            # Check for GraphQL errors first
-            if "errors" in result:
-                self._handle_graphql_errors(result["errors"], thread_id, "resolve")
+        Args:
+            thread_id: GitHub thread ID (numeric or node ID starting with PRT_).
 
-            # Extract thread data from response with validation
-            try:
-                thread_data = (
-                    result.get("data", {})
-                    .get("resolveReviewThread", {})
-                    .get("thread", {})
-                )
+        Returns:
+            Dictionary containing unresolve result information.
 
-                if not thread_data:
-                    raise ResolveServiceError(
-                        message="No thread data returned from GraphQL mutation",
-                        context={"thread_id": thread_id, "action": "resolve"},
-                    )
+        Raises:
+            ResolveServiceError: If the unresolve operation fails.
+            ThreadNotFoundError: If the thread cannot be found.
+            ThreadPermissionError: If user lacks permission to unresolve.
+            ValidationError: If the thread ID is invalid.
+            GitHubAPIError: If the GitHub API call fails.
+        """
+        result, _ = self._mutate_thread(thread_id, undo=True)
+        return result
+
+    def resolve_thread_in_pull_request(
+        self,
+        thread_id: str,
+        pull_number: int,
+        owner: Optional[str] = None,
+        repo: Optional[str] = None,
+        undo: bool = False,
+    ) -> dict[str, Any]:
+        """Resolve a thread after checking that it belongs to a pull request.
+
+        The thread's pull request and repository are looked up with the same
+        ``nodes(ids:)`` query as validate_threads_exist, and the mutation is
+        only sent once ownership is confirmed, so a wrong thread ID never
+        changes a thread elsewhere.
 
-                # Extract URL with intelligent fallback
-                thread_url = self._get_thread_url(thread_data, thread_id)
+        Args:
+            thread_id: GitHub thread node ID.
+            pull_number: Pull request the thread is expected to belong to.
+            owner: Expected repository owner, or None to skip the repository
+                check.
+            repo: Expected repository name, or None to skip the repository
+                check.
+            undo: If True, unresolve the thread instead of resolving it.
 
-                return {
-                    "thread_id": thread_id,
-                    "action": "resolve",
-                    "success": True,
-                    "is_resolved": str(thread_data.get("isResolved", True)).lower(),
-                    "thread_url": thread_url,
-                }
-            except (KeyError, TypeError, AttributeError) as e:
-                raise ResolveServiceError(
-                    message=(
-                        "Invalid response structure from resolve mutation: " f"{e!s}"
-                    ),
-                    context={
-                        "thread_id": thread_id,
-                        "action": "resolve",
-                        "response_keys": (
-                            list(result.keys())
-                            if isinstance(result, dict)
-                            else "not_dict"
-                        ),
-                    },
-                ) from e
+        Returns:
+            Resolution result, as for resolve_thread, plus ``pr_number`` and
+            ``repository`` keys.
 
-        except (
-            ValidationError,
-            ResolveServiceError,
-            ThreadNotFoundError,
-            ThreadPermissionError,
-            GitHubAPIError,
-        ):
-            # Re-raise our custom exceptions as-is
-            raise
-        except Exception as e:
-            # Wrap any unexpected errors
-            raise ResolveServiceError(
-                message=f"Unexpected error during thread resolution: {e!s}",
-                context={"thread_id": thread_id, "action": "resolve"},
+        Raises:
+            ThreadNotFoundError: If the thread does not exist or belongs to a
+                different pull request or repository.
+            ResolveServiceError: If the operation fails.
+            ThreadPermissionError: If user lacks permission to resolve.
+            ValidationError: If an argument is invalid.
+            GitHubAPIError: If the GitHub API call fails.
+        """
+        if not isinstance(pull_number, int) or pull_number <= 0:
+            raise create_validation_error(
+                field_name="pull_number",
+                invalid_value=pull_number,
+                expected_format="positive integer",
+                message="Pull request number must be a positive integer",
+            )
+        self._validate_thread_id_format(thread_id)
+
+        expected_repo = f"{owner}/{repo}" if owner and repo else None
+        expected = (
+            f"{expected_repo}#{pull_number}" if expected_repo else f"PR #{pull_number}"
+        )
+
+        location = self._thread_locations([thread_id])[thread_id]
+        if location is None:
+            raise ThreadNotFoundError(
+                message=f"Thread {thread_id} not found in {expected}",
+                thread_id=thread_id,
+                context={"expected_pr_number": pull_number},
+            )
+
+        actual_number, name_with_owner = location
+        wrong_number = actual_number != pull_number
+        wrong_repo = expected_repo is not None and (
+            name_with_owner is None or name_with_owner.lower() != expected_repo.lower()
+        )
+        if wrong_number or wrong_repo:
+            raise ThreadNotFoundError(
+                message=(
+                    f"Thread {thread_id} not found in {expected}; it belongs to "
+                    f"{name_with_owner or 'unknown repository'}#{actual_number} "
+                    "and was not changed"
+                ),
+                thread_id=thread_id,
+                context={
+                    "expected_pr_number": pull_number,
+                    "actual_pr_number": actual_number,
+                    "actual_repository": name_with_owner,
+                },
+            )
+
+        result, _ = self._mutate_thread(thread_id, undo=undo)
+        result["pr_number"] = actual_number
+        result["repository"] = name_with_owner
+        return result
+
+    def _validate_thread_id_format(self, thread_id: str) -> None:
+        """Validate the format of a thread ID.
+
+        Args:
+            thread_id: GitHub thread ID.
+
+        Raises:
+            ValidationError: If the thread ID is invalid.
+        """
+        try:
+            validate_thread_id(thread_id)
+        except ValueError as e:
+            raise create_validation_error(
+                field_name="thread_id",
+                invalid_value=thread_id,
+                expected_format="valid GitHub thread ID",
+                message=f"Invalid thread ID format: {e!s}",
             ) from e
 
-    def unresolve_thread(self, thread_id: str) -> dict[str, Any]:
-        """Unresolve a review thread.
+    def _mutate_thread(
+        self, thread_id: str, undo: bool
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Run the resolve or unresolve mutation for a thread.
 
         Args:
-            thread_id: GitHub thread ID (numeric or node ID starting with PRT_).
+            thread_id: GitHub thread ID.
+            undo: If True, unresolve the thread instead of resolving it.
 
         Returns:
-            Dictionary containing unresolve result information.
+            Tuple of the result dictionary and the thread data returned by the
+            mutation.
 
         Raises:
-            ResolveServiceError: If the unresolve operation fails.
+            ResolveServiceError: If the operation fails.
             ThreadNotFoundError: If the thread cannot be found.
-            ThreadPermissionError: If user lacks permission to unresolve.
+            ThreadPermissionError: If user lacks permission to change the thread.
             ValidationError: If the thread ID is invalid.
             GitHubAPIError: If the GitHub API call fails.
         """
+        from ..parsers.query_registry import registered_mutations
+
+        action = "unresolve" if undo else "resolve"
+        payload_field = "unresolveReviewThread" if undo else "resolveReviewThread"
+        mutation = registered_mutations()[payload_field].document
+
         try:
             # Validate thread ID with enhanced error handling
-            try:
-                validate_thread_id(thread_id)
-            except ValueError as e:
-                raise create_validation_error(
-                    field_name="thread_id",
-                    invalid_value=thread_id,
-                    expected_format="valid GitHub thread ID",
-                    message=f"Invalid thread ID format: {e!s}",
-                ) from e
+            self._validate_thread_id_format(thread_id)
 
             # Execute GraphQL mutation with error handling
             variables = {"threadId": thread_id}
             try:
-                result = self.github_service.execute_graphql_query(
-                    UNRESOLVE_THREAD_MUTATION, variables
-                )
+                result = self.github_service.execute_graphql_query(mutation, variables)
             except GitHubAPIError:
                 raise
             except Exception as e:
                 raise create_github_error(
-                    message=f"Failed to execute unresolve mutation: {e!s}",
-                    api_endpoint="GraphQL unresolve mutation",
+                    message=f"Failed to execute {action} mutation: {e!s}",
+                    api_endpoint=f"GraphQL {action} mutation",
                 ) from e
 
             # Check for GraphQL errors first
             if "errors" in result:
-                self._handle_graphql_errors(result["errors"], thread_id, "unresolve")
+                self._handle_graphql_errors(result["errors"], thread_id, action)
 
             # Extract thread data from response with validation
             try:
                 thread_data = (
-                    result.get("data", {})
-                    .get("unresolveReviewThread", {})
-                    .get("thread", {})
+                    result.get("data", {}).get(payload_field, {}).get("thread", {})
                 )
 
                 if not thread_data:
                     raise ResolveServiceError(
                         message="No thread data returned from GraphQL mutation",
-                        context={"thread_id": thread_id, "action": "unresolve"},
+                        context={"thread_id": thread_id, "action": action},
                     )
 
                 # Extract URL with intelligent fallback
                 thread_url = self._get_thread_url(thread_data, thread_id)
 
-                return {
-                    "thread_id": thread_id,
-                    "action": "unresolve",
-                    "success": True,
-                    "is_resolved": str(thread_data.get("isResolved", False)).lower(),
-                    "thread_url": thread_url,
-                }
+                return (
+                    {
+                        "thread_id": thread_id,
+                        "action": action,
+                        "success": True,
+                        "is_resolved": str(
+                            thread_data.get("isResolved", not undo)
+                        ).lower(),
+                        "thread_url": thread_url,
+                    },
+                    thread_data,
+                )
             except (KeyError, TypeError, AttributeError) as e:
                 raise ResolveServiceError(
                     message=(
-                        "Invalid response structure from unresolve mutation: " f"{e!s}"
+                        f"Invalid response structure from {action} mutation: {e!s}"
                     ),
                     context={
                         "thread_id": thread_id,
-                        "action": "unresolve",
+                        "action": action,
                         "response_keys": (
                             list(result.keys())
                             if isinstance(result, dict)
@@ -230,11 +290,102 @@ class ResolveService:
             raise
         except Exception as e:
             # Wrap any unexpected errors
+            description = "unresolution" if undo else "resolution"
             raise ResolveServiceError(
-                message=f"Unexpected error during thread unresolution: {e!s}",
-                context={"thread_id": thread_id, "action": "unresolve"},
+                message=f"Unexpected error during thread {description}: {e!s}",
+                context={"thread_id": thread_id, "action": action},
             ) from e
 
+    def resolve_threads(
+        self, thread_ids: list[str], undo: bool = False
+    ) -> list[dict[str, Any]]:
+        """Resolve or unresolve several threads in a single request.
+
+        All threads are sent as aliased fields of one mutation document, so
+        callers should pass at most RESOLVE_BATCH_SIZE IDs per call. A failure
+        on one thread does not affect the others.
+
+        Args:
+            thread_ids: Thread node IDs to update.
+            undo: If True, unresolve the threads instead of resolving them.
+
+        Returns:
+            One result per thread ID, in input order, with ``thread_id``,
+            ``action`` and ``success`` keys plus ``is_resolved`` on success or
+            ``error`` on failure.
+
+        Raises:
+            ResolveServiceError: If the response cannot be interpreted.
+            GitHubAPIError: If the request as a whole fails.
+        """
+        action = "unresolve" if undo else "resolve"
+        results: list[dict[str, Any]] = [
+            {"thread_id": thread_id, "action": action, "success": False}
+            for thread_id in thread_ids
+        ]
+
+        # Invalid IDs are reported without being sent
+        batch: list[int] = []
+        for index, thread_id in enumerate(thread_ids):
+            try:
+                validate_thread_id(thread_id)
+            except ValueError as e:
+                results[index]["error"] = f"Invalid thread ID format: {e!s}"
+            else:
+                batch.append(index)
+        if not batch:
+            return results
+
+        from ..parsers.query_registry import bulk_resolve_mutation
+
+        mutation = bulk_resolve_mutation(len(batch), undo=undo).document
+        variables = {
+            f"t{alias}": thread_ids[index] for alias, index in enumerate(batch)
+        }
+        try:
+            response = self.github_service.execute_graphql_query(
+                mutation, variables, allow_partial_errors=True
+            )
+        except GitHubAPIError:
+            raise
+        except Exception as e:
+            raise create_github_error(
+                message=f"Failed to execute bulk {action} mutation: {e!s}",
+                api_endpoint=f"GraphQL bulk {action} mutation",
+            ) from e
+
+        if not isinstance(response, dict):
+            raise ResolveServiceError(
+                message=f"Invalid response from bulk {action} mutation",
+                context={"action": action, "thread_count": len(batch)},
+            )
+
+        # Errors name the alias they belong to in their path
+        alias_errors: dict[str, list[str]] = {}
+        for error in response.get("errors") or []:
+            if not isinstance(error, dict):
+                continue
+            path = error.get("path") or []
+            alias = str(path[0]) if path else ""
+            alias_errors.setdefault(alias, []).append(str(error.get("message", error)))
+
+        data = response.get("data") or {}
+        for alias_index, index in enumerate(batch):
+            alias = f"t{alias_index}"
+            payload = data.get(alias) if isinstance(data, dict) else None
+            thread = payload.get("thread") if isinstance(payload, dict) else None
+            if isinstance(thread, dict):
+                results[index]["success"] = True
+                results[index]["is_resolved"] = bool(thread.get("isResolved", not undo))
+            else:
+                messages = alias_errors.get(alias) or alias_errors.get("") or []
+                results[index]["error"] = (
+                    "; ".join(messages)
+                    if messages
+                    else "No thread data returned from GraphQL mutation"
+                )
+        return results
+
     def _handle_graphql_errors(
         self, errors: list[dict[str, Any]], thread_id: str, action: str
     ) -> None:
@@ -353,27 +504,7 @@ class ResolveService:
 
         try:
             # Validate input parameters
-            if not isinstance(owner, str) or not owner.strip():
-                raise create_validation_error(
-                    field_name="owner",
-                    invalid_value=owner,
-                    expected_format="non-empty string",
-                    message="Repository owner must be a non-empty string",
-                )
-            if not isinstance(repo, str) or not repo.strip():
-                raise create_validation_error(
-                    field_name="repo",
-                    invalid_value=repo,
-                    expected_format="non-empty string",
-                    message="Repository name must be a non-empty string",
-                )
-            if not isinstance(pull_number, int) or pull_number <= 0:
-                raise create_validation_error(
-                    field_name="pull_number",
-                    invalid_value=pull_number,
-                    expected_format="positive integer",
-                    message="Pull request number must be a positive integer",
-                )
+            self._validate_pull_request_target(owner, repo, pull_number)
             if not isinstance(thread_id, str) or not thread_id.strip():
                 raise create_validation_error(
                     field_name="thread_id",
@@ -549,6 +680,145 @@ class ResolveService:
                 },
             ) from e
 
+    def validate_threads_exist(
+        self, owner: str, repo: str, pull_number: int, thread_ids: list[str]
+    ) -> dict[str, bool]:
+        """Validate that many threads exist in a pull request.
+
+        Threads are looked up with a single ``nodes(ids:)`` query per
+        VALIDATION_BATCH_SIZE IDs instead of one query per thread.
+
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            pull_number: Pull request number.
+            thread_ids: Thread IDs to validate.
+
+        Returns:
+            Mapping of each thread ID to True if it is a review thread in the
+            pull request, False otherwise.
+
+        Raises:
+            ValidationError: If input parameters are invalid.
+            ResolveServiceError: If the response cannot be interpreted.
+            GitHubAPIError: If the GitHub API call fails.
+        """
+        self._validate_pull_request_target(owner, repo, pull_number)
+
+        expected_repo = f"{owner}/{repo}".lower()
+        return {
+            thread_id: location is not None
+            and location[0] == pull_number
+            and location[1] is not None
+            and location[1].lower() == expected_repo
+            for thread_id, location in self._thread_locations(thread_ids).items()
+        }
+
+    def _thread_locations(
+        self, thread_ids: list[str]
+    ) -> dict[str, Optional[tuple[Optional[int], Optional[str]]]]:
+        """Look up the pull request and repository of many threads.
+
+        Args:
+            thread_ids: Thread IDs to look up.
+
+        Returns:
+            Mapping of each unique thread ID to its pull request number and
+            repository in owner/repo format, or None if it is not a review
+            thread.
+
+        Raises:
+            ResolveServiceError: If the response cannot be interpreted.
+            GitHubAPIError: If the GitHub API call fails.
+        """
+        from ..parsers.query_registry import registered_document
+
+        unique_ids = list(dict.fromkeys(thread_ids))
+        locations: dict[str, Optional[tuple[Optional[int], Optional[str]]]] = (
+            dict.fromkeys(unique_ids)
+        )
+
+        for start in range(0, len(unique_ids), VALIDATION_BATCH_SIZE):
+            batch = unique_ids[start : start + VALIDATION_BATCH_SIZE]
+            try:
+                response = self.github_service.execute_graphql_query(
+                    registered_document(
+                        "validateThreadsExist", VALIDATE_THREADS_QUERY
+                    ).document,
+                    {"ids": batch},
+                    allow_partial_errors=True,
+                )
+            except GitHubAPIError:
+                raise
+            except Exception as e:
+                raise create_github_error(
+                    message=f"Failed to execute thread validation query: {e!s}",
+                    api_endpoint="GraphQL nodes validation",
+                ) from e
+
+            # Unknown IDs come back as null nodes with a per-ID error
+            nodes = (response.get("data") or {}).get("nodes")
+            if not isinstance(nodes, list):
+                raise ResolveServiceError(
+                    message="Failed to validate threads: response has no nodes list",
+                    context={"thread_count": len(batch)},
+                )
+
+            for thread_id, node in zip(batch, nodes):
+                if not isinstance(node, dict):
+                    continue
+                pull_request = node.get("pullRequest")
+                if not isinstance(pull_request, dict):
+                    continue
+                repository = pull_request.get("repository")
+                name_with_owner = (
+                    repository.get("nameWithOwner")
+                    if isinstance(repository, dict)
+                    else None
+                )
+                number = pull_request.get("number")
+                locations[thread_id] = (
+                    number if isinstance(number, int) else None,
+                    name_with_owner if isinstance(name_with_owner, str) else None,
+                )
+
+        return locations
+
+    def _validate_pull_request_target(
+        self, owner: str, repo: str, pull_number: int
+    ) -> None:
+        """Validate repository and pull request lookup parameters.
+
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            pull_number: Pull request number.
+
+        Raises:
+            ValidationError: If a parameter is invalid.
+        """
+        if not isinstance(owner, str) or not owner.strip():
+            raise create_validation_error(
+                field_name="owner",
+                invalid_value=owner,
+                expected_format="non-empty string",
+                message="Repository owner must be a non-empty string",
+            )
+        if not isinstance(repo, str) or not repo.strip():
+            raise create_validation_error(
+                field_name="repo",
+                invalid_value=repo,
+                expected_format="non-empty string",
+                message="Repository name must be a non-empty string",
+            )
+        if not isinstance(pull_number, int) or pull_number <= 0:
+            raise create_validation_error(
+                field_name="pull_number",
+                invalid_value=pull_number,
+                expected_format="positive integer",
+                message="Pull request number must be a positive integer",
+            )
+
     def _get_thread_url(self, thread_data: dict[str, Any], thread_id: str) -> str:
         """Extract thread URL from GraphQL response with intelligent fallback.
 
@@ -0,0 +1,446 @@
+"""On-disk cache of read-only GraphQL responses.
+
+Running ``toady fetch`` or ``toady resolve --all`` several times in a row asks
+GitHub the same questions each time. Responses to read-only queries are
+therefore kept under ``~/.toady/cache/graphql`` for a short, per-kind TTL:
+
+* ``<key>.json`` holds one response with its kind and expiry time.
+* ``index.json`` maps each key to the entry's size, the node IDs that
+  appear in the response and, for queries about one pull request, that
+  pull request.
+
+Keys hash the query text, the variables, the GitHub host and the identity of
+the gh credentials, so switching accounts or hosts never serves another
+account's data. The identity, the cache location and TOADY_NO_CACHE are read
+from the environment on every lookup, because a long-lived process such as
+``toady serve`` runs each command with its caller's environment.
+
+The least recently used entries are evicted once the cache grows past
+MAX_CACHE_BYTES; an entry file's mtime records its last use.
+
+When toady performs a mutation, every entry whose response contains one of the
+mutated node IDs (for example the thread that was resolved or replied to) is
+dropped. Changes made through the REST API, which has no node IDs to match,
+drop every entry about the pull request they changed instead. Set
+``TOADY_NO_CACHE=1`` to bypass the cache entirely.
+
+Files are replaced atomically and index updates hold ``index.lock``, so
+several toady processes can share the cache. The cache is best effort:
+unreadable entries count as misses and write failures are logged and ignored.
+"""
+
+from collections.abc import Callable, Iterable
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import time
+from typing import Any, Optional
+
+from .cache_storage import FileLock, atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+# Total size of cached responses before the least recently used are evicted
+MAX_CACHE_BYTES = 50 * 1024 * 1024
+
+# Seconds a response stays fresh, by query kind; kinds missing here are not
+# cached
+QUERY_KIND_TTLS = {
+    "review_threads": 30,
+    "pull_requests": 60,
+    "pull_request": 120,
+}
+
+# Environment variables gh reads credentials from, in priority order
+TOKEN_ENV_VARS = ("GH_TOKEN", "GITHUB_TOKEN", "GH_ENTERPRISE_TOKEN")
+
+# Variable values that look like GitHub node IDs (PRRT_..., IC_..., PR_...)
+_NODE_ID_PATTERN = re.compile(r"^[A-Z]{1,6}_[A-Za-z0-9_=-]+$")
+
+
+def query_kind(query: str) -> str:
+    """Classify a GraphQL document for TTL purposes.
+
+    Args:
+        query: GraphQL document.
+
+    Returns:
+        One of "mutation", "introspection", "review_threads", "pull_requests",
+        "pull_request" or "other".
+    """
+    if query.lstrip().startswith("mutation"):
+        return "mutation"
+    if "__schema" in query:
+        return "introspection"
+    if "reviewThreads" in query:
+        return "review_threads"
+    if "pullRequests" in query:
+        return "pull_requests"
+    if "pullRequest(" in query:
+        return "pull_request"
+    return "other"
+
+
+def mutated_node_ids(variables: Optional[dict[str, Any]]) -> set[str]:
+    """Find the node IDs a mutation targets from its variables.
+
+    Args:
+        variables: Mutation variables.
+
+    Returns:
+        Variable values that look like GitHub node IDs.
+    """
+    node_ids: set[str] = set()
+    for value in (variables or {}).values():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for item in values:
+            if isinstance(item, str) and _NODE_ID_PATTERN.match(item):
+                node_ids.add(item)
+    return node_ids
+
+
+def _response_node_ids(data: Any) -> set[str]:
+    """Collect every ``id`` field value in a GraphQL response.
+
+    Args:
+        data: Decoded response, or part of it.
+
+    Returns:
+        Node IDs found anywhere in the response.
+    """
+    node_ids: set[str] = set()
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            node_id = item.get("id")
+            if isinstance(node_id, str):
+                node_ids.add(node_id)
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return node_ids
+
+
+def _pull_request_of(variables: Optional[dict[str, Any]]) -> Optional[str]:
+    """Identify the pull request a query is about from its variables.
+
+    Args:
+        variables: Query variables.
+
+    Returns:
+        ``owner/repo#number`` in lowercase, or None if the variables do not
+        name a single pull request.
+    """
+    variables = variables or {}
+    owner, repo, number = (variables.get(name) for name in ("owner", "repo", "number"))
+    if not (owner and repo and number):
+        return None
+    return f"{owner}/{repo}#{number}".lower()
+
+
+def _gh_identity() -> str:
+    """Identify the gh credentials in use without running gh.
+
+    Returns:
+        Digest of the token from the environment, or of gh's hosts.yml when
+        gh uses its stored login.
+    """
+    for name in TOKEN_ENV_VARS:
+        token = os.environ.get(name)
+        if token:
+            return hashlib.sha256(f"{name}:{token}".encode()).hexdigest()
+
+    config_dir = os.environ.get("GH_CONFIG_DIR")
+    if not config_dir:
+        xdg_config = os.environ.get("XDG_CONFIG_HOME")
+        base = Path(xdg_config) if xdg_config else Path.home() / ".config"
+        config_dir = str(base / "gh")
+    try:
+        return hashlib.sha256(Path(config_dir, "hosts.yml").read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+class ResponseCache:
+    """TTL and size bounded cache of GraphQL responses."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache. Defaults to
+                ~/.toady/cache/graphql for the current HOME.
+            max_bytes: Size limit. Defaults to MAX_CACHE_BYTES.
+            enabled: Whether to use the cache. Defaults to on unless the
+                TOADY_NO_CACHE environment variable is set.
+        """
+        self._cache_dir = cache_dir
+        self.max_bytes = MAX_CACHE_BYTES if max_bytes is None else max_bytes
+        self._enabled = enabled
+
+    @property
+    def cache_dir(self) -> Path:
+        """Directory holding the cache."""
+        return self._cache_dir or Path.home() / ".toady" / "cache" / "graphql"
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is used."""
+        if self._enabled is not None:
+            return self._enabled
+        return os.environ.get("TOADY_NO_CACHE", "").lower() not in (
+            "1",
+            "true",
+            "yes",
+        )
+
+    @property
+    def index_path(self) -> Path:
+        """Location of the index file."""
+        return self.cache_dir / "index.json"
+
+    def _index_lock(self) -> FileLock:
+        """Lock serializing index updates across processes."""
+        return FileLock(self.cache_dir / "index.lock")
+
+    def key(self, query: str, variables: Optional[dict[str, Any]] = None) -> str:
+        """Compute the cache key of a query.
+
+        Args:
+            query: GraphQL document.
+            variables: Query variables.
+
+        Returns:
+            Hex digest identifying the query for the current host and account.
+        """
+        material = json.dumps(
+            [
+                CACHE_VERSION,
+                os.environ.get("GH_HOST", "github.com"),
+                _gh_identity(),
+                query,
+                variables or {},
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, query: str, variables: Optional[dict[str, Any]] = None) -> Any:
+        """Look up a fresh cached response.
+
+        Args:
+            query: GraphQL document.
+            variables: Query variables.
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        if not self.enabled or query_kind(query) not in QUERY_KIND_TTLS:
+            return None
+
+        path = self._entry_path(self.key(query, variables))
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+
+        if not isinstance(entry, dict) or entry.get("expires_at", 0) <= time.time():
+            return None
+        try:
+            # The mtime marks the entry as recently used for eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("response")
+
+    def put(
+        self, query: str, variables: Optional[dict[str, Any]], response: Any
+    ) -> None:
+        """Store a response if its query kind is cacheable.
+
+        Args:
+            query: GraphQL document.
+            variables: Query variables.
+            response: Decoded response without errors.
+        """
+        kind = query_kind(query)
+        ttl = QUERY_KIND_TTLS.get(kind)
+        if not self.enabled or not ttl:
+            return
+
+        key = self.key(query, variables)
+        payload = json.dumps(
+            {"kind": kind, "expires_at": time.time() + ttl, "response": response},
+            separators=(",", ":"),
+        )
+        try:
+            atomic_write_text(self._entry_path(key), payload)
+            with self._index_lock():
+                index = self._load_index()
+                meta: dict[str, Any] = {
+                    "size": len(payload),
+                    "nodes": sorted(_response_node_ids(response)),
+                }
+                pull_request = _pull_request_of(variables)
+                if pull_request:
+                    meta["pull_request"] = pull_request
+                index[key] = meta
+                self._evict(index)
+                self._save_index(index)
+        except OSError as e:
+            logger.warning("Cannot write response cache %s: %s", self.cache_dir, e)
+
+    def invalidate(self, node_ids: Iterable[str]) -> int:
+        """Drop every entry whose response mentions one of the given nodes.
+
+        Args:
+            node_ids: IDs of nodes that changed.
+
+        Returns:
+            Number of entries removed.
+        """
+        targets = set(node_ids)
+        if not targets:
+            return 0
+        return self._drop(
+            lambda meta: bool(targets.intersection(meta.get("nodes", ())))
+        )
+
+    def invalidate_pull_request(self, owner: str, repo: str, number: int) -> int:
+        """Drop every entry about one pull request.
+
+        Used after changes whose node IDs are unknown, such as replies posted
+        through the REST API.
+
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            number: Pull request number.
+
+        Returns:
+            Number of entries removed.
+        """
+        target = _pull_request_of({"owner": owner, "repo": repo, "number": number})
+        return self._drop(lambda meta: meta.get("pull_request") == target)
+
+    def _drop(self, is_stale: Callable[[dict[str, Any]], bool]) -> int:
+        """Remove the entries whose index metadata matches a predicate.
+
+        Args:
+            is_stale: Called with each entry's metadata.
+
+        Returns:
+            Number of entries removed.
+        """
+        if not self.enabled or not self.index_path.exists():
+            return 0
+
+        try:
+            with self._index_lock():
+                index = self._load_index()
+                stale = [key for key, meta in index.items() if is_stale(meta)]
+                for key in stale:
+                    del index[key]
+                    self._remove_entry(key)
+                if stale:
+                    self._save_index(index)
+        except OSError as e:
+            logger.warning("Cannot write response cache %s: %s", self.cache_dir, e)
+            return 0
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        try:
+            with self._index_lock():
+                for key in self._load_index():
+                    self._remove_entry(key)
+                self.index_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Cannot clear response cache %s: %s", self.cache_dir, e)
+
+    def _entry_path(self, key: str) -> Path:
+        """Location of the file holding an entry."""
+        return self.cache_dir / f"{key}.json"
+
+    def _remove_entry(self, key: str) -> None:
+        """Delete an entry file if it exists."""
+        try:
+            self._entry_path(key).unlink()
+        except OSError:
+            pass
+
+    def _evict(self, index: dict[str, dict[str, Any]]) -> None:
+        """Drop least recently used entries until the cache fits its limit.
+
+        Args:
+            index: Index to update in place.
+        """
+        total = sum(int(meta.get("size", 0)) for meta in index.values())
+        if total <= self.max_bytes:
+            return
+
+        def last_used(key: str) -> float:
+            try:
+                return self._entry_path(key).stat().st_mtime
+            except OSError:
+                return 0.0
+
+        for key in sorted(index, key=last_used):
+            if total <= self.max_bytes:
+                break
+            total -= int(index.pop(key).get("size", 0))
+            self._remove_entry(key)
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        """Read the index, treating any problem as an empty index.
+
+        Returns:
+            Mapping of cache key to entry metadata.
+        """
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable cache index %s: %s", self.index_path, e)
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        entries = data.get("entries")
+        if not isinstance(entries, dict):
+            return {}
+        return {
+            str(key): meta for key, meta in entries.items() if isinstance(meta, dict)
+        }
+
+    def _save_index(self, index: dict[str, dict[str, Any]]) -> None:
+        """Write the index atomically.
+
+        Args:
+            index: Mapping of cache key to entry metadata.
+        """
+        atomic_write_text(
+            self.index_path,
+            json.dumps(
+                {"version": CACHE_VERSION, "entries": index}, separators=(",", ":")
+            ),
+        )
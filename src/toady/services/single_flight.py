@@ -0,0 +1,86 @@
+"""Deduplication of identical concurrent calls.
+
+When several threads ask for the same thing at the same time, only the first
+one does the work; the others wait for it and receive the same result or
+exception. Nothing is cached: once the call returns, the next caller with the
+same key starts a fresh call.
+"""
+
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Call(Generic[T]):
+    """An in-flight call and its outcome."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Optional[T] = None
+    error: Optional[BaseException] = None
+    waiters: int = 0
+
+
+class SingleFlight(Generic[T]):
+    """Group of calls where concurrent calls with equal keys run once."""
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call[T]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn``, or join an identical call that is already running.
+
+        Args:
+            key: Identity of the call; calls with equal keys are shared.
+            fn: Function doing the work.
+
+        Returns:
+            The result of the call, shared by every caller that joined it.
+
+        Raises:
+            BaseException: Whatever ``fn`` raised, re-raised in every caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def waiting(self, key: Hashable) -> int:
+        """Count the callers waiting on the in-flight call for a key.
+
+        Args:
+            key: Identity of the call.
+
+        Returns:
+            Number of callers that joined the running call, not counting the
+            one doing the work; 0 if no call with this key is running.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            return call.waiters if call is not None else 0
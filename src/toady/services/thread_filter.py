@@ -0,0 +1,230 @@
+"""Predicate filters for selecting review threads in bulk operations.
+
+Filters are written as ``key=value`` clauses, for example::
+
+    path=docs/**         file path glob (a trailing "/" matches a directory)
+    author=alice,bob     thread author login, case-insensitive
+    outdated             only outdated threads ("outdated=false" for current)
+    older-than=7d        no activity for the given duration (s, m, h, d, w)
+
+Clauses with different keys must all match. Repeated ``path`` or ``author``
+clauses match if any of their values match.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from fnmatch import fnmatchcase
+import re
+from typing import Optional
+
+from ..models.models import ReviewThread
+
+FILTER_KEYS = ("path", "author", "outdated", "older-than")
+
+_DURATION_PATTERN = re.compile(r"^(\d+)([smhdw])$")
+_DURATION_UNITS = {
+    "s": "seconds",
+    "m": "minutes",
+    "h": "hours",
+    "d": "days",
+    "w": "weeks",
+}
+
+
+def parse_duration(value: str) -> timedelta:
+    """Parse a compact duration such as ``30m``, ``12h`` or ``7d``.
+
+    Args:
+        value: Duration made of a positive integer and a unit suffix.
+
+    Returns:
+        The parsed duration.
+
+    Raises:
+        ValueError: If the duration is malformed.
+    """
+    match = _DURATION_PATTERN.match(value.strip().lower())
+    if not match:
+        raise ValueError(
+            f"Invalid duration '{value}'. Use a number followed by s, m, h, d or w "
+            "(e.g. 7d)"
+        )
+    amount, unit = match.groups()
+    return timedelta(**{_DURATION_UNITS[unit]: int(amount)})
+
+
+@dataclass
+class ThreadFilter:
+    """Conjunction of thread predicates parsed from ``--where`` clauses.
+
+    Attributes:
+        paths: File path globs; a thread matches if any glob matches.
+        authors: Lowercased author logins; a thread matches if any is the author.
+        outdated: Required outdated state, or None to ignore it.
+        older_than: Minimum time since the thread's last activity.
+    """
+
+    paths: list[str] = field(default_factory=list)
+    authors: list[str] = field(default_factory=list)
+    outdated: Optional[bool] = None
+    older_than: Optional[timedelta] = None
+
+    @classmethod
+    def from_clauses(cls, clauses: Iterable[str]) -> "ThreadFilter":
+        """Build a filter from ``key=value`` clauses.
+
+        Args:
+            clauses: Filter clauses as given on the command line.
+
+        Returns:
+            ThreadFilter combining all clauses.
+
+        Raises:
+            ValueError: If a clause has an unknown key or invalid value.
+        """
+        thread_filter = cls()
+        for clause in clauses:
+            key, has_value, value = clause.partition("=")
+            key = key.strip().lower()
+            value = value.strip()
+
+            if key not in FILTER_KEYS:
+                raise ValueError(
+                    f"Unknown filter '{key}'. Available filters: "
+                    f"{', '.join(FILTER_KEYS)}"
+                )
+            if key != "outdated" and not value:
+                raise ValueError(f"Filter '{key}' requires a value, e.g. {key}=...")
+
+            if key == "path":
+                thread_filter.paths.append(value)
+            elif key == "author":
+                thread_filter.authors.extend(
+                    author.strip().lstrip("@").lower()
+                    for author in value.split(",")
+                    if author.strip()
+                )
+            elif key == "outdated":
+                thread_filter.outdated = _parse_bool(value) if has_value else True
+            else:
+                thread_filter.older_than = parse_duration(value)
+
+        return thread_filter
+
+    def matches(self, thread: ReviewThread, now: Optional[datetime] = None) -> bool:
+        """Check whether a thread satisfies every predicate.
+
+        Args:
+            thread: Thread to test.
+            now: Current time as a naive UTC datetime. Defaults to the current
+                time.
+
+        Returns:
+            True if the thread matches.
+        """
+        if self.paths and not (
+            thread.file_path
+            and any(_path_matches(thread.file_path, glob) for glob in self.paths)
+        ):
+            return False
+
+        if self.authors and thread.author.lower() not in self.authors:
+            return False
+
+        if self.outdated is not None and thread.is_outdated != self.outdated:
+            return False
+
+        if self.older_than is not None:
+            if now is None:
+                now = datetime.now(timezone.utc).replace(tzinfo=None)
+            if now - thread.updated_at < self.older_than:
+                return False
+
+        return True
+
+    def apply(
+        self, threads: Iterable[ReviewThread], now: Optional[datetime] = None
+    ) -> list[ReviewThread]:
+        """Return the threads that match the filter.
+
+        Args:
+            threads: Threads to filter.
+            now: Current time as a naive UTC datetime. Defaults to the current
+                time.
+
+        Returns:
+            Matching threads in their original order.
+        """
+        if now is None and self.older_than is not None:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return [thread for thread in threads if self.matches(thread, now)]
+
+    def describe(self) -> str:
+        """Describe the filter in the clause syntax it was parsed from.
+
+        Returns:
+            Space-separated clauses, or an empty string for an empty filter.
+        """
+        clauses = [f"path={glob}" for glob in self.paths]
+        if self.authors:
+            clauses.append(f"author={','.join(self.authors)}")
+        if self.outdated is not None:
+            clauses.append("outdated" if self.outdated else "outdated=false")
+        if self.older_than is not None:
+            clauses.append(f"older-than={_format_duration(self.older_than)}")
+        return " ".join(clauses)
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean filter value.
+
+    Args:
+        value: Value such as ``true`` or ``no``.
+
+    Returns:
+        The boolean value.
+
+    Raises:
+        ValueError: If the value is not a recognised boolean.
+    """
+    lowered = value.lower()
+    if lowered in ("true", "yes", "1"):
+        return True
+    if lowered in ("false", "no", "0"):
+        return False
+    raise ValueError(f"Invalid boolean '{value}'. Use true or false")
+
+
+def _path_matches(file_path: str, glob: str) -> bool:
+    """Match a file path against a glob or directory prefix.
+
+    ``*`` matches across directory separators, so ``docs/*`` and ``docs/**``
+    both match every file under ``docs``.
+
+    Args:
+        file_path: Repository-relative file path.
+        glob: Glob pattern, or a directory ending in ``/``.
+
+    Returns:
+        True if the path matches.
+    """
+    if glob.endswith("/"):
+        return file_path.startswith(glob)
+    return fnmatchcase(file_path, glob)
+
+
+def _format_duration(duration: timedelta) -> str:
+    """Format a duration using the largest whole unit.
+
+    Args:
+        duration: Duration to format.
+
+    Returns:
+        Compact duration such as ``7d``.
+    """
+    seconds = int(duration.total_seconds())
+    for suffix, unit_seconds in (("w", 604800), ("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds and seconds % unit_seconds == 0:
+            return f"{seconds // unit_seconds}{suffix}"
+    return f"{seconds}s"
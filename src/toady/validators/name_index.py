@@ -0,0 +1,78 @@
+"""Trigram index for suggesting schema names close to a misspelled one.
+
+Each name is lowercased, padded with a boundary marker and split into its
+overlapping three-character n-grams, so ``title`` becomes ``$ti tit itl tle
+le$``. The index maps every n-gram to the names containing it; looking a
+name up only visits names sharing at least one n-gram with it and ranks them
+by the Dice coefficient of the two n-gram sets.
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+
+NGRAM_SIZE = 3
+
+# Candidates scoring below this share too little with the name to help
+MIN_SIMILARITY = 0.3
+
+
+def ngrams(name: str) -> set[str]:
+    """Split a name into its padded, lowercased n-grams.
+
+    Args:
+        name: Name to split
+
+    Returns:
+        Set of n-grams of the name
+    """
+    padded = f"${name.lower()}$"
+    return {
+        padded[start : start + NGRAM_SIZE]
+        for start in range(max(len(padded) - NGRAM_SIZE + 1, 1))
+    }
+
+
+class NameIndex:
+    """Inverted n-gram index over a fixed set of names."""
+
+    def __init__(self, names: Iterable[str]) -> None:
+        """Index a set of names.
+
+        Args:
+            names: Names to index; duplicates are ignored
+        """
+        self._names: list[str] = sorted(set(names))
+        self._sizes: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+        for position, name in enumerate(self._names):
+            grams = ngrams(name)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        """Return the number of indexed names."""
+        return len(self._names)
+
+    def suggest(self, name: str, limit: int = 5) -> list[str]:
+        """Find the indexed names most similar to a name.
+
+        Args:
+            name: Possibly misspelled name
+            limit: Maximum number of suggestions
+
+        Returns:
+            Up to ``limit`` names, most similar first
+        """
+        grams = ngrams(name)
+        shared: Counter[int] = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+
+        scored = []
+        for position, count in shared.items():
+            similarity = 2 * count / (len(grams) + self._sizes[position])
+            if similarity >= MIN_SIMILARITY and self._names[position] != name:
+                scored.append((-similarity, self._names[position]))
+        scored.sort()
+        return [candidate for _, candidate in scored[:limit]]
@@ -0,0 +1,236 @@
+"""Compact, indexed on-disk form of the GitHub GraphQL schema.
+
+The introspection result is several megabytes of JSON, most of it
+descriptions, and validating a query only ever looks at a handful of types.
+:func:`write_schema_index` therefore compiles the schema into a binary file
+that :class:`SchemaIndex` memory-maps and decodes one type at a time::
+
+    header   magic "TDYS", format version, type count, schema hash
+    records  one per type, sorted by name:
+             name offset, name length, data offset, data length
+    names    UTF-8 type names
+    data     compact JSON of each type definition, without descriptions
+
+Looking a type up is a binary search over the fixed-size records followed by
+decoding that one type, so opening the index costs no JSON decoding at all.
+"""
+
+import hashlib
+import json
+import mmap
+from pathlib import Path
+import struct
+from types import TracebackType
+from typing import Any, Optional
+
+from ..services.cache_storage import atomic_write_bytes
+
+INDEX_MAGIC = b"TDYS"
+INDEX_VERSION = 1
+
+# magic, version, reserved, type count, sha256 of the source schema
+_HEADER = struct.Struct("<4sHHI32s")
+# name offset, name length, data offset, data length
+_RECORD = struct.Struct("<IHII")
+
+
+class SchemaIndexError(Exception):
+    """Raised when a schema index file is missing, corrupt or outdated."""
+
+
+def schema_hash(schema: dict[str, Any]) -> str:
+    """Hash an introspection schema the way the schema cache records it.
+
+    Args:
+        schema: The ``__schema`` object of an introspection result.
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding.
+    """
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+
+
+def _strip_descriptions(value: Any) -> Any:
+    """Drop the ``description`` keys validation never reads.
+
+    Args:
+        value: Part of a type definition.
+
+    Returns:
+        Copy of the value without descriptions.
+    """
+    if isinstance(value, dict):
+        return {
+            key: _strip_descriptions(item)
+            for key, item in value.items()
+            if key != "description"
+        }
+    if isinstance(value, list):
+        return [_strip_descriptions(item) for item in value]
+    return value
+
+
+def compile_schema_index(schema: dict[str, Any], digest: str) -> bytes:
+    """Compile an introspection schema into the binary index format.
+
+    Args:
+        schema: The ``__schema`` object of an introspection result.
+        digest: Hex schema hash stored in the header, see :func:`schema_hash`.
+
+    Returns:
+        Contents of the index file.
+    """
+    types: dict[bytes, bytes] = {}
+    for type_def in schema.get("types", []):
+        if isinstance(type_def, dict) and type_def.get("name"):
+            encoded = json.dumps(_strip_descriptions(type_def), separators=(",", ":"))
+            types[type_def["name"].encode("utf-8")] = encoded.encode("utf-8")
+    names = sorted(types)
+
+    names_offset = _HEADER.size + _RECORD.size * len(names)
+    data_offset = names_offset + sum(len(name) for name in names)
+
+    records = bytearray()
+    name_blob = bytearray()
+    data_blob = bytearray()
+    for name in names:
+        data = types[name]
+        records += _RECORD.pack(
+            names_offset + len(name_blob),
+            len(name),
+            data_offset + len(data_blob),
+            len(data),
+        )
+        name_blob += name
+        data_blob += data
+
+    header = _HEADER.pack(
+        INDEX_MAGIC, INDEX_VERSION, 0, len(names), bytes.fromhex(digest)
+    )
+    return bytes(header + records + name_blob + data_blob)
+
+
+def write_schema_index(path: Path, schema: dict[str, Any], digest: str) -> None:
+    """Compile a schema and write its index atomically.
+
+    Args:
+        path: Destination file.
+        schema: The ``__schema`` object of an introspection result.
+        digest: Hex schema hash, see :func:`schema_hash`.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    atomic_write_bytes(path, compile_schema_index(schema, digest))
+
+
+class SchemaIndex:
+    """Read-only, memory-mapped view of a compiled schema index."""
+
+    def __init__(self, path: Path) -> None:
+        """Open and map an index file.
+
+        Args:
+            path: Index file written by :func:`write_schema_index`.
+
+        Raises:
+            SchemaIndexError: If the file is missing or not a valid index.
+        """
+        try:
+            with open(path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise SchemaIndexError(f"Cannot open schema index {path}: {e}") from e
+
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise SchemaIndexError(f"Schema index {path} is truncated")
+        magic, version, _, count, digest = _HEADER.unpack_from(self._map, 0)
+        if (
+            magic != INDEX_MAGIC
+            or version != INDEX_VERSION
+            or len(self._map) < _HEADER.size + count * _RECORD.size
+        ):
+            self.close()
+            raise SchemaIndexError(f"Schema index {path} is invalid or outdated")
+
+        self.type_count: int = count
+        self.schema_hash: str = digest.hex()
+        self._types: dict[str, Optional[dict[str, Any]]] = {}
+
+    def _record(self, position: int) -> tuple[bytes, int, int]:
+        """Read the record at a position in the sorted record table.
+
+        Args:
+            position: Record number.
+
+        Returns:
+            Tuple of (type name, data offset, data length).
+        """
+        name_offset, name_length, data_offset, data_length = _RECORD.unpack_from(
+            self._map, _HEADER.size + position * _RECORD.size
+        )
+        return (
+            self._map[name_offset : name_offset + name_length],
+            data_offset,
+            data_length,
+        )
+
+    def get_type(self, type_name: str) -> Optional[dict[str, Any]]:
+        """Look up and decode one type definition.
+
+        Args:
+            type_name: Name of the type.
+
+        Returns:
+            Type definition without descriptions, or None if not found.
+        """
+        if type_name in self._types:
+            return self._types[type_name]
+
+        target = type_name.encode("utf-8")
+        low, high = 0, self.type_count
+        type_def = None
+        while low < high:
+            middle = (low + high) // 2
+            name, data_offset, data_length = self._record(middle)
+            if name < target:
+                low = middle + 1
+            elif name > target:
+                high = middle
+            else:
+                type_def = json.loads(
+                    self._map[data_offset : data_offset + data_length]
+                )
+                break
+
+        self._types[type_name] = type_def
+        return type_def
+
+    def type_names(self) -> list[str]:
+        """List every type name in the index.
+
+        Returns:
+            Type names in sorted order.
+        """
+        return [
+            self._record(position)[0].decode("utf-8")
+            for position in range(self.type_count)
+        ]
+
+    def close(self) -> None:
+        """Unmap the index file."""
+        self._map.close()
+
+    def __enter__(self) -> "SchemaIndex":
+        """Return the open index."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Close the index."""
+        self.close()
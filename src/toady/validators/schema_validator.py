@@ -5,19 +5,107 @@ against the live GitHub API schema, ensuring compatibility and catching
 breaking changes early.
 """
 
+from collections.abc import Iterable
+import copy
 from datetime import datetime, timedelta
 import hashlib
 import json
 import logging
 from pathlib import Path
 import subprocess
-from typing import Any, Optional
-
-from ..parsers.graphql_parser import GraphQLField, GraphQLParser
+import time
+from typing import Any, Callable, Optional
+
+from .. import __version__
+from ..parsers.graphql_parser import (
+    GraphQLField,
+    GraphQLParser,
+    GraphQLSyntaxError,
+    tokenize,
+)
+from ..services.cache_storage import FileLock, LockTimeoutError, atomic_write_text
 from ..services.github_service import GitHubService
+from .name_index import NameIndex
+from .schema_index import (
+    SchemaIndex,
+    SchemaIndexError,
+    schema_hash,
+    write_schema_index,
+)
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for another process that is refreshing the schema
+SCHEMA_REFRESH_LOCK_TIMEOUT = 120
+
+# Format of the cached validation results; bump when validation changes
+VALIDATION_CACHE_VERSION = 2
+
+# Queries whose validation results are kept; the oldest are dropped first
+MAX_VALIDATION_CACHE_ENTRIES = 256
+
+
+def query_hash(query: str) -> str:
+    """Hash a GraphQL document ignoring whitespace, commas and comments.
+
+    Args:
+        query: GraphQL document
+
+    Returns:
+        Hex SHA-256 digest of the document's tokens, or of the raw text if
+        it cannot be tokenized.
+    """
+    try:
+        normalized = " ".join(token.value for token in tokenize(query))
+    except GraphQLSyntaxError:
+        normalized = query
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def schema_fingerprint(schema: dict[str, Any]) -> str:
+    """Hash the parts of a schema that query validation depends on.
+
+    The fingerprint covers the names of every type, field, argument, input
+    field and enum value plus field deprecation. It can be computed from a
+    full introspection result or from the much smaller response to
+    GitHubSchemaValidator.FINGERPRINT_QUERY, and both give the same digest.
+
+    Args:
+        schema: The ``__schema`` object of either query.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    types = []
+    for type_def in schema.get("types") or []:
+        if not isinstance(type_def, dict):
+            continue
+        types.append(
+            [
+                type_def.get("name") or "",
+                sorted(
+                    [
+                        field.get("name") or "",
+                        bool(field.get("isDeprecated")),
+                        sorted(
+                            arg.get("name") or "" for arg in field.get("args") or []
+                        ),
+                    ]
+                    for field in type_def.get("fields") or []
+                ),
+                sorted(
+                    field.get("name") or ""
+                    for field in type_def.get("inputFields") or []
+                ),
+                sorted(
+                    value.get("name") or ""
+                    for value in type_def.get("enumValues") or []
+                ),
+            ]
+        )
+    types.sort()
+    return hashlib.sha256(json.dumps(types).encode()).hexdigest()
+
 
 class SchemaValidationError(Exception):
     """Exception raised when schema validation fails."""
@@ -62,6 +150,14 @@ class GitHubSchemaValidator:
         "ofType { kind name ofType { kind name ofType { kind name } } } } } } } }"
     )
 
+    # Cheap query used on cache expiry to check whether the schema changed,
+    # see schema_fingerprint()
+    FINGERPRINT_QUERY = (
+        "query SchemaFingerprint { __schema { types { name "
+        "fields(includeDeprecated: true) { name isDeprecated args { name } } "
+        "inputFields { name } enumValues(includeDeprecated: true) { name } } } }"
+    )
+
     def __init__(
         self,
         cache_dir: Optional[Path] = None,
@@ -77,6 +173,12 @@ class GitHubSchemaValidator:
         self.cache_ttl = cache_ttl
         self._schema: Optional[dict[str, Any]] = None
         self._type_map: Optional[dict[str, Any]] = None
+        self._index: Optional[SchemaIndex] = None
+        self._schema_digest: Optional[tuple[dict[str, Any], str]] = None
+        self._validation_results: Optional[tuple[str, dict[str, Any]]] = None
+        # Results not written to the validation cache yet, with their schema
+        self._pending_results: Optional[tuple[str, dict[str, Any]]] = None
+        self._name_indexes: Optional[tuple[str, dict[str, NameIndex]]] = None
         self._github_service = GitHubService()
 
     def _get_cache_path(self) -> Path:
@@ -88,6 +190,22 @@ class GitHubSchemaValidator:
         """Get the path to the cache metadata file."""
         return self.cache_dir / "github_schema_metadata.json"
 
+    def _get_index_path(self) -> Path:
+        """Get the path to the compiled schema index."""
+        return self.cache_dir / "github_schema.idx"
+
+    def _get_validation_cache_path(self) -> Path:
+        """Get the path to the cached query validation results."""
+        return self.cache_dir / "github_schema_validation.json"
+
+    def _get_validation_lock_path(self) -> Path:
+        """Get the path to the lock serializing validation cache updates."""
+        return self.cache_dir / "github_schema_validation.lock"
+
+    def _get_cache_lock_path(self) -> Path:
+        """Get the path to the lock file held while refreshing the schema."""
+        return self.cache_dir / "github_schema.lock"
+
     def _is_cache_valid(self) -> bool:
         """Check if the cached schema is still valid."""
         metadata_path = self._get_cache_metadata_path()
@@ -103,11 +221,52 @@ class GitHubSchemaValidator:
         except (json.JSONDecodeError, KeyError, ValueError):
             return False
 
-    def _load_cached_schema(self) -> Optional[dict[str, Any]]:
-        """Load schema from cache if valid."""
+    def _load_schema_index(self) -> Optional[SchemaIndex]:
+        """Open the compiled index of the cached schema if it is valid.
+
+        Returns:
+            The index, or None if the cache has expired or the index is
+            missing or does not match the cached schema.
+        """
         if not self._is_cache_valid():
             return None
 
+        try:
+            with open(self._get_cache_metadata_path()) as f:
+                expected_hash = json.load(f).get("schema_hash")
+            index = SchemaIndex(self._get_index_path())
+        except (OSError, ValueError, AttributeError, SchemaIndexError) as e:
+            logger.debug("Schema index unavailable: %s", e)
+            return None
+
+        if index.schema_hash != expected_hash:
+            index.close()
+            return None
+        return index
+
+    def _write_schema_index(self, schema: dict[str, Any], digest: str) -> None:
+        """Write the compiled index of a schema, logging failures.
+
+        Args:
+            schema: The GitHub GraphQL schema
+            digest: Hash of the schema
+        """
+        try:
+            write_schema_index(self._get_index_path(), schema, digest)
+        except OSError as e:
+            logger.warning("Failed to write schema index: %s", e)
+
+    def _load_cached_schema(
+        self, allow_stale: bool = False
+    ) -> Optional[dict[str, Any]]:
+        """Load schema from cache if valid.
+
+        Args:
+            allow_stale: Also return a cached schema whose TTL has expired.
+        """
+        if not allow_stale and not self._is_cache_valid():
+            return None
+
         cache_path = self._get_cache_path()
         if not cache_path.exists():
             return None
@@ -121,23 +280,153 @@ class GitHubSchemaValidator:
             return None
 
     def _save_schema_to_cache(self, schema: dict[str, Any]) -> None:
-        """Save schema to cache with metadata."""
+        """Save schema to cache with metadata.
+
+        Next to the raw introspection JSON, the schema is compiled into an
+        indexed binary file that validation reads without decoding the JSON.
+        All files are replaced atomically, so concurrent readers see either
+        the old or the new version. The metadata is written last because it
+        is what marks the cache as fresh.
+        """
         cache_path = self._get_cache_path()
         metadata_path = self._get_cache_metadata_path()
+        digest = schema_hash(schema)
 
-        # Save schema
-        with open(cache_path, "w") as f:
-            json.dump(schema, f, indent=2)
+        # Save schema and its index
+        atomic_write_text(cache_path, json.dumps(schema, separators=(",", ":")))
+        self._write_schema_index(schema, digest)
 
         # Save metadata
         metadata = {
             "timestamp": datetime.now().isoformat(),
-            "schema_hash": hashlib.sha256(
-                json.dumps(schema, sort_keys=True).encode()
-            ).hexdigest(),
+            "schema_hash": digest,
+            "fingerprint": schema_fingerprint(schema),
         }
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        atomic_write_text(metadata_path, json.dumps(metadata, indent=2))
+
+    def _fetch_schema_fingerprint(self) -> str:
+        """Fetch the fingerprint of the live schema.
+
+        Returns:
+            Fingerprint as computed by schema_fingerprint()
+
+        Raises:
+            SchemaValidationError: If the fingerprint query fails
+        """
+        try:
+            process_result = self._github_service.run_gh_command(
+                ["api", "graphql", "-f", f"query={self.FINGERPRINT_QUERY}"]
+            )
+            schema = json.loads(process_result.stdout)["data"]["__schema"]
+            if not isinstance(schema, dict):
+                raise SchemaValidationError("Schema data is not a dictionary")
+            return schema_fingerprint(schema)
+        except SchemaValidationError:
+            raise
+        except Exception as e:
+            raise SchemaValidationError(
+                f"Failed to fetch GitHub schema fingerprint: {e}"
+            ) from e
+
+    def _extend_cache_if_unchanged(self) -> bool:
+        """Renew an expired cache whose schema GitHub has not changed.
+
+        Compares the fingerprint recorded with the cached schema against the
+        live one, which costs a small query instead of a full introspection.
+
+        Returns:
+            True if the cache lifetime was extended, False if the schema has
+            to be downloaded again.
+        """
+        metadata_path = self._get_cache_metadata_path()
+        try:
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+            expected = metadata["fingerprint"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        if not self._get_cache_path().exists():
+            return False
+
+        try:
+            fingerprint = self._fetch_schema_fingerprint()
+        except SchemaValidationError as e:
+            logger.debug("Cannot check schema fingerprint: %s", e)
+            return False
+        if fingerprint != expected:
+            logger.info("GitHub schema changed, downloading it again")
+            return False
+
+        metadata["timestamp"] = datetime.now().isoformat()
+        try:
+            atomic_write_text(metadata_path, json.dumps(metadata, indent=2))
+        except OSError as e:
+            logger.warning("Failed to extend schema cache: %s", e)
+            return False
+        logger.debug("GitHub schema unchanged, extended cache lifetime")
+        return True
+
+    def _acquire_refresh_lock(
+        self, force_refresh: bool
+    ) -> tuple[Optional[FileLock], Optional[dict[str, Any]]]:
+        """Become the one process that refreshes the schema, or reuse its work.
+
+        When another process is already refreshing, a stale cached schema is
+        used if there is one; otherwise this waits for the other process and
+        then uses the schema it cached.
+
+        Args:
+            force_refresh: Whether the caller wants a fresh schema regardless
+                of the cache.
+
+        Returns:
+            Tuple of (held lock, cached schema). The lock is None if locking
+            is unavailable; the schema is set if no refresh is needed.
+        """
+        lock = FileLock(self._get_cache_lock_path())
+        try:
+            if not lock.acquire(blocking=False):
+                if not force_refresh:
+                    stale_schema = self._load_cached_schema(allow_stale=True)
+                    if stale_schema:
+                        logger.debug("Schema refresh in progress, using stale cache")
+                        return None, stale_schema
+                lock.acquire(timeout=SCHEMA_REFRESH_LOCK_TIMEOUT)
+        except LockTimeoutError:
+            logger.warning("Timed out waiting for another schema refresh")
+            return None, None
+        except OSError as e:
+            logger.debug("Cannot lock schema cache: %s", e)
+            return None, None
+
+        # Another process may have refreshed the cache while we waited
+        if not force_refresh:
+            cached_schema = self._load_cached_schema()
+            if cached_schema:
+                return lock, cached_schema
+        return lock, None
+
+    def load_schema(self, force_refresh: bool = False) -> None:
+        """Make the schema available for validation as cheaply as possible.
+
+        A valid cache is used through its compiled index, so no JSON is
+        decoded; otherwise the schema is fetched as by :meth:`fetch_schema`.
+
+        Args:
+            force_refresh: Force fetching fresh schema even if cache is valid
+
+        Raises:
+            SchemaValidationError: If schema fetching fails
+        """
+        if force_refresh:
+            self.fetch_schema(force_refresh=True)
+            return
+        if self._schema or self._index is not None:
+            return
+
+        self._index = self._load_schema_index()
+        if self._index is None:
+            self.fetch_schema()
 
     def fetch_schema(self, force_refresh: bool = False) -> dict[str, Any]:
         """Fetch the GitHub GraphQL schema.
@@ -156,10 +445,40 @@ class GitHubSchemaValidator:
             cached_schema = self._load_cached_schema()
             if cached_schema:
                 logger.debug("Using cached GitHub schema")
+                self._schema = cached_schema
+                self._build_type_map()
+                if not self._get_index_path().exists():
+                    # Caches written before the index existed
+                    self._write_schema_index(cached_schema, schema_hash(cached_schema))
+                return cached_schema
+
+        # Only one process at a time fetches the schema
+        lock, cached_schema = self._acquire_refresh_lock(force_refresh)
+        try:
+            if cached_schema:
                 self._schema = cached_schema
                 self._build_type_map()
                 return cached_schema
+            if not force_refresh and self._extend_cache_if_unchanged():
+                cached_schema = self._load_cached_schema()
+                if cached_schema:
+                    self._schema = cached_schema
+                    self._build_type_map()
+                    return cached_schema
+            return self._fetch_schema_from_api()
+        finally:
+            if lock is not None:
+                lock.release()
+
+    def _fetch_schema_from_api(self) -> dict[str, Any]:
+        """Fetch the schema with an introspection query and cache it.
 
+        Returns:
+            The GitHub GraphQL schema
+
+        Raises:
+            SchemaValidationError: If schema fetching fails
+        """
         logger.info("Fetching GitHub GraphQL schema...")
 
         try:
@@ -211,9 +530,14 @@ class GitHubSchemaValidator:
             Type definition or None if not found
         """
         if not self._type_map:
-            self.fetch_schema()
+            if self._schema:
+                self._build_type_map()
+            else:
+                self.load_schema()
 
-        return self._type_map.get(type_name) if self._type_map else None
+        if self._type_map:
+            return self._type_map.get(type_name)
+        return self._index.get_type(type_name) if self._index else None
 
     def validate_query(self, query: str) -> list[dict[str, Any]]:
         """Validate a GraphQL query against the schema.
@@ -224,10 +548,24 @@ class GitHubSchemaValidator:
         Returns:
             List of validation errors (empty if valid)
         """
-        if not self._schema:
-            self.fetch_schema()
+        errors = self._validate_query_cached(query)
+        self._save_validation_results()
+        return errors
+
+    def _validate_query_cached(self, query: str) -> list[dict[str, Any]]:
+        """Validate a query, reusing and recording results in memory only.
+
+        New results are written by _save_validation_results().
+
+        Args:
+            query: GraphQL query string to validate
+
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        self.load_schema()
 
-        errors = []
+        errors: list[dict[str, Any]] = []
 
         # Basic query structure validation
         if not query.strip():
@@ -239,6 +577,28 @@ class GitHubSchemaValidator:
             )
             return errors
 
+        # Reuse the result of validating the same query against this schema
+        digest = self._current_schema_hash()
+        key = query_hash(query)
+        if digest:
+            cached = self._load_validation_cache(digest).get(key)
+            if isinstance(cached, list):
+                return copy.deepcopy(cached)
+
+        self._validate_query_against_schema(query, errors)
+        if digest:
+            self._store_validation_result(digest, key, errors)
+        return errors
+
+    def _validate_query_against_schema(
+        self, query: str, errors: list[dict[str, Any]]
+    ) -> None:
+        """Parse a query and validate it against the loaded schema.
+
+        Args:
+            query: GraphQL query string to validate
+            errors: List to append errors to
+        """
         # Parse the query
         parser = GraphQLParser()
         try:
@@ -250,7 +610,7 @@ class GitHubSchemaValidator:
                     "message": f"Failed to parse query: {e!s}",
                 }
             )
-            return errors
+            return
 
         # Validate operation type
         root_type_name = operation.type.capitalize()
@@ -262,14 +622,124 @@ class GitHubSchemaValidator:
                     "message": f"{root_type_name} type not found in schema",
                 }
             )
-            return errors
+            return
 
         # Validate fields recursively
         self._validate_selections(
             operation.selections, root_type, errors, [root_type_name]
         )
 
-        return errors
+    def _current_schema_hash(self) -> Optional[str]:
+        """Get the hash of the loaded schema, computing it at most once.
+
+        Returns:
+            Hex schema hash, or None if no schema is loaded
+        """
+        if self._schema:
+            memo = self._schema_digest
+            if memo is None or memo[0] is not self._schema:
+                memo = (self._schema, schema_hash(self._schema))
+                self._schema_digest = memo
+            return memo[1]
+        if self._index is not None:
+            return self._index.schema_hash
+        return None
+
+    def _load_validation_cache(self, digest: str) -> dict[str, Any]:
+        """Load the cached validation results for a schema.
+
+        Results recorded for another schema or toady version are discarded,
+        which invalidates them whenever the schema changes.
+
+        Args:
+            digest: Hash of the loaded schema
+
+        Returns:
+            Mapping of query hash to validation errors
+        """
+        if self._validation_results and self._validation_results[0] == digest:
+            return self._validation_results[1]
+
+        results = self._read_validation_cache(digest)
+        self._validation_results = (digest, results)
+        return results
+
+    def _read_validation_cache(self, digest: str) -> dict[str, Any]:
+        """Read the validation cache file, ignoring results for other schemas.
+
+        Args:
+            digest: Hash of the loaded schema
+
+        Returns:
+            Mapping of query hash to validation errors
+        """
+        try:
+            with open(self._get_validation_cache_path()) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if (
+            isinstance(data, dict)
+            and data.get("version") == VALIDATION_CACHE_VERSION
+            and data.get("toady_version") == __version__
+            and data.get("schema_hash") == digest
+            and isinstance(data.get("results"), dict)
+        ):
+            return data["results"]
+        return {}
+
+    def _store_validation_result(
+        self, digest: str, key: str, errors: list[dict[str, Any]]
+    ) -> None:
+        """Record the validation result of a query until the next save.
+
+        Args:
+            digest: Hash of the schema the query was validated against
+            key: Hash of the query, see query_hash()
+            errors: Validation errors of the query
+        """
+        self._load_validation_cache(digest)[key] = copy.deepcopy(errors)
+        if self._pending_results is None or self._pending_results[0] != digest:
+            self._pending_results = (digest, {})
+        self._pending_results[1][key] = copy.deepcopy(errors)
+
+    def _save_validation_results(self) -> None:
+        """Merge recorded results into the validation cache file in one write.
+
+        The file is re-read under a lock, so results other processes saved
+        in the meantime are kept. Write failures are logged and ignored.
+        """
+        if not self._pending_results:
+            return
+        digest, pending = self._pending_results
+        self._pending_results = None
+        if not pending:
+            return
+
+        try:
+            with FileLock(self._get_validation_lock_path()):
+                results = self._read_validation_cache(digest)
+                for key, errors in pending.items():
+                    # Re-insert so the entry counts as the most recent
+                    results.pop(key, None)
+                    results[key] = errors
+                while len(results) > MAX_VALIDATION_CACHE_ENTRIES:
+                    del results[next(iter(results))]
+
+                data = {
+                    "version": VALIDATION_CACHE_VERSION,
+                    "toady_version": __version__,
+                    "schema_hash": digest,
+                    "results": results,
+                }
+                atomic_write_text(
+                    self._get_validation_cache_path(),
+                    json.dumps(data, separators=(",", ":")),
+                )
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Failed to write validation cache: %s", e)
+            return
+        self._validation_results = (digest, results)
 
     def _validate_selections(
         self,
@@ -310,6 +780,18 @@ class GitHubSchemaValidator:
                         errors,
                         type_path + [fragment_type_name],
                     )
+                else:
+                    errors.append(
+                        {
+                            "type": "unknown_type",
+                            "message": f"Type '{fragment_type_name}' not found "
+                            "in schema",
+                            "path": ".".join(type_path),
+                            "suggestions": self.get_type_suggestions(
+                                fragment_type_name
+                            ),
+                        }
+                    )
                 continue
 
             field_def = available_fields.get(selection.name)
@@ -345,7 +827,11 @@ class GitHubSchemaValidator:
 
             # Validate arguments
             self._validate_arguments(
-                selection, field_def, errors, type_path + [selection.name]
+                selection,
+                field_def,
+                errors,
+                type_path + [selection.name],
+                parent_type.get("name", ""),
             )
 
             # If field has selections, validate them recursively
@@ -368,6 +854,7 @@ class GitHubSchemaValidator:
         field_def: dict[str, Any],
         errors: list[dict[str, Any]],
         type_path: list[str],
+        type_name: str,
     ) -> None:
         """Validate field arguments against schema.
 
@@ -376,6 +863,7 @@ class GitHubSchemaValidator:
             field_def: Field definition from schema
             errors: List to append errors to
             type_path: Current type path for error messages
+            type_name: Name of the type the field belongs to
         """
         available_args = {arg["name"]: arg for arg in field_def.get("args", [])}
 
@@ -389,6 +877,9 @@ class GitHubSchemaValidator:
                         "message": f"Unknown argument '{arg_name}' on field "
                         f"'{field.name}'",
                         "path": path,
+                        "suggestions": self._get_name_index(
+                            f"{type_name}.{field.name}", lambda: available_args
+                        ).suggest(arg_name),
                     }
                 )
 
@@ -446,8 +937,7 @@ class GitHubSchemaValidator:
         Returns:
             List of deprecation warnings
         """
-        if not self._schema:
-            self.fetch_schema()
+        self.load_schema()
 
         warnings: list[dict[str, Any]] = []
 
@@ -465,12 +955,10 @@ class GitHubSchemaValidator:
         Returns:
             Schema version hash or None
         """
-        if not self._schema:
-            self.fetch_schema()
+        self.load_schema()
 
-        # Generate a hash of the schema for version tracking
-        schema_str = json.dumps(self._schema, sort_keys=True)
-        return hashlib.sha256(schema_str.encode()).hexdigest()[:12]
+        # The schema hash doubles as a version identifier
+        return (self._current_schema_hash() or schema_hash({}))[:12]
 
     def get_field_suggestions(self, type_name: str, field_name: str) -> list[str]:
         """Get suggestions for a field name on a type.
@@ -483,103 +971,215 @@ class GitHubSchemaValidator:
             List of suggested field names
         """
         type_def = self.get_type(type_name)
-        if not type_def or "fields" not in type_def:
+        if not type_def or not type_def.get("fields"):
             return []
 
-        field_names = [f["name"] for f in type_def["fields"] if f.get("name")]
+        index = self._get_name_index(
+            type_name,
+            lambda: [f["name"] for f in type_def["fields"] if f.get("name")],
+        )
+        return index.suggest(field_name)
+
+    def get_argument_suggestions(
+        self, type_name: str, field_name: str, arg_name: str
+    ) -> list[str]:
+        """Get suggestions for an argument name on a field.
+
+        Args:
+            type_name: Name of the GraphQL type
+            field_name: Name of the field on that type
+            arg_name: Argument name to find suggestions for
 
-        # Simple similarity check - fields starting with same letter
-        suggestions = [
-            name
-            for name in field_names
-            if name.lower().startswith(field_name[0].lower())
+        Returns:
+            List of suggested argument names
+        """
+        type_def = self.get_type(type_name)
+        if not type_def:
+            return []
+
+        field_defs = [
+            f for f in type_def.get("fields") or [] if f.get("name") == field_name
         ]
+        if not field_defs:
+            return []
+
+        args = field_defs[0].get("args") or []
+        index = self._get_name_index(
+            f"{type_name}.{field_name}", lambda: [a["name"] for a in args]
+        )
+        return index.suggest(arg_name)
 
-        return suggestions[:5]  # Limit to top 5 suggestions
+    def get_type_suggestions(self, type_name: str) -> list[str]:
+        """Get suggestions for a type name.
 
-    def validate_mutations(self) -> dict[str, list[dict[str, Any]]]:
-        """Validate all mutations defined in the codebase.
+        Args:
+            type_name: Type name to find suggestions for
 
         Returns:
-            Dictionary mapping mutation names to validation errors
+            List of suggested type names
         """
-        from ..services.github_service import (
-            REPLY_COMMENT_MUTATION,
-            REPLY_THREAD_MUTATION,
-            RESOLVE_THREAD_MUTATION,
-            UNRESOLVE_THREAD_MUTATION,
-        )
+        self.load_schema()
 
-        errors = {}
+        def type_names() -> list[str]:
+            if self._schema:
+                return [
+                    t["name"] for t in self._schema.get("types", []) if t.get("name")
+                ]
+            return self._index.type_names() if self._index else []
 
-        # Validate resolve mutation
-        resolve_errors = self.validate_query(RESOLVE_THREAD_MUTATION)
-        if resolve_errors:
-            errors["resolveReviewThread"] = resolve_errors
+        return self._get_name_index("", type_names).suggest(type_name)
 
-        # Validate unresolve mutation
-        unresolve_errors = self.validate_query(UNRESOLVE_THREAD_MUTATION)
-        if unresolve_errors:
-            errors["unresolveReviewThread"] = unresolve_errors
+    def _get_name_index(
+        self, key: str, names: Callable[[], Iterable[str]]
+    ) -> NameIndex:
+        """Get the suggestion index of a set of schema names, building it once.
 
-        # Validate reply mutations
-        reply_thread_errors = self.validate_query(REPLY_THREAD_MUTATION)
-        if reply_thread_errors:
-            errors["addPullRequestReviewThreadReply"] = reply_thread_errors
+        Indexes are kept per schema, keyed by "" for type names, the type name
+        for its fields and "Type.field" for a field's arguments.
 
-        reply_comment_errors = self.validate_query(REPLY_COMMENT_MUTATION)
-        if reply_comment_errors:
-            errors["addPullRequestReviewComment"] = reply_comment_errors
+        Args:
+            key: Which names the index covers
+            names: Produces the names if the index has not been built yet
 
-        return errors
+        Returns:
+            The name index
+        """
+        digest = self._current_schema_hash() or ""
+        memo = self._name_indexes
+        if memo is None or memo[0] != digest:
+            memo = (digest, {})
+            self._name_indexes = memo
 
-    def validate_queries(self) -> dict[str, list[dict[str, Any]]]:
-        """Validate all queries defined in the codebase.
+        index = memo[1].get(key)
+        if index is None:
+            index = NameIndex(names())
+            memo[1][key] = index
+        return index
+
+    def _mutation_operations(self) -> dict[str, str]:
+        """Get the documents services actually send for each mutation.
 
         Returns:
-            Dictionary mapping query names to validation errors
+            Mapping of mutation name to document
+        """
+        from ..parsers.query_registry import registered_mutations
+
+        return {
+            name: mutation.document for name, mutation in registered_mutations().items()
+        }
+
+    def _query_operations(self) -> dict[str, str]:
+        """Get the documents services actually send for each registered query.
+
+        Returns:
+            Mapping of query name to document
         """
-        from ..parsers.graphql_queries import ReviewThreadQueryBuilder
+        from ..parsers.query_registry import registered_queries
 
-        errors = {}
+        return {name: query.document for name, query in registered_queries().items()}
 
-        # Create query builder
-        builder = ReviewThreadQueryBuilder()
+    def validate_operations(
+        self, operations: dict[str, str]
+    ) -> tuple[dict[str, list[dict[str, Any]]], dict[str, float]]:
+        """Validate several operations against one loaded schema, timing each.
 
-        # Validate review threads query
-        review_query = builder.build_query()
-        review_errors = self.validate_query(review_query)
-        if review_errors:
-            errors["reviewThreads"] = review_errors
+        The schema, its type lookups and the validation cache are loaded once
+        up front rather than by the first operation, so every timing covers
+        validating that operation only. New results are written to the
+        validation cache once, after the last operation.
 
+        Args:
+            operations: Mapping of operation name to document
+
+        Returns:
+            Tuple of (errors, timings): validation errors of each operation
+            that has any, and the validation time of every operation in
+            milliseconds
+
+        Raises:
+            SchemaValidationError: If schema fetching fails
+        """
+        self.load_schema()
+        if self._schema and not self._type_map:
+            self._build_type_map()
+        digest = self._current_schema_hash()
+        if digest:
+            self._load_validation_cache(digest)
+
+        errors: dict[str, list[dict[str, Any]]] = {}
+        timings: dict[str, float] = {}
+        try:
+            for name, query in operations.items():
+                start = time.perf_counter()
+                operation_errors = self._validate_query_cached(query)
+                timings[name] = round((time.perf_counter() - start) * 1000, 3)
+                if operation_errors:
+                    errors[name] = operation_errors
+        finally:
+            self._save_validation_results()
+        return errors, timings
+
+    def validate_mutations(self) -> dict[str, list[dict[str, Any]]]:
+        """Validate all mutations defined in the codebase.
+
+        Returns:
+            Dictionary mapping mutation names to validation errors
+        """
+        errors, _ = self.validate_operations(self._mutation_operations())
+        return errors
+
+    def validate_queries(self) -> dict[str, list[dict[str, Any]]]:
+        """Validate all queries defined in the codebase.
+
+        Returns:
+            Dictionary mapping query names to validation errors
+        """
+        errors, _ = self.validate_operations(self._query_operations())
         return errors
 
     def generate_compatibility_report(self) -> dict[str, Any]:
         """Generate a comprehensive compatibility report.
 
+        All queries and mutations are validated against one loaded schema,
+        and the report records how long each of them took.
+
         Returns:
-            Report containing validation results and recommendations
+            Report containing validation results, timings and recommendations
         """
+        queries = self._query_operations()
+        mutations = self._mutation_operations()
+        # Keyed by category so a query and a mutation may share a name
+        operations = {f"queries/{name}": doc for name, doc in queries.items()}
+        operations.update({f"mutations/{name}": doc for name, doc in mutations.items()})
+
+        start = time.perf_counter()
+        errors, timings = self.validate_operations(operations)
+        total_ms = (time.perf_counter() - start) * 1000
+
         report: dict[str, Any] = {
             "timestamp": datetime.now().isoformat(),
             "schema_version": self.get_schema_version(),
-            "queries": self.validate_queries(),
-            "mutations": self.validate_mutations(),
+            "queries": {
+                name: errors[f"queries/{name}"]
+                for name in queries
+                if f"queries/{name}" in errors
+            },
+            "mutations": {
+                name: errors[f"mutations/{name}"]
+                for name in mutations
+                if f"mutations/{name}" in errors
+            },
             "deprecations": [],
             "recommendations": [],
+            "timings": {
+                "total_ms": round(total_ms, 3),
+                "queries": {name: timings[f"queries/{name}"] for name in queries},
+                "mutations": {name: timings[f"mutations/{name}"] for name in mutations},
+            },
         }
 
         # Add recommendations based on errors
-        all_errors: list[dict[str, Any]] = []
-        queries = report.get("queries", {})
-        mutations = report.get("mutations", {})
-        if isinstance(queries, dict):
-            all_errors.extend(queries.get("reviewThreads", []))
-        if isinstance(mutations, dict):
-            all_errors.extend(mutations.get("resolveReviewThread", []))
-            all_errors.extend(mutations.get("unresolveReviewThread", []))
-
-        if all_errors:
+        if errors:
             report["recommendations"].append(
                 "Update GraphQL queries to match current GitHub schema"
             )
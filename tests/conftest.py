@@ -18,6 +18,13 @@ def pytest_configure(config):
         config.option.tb = "short"
 
 
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """Keep ~/.toady state (journals, comment index) out of the real home."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
 @pytest.fixture
 def runner():
     """Create a Click CLI test runner."""
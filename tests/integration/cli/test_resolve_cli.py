@@ -482,7 +482,10 @@ class TestResolveCLI:
         mock_fetch_service_class.return_value = mock_fetch_service
 
         mock_resolve_service = Mock()
-        mock_resolve_service.resolve_thread.return_value = {"success": True}
+        mock_resolve_service.resolve_threads.return_value = [
+            {"thread_id": "thread1", "success": True},
+            {"thread_id": "thread2", "success": True},
+        ]
         mock_resolve_service_class.return_value = mock_resolve_service
 
         # Test JSON mode with --yes flag
@@ -495,10 +498,11 @@ class TestResolveCLI:
         assert output["threads_succeeded"] == 2
         assert output["threads_failed"] == 0
 
-        # Verify both threads were resolved
-        assert mock_resolve_service.resolve_thread.call_count == 2
-        mock_resolve_service.resolve_thread.assert_any_call("thread1")
-        mock_resolve_service.resolve_thread.assert_any_call("thread2")
+        # Verify both threads were resolved in one batched request
+        mock_resolve_service.resolve_threads.assert_called_once_with(
+            ["thread1", "thread2"], undo=False
+        )
+        mock_resolve_service.resolve_thread.assert_not_called()
 
     @patch("toady.commands.resolve.ResolveService")
     @patch("toady.commands.resolve.FetchService")
@@ -538,7 +542,10 @@ class TestResolveCLI:
         mock_fetch_service_class.return_value = mock_fetch_service
 
         mock_resolve_service = Mock()
-        mock_resolve_service.resolve_thread.return_value = {"success": True}
+        mock_resolve_service.resolve_threads.return_value = [
+            {"thread_id": "thread1", "success": True},
+            {"thread_id": "thread2", "success": True},
+        ]
         mock_resolve_service_class.return_value = mock_resolve_service
 
         result = runner.invoke(
@@ -58,7 +58,7 @@ class TestSchemaCLI:
     ) -> None:
         """Test successful schema validation with summary output."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         mock_validator.generate_compatibility_report.return_value = {
             "timestamp": "2024-01-01T12:00:00",
             "schema_version": "v1.0",
@@ -80,7 +80,7 @@ class TestSchemaCLI:
     ) -> None:
         """Test successful schema validation with JSON output."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         mock_report = {
             "timestamp": "2024-01-01T12:00:00",
             "schema_version": "v1.0",
@@ -115,7 +115,7 @@ class TestSchemaCLI:
     ) -> None:
         """Test schema validation with network error."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.side_effect = ConnectionError("Network timeout")
+        mock_validator.load_schema.side_effect = ConnectionError("Network timeout")
         mock_validator_class.return_value = mock_validator
 
         result = runner.invoke(cli, ["schema", "validate"])
@@ -231,7 +231,7 @@ class TestSchemaCLI:
     ) -> None:
         """Test schema validation with timeout error."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.side_effect = TimeoutError("Request timeout")
+        mock_validator.load_schema.side_effect = TimeoutError("Request timeout")
         mock_validator_class.return_value = mock_validator
 
         result = runner.invoke(cli, ["schema", "validate"])
@@ -244,7 +244,7 @@ class TestSchemaCLI:
     ) -> None:
         """Test schema validation with JSON formatting error."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         # Return an object that will cause JSON serialization error
         mock_validator.generate_compatibility_report.return_value = {"timestamp": set()}
         mock_validator_class.return_value = mock_validator
@@ -259,7 +259,7 @@ class TestSchemaCLI:
     ) -> None:
         """Test schema validation exits with code 1 when critical errors exist."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         mock_report = {
             "timestamp": "2024-01-01T12:00:00",
             "schema_version": "v1.0",
@@ -281,7 +281,7 @@ class TestSchemaCLI:
     ) -> None:
         """Test schema validation exits with code 0 when only warnings exist."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         mock_report = {
             "timestamp": "2024-01-01T12:00:00",
             "schema_version": "v1.0",
@@ -301,7 +301,7 @@ class TestSchemaCLI:
     ) -> None:
         """Test schema validation with custom cache directory."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         mock_validator.generate_compatibility_report.return_value = {
             "timestamp": "2024-01-01T12:00:00",
             "schema_version": "v1.0",
@@ -323,7 +323,7 @@ class TestSchemaCLI:
     ) -> None:
         """Test schema validation with force refresh."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         mock_validator.generate_compatibility_report.return_value = {
             "timestamp": "2024-01-01T12:00:00",
             "schema_version": "v1.0",
@@ -335,7 +335,7 @@ class TestSchemaCLI:
 
         result = runner.invoke(cli, ["schema", "validate", "--force-refresh"])
         assert result.exit_code == 0
-        mock_validator.fetch_schema.assert_called_once_with(force_refresh=True)
+        mock_validator.load_schema.assert_called_once_with(force_refresh=True)
 
     @patch("toady.commands.schema.GitHubSchemaValidator")
     def test_schema_fetch_with_custom_cache_dir(
@@ -523,7 +523,7 @@ class TestSchemaCLI:
     ) -> None:
         """Test schema validation when summary display fails."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         # Return invalid report that will cause display to fail
         mock_validator.generate_compatibility_report.return_value = "invalid_report"
         mock_validator_class.return_value = mock_validator
@@ -538,7 +538,7 @@ class TestSchemaCLI:
     ) -> None:
         """Test schema validation when critical error analysis fails."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         # Return invalid report that will cause error analysis to fail
         mock_validator.generate_compatibility_report.return_value = "invalid_report"
         mock_validator_class.return_value = mock_validator
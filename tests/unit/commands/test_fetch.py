@@ -21,6 +21,14 @@ from toady.exceptions import (
     GitHubRateLimitError,
     GitHubTimeoutError,
 )
+from toady.services.code_context import CodeContextError
+
+
+@pytest.fixture(autouse=True)
+def mock_comment_index():
+    """Stub the comment index, which cannot index Mock threads."""
+    with patch("toady.commands.fetch.CommentIndex") as mock_index_class:
+        yield mock_index_class
 
 
 class TestFetchCommandCore:
@@ -289,6 +297,7 @@ class TestFetchCommandOutputFormatting:
         mock_format_output.assert_called_once_with(
             threads=threads,
             format_name="pretty",
+            formatter_options={},
             show_progress=True,
             pr_number=123,
             thread_type="all threads",
@@ -316,12 +325,146 @@ class TestFetchCommandOutputFormatting:
         mock_format_output.assert_called_once_with(
             threads=threads,
             format_name="json",
+            formatter_options={},
             show_progress=True,
             pr_number=789,
             thread_type="unresolved threads",
             limit=100,
         )
 
+    @patch("toady.commands.fetch.FetchService")
+    @patch("toady.commands.fetch.format_threads_output")
+    def test_tabular_options_passed_to_formatter(
+        self, mock_format_output, mock_service_class, runner
+    ):
+        """Test --columns and --comment-rows become csv formatter options."""
+        mock_service = Mock()
+        mock_service.fetch_review_threads_with_pr_selection.return_value = ([], 123)
+        mock_service_class.return_value = mock_service
+
+        result = runner.invoke(
+            cli,
+            [
+                "fetch",
+                "--pr",
+                "123",
+                "--format",
+                "csv",
+                "--columns",
+                "thread_id, comment_id",
+                "--comment-rows",
+            ],
+        )
+
+        assert result.exit_code == 0
+        mock_service_class.assert_called_once_with(output_format="json")
+        assert mock_format_output.call_args[1]["formatter_options"] == {
+            "columns": ["thread_id", "comment_id"],
+            "comment_rows": True,
+        }
+
+    @patch("toady.commands.fetch.FetchService")
+    def test_tabular_options_rejected_for_json(self, mock_service_class, runner):
+        """Test --columns is rejected for non-tabular formats."""
+        result = runner.invoke(
+            cli, ["fetch", "--pr", "123", "--format", "json", "--columns", "title"]
+        )
+
+        assert result.exit_code == 2
+        assert "--format csv" in result.output
+        mock_service_class.assert_not_called()
+
+    @patch("toady.commands.fetch.FetchService")
+    @patch("toady.commands.fetch.format_threads_output")
+    def test_fetched_comments_are_indexed(
+        self, mock_format_output, mock_service_class, mock_comment_index, runner
+    ):
+        """Test fetched threads are recorded in the comment index for replies."""
+        threads = [Mock()]
+        mock_service = Mock()
+        mock_service.fetch_review_threads_with_pr_selection.return_value = (
+            threads,
+            123,
+        )
+        mock_service_class.return_value = mock_service
+
+        result = runner.invoke(cli, ["fetch", "--pr", "123"])
+
+        assert result.exit_code == 0
+        mock_comment_index.return_value.record_threads.assert_called_once_with(threads)
+
+    @patch("toady.commands.fetch.attach_code_context")
+    @patch("toady.commands.fetch.FetchService")
+    @patch("toady.commands.fetch.format_threads_output")
+    def test_context_attached_at_head_commit(
+        self, mock_format_output, mock_service_class, mock_attach, runner
+    ):
+        """Test --context reads code at the pull request's head commit."""
+        threads = [Mock()]
+        mock_service = Mock()
+        mock_service.fetch_review_threads_with_pr_selection.return_value = (
+            threads,
+            123,
+        )
+        mock_service.head_commit_oid = "abc123"
+        mock_service_class.return_value = mock_service
+
+        result = runner.invoke(cli, ["fetch", "--pr", "123", "--context", "2"])
+
+        assert result.exit_code == 0
+        mock_attach.assert_called_once_with(threads, "abc123", context_lines=2)
+
+    @patch("toady.commands.fetch.attach_code_context")
+    @patch("toady.commands.fetch.FetchService")
+    @patch("toady.commands.fetch.format_threads_output")
+    def test_context_error_is_a_warning(
+        self, mock_format_output, mock_service_class, mock_attach, runner
+    ):
+        """Test a failure to read local code does not fail the fetch."""
+        mock_service = Mock()
+        mock_service.fetch_review_threads_with_pr_selection.return_value = (
+            [Mock()],
+            123,
+        )
+        mock_service.head_commit_oid = None
+        mock_service_class.return_value = mock_service
+        mock_attach.side_effect = CodeContextError("Could not start git")
+
+        result = runner.invoke(cli, ["fetch", "--pr", "123", "--context", "2"])
+
+        assert result.exit_code == 0
+        assert mock_attach.call_args[0][1] == "HEAD"
+        mock_format_output.assert_called_once()
+
+    @patch("toady.services.code_context.GitBlobReader._has_revision")
+    @patch("toady.services.code_context.GitBlobReader._request")
+    @patch("toady.commands.fetch.FetchService")
+    @patch("toady.commands.fetch.format_threads_output")
+    def test_unfetched_head_commit_warns_once(
+        self, mock_format_output, mock_service_class, mock_request, mock_has, runner
+    ):
+        """Test threads at a commit not fetched locally produce one warning."""
+        threads = [
+            Mock(file_path=f"src/file{index}.py", line=1, diff_side="RIGHT")
+            for index in range(3)
+        ]
+        mock_service = Mock()
+        mock_service.fetch_review_threads_with_pr_selection.return_value = (
+            threads,
+            123,
+        )
+        mock_service.head_commit_oid = "abc123"
+        mock_service_class.return_value = mock_service
+        mock_request.return_value = None
+        mock_has.return_value = False
+
+        result = runner.invoke(cli, ["fetch", "--pr", "123", "--context", "2"])
+
+        assert result.exit_code == 0
+        assert result.output.count("Warning:") == 1
+        assert "run git fetch to get code context" in result.output
+        mock_format_output.assert_called_once()
+
 
 class TestFetchCommandExitConditions:
     """Test exit conditions in the fetch command."""
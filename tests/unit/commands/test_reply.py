@@ -5,6 +5,7 @@ error handling, format resolution, and service integration. It focuses on unit
 testing the command implementation without testing the CLI interface directly.
 """
 
+from datetime import datetime
 import json
 from unittest.mock import Mock, patch
 
@@ -30,6 +31,8 @@ from toady.exceptions import (
     GitHubRateLimitError,
     GitHubTimeoutError,
 )
+from toady.models.models import Comment, ReviewThread
+from toady.services.github_service import GitHubService
 from toady.services.reply_service import (
     CommentNotFoundError,
     ReplyRequest,
@@ -923,6 +926,357 @@ class TestReplyCommandEdgeCases:
         assert request.reply_body == unicode_body
 
 
+class TestBatchReply:
+    """Test posting replies from an NDJSON batch."""
+
+    THREAD_A = "PRRT_kwDOABcD12MAAAABcDE3fg"
+    THREAD_B = "PRRT_kwDOABcD12MAAAABcDE3fh"
+
+    @staticmethod
+    def _ndjson(*entries):
+        return "".join(json.dumps(entry) + "\n" for entry in entries)
+
+    @staticmethod
+    def _success(request):
+        return {
+            "id": request.comment_id,
+            "success": True,
+            "reply_id": f"reply-{request.comment_id}",
+            "reply_url": "https://github.com/o/r/pull/1#discussion_r1",
+        }
+
+    @patch("toady.commands.reply.ReplyService")
+    def test_batch_from_stdin(self, mock_service_class, runner):
+        """Test replies from stdin are posted together and streamed as NDJSON."""
+        mock_service = Mock()
+        mock_service.post_replies.side_effect = lambda requests: [
+            self._success(request) for request in requests
+        ]
+        mock_service_class.return_value = mock_service
+        batch = self._ndjson(
+            {"id": self.THREAD_A, "body": "Fixed in abc123"},
+            {"id": self.THREAD_B, "body": "  Good catch, thanks  "},
+        )
+
+        result = runner.invoke(cli, ["reply", "--batch", "-"], input=batch)
+
+        assert result.exit_code == 0, result.output
+        requests = mock_service.post_replies.call_args[0][0]
+        assert [(r.comment_id, r.reply_body) for r in requests] == [
+            (self.THREAD_A, "Fixed in abc123"),
+            (self.THREAD_B, "Good catch, thanks"),
+        ]
+        lines = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [(line["line"], line["success"]) for line in lines] == [
+            (1, True),
+            (2, True),
+        ]
+
+    @patch("toady.commands.reply.REPLY_BATCH_SIZE", 2)
+    @patch("toady.commands.reply.ReplyService")
+    def test_batch_split_into_requests(self, mock_service_class, runner):
+        """Test large batches are split into REPLY_BATCH_SIZE chunks."""
+        mock_service = Mock()
+        mock_service.post_replies.side_effect = lambda requests: [
+            self._success(request) for request in requests
+        ]
+        mock_service_class.return_value = mock_service
+        batch = self._ndjson(
+            *({"id": self.THREAD_A, "body": f"Reply {n}"} for n in range(3))
+        )
+
+        result = runner.invoke(
+            cli, ["reply", "--batch", "-", "--concurrency", "1"], input=batch
+        )
+
+        assert result.exit_code == 0
+        sizes = [len(c[0][0]) for c in mock_service.post_replies.call_args_list]
+        assert sizes == [2, 1]
+
+    @patch("toady.commands.reply.ReplyService")
+    def test_invalid_lines_post_nothing(self, mock_service_class, runner):
+        """Test every line is validated before anything is posted."""
+        batch = (
+            self._ndjson({"id": self.THREAD_A, "body": "Looks good"})
+            + "not json\n"
+            + self._ndjson(
+                {"id": "PRRC_kwDOABcD12MAAAABcDE3fg", "body": "Fixed"},
+                {"id": self.THREAD_B, "body": "..."},
+                {"body": "Missing id"},
+            )
+        )
+
+        result = runner.invoke(cli, ["reply", "--batch", "-"], input=batch)
+
+        assert result.exit_code == 2
+        assert "4 invalid line(s), nothing was posted" in result.output
+        assert "line 2: invalid JSON" in result.output
+        assert "line 3:" in result.output and "PRRC_" in result.output
+        assert "line 4:" in result.output
+        assert 'line 5: "id" must be a non-empty string' in result.output
+        mock_service_class.return_value.post_replies.assert_not_called()
+
+    @patch("toady.commands.reply.ReplyService")
+    def test_resume_posts_only_failed_replies(self, mock_service_class, runner):
+        """Test --resume skips replies a previous run already posted."""
+        mock_service = Mock()
+        mock_service.post_replies.return_value = [
+            self._success(ReplyRequest(self.THREAD_A, "Fixed")),
+            {"id": self.THREAD_B, "success": False, "error": "Timed out"},
+        ]
+        mock_service_class.return_value = mock_service
+        batch = self._ndjson(
+            {"id": self.THREAD_A, "body": "Fixed"},
+            {"id": self.THREAD_B, "body": "Done"},
+        )
+
+        first = runner.invoke(cli, ["reply", "--batch", "-"], input=batch)
+        assert first.exit_code == 1
+
+        mock_service.post_replies.return_value = [
+            self._success(ReplyRequest(self.THREAD_B, "Done"))
+        ]
+        second = runner.invoke(cli, ["reply", "--batch", "-", "--resume"], input=batch)
+
+        assert second.exit_code == 0
+        retried = mock_service.post_replies.call_args[0][0]
+        assert [r.comment_id for r in retried] == [self.THREAD_B]
+
+    @patch("toady.commands.reply.ReplyService")
+    def test_resume_does_not_repost_failed_request(self, mock_service_class, runner):
+        """Test replies of a request that failed as a whole are never reposted."""
+        mock_service = Mock()
+        mock_service.post_replies.side_effect = GitHubTimeoutError("Timed out")
+        mock_service_class.return_value = mock_service
+        batch = self._ndjson(
+            {"id": self.THREAD_A, "body": "Fixed"},
+            {"id": self.THREAD_B, "body": "Done"},
+        )
+
+        first = runner.invoke(cli, ["reply", "--batch", "-"], input=batch)
+        assert first.exit_code == 1
+        assert [
+            json.loads(line)["outcome_unknown"] for line in first.stdout.splitlines()
+        ] == [True, True]
+
+        mock_service.post_replies.reset_mock(side_effect=True)
+        second = runner.invoke(cli, ["reply", "--batch", "-", "--resume"], input=batch)
+
+        assert second.exit_code == 1
+        mock_service.post_replies.assert_not_called()
+        lines = [json.loads(line) for line in second.stdout.splitlines()]
+        assert [(line["line"], line["outcome_unknown"]) for line in lines] == [
+            (1, True),
+            (2, True),
+        ]
+        assert "not posted again" in lines[0]["error"]
+
+    def test_batch_conflicts_with_id(self, runner):
+        """Test --batch cannot be combined with --id."""
+        result = runner.invoke(
+            cli, ["reply", "--batch", "-", "--id", self.THREAD_A], input=""
+        )
+
+        assert result.exit_code == 2
+        assert "--batch cannot be used with --id or --body" in result.output
+
+    def test_resume_requires_batch(self, runner):
+        """Test --resume is rejected for single replies."""
+        result = runner.invoke(
+            cli, ["reply", "--id", self.THREAD_A, "--body", "Fixed", "--resume"]
+        )
+
+        assert result.exit_code == 2
+        assert "--resume can only be used with --batch" in result.output
+
+    @patch("toady.commands.reply.ReplyService")
+    def test_batch_resolve(self, mock_service_class, runner):
+        """Test --resolve applies to every line and failed resolves fail the run."""
+        mock_service = Mock()
+        mock_service.post_replies.side_effect = lambda requests: [
+            {
+                **self._success(request),
+                "thread_resolved": request.comment_id == self.THREAD_A,
+                **(
+                    {}
+                    if request.comment_id == self.THREAD_A
+                    else {"resolve_error": "Thread is locked"}
+                ),
+            }
+            for request in requests
+        ]
+        mock_service_class.return_value = mock_service
+        batch = self._ndjson(
+            {"id": self.THREAD_A, "body": "Fixed in abc123"},
+            {"id": self.THREAD_B, "body": "Fixed in abc124"},
+        )
+
+        result = runner.invoke(cli, ["reply", "--batch", "-", "--resolve"], input=batch)
+
+        assert result.exit_code == 1
+        requests = mock_service.post_replies.call_args[0][0]
+        assert all(request.resolve for request in requests)
+        lines = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [line["thread_resolved"] for line in lines] == [True, False]
+
+    @patch("toady.commands.reply.ReplyService")
+    def test_batch_resolve_requires_thread_ids(self, mock_service_class, runner):
+        """Test a comment ID marked for resolving is rejected before posting."""
+        batch = self._ndjson(
+            {"id": self.THREAD_A, "body": "Fixed in abc123"},
+            {"id": "123456789", "body": "Fixed in abc124", "resolve": True},
+        )
+
+        result = runner.invoke(cli, ["reply", "--batch", "-"], input=batch)
+
+        assert result.exit_code != 0
+        assert "line 2: 123456789: only thread IDs" in result.output
+        mock_service_class.return_value.post_replies.assert_not_called()
+
+
+class TestReplyResolve:
+    """Test replying and resolving a thread in one request."""
+
+    @patch("toady.commands.reply.ReplyService")
+    def test_reply_and_resolve(self, mock_service_class, runner):
+        """Test --resolve is passed on and reported in the JSON output."""
+        mock_service = Mock()
+        mock_service.post_reply.return_value = {
+            "reply_id": "C1",
+            "reply_url": "https://github.com/o/r/pull/1#discussion_r1",
+            "thread_resolved": True,
+        }
+        mock_service_class.return_value = mock_service
+
+        result = runner.invoke(
+            cli,
+            [
+                "reply",
+                "--id",
+                "PRRT_kwDOABcD12MAAAABcDE3fg",
+                "--body",
+                "Fixed in abc123",
+                "--resolve",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        request = mock_service.post_reply.call_args[0][0]
+        assert request.resolve is True
+        output = json.loads(result.stdout)
+        assert output["success"] is True
+        assert output["thread_resolved"] is True
+
+    @patch("toady.commands.reply.ReplyService")
+    def test_failed_resolve_exits_nonzero(self, mock_service_class, runner):
+        """Test a posted reply whose thread stayed open is not a success."""
+        mock_service = Mock()
+        mock_service.post_reply.return_value = {
+            "reply_id": "C1",
+            "thread_resolved": False,
+            "resolve_error": "Must have write access",
+        }
+        mock_service_class.return_value = mock_service
+
+        result = runner.invoke(
+            cli,
+            [
+                "reply",
+                "--id",
+                "PRRT_kwDOABcD12MAAAABcDE3fg",
+                "--body",
+                "Fixed in abc123",
+                "--resolve",
+            ],
+        )
+
+        assert result.exit_code == 1
+        output = json.loads(result.stdout)
+        assert output["reply_posted"] is True
+        assert output["success"] is False
+        assert output["resolve_error"] == "Must have write access"
+
+    @patch("toady.commands.reply.ReplyService")
+    def test_resolve_rejects_comment_ids(self, mock_service_class, runner):
+        """Test --resolve needs a thread ID."""
+        result = runner.invoke(
+            cli, ["reply", "--id", "123456789", "--body", "Fixed it", "--resolve"]
+        )
+
+        assert result.exit_code != 0
+        assert "--resolve requires a thread ID" in result.output
+        mock_service_class.return_value.post_reply.assert_not_called()
+
+
+class TestReplyAfterFetch:
+    """Test replies to IDs recorded by an earlier fetch."""
+
+    REPLY_RESPONSES = {
+        "PRRT_kwDOABcD12MAAAABcDE3fg": {
+            "data": {
+                "addPullRequestReviewThreadReply": {
+                    "comment": {
+                        "id": "PRRC_kwDOABcD12MAAAABcDE3fz",
+                        "url": "https://github.com/octo/widgets/pull/7#discussion_r2",
+                    }
+                }
+            }
+        },
+        "123456": {
+            "id": 2,
+            "html_url": "https://github.com/octo/widgets/pull/7#discussion_r2",
+            "pull_request_url": "https://api.github.com/repos/octo/widgets/pulls/7",
+            "user": {"login": "dev"},
+        },
+    }
+
+    @pytest.mark.parametrize("target_id", ["PRRT_kwDOABcD12MAAAABcDE3fg", "123456"])
+    def test_fetched_target_needs_one_request(self, target_id, runner):
+        """Test a reply to a fetched thread or comment sends exactly one request."""
+        created = datetime(2024, 1, 1, 12, 0, 0)
+        thread = ReviewThread(
+            thread_id="PRRT_kwDOABcD12MAAAABcDE3fg",
+            title="Rename variable",
+            created_at=created,
+            updated_at=created,
+            status="UNRESOLVED",
+            author="reviewer",
+            comments=[
+                Comment(
+                    comment_id="PRRC_kwDOABcD12MAAAABcDE3fa",
+                    content="Rename variable",
+                    author="reviewer",
+                    created_at=created,
+                    updated_at=created,
+                    parent_id=None,
+                    thread_id="PRRT_kwDOABcD12MAAAABcDE3fg",
+                    url="https://github.com/octo/widgets/pull/7#discussion_r123456",
+                )
+            ],
+        )
+        with (
+            patch("toady.commands.fetch.FetchService") as mock_fetch_service,
+            patch("toady.commands.fetch.format_threads_output"),
+        ):
+            mock_fetch_service.return_value.fetch_review_threads_with_pr_selection.return_value = (  # noqa: E501
+                [thread],
+                7,
+            )
+            result = runner.invoke(cli, ["fetch", "--pr", "7"])
+        assert result.exit_code == 0, result.output
+
+        with patch.object(GitHubService, "run_gh_command") as mock_run:
+            mock_run.return_value = Mock(
+                stdout=json.dumps(self.REPLY_RESPONSES[target_id]), returncode=0
+            )
+            result = runner.invoke(
+                cli, ["reply", "--id", target_id, "--body", "Fixed in abc123"]
+            )
+
+        assert result.exit_code == 0, result.output
+        assert mock_run.call_count == 1
+
+
 @pytest.fixture(scope="module")
 def runner():
     """Create a Click CLI test runner for the module."""
@@ -6,7 +6,7 @@ testing the command implementation without testing the CLI interface directly.
 """
 
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import click
 from click.testing import CliRunner
@@ -24,7 +24,8 @@ from toady.commands.resolve import (
     _handle_single_resolve,
     _handle_single_resolve_error,
     _handle_single_resolve_success,
-    _process_threads,
+    _parse_where_filter,
+    _process_threads_batched,
     _show_single_resolve_progress,
     _validate_and_prepare_thread_id,
     _validate_resolve_parameters,
@@ -39,6 +40,8 @@ from toady.exceptions import (
     ThreadPermissionError,
 )
 from toady.services.fetch_service import FetchServiceError
+from toady.services.journal import JournalItem, OperationJournal
+from toady.services.thread_filter import ThreadFilter
 
 
 class TestResolveCommandCore:
@@ -201,6 +204,24 @@ class TestFetchAndFilterThreads:
             _fetch_and_filter_threads(123, False, False, 100)
             mock_echo.assert_not_called()
 
+    @patch("toady.commands.resolve.FetchService")
+    def test_fetch_threads_with_filter(self, mock_service_class):
+        """Test --where predicates are applied after the resolution filter."""
+        mock_service = Mock()
+        mock_threads = [
+            Mock(is_resolved=False, file_path="docs/a.md", is_outdated=True),
+            Mock(is_resolved=False, file_path="src/a.py", is_outdated=True),
+            Mock(is_resolved=True, file_path="docs/b.md", is_outdated=True),
+        ]
+        mock_service.fetch_review_threads_from_current_repo.return_value = mock_threads
+        mock_service_class.return_value = mock_service
+        thread_filter = ThreadFilter.from_clauses(["path=docs/", "outdated"])
+
+        result = _fetch_and_filter_threads(123, False, False, 100, thread_filter)
+
+        assert result == [mock_threads[0]]
+        mock_service.fetch_review_threads_from_current_repo.assert_called_once()
+
 
 class TestHandleConfirmationPrompt:
     """Test confirmation prompt handling."""
@@ -271,105 +292,140 @@ class TestHandleConfirmationPrompt:
         assert any("... and 5 more" in call for call in echo_calls)
 
 
-class TestProcessThreads:
-    """Test thread processing logic."""
+class TestProcessThreadsBatched:
+    """Test batched thread processing for filtered bulk operations."""
 
+    @patch("toady.commands.resolve.RESOLVE_BATCH_SIZE", 2)
     @patch("toady.commands.resolve.ResolveService")
-    @patch("toady.commands.resolve.time.sleep")
-    @patch("toady.commands.resolve.click.echo")
-    def test_process_threads_resolve_success(
-        self, mock_echo, mock_sleep, mock_service_class
-    ):
-        """Test successful thread resolution processing."""
+    def test_one_request_per_batch(self, mock_service_class):
+        """Test threads are sent in batches and results are tallied."""
         mock_service = Mock()
+        mock_service.resolve_threads.side_effect = [
+            [
+                {"thread_id": "t1", "success": True},
+                {"thread_id": "t2", "success": False, "error": "Not found"},
+            ],
+            [{"thread_id": "t3", "success": True}],
+        ]
         mock_service_class.return_value = mock_service
+        threads = [Mock(thread_id=f"t{i}") for i in range(1, 4)]
 
-        threads = [Mock(thread_id="t1"), Mock(thread_id="t2")]
-        succeeded, failed, failed_threads = _process_threads(
-            threads, False, "Resolving", "🔒", True
+        succeeded, failed, failed_threads = _process_threads_batched(
+            threads, False, "Resolving", "🔒", False
         )
 
-        assert succeeded == 2
-        assert failed == 0
-        assert failed_threads == []
-        assert mock_service.resolve_thread.call_count == 2
-        mock_service.resolve_thread.assert_any_call("t1")
-        mock_service.resolve_thread.assert_any_call("t2")
+        assert mock_service.resolve_threads.call_args_list == [
+            ((["t1", "t2"],), {"undo": False}),
+            ((["t3"],), {"undo": False}),
+        ]
+        assert (succeeded, failed) == (2, 1)
+        assert failed_threads == [{"thread_id": "t2", "error": "Not found"}]
 
     @patch("toady.commands.resolve.ResolveService")
-    @patch("toady.commands.resolve.time.sleep")
-    @patch("toady.commands.resolve.click.echo")
-    def test_process_threads_unresolve_success(
-        self, mock_echo, mock_sleep, mock_service_class
-    ):
-        """Test successful thread unresolve processing."""
+    def test_outcomes_are_journaled(self, mock_service_class):
+        """Test each thread's outcome is recorded in the journal."""
         mock_service = Mock()
+        mock_service.resolve_threads.return_value = [
+            {"thread_id": "t1", "success": True},
+            {"thread_id": "t2", "success": False, "error": "Not found"},
+        ]
         mock_service_class.return_value = mock_service
-
-        threads = [Mock(thread_id="t1")]
-        succeeded, failed, failed_threads = _process_threads(
-            threads, True, "Unresolving", "🔓", False
+        journal = Mock()
+
+        _process_threads_batched(
+            [Mock(thread_id="t1"), Mock(thread_id="t2")],
+            False,
+            "Resolving",
+            "🔒",
+            False,
+            journal=journal,
         )
 
-        assert succeeded == 1
-        assert failed == 0
-        mock_service.unresolve_thread.assert_called_once_with("t1")
+        assert journal.record.call_args_list == [
+            (("t1", True, ""),),
+            (("t2", False, "Not found"),),
+        ]
 
-    @patch("toady.commands.resolve.ResolveService")
     @patch("toady.commands.resolve.time.sleep")
-    @patch("toady.commands.resolve.click.echo")
-    def test_process_threads_rate_limit_error(
-        self, mock_echo, mock_sleep, mock_service_class
-    ):
-        """Test handling of rate limit errors during processing."""
+    @patch("toady.commands.resolve.ResolveService")
+    def test_rate_limited_batch_fails_its_threads(self, mock_service_class, mock_sleep):
+        """Test a rate-limited batch marks its threads failed and backs off."""
         mock_service = Mock()
-        mock_service.resolve_thread.side_effect = [
-            None,  # First call succeeds
-            GitHubRateLimitError("Rate limit exceeded"),  # Second call fails
-        ]
+        mock_service.resolve_threads.side_effect = GitHubRateLimitError(
+            "Rate limit exceeded"
+        )
         mock_service_class.return_value = mock_service
-
         threads = [Mock(thread_id="t1"), Mock(thread_id="t2")]
-        succeeded, failed, failed_threads = _process_threads(
-            threads, False, "Resolving", "🔒", True
+
+        succeeded, failed, failed_threads = _process_threads_batched(
+            threads, True, "Unresolving", "🔓", False
         )
 
-        assert succeeded == 1
-        assert failed == 1
-        assert len(failed_threads) == 1
-        assert failed_threads[0]["thread_id"] == "t2"
-        assert "Rate limit exceeded" in failed_threads[0]["error"]
+        assert (succeeded, failed) == (0, 2)
+        assert [f["thread_id"] for f in failed_threads] == ["t1", "t2"]
+        mock_sleep.assert_called_once_with(2.0)
 
     @patch("toady.commands.resolve.ResolveService")
-    @patch("toady.commands.resolve.time.sleep")
-    @patch("toady.commands.resolve.click.echo")
-    def test_process_threads_api_error(self, mock_echo, mock_sleep, mock_service_class):
-        """Test handling of API errors during processing."""
+    def test_threads_outside_pull_request_not_sent(self, mock_service_class):
+        """Test verified threads from another PR fail without a mutation."""
         mock_service = Mock()
-        mock_service.resolve_thread.side_effect = ResolveServiceError("API error")
+        mock_service.validate_threads_exist.return_value = {"t1": True, "t2": False}
+        mock_service.resolve_threads.return_value = [
+            {"thread_id": "t1", "success": True}
+        ]
         mock_service_class.return_value = mock_service
+        journal = Mock()
+
+        succeeded, failed, failed_threads = _process_threads_batched(
+            [Mock(thread_id="t1"), Mock(thread_id="t2")],
+            False,
+            "Resolving",
+            "🔒",
+            False,
+            journal=journal,
+            verify_in=("owner/repo", 123),
+        )
 
-        threads = [Mock(thread_id="t1")]
-        succeeded, failed, failed_threads = _process_threads(
-            threads, False, "Resolving", "🔒", False
+        mock_service.validate_threads_exist.assert_called_once_with(
+            "owner", "repo", 123, ["t1", "t2"]
+        )
+        mock_service.resolve_threads.assert_called_once_with(["t1"], undo=False)
+        assert (succeeded, failed) == (1, 1)
+        assert failed_threads == [
+            {"thread_id": "t2", "error": "Thread not found in owner/repo#123"}
+        ]
+        journal.record.assert_any_call(
+            "t2", False, "Thread not found in owner/repo#123"
         )
 
-        assert succeeded == 0
-        assert failed == 1
-        assert failed_threads[0]["thread_id"] == "t1"
 
-    @patch("toady.commands.resolve.ResolveService")
-    @patch("toady.commands.resolve.time.sleep")
-    def test_process_threads_no_sleep_after_last(self, mock_sleep, mock_service_class):
-        """Test that no sleep occurs after the last thread."""
-        mock_service = Mock()
-        mock_service_class.return_value = mock_service
+class TestParseWhereFilter:
+    """Test parsing of --where clauses in the command."""
+
+    def test_no_clauses(self):
+        """Test no filter is built without --where."""
+        assert _parse_where_filter((), None, 123) is None
+
+    def test_clauses_parsed(self):
+        """Test clauses become a ThreadFilter."""
+        result = _parse_where_filter(("author=alice",), None, 123)
 
-        threads = [Mock(thread_id="t1")]
-        _process_threads(threads, False, "Resolving", "🔒", False)
+        assert result == ThreadFilter(authors=["alice"])
 
-        # Should not sleep after processing the last (only) thread
-        mock_sleep.assert_not_called()
+    def test_conflicts_with_thread_id(self):
+        """Test --where cannot be combined with --thread-id."""
+        with pytest.raises(click.BadParameter, match="--where and --thread-id"):
+            _parse_where_filter(("outdated",), "PRRT_abc", 123)
+
+    def test_requires_pr(self):
+        """Test --where requires --pr."""
+        with pytest.raises(click.BadParameter, match="--pr is required"):
+            _parse_where_filter(("outdated",), None, None)
+
+    def test_invalid_clause(self):
+        """Test invalid clauses become BadParameter errors."""
+        with pytest.raises(click.BadParameter, match="Unknown filter"):
+            _parse_where_filter(("label=bug",), None, 123)
 
 
 class TestDisplaySummary:
@@ -485,6 +541,18 @@ class TestHandleEmptyThreads:
         output = json.loads(mock_echo.call_args[0][0])
         assert output["message"] == "No resolved threads found"
 
+    @patch("toady.commands.resolve.click.echo")
+    def test_handle_empty_threads_with_filter_json(self, mock_echo):
+        """Test the empty result names the filter that matched nothing."""
+        thread_filter = ThreadFilter(outdated=True)
+
+        _handle_empty_threads(123, "resolve", False, False, thread_filter)
+
+        result = json.loads(mock_echo.call_args[0][0])
+        assert result["success"] is True
+        assert result["threads_processed"] == 0
+        assert result["message"] == "No unresolved threads match: outdated"
+
 
 class TestHandleBulkResolveError:
     """Test bulk resolve error handling."""
@@ -799,10 +867,60 @@ class TestHandleSingleResolve:
             ctx, mock_error, "clean_thread_id", True, False
         )
 
+    @patch("toady.commands.resolve._validate_and_prepare_thread_id")
+    @patch("toady.commands.resolve.ResolveService")
+    @patch("toady.commands.resolve._handle_single_resolve_success")
+    def test_handle_single_resolve_with_pr_checks_ownership(
+        self, mock_handle_success, mock_service_class, mock_validate_id
+    ):
+        """Test --pr with --thread-id uses the ownership-checked mutation."""
+        ctx = Mock()
+        mock_validate_id.return_value = "clean_thread_id"
+        mock_service = Mock()
+        mock_service.github_service.get_current_repo.return_value = "owner/repo"
+        mock_result = {"thread_id": "clean_thread_id", "pr_number": 123}
+        mock_service.resolve_thread_in_pull_request.return_value = mock_result
+        mock_service_class.return_value = mock_service
+
+        _handle_single_resolve(ctx, "thread_id", True, False, 123)
+
+        mock_service.resolve_thread_in_pull_request.assert_called_once_with(
+            "clean_thread_id", 123, owner="owner", repo="repo", undo=True
+        )
+        mock_service.unresolve_thread.assert_not_called()
+        mock_handle_success.assert_called_once_with(mock_result, True, False)
+
+    @patch("toady.commands.resolve._validate_and_prepare_thread_id")
+    @patch("toady.commands.resolve.ResolveService")
+    @patch("toady.commands.resolve._handle_single_resolve_success")
+    def test_handle_single_resolve_with_pr_outside_repository(
+        self, mock_handle_success, mock_service_class, mock_validate_id
+    ):
+        """Test only the PR number is checked when no repository is detected."""
+        ctx = Mock()
+        mock_validate_id.return_value = "clean_thread_id"
+        mock_service = Mock()
+        mock_service.github_service.get_current_repo.return_value = None
+        mock_service_class.return_value = mock_service
+
+        _handle_single_resolve(ctx, "thread_id", False, False, 123)
+
+        mock_service.resolve_thread_in_pull_request.assert_called_once_with(
+            "clean_thread_id", 123, owner=None, repo=None, undo=False
+        )
+
 
 class TestHandleBulkResolve:
     """Test bulk resolve handling integration."""
 
+    @pytest.fixture(autouse=True)
+    def current_repository(self):
+        """Run bulk operations as if in the owner/repo repository."""
+        with patch(
+            "toady.commands.resolve._current_repository", return_value="owner/repo"
+        ) as mock_repository:
+            yield mock_repository
+
     @patch("toady.commands.resolve._fetch_and_filter_threads")
     @patch("toady.commands.resolve._handle_empty_threads")
     def test_handle_bulk_resolve_empty_threads(self, mock_handle_empty, mock_fetch):
@@ -812,30 +930,33 @@ class TestHandleBulkResolve:
 
         _handle_bulk_resolve(ctx, 123, False, False, True, 100)
 
-        mock_fetch.assert_called_once_with(123, False, True, 100)
-        mock_handle_empty.assert_called_once_with(123, "resolve", False, True)
+        mock_fetch.assert_called_once_with(123, False, True, 100, None)
+        mock_handle_empty.assert_called_once_with(123, "resolve", False, True, None)
 
     @patch("toady.commands.resolve._fetch_and_filter_threads")
     @patch("toady.commands.resolve._handle_confirmation_prompt")
-    @patch("toady.commands.resolve._process_threads")
+    @patch("toady.commands.resolve._process_threads_batched")
     @patch("toady.commands.resolve._display_summary")
     def test_handle_bulk_resolve_success_flow(
         self, mock_display, mock_process, mock_confirm, mock_fetch
     ):
         """Test successful bulk resolve flow."""
         ctx = Mock()
-        mock_threads = [Mock(thread_id="t1"), Mock(thread_id="t2")]
+        mock_threads = [
+            Mock(thread_id="t1", title="First"),
+            Mock(thread_id="t2", title="Second"),
+        ]
         mock_fetch.return_value = mock_threads
         mock_process.return_value = (2, 0, [])  # succeeded, failed, failed_threads
 
         _handle_bulk_resolve(ctx, 123, False, True, False, 100)
 
-        mock_fetch.assert_called_once_with(123, False, False, 100)
+        mock_fetch.assert_called_once_with(123, False, False, 100, None)
         mock_confirm.assert_called_once_with(
             ctx, mock_threads, "resolve", "🔒", 123, True, False
         )
         mock_process.assert_called_once_with(
-            mock_threads, False, "Resolving", "🔒", False
+            mock_threads, False, "Resolving", "🔒", False, journal=ANY, verify_in=None
         )
         mock_display.assert_called_once_with(
             mock_threads, 2, 0, [], "resolve", "resolved", 123, False
@@ -843,7 +964,7 @@ class TestHandleBulkResolve:
 
     @patch("toady.commands.resolve._fetch_and_filter_threads")
     @patch("toady.commands.resolve._handle_confirmation_prompt")
-    @patch("toady.commands.resolve._process_threads")
+    @patch("toady.commands.resolve._process_threads_batched")
     @patch("toady.commands.resolve._display_summary")
     def test_handle_bulk_resolve_with_failures(
         self, mock_display, mock_process, mock_confirm, mock_fetch
@@ -859,6 +980,52 @@ class TestHandleBulkResolve:
         # Should exit with error code when there are failures
         ctx.exit.assert_called_once_with(1)
 
+    @patch("toady.commands.resolve._fetch_and_filter_threads")
+    @patch("toady.commands.resolve._process_threads_batched")
+    @patch("toady.commands.resolve._display_summary")
+    def test_handle_bulk_resolve_with_filter_uses_batches(
+        self, mock_display, mock_batched, mock_fetch
+    ):
+        """Test filtered bulk resolve passes the filter and batches mutations."""
+        ctx = Mock()
+        thread_filter = ThreadFilter(outdated=True)
+        mock_threads = [Mock(thread_id="t1", title="First")]
+        mock_fetch.return_value = mock_threads
+        mock_batched.return_value = (1, 0, [])
+
+        _handle_bulk_resolve(ctx, 123, False, True, False, 100, thread_filter)
+
+        mock_fetch.assert_called_once_with(123, False, False, 100, thread_filter)
+        mock_batched.assert_called_once_with(
+            mock_threads, False, "Resolving", "🔒", False, journal=ANY, verify_in=None
+        )
+
+    @patch("toady.commands.resolve._fetch_and_filter_threads")
+    @patch("toady.commands.resolve._process_threads_batched")
+    @patch("toady.commands.resolve._display_summary")
+    def test_handle_bulk_resolve_resume_verifies_threads(
+        self, mock_display, mock_batched, mock_fetch
+    ):
+        """Test resumed threads are checked to belong to the PR before mutating."""
+        thread_filter = ThreadFilter(outdated=True)
+        journal = OperationJournal(
+            {
+                "command": "resolve",
+                "repository": "owner/repo",
+                "pr_number": 123,
+                "action": "resolve",
+                "where": thread_filter.describe(),
+            }
+        )
+        journal.start([JournalItem("t1", "First")])
+        journal.close()
+        mock_batched.return_value = (1, 0, [])
+
+        _handle_bulk_resolve(Mock(), 123, False, True, False, 100, thread_filter, True)
+
+        mock_fetch.assert_not_called()
+        assert mock_batched.call_args.kwargs["verify_in"] == ("owner/repo", 123)
+
     @patch("toady.commands.resolve._fetch_and_filter_threads")
     @patch("toady.commands.resolve._handle_bulk_resolve_error")
     def test_handle_bulk_resolve_exception_handling(
@@ -875,6 +1042,121 @@ class TestHandleBulkResolve:
             ctx, mock_error, 123, "resolve", False
         )
 
+    @patch("toady.commands.resolve._fetch_and_filter_threads")
+    @patch("toady.commands.resolve._process_threads_batched")
+    @patch("toady.commands.resolve._display_summary")
+    def test_handle_bulk_resolve_resume_skips_succeeded(
+        self, mock_display, mock_process, mock_fetch, isolated_home
+    ):
+        """Test --resume retries only unfinished threads without refetching."""
+        journal = OperationJournal(
+            {
+                "command": "resolve",
+                "repository": "owner/repo",
+                "pr_number": 123,
+                "action": "resolve",
+                "where": "",
+            }
+        )
+        journal.start([JournalItem("t1", "First"), JournalItem("t2", "Second")])
+        journal.record("t1", True)
+        journal.record("t2", False, "Timed out")
+        journal.close()
+        mock_process.return_value = (1, 0, [])
+        ctx = Mock()
+
+        _handle_bulk_resolve(ctx, 123, False, True, False, 100, None, True)
+
+        mock_fetch.assert_not_called()
+        threads = mock_process.call_args[0][0]
+        assert [(t.thread_id, t.title) for t in threads] == [("t2", "Second")]
+        assert not journal.exists()
+        assert str(journal.path).startswith(str(isolated_home))
+
+    @patch("toady.commands.resolve._fetch_and_filter_threads")
+    @patch("toady.commands.resolve._process_threads_batched")
+    @patch("toady.commands.resolve._display_summary")
+    def test_handle_bulk_resolve_resume_ignores_other_repository(
+        self, mock_display, mock_process, mock_fetch, current_repository
+    ):
+        """Test --resume never continues a journal written in another repository."""
+        journal_a = OperationJournal(
+            {
+                "command": "resolve",
+                "repository": "owner/repo-a",
+                "pr_number": 5,
+                "action": "resolve",
+                "where": "",
+            }
+        )
+        journal_a.start([JournalItem("a1", "From repo A")])
+        journal_a.close()
+
+        current_repository.return_value = "owner/repo-b"
+        mock_fetch.return_value = [Mock(thread_id="t9", title="Other")]
+        mock_process.return_value = (1, 0, [])
+
+        _handle_bulk_resolve(Mock(), 5, False, True, False, 100, None, True)
+
+        mock_fetch.assert_called_once_with(5, False, False, 100, None)
+        threads = mock_process.call_args[0][0]
+        assert [t.thread_id for t in threads] == ["t9"]
+        assert journal_a.exists()
+
+    @patch("toady.commands.resolve._fetch_and_filter_threads")
+    @patch("toady.commands.resolve._process_threads_batched")
+    @patch("toady.commands.resolve._display_summary")
+    def test_handle_bulk_resolve_without_repository_skips_journal(
+        self, mock_display, mock_process, mock_fetch, current_repository
+    ):
+        """Test no journal is written when the repository is unknown."""
+        current_repository.return_value = None
+        mock_fetch.return_value = [Mock(thread_id="t1", title="First")]
+        mock_process.return_value = (1, 0, [])
+
+        _handle_bulk_resolve(Mock(), 123, False, True, False, 100)
+
+        assert mock_process.call_args.kwargs["journal"] is None
+
+    @patch("toady.commands.resolve._fetch_and_filter_threads")
+    @patch("toady.commands.resolve._process_threads_batched")
+    @patch("toady.commands.resolve._display_summary")
+    def test_handle_bulk_resolve_failures_keep_journal(
+        self, mock_display, mock_process, mock_fetch
+    ):
+        """Test a run with failures keeps its journal for --resume."""
+        mock_fetch.return_value = [Mock(thread_id="t1", title="First")]
+
+        def process(threads, *args, journal, verify_in):
+            journal.record("t1", False, "Failed")
+            return 0, 1, [{"thread_id": "t1", "error": "Failed"}]
+
+        mock_process.side_effect = process
+        ctx = Mock()
+
+        _handle_bulk_resolve(ctx, 123, False, True, False, 100)
+
+        ctx.exit.assert_called_once_with(1)
+        state = mock_process.call_args.kwargs["journal"].load()
+        assert [item.item_id for item in state.pending_items] == ["t1"]
+        assert state.errors == {"t1": "Failed"}
+
+    @patch("toady.commands.resolve._fetch_and_filter_threads")
+    @patch("toady.commands.resolve._process_threads_batched")
+    @patch("toady.commands.resolve._display_summary")
+    def test_handle_bulk_resolve_resume_without_journal_fetches(
+        self, mock_display, mock_process, mock_fetch
+    ):
+        """Test --resume with no interrupted run starts a fresh operation."""
+        mock_threads = [Mock(thread_id="t1", title="First")]
+        mock_fetch.return_value = mock_threads
+        mock_process.return_value = (1, 0, [])
+
+        _handle_bulk_resolve(Mock(), 123, False, True, False, 100, None, True)
+
+        mock_fetch.assert_called_once_with(123, False, False, 100, None)
+        assert mock_process.call_args[0][0] == mock_threads
+
 
 class TestResolveCommandIntegration:
     """Test resolve command integration with CLI."""
@@ -909,6 +1191,34 @@ class TestResolveCommandIntegration:
         mock_validate.assert_called_once_with(True, None, 123, 100)
         mock_handle_bulk.assert_called_once()
 
+    @patch("toady.commands.resolve._handle_bulk_resolve")
+    def test_resolve_command_where_implies_bulk(self, mock_handle_bulk, runner):
+        """Test --where runs a bulk operation with the parsed filter."""
+        result = runner.invoke(
+            cli,
+            ["resolve", "--pr", "123", "--where", "outdated", "--where", "path=docs/"],
+        )
+
+        assert result.exit_code == 0
+        thread_filter = mock_handle_bulk.call_args[0][6]
+        assert thread_filter == ThreadFilter(paths=["docs/"], outdated=True)
+
+    def test_resolve_command_resume_requires_bulk(self, runner):
+        """Test --resume is rejected for single thread operations."""
+        result = runner.invoke(
+            cli, ["resolve", "--thread-id", "PRRT_kwDOO3WQIc5RvXMO", "--resume"]
+        )
+
+        assert result.exit_code == 2
+        assert "--resume requires --all or --where" in result.output
+
+    def test_resolve_command_invalid_where(self, runner):
+        """Test invalid --where clauses are usage errors."""
+        result = runner.invoke(cli, ["resolve", "--pr", "123", "--where", "x=1"])
+
+        assert result.exit_code == 2
+        assert "Unknown filter 'x'" in result.output
+
     def test_resolve_command_validation_error(self, runner):
         """Test resolve command validation error handling."""
         result = runner.invoke(cli, ["resolve"])
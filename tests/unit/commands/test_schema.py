@@ -97,7 +97,7 @@ class TestValidateCommand:
         """Test successful validation with summary output format."""
         # Setup mock validator
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         mock_report = {
             "timestamp": "2024-01-15T10:00:00Z",
             "schema_version": "v1.0",
@@ -113,7 +113,7 @@ class TestValidateCommand:
 
         assert result.exit_code == 0
         mock_validator_class.assert_called_once_with(cache_dir=None)
-        mock_validator.fetch_schema.assert_called_once_with(force_refresh=False)
+        mock_validator.load_schema.assert_called_once_with(force_refresh=False)
         mock_validator.generate_compatibility_report.assert_called_once()
 
     @patch("toady.commands.schema.GitHubSchemaValidator")
@@ -121,7 +121,7 @@ class TestValidateCommand:
         """Test successful validation with JSON output format."""
         # Setup mock validator
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         mock_report = {
             "timestamp": "2024-01-15T10:00:00Z",
             "schema_version": "v1.0",
@@ -145,7 +145,7 @@ class TestValidateCommand:
         """Test validation with custom cache directory."""
         # Setup mock validator
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         mock_validator.generate_compatibility_report.return_value = {
             "timestamp": "2024-01-15T10:00:00Z",
             "schema_version": "v1.0",
@@ -168,7 +168,7 @@ class TestValidateCommand:
         """Test validation with force refresh flag."""
         # Setup mock validator
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         mock_validator.generate_compatibility_report.return_value = {
             "timestamp": "2024-01-15T10:00:00Z",
             "schema_version": "v1.0",
@@ -182,7 +182,7 @@ class TestValidateCommand:
         result = runner.invoke(cli, ["schema", "validate", "--force-refresh"])
 
         assert result.exit_code == 0
-        mock_validator.fetch_schema.assert_called_once_with(force_refresh=True)
+        mock_validator.load_schema.assert_called_once_with(force_refresh=True)
 
     @patch("toady.commands.schema.GitHubSchemaValidator")
     def test_validate_validator_initialization_os_error(
@@ -226,7 +226,7 @@ class TestValidateCommand:
     def test_validate_schema_fetch_connection_error(self, mock_validator_class, runner):
         """Test validation when schema fetch fails with connection error."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.side_effect = ConnectionError("Network timeout")
+        mock_validator.load_schema.side_effect = ConnectionError("Network timeout")
         mock_validator_class.return_value = mock_validator
 
         result = runner.invoke(cli, ["schema", "validate"])
@@ -238,7 +238,7 @@ class TestValidateCommand:
     def test_validate_schema_fetch_timeout_error(self, mock_validator_class, runner):
         """Test validation when schema fetch fails with timeout error."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.side_effect = TimeoutError("Request timeout")
+        mock_validator.load_schema.side_effect = TimeoutError("Request timeout")
         mock_validator_class.return_value = mock_validator
 
         result = runner.invoke(cli, ["schema", "validate"])
@@ -252,7 +252,7 @@ class TestValidateCommand:
     ):
         """Test validation when schema fetch fails with file operation error."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.side_effect = OSError("Disk full")
+        mock_validator.load_schema.side_effect = OSError("Disk full")
         mock_validator_class.return_value = mock_validator
 
         result = runner.invoke(cli, ["schema", "validate"])
@@ -264,7 +264,7 @@ class TestValidateCommand:
     def test_validate_report_generation_error(self, mock_validator_class, runner):
         """Test validation when report generation fails."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         mock_validator.generate_compatibility_report.side_effect = Exception(
             "Report error"
         )
@@ -279,7 +279,7 @@ class TestValidateCommand:
     def test_validate_json_output_format_error(self, mock_validator_class, runner):
         """Test validation when JSON output formatting fails."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         # Return non-serializable object
         mock_validator.generate_compatibility_report.return_value = {"timestamp": set()}
         mock_validator_class.return_value = mock_validator
@@ -293,7 +293,7 @@ class TestValidateCommand:
     def test_validate_summary_display_error(self, mock_validator_class, runner):
         """Test validation when summary display fails."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         # Return invalid report format
         mock_validator.generate_compatibility_report.return_value = "invalid_report"
         mock_validator_class.return_value = mock_validator
@@ -309,7 +309,7 @@ class TestValidateCommand:
     ):
         """Test validation when critical error analysis fails."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         # Return invalid report that will cause error analysis to fail
         mock_validator.generate_compatibility_report.return_value = "invalid_report"
         mock_validator_class.return_value = mock_validator
@@ -325,7 +325,7 @@ class TestValidateCommand:
     ):
         """Test validation exits with code 1 when critical errors exist."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         mock_report = {
             "timestamp": "2024-01-15T10:00:00Z",
             "schema_version": "v1.0",
@@ -346,7 +346,7 @@ class TestValidateCommand:
     def test_validate_with_warnings_only_exits_zero(self, mock_validator_class, runner):
         """Test validation exits with code 0 when only warnings exist."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         mock_report = {
             "timestamp": "2024-01-15T10:00:00Z",
             "schema_version": "v1.0",
@@ -383,7 +383,7 @@ class TestValidateCommand:
     ):
         """Test validation when SchemaValidationError is raised during fetch."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.side_effect = SchemaValidationError(
+        mock_validator.load_schema.side_effect = SchemaValidationError(
             "Schema fetch error", suggestions=["Check connection"]
         )
         mock_validator_class.return_value = mock_validator
@@ -401,7 +401,7 @@ class TestValidateCommand:
     ):
         """Test validation when SchemaValidationError has no suggestions."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.side_effect = SchemaValidationError("Schema error")
+        mock_validator.load_schema.side_effect = SchemaValidationError("Schema error")
         mock_validator_class.return_value = mock_validator
 
         result = runner.invoke(cli, ["schema", "validate"])
@@ -766,6 +766,23 @@ class TestDisplaySummaryReport:
         assert "All queries are valid" in captured.out
         assert "All mutations are valid" in captured.out
 
+    def test_display_summary_timings(self, capsys):
+        """Test the summary reports how long validation took."""
+        report = {
+            "queries": {},
+            "mutations": {},
+            "timings": {
+                "total_ms": 12.345,
+                "queries": {"reviewThreads": 4.0},
+                "mutations": {"resolveReviewThread": 2.0},
+            },
+        }
+
+        _display_summary_report(report)
+
+        captured = capsys.readouterr()
+        assert "Validated 2 operation(s) in 12.3 ms" in captured.out
+
     def test_display_summary_invalid_report_type(self):
         """Test displaying summary with invalid report type."""
         with pytest.raises(ToadyError) as exc_info:
@@ -1180,7 +1197,7 @@ class TestSchemaCommandIntegration:
     def test_validate_complete_successful_flow(self, mock_validator_class, runner):
         """Test complete successful validation flow."""
         mock_validator = Mock()
-        mock_validator.fetch_schema.return_value = None
+        mock_validator.load_schema.return_value = None
         mock_report = {
             "timestamp": "2024-01-15T10:00:00Z",
             "schema_version": "v1.0",
@@ -1197,7 +1214,7 @@ class TestSchemaCommandIntegration:
 
         assert result.exit_code == 0
         mock_validator_class.assert_called_once_with(cache_dir="/tmp/cache")
-        mock_validator.fetch_schema.assert_called_once_with(force_refresh=True)
+        mock_validator.load_schema.assert_called_once_with(force_refresh=True)
         mock_validator.generate_compatibility_report.assert_called_once()
 
     @patch("toady.commands.schema.GitHubSchemaValidator")
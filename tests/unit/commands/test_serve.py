@@ -0,0 +1,85 @@
+"""Unit tests for the serve command module."""
+
+from collections.abc import Iterator
+import os
+import shutil
+import tempfile
+import threading
+from unittest.mock import patch
+
+from click.testing import CliRunner
+import pytest
+
+from toady.cli import cli
+from toady.services.daemon import DaemonServer
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Create a Click test runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def socket_path() -> Iterator[str]:
+    """Provide a socket path short enough for AF_UNIX address limits."""
+    directory = tempfile.mkdtemp(prefix="toady-", dir="/tmp")
+    yield os.path.join(directory, "daemon.sock")
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class TestServeCommand:
+    """Test the serve command."""
+
+    @patch(
+        "toady.services.github_service.GitHubService.check_gh_installation",
+        return_value=True,
+    )
+    def test_serves_until_idle(self, _mock_check, runner, socket_path) -> None:
+        """Test the daemon warms up, listens and exits after the idle timeout."""
+        result = runner.invoke(
+            cli, ["serve", "--socket", socket_path, "--idle-timeout", "0.1"]
+        )
+
+        assert result.exit_code == 0
+        assert f"listening on {socket_path}" in result.output
+        assert not os.path.exists(socket_path)
+
+    def test_already_running(self, runner, socket_path) -> None:
+        """Test starting a second daemon on the same socket fails."""
+        server = DaemonServer(socket_path)
+        server.bind()
+        try:
+            result = runner.invoke(cli, ["serve", "--socket", socket_path])
+        finally:
+            server.close()
+
+        assert result.exit_code == 1
+        assert "already serving" in result.output
+
+    def test_stop(self, runner, socket_path) -> None:
+        """Test --stop shuts down a running daemon."""
+        server = DaemonServer(socket_path)
+        server.bind()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        result = runner.invoke(cli, ["serve", "--socket", socket_path, "--stop"])
+        thread.join(5)
+
+        assert result.exit_code == 0
+        assert "stopped" in result.output
+        assert not thread.is_alive()
+
+    def test_stop_without_daemon(self, runner, socket_path) -> None:
+        """Test --stop reports when no daemon is running."""
+        result = runner.invoke(cli, ["serve", "--socket", socket_path, "--stop"])
+
+        assert result.exit_code == 1
+        assert "No toady daemon is running" in result.output
+
+    def test_negative_idle_timeout_rejected(self, runner) -> None:
+        """Test --idle-timeout must not be negative."""
+        result = runner.invoke(cli, ["serve", "--idle-timeout", "-1"])
+
+        assert result.exit_code == 2
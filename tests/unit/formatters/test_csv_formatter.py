@@ -0,0 +1,141 @@
+"""Tests for the CSV and TSV formatter implementations."""
+
+import csv
+from datetime import datetime
+import io
+
+import pytest
+
+from toady.formatters.csv_formatter import CSVFormatter, TSVFormatter
+from toady.formatters.format_interfaces import FormatterError
+from toady.formatters.format_selection import create_formatter, format_threads_output
+from toady.models.models import Comment, ReviewThread
+
+
+def _make_thread(index: int = 0, comment_count: int = 2) -> ReviewThread:
+    thread_id = f"PRRT_kwDOABcD12MAAAABcDE3f{index}"
+    comments = [
+        Comment(
+            comment_id=f"IC_kwDOABcD12MAAAABcDE3f{index}{j}",
+            content=f"Comment {j}, with a comma\nand a newline",
+            author=f"user{j}",
+            created_at=datetime(2024, 1, 1, 12, j, 0),
+            updated_at=datetime(2024, 1, 1, 12, j, 0),
+            parent_id=None,
+            thread_id=thread_id,
+        )
+        for j in range(comment_count)
+    ]
+    return ReviewThread(
+        thread_id=thread_id,
+        title=f"Thread {index}",
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 1, 13, 0, 0),
+        status="UNRESOLVED",
+        author="reviewer",
+        comments=comments,
+        file_path="src/app.py",
+        line=10 + index,
+    )
+
+
+def _parse(text: str, delimiter: str = ",") -> list[list[str]]:
+    return list(csv.reader(io.StringIO(text), delimiter=delimiter))
+
+
+@pytest.mark.formatter
+@pytest.mark.unit
+class TestCSVFormatter:
+    """Test the CSVFormatter class."""
+
+    def test_thread_rows_with_default_columns(self):
+        """Test one row is written per thread with a header."""
+        rows = _parse(CSVFormatter().format_threads([_make_thread(0), _make_thread(1)]))
+
+        assert rows[0][:3] == ["thread_id", "status", "title"]
+        assert len(rows) == 3
+        assert rows[1][2] == "Thread 0"
+        assert rows[1][rows[0].index("comment_count")] == "2"
+        assert rows[1][rows[0].index("is_outdated")] == "false"
+
+    def test_custom_columns(self):
+        """Test only the requested columns are written, in order."""
+        formatter = CSVFormatter(columns=["line", "thread_id"], include_header=False)
+
+        rows = _parse(formatter.format_threads([_make_thread(3)]))
+
+        assert rows == [["13", "PRRT_kwDOABcD12MAAAABcDE3f3"]]
+
+    def test_comment_rows(self):
+        """Test one row is written per comment with thread fields repeated."""
+        formatter = CSVFormatter(
+            columns=["thread_id", "comment_author", "comment_content"],
+            comment_rows=True,
+        )
+
+        rows = _parse(formatter.format_threads([_make_thread(0), _make_thread(1, 1)]))
+
+        assert len(rows) == 4
+        assert rows[1] == [
+            "PRRT_kwDOABcD12MAAAABcDE3f0",
+            "user0",
+            "Comment 0, with a comma\nand a newline",
+        ]
+        assert rows[3][0] == "PRRT_kwDOABcD12MAAAABcDE3f1"
+
+    def test_comment_columns_require_comment_rows(self):
+        """Test comment columns are rejected in thread mode."""
+        with pytest.raises(FormatterError, match="comment columns need comment"):
+            CSVFormatter(columns=["comment_id"])
+
+    def test_unknown_column(self):
+        """Test unknown columns are rejected with the available names."""
+        with pytest.raises(FormatterError, match="Unknown column"):
+            CSVFormatter(columns=["nope"])
+
+    def test_iter_threads_yields_incrementally(self):
+        """Test rows are produced one thread at a time."""
+        threads = (_make_thread(i) for i in range(3))
+
+        chunks = list(CSVFormatter().iter_threads(threads))
+
+        assert len(chunks) == 4
+        assert all(chunk.endswith("\n") for chunk in chunks)
+
+    def test_format_array_of_dicts(self):
+        """Test dictionaries become a table over the union of their keys."""
+        result = CSVFormatter().format_array([{"a": 1}, {"b": [1, 2], "a": None}])
+
+        assert _parse(result) == [["a", "b"], ["1", ""], ["", "[1, 2]"]]
+
+
+@pytest.mark.formatter
+@pytest.mark.unit
+class TestTSVFormatter:
+    """Test the TSVFormatter class and CLI output integration."""
+
+    def test_tab_delimited(self):
+        """Test rows are tab separated."""
+        text = TSVFormatter(columns=["thread_id", "title"]).format_threads(
+            [_make_thread()]
+        )
+
+        assert text.splitlines()[0] == "thread_id\ttitle"
+        assert _parse(text, "\t")[1][1] == "Thread 0"
+
+    def test_registered_formats(self):
+        """Test csv and tsv are available through format selection."""
+        assert isinstance(create_formatter("csv"), CSVFormatter)
+        assert isinstance(create_formatter("tsv"), TSVFormatter)
+
+    def test_format_threads_output_streams_rows(self, capsys):
+        """Test output is written with the requested formatter options."""
+        format_threads_output(
+            [_make_thread()],
+            "tsv",
+            formatter_options={"columns": ["comment_id"], "comment_rows": True},
+        )
+
+        assert capsys.readouterr().out == (
+            "comment_id\nIC_kwDOABcD12MAAAABcDE3f00\nIC_kwDOABcD12MAAAABcDE3f01\n"
+        )
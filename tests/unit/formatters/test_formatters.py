@@ -357,6 +357,69 @@ class TestFormatFetchOutput:
         call_args = mock_echo.call_args[0][0]
         assert call_args == "No review threads found."
 
+    @patch("toady.formatters.formatters.click.echo_via_pager")
+    @patch("toady.formatters.formatters.click.echo")
+    @patch("toady.formatters.formatters.sys.stdout")
+    def test_format_fetch_output_pages_on_tty(
+        self, mock_stdout, mock_echo, mock_pager, monkeypatch
+    ) -> None:
+        """Test long pretty output is streamed to a pager on a terminal."""
+        monkeypatch.delenv("TOADY_NO_PAGER", raising=False)
+        mock_stdout.isatty.return_value = True
+        threads = [
+            ReviewThread(
+                thread_id=f"RT_{i}",
+                title=f"Thread {i}",
+                created_at=datetime(2024, 1, 15, 10, 0, 0),
+                updated_at=datetime(2024, 1, 15, 10, 30, 0),
+                status="UNRESOLVED",
+                author="reviewer1",
+                comments=[],
+            )
+            for i in range(50)
+        ]
+
+        format_fetch_output(
+            threads=threads,
+            pretty=True,
+            show_progress=True,
+            pr_number=123,
+            thread_type="unresolved threads",
+            limit=50,
+        )
+
+        # Progress goes straight to stdout, the rest is streamed to the pager
+        assert mock_echo.call_count == 1
+        assert mock_pager.call_count == 1
+        chunks = list(mock_pager.call_args[0][0])
+        assert len(chunks) == len(threads) + 3
+        assert all(chunk.endswith("\n") for chunk in chunks)
+        assert "📝 Found 50 unresolved threads" in chunks[-1]
+
+    @patch("toady.formatters.formatters.click.echo_via_pager")
+    @patch("toady.formatters.formatters.click.echo")
+    @patch("toady.formatters.formatters.sys.stdout")
+    def test_format_fetch_output_pager_disabled(
+        self, mock_stdout, mock_echo, mock_pager, monkeypatch
+    ) -> None:
+        """Test TOADY_NO_PAGER keeps output on stdout."""
+        monkeypatch.setenv("TOADY_NO_PAGER", "1")
+        mock_stdout.isatty.return_value = True
+        thread = ReviewThread(
+            thread_id="RT_1",
+            title="Thread",
+            created_at=datetime(2024, 1, 15, 10, 0, 0),
+            updated_at=datetime(2024, 1, 15, 10, 30, 0),
+            status="UNRESOLVED",
+            author="reviewer1",
+            comments=[],
+        )
+
+        format_fetch_output(threads=[thread] * 50, pretty=True, show_progress=False)
+
+        mock_pager.assert_not_called()
+        assert mock_echo.call_count == 1
+
     @patch("toady.formatters.formatters.click.echo")
     def test_format_fetch_output_with_threads(self, mock_echo) -> None:
         """Test format_fetch_output with actual threads."""
@@ -0,0 +1,135 @@
+"""Tests for the MessagePack formatter implementation."""
+
+from datetime import datetime
+import io
+import json
+
+import pytest
+
+from toady.formatters.format_interfaces import FormatterError
+from toady.formatters.format_selection import create_formatter, format_threads_output
+from toady.formatters.json_formatter import JSONFormatter
+from toady.models.models import Comment, ReviewThread
+
+msgpack = pytest.importorskip("msgpack")
+
+from toady.formatters.msgpack_formatter import (  # noqa: E402
+    MsgpackFormatter,
+    read_msgpack,
+    read_threads_msgpack,
+)
+
+
+def _make_thread(index: int = 0) -> ReviewThread:
+    comment = Comment(
+        comment_id=f"IC_kwDOABcD12MAAAABcDE3f{index}",
+        content="Please rename this variable",
+        author="reviewer",
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 1, 12, 5, 0),
+        parent_id=None,
+        thread_id=f"PRRT_kwDOABcD12MAAAABcDE3f{index}",
+        url="https://github.com/owner/repo/pull/1#discussion_r1",
+    )
+    return ReviewThread(
+        thread_id=f"PRRT_kwDOABcD12MAAAABcDE3f{index}",
+        title="Rename variable",
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 1, 13, 0, 0),
+        status="UNRESOLVED",
+        author="reviewer",
+        comments=[comment],
+        file_path="src/app.py",
+        line=12,
+    )
+
+
+@pytest.mark.formatter
+@pytest.mark.unit
+class TestMsgpackFormatter:
+    """Test the MsgpackFormatter class."""
+
+    def test_registered_with_factory(self):
+        """Test the formatter is available through the factory."""
+        formatter = create_formatter("msgpack")
+
+        assert isinstance(formatter, MsgpackFormatter)
+
+    def test_format_threads_mirrors_json_output(self):
+        """Test decoded thread payload equals the JSON formatter's output."""
+        threads = [_make_thread(i) for i in range(3)]
+
+        packed = MsgpackFormatter().format_threads(threads)
+
+        assert isinstance(packed, bytes)
+        assert msgpack.unpackb(packed, raw=False) == json.loads(
+            JSONFormatter().format_threads(threads)
+        )
+
+    def test_output_smaller_than_indented_json(self):
+        """Test the binary payload is smaller than indented JSON."""
+        threads = [_make_thread(i) for i in range(20)]
+
+        packed = MsgpackFormatter().format_threads(threads)
+        text = JSONFormatter(indent=2).format_threads(threads)
+
+        assert len(packed) < len(text.encode("utf-8"))
+
+    def test_format_error_adds_flags(self):
+        """Test error payloads include error and success flags."""
+        packed = MsgpackFormatter().format_error({"message": "boom"})
+
+        assert read_msgpack(packed) == {
+            "message": "boom",
+            "error": True,
+            "success": False,
+        }
+
+    def test_format_object_unserializable_raises(self):
+        """Test encoding failures are wrapped in FormatterError."""
+        with pytest.raises(FormatterError, match="as msgpack"):
+            MsgpackFormatter().format_object({"value": 2**70})
+
+
+@pytest.mark.formatter
+@pytest.mark.unit
+class TestMsgpackReaders:
+    """Test the MessagePack reader helpers."""
+
+    def test_read_threads_from_stream(self):
+        """Test threads can be read back from a binary stream."""
+        threads = [_make_thread(i) for i in range(2)]
+        stream = io.BytesIO(MsgpackFormatter().format_threads(threads))
+
+        result = read_threads_msgpack(stream)
+
+        assert result == [thread.to_dict() for thread in threads]
+
+    def test_read_threads_as_models(self):
+        """Test threads can be decoded into ReviewThread objects."""
+        thread = _make_thread()
+
+        result = read_threads_msgpack(
+            MsgpackFormatter().format_threads([thread]), as_models=True
+        )
+
+        assert result[0].thread_id == thread.thread_id
+        assert result[0].comments[0].content == thread.comments[0].content
+
+    def test_read_threads_rejects_non_array(self):
+        """Test a non-array payload is rejected."""
+        with pytest.raises(FormatterError, match="Expected an array"):
+            read_threads_msgpack(msgpack.packb({"threads": []}))
+
+    def test_read_invalid_data(self):
+        """Test invalid data raises FormatterError."""
+        with pytest.raises(FormatterError, match="Failed to read msgpack"):
+            read_msgpack(b"\xc1")
+
+    def test_threads_output_has_no_trailing_newline(self, capsysbinary):
+        """Test CLI output can be decoded without stripping a newline."""
+        format_threads_output([_make_thread()], "msgpack")
+
+        output = capsysbinary.readouterr().out
+
+        assert read_threads_msgpack(output)[0]["title"] == "Rename variable"
@@ -666,3 +666,57 @@ class TestPrettyFormatterIntegration:
             lengths = [len(line) for line in stripped_lines]
             # Allow small variance due to content differences
             assert max(lengths) - min(lengths) <= 3
+
+    def test_iter_threads_matches_format_threads(self):
+        """Test streamed chunks join to the same text as format_threads."""
+        formatter = PrettyFormatter(use_colors=True)
+        threads = [
+            ReviewThread(
+                thread_id=f"T_{i}",
+                title=f"Thread {i}",
+                status="RESOLVED" if i % 2 else "UNRESOLVED",
+                author="testuser",
+                created_at=datetime(2024, 1, 1, 12, 0, 0),
+                updated_at=datetime(2024, 1, 1, 12, 0, 0),
+                comments=[],
+            )
+            for i in range(3)
+        ]
+
+        chunks = list(formatter.iter_threads(threads))
+
+        # Header, one chunk per thread, summary footer
+        assert len(chunks) == 5
+        assert "\n".join(chunks) == formatter.format_threads(threads)
+
+    def test_wrap_comment_content_reuses_wrapper(self):
+        """Test long lines are wrapped and short lines are kept intact."""
+        formatter = PrettyFormatter(use_colors=False, text_width=30)
+
+        result = formatter._wrap_comment_content("short line\n" + "word " * 20)
+
+        assert result[0] == "      short line"
+        assert len(result) > 2
+        assert all(len(line) <= 30 for line in result)
+        assert formatter._get_text_wrapper() is formatter._get_text_wrapper()
+
+    def test_code_block_fence_styled_dim(self):
+        """Test code fences render with the dim attribute instead of failing."""
+        formatter = PrettyFormatter(use_colors=True)
+
+        result = formatter._wrap_comment_content("```\ncode\n```")
+
+        assert "\x1b[2m```" in result[0]
+
+    def test_table_pads_cells_with_ansi_values(self):
+        """Test table cells containing ANSI codes pad by visible width."""
+        formatter = PrettyFormatter(use_colors=False)
+        items = [
+            {"name": "\x1b[32mab\x1b[0m", "value": "1"},
+            {"name": "abcdef", "value": "2"},
+        ]
+
+        lines = formatter._format_table(items).split("\n")
+        stripped = [formatter._strip_ansi_codes(line) for line in lines]
+
+        assert len({len(line) for line in stripped}) == 1
@@ -0,0 +1,190 @@
+"""Tests for the serializer registry."""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+import pytest
+
+from toady.formatters.serializers import (
+    SerializerRegistry,
+    create_default_registry,
+    default_registry,
+)
+from toady.models import Comment, ReviewThread
+from toady.models.models import PullRequest
+
+
+def _make_comment(comment_id: str = "IC_kwDOABcD12MAAAABcDE3fg") -> Comment:
+    return Comment(
+        comment_id=comment_id,
+        content="Looks good",
+        author="reviewer",
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 1, 12, 30, 0),
+        parent_id=None,
+        thread_id="PRRT_kwDOABcD12MAAAABcDE3fg",
+        url="https://github.com/owner/repo/pull/1#discussion_r1",
+    )
+
+
+def _make_thread() -> ReviewThread:
+    return ReviewThread(
+        thread_id="PRRT_kwDOABcD12MAAAABcDE3fg",
+        title="Consider renaming",
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 2, 8, 0, 0),
+        status="UNRESOLVED",
+        author="reviewer",
+        comments=[_make_comment(), _make_comment("IC_kwDOABcD12MAAAABcDE3fh")],
+        file_path="src/module.py",
+        line=42,
+    )
+
+
+class TestModelEncoders:
+    """Test the generated encoders for toady's models."""
+
+    def test_review_thread_matches_to_dict(self) -> None:
+        """Test thread encoding matches ReviewThread.to_dict, including order."""
+        thread = _make_thread()
+
+        result = default_registry.serialize(thread, repr)
+
+        assert result == thread.to_dict()
+        assert list(result) == list(thread.to_dict())
+
+    def test_comment_matches_to_dict(self) -> None:
+        """Test comment encoding matches Comment.to_dict."""
+        comment = _make_comment()
+
+        assert default_registry.serialize(comment, repr) == comment.to_dict()
+
+    def test_pull_request_matches_to_dict(self) -> None:
+        """Test pull request encoding matches PullRequest.to_dict."""
+        pr = PullRequest(
+            number=7,
+            title="Add feature",
+            author="octocat",
+            head_ref="feature",
+            base_ref="main",
+            is_draft=False,
+            created_at=datetime(2024, 1, 1),
+            updated_at=datetime(2024, 1, 2),
+            url="https://github.com/owner/repo/pull/7",
+            review_thread_count=3,
+        )
+
+        assert default_registry.serialize(pr, repr) == pr.to_dict()
+
+    def test_models_nested_in_containers(self) -> None:
+        """Test models inside dicts and lists are encoded recursively."""
+        thread = _make_thread()
+
+        result = default_registry.serialize({"threads": [thread]}, repr)
+
+        assert result == {"threads": [thread.to_dict()]}
+
+    def test_register_model_rejects_non_dataclass(self) -> None:
+        """Test register_model raises TypeError for non-dataclass types."""
+        registry = SerializerRegistry()
+
+        with pytest.raises(TypeError, match="not a dataclass"):
+            registry.register_model(object)
+
+    def test_register_custom_model(self) -> None:
+        """Test encoders can be generated for arbitrary dataclasses."""
+
+        @dataclass
+        class Point:
+            x: int
+            seen_at: datetime
+
+        registry = create_default_registry()
+        registry.register_model(Point)
+
+        result = registry.serialize(Point(1, datetime(2024, 5, 1)), repr)
+
+        assert result == {"x": 1, "seen_at": "2024-05-01T00:00:00"}
+
+
+class TestRegistryLookup:
+    """Test encoder resolution and fallback behavior."""
+
+    def test_builtin_values(self) -> None:
+        """Test primitives, dates and containers are encoded."""
+        value = {
+            "count": 3,
+            "ratio": 0.5,
+            "flag": True,
+            "missing": None,
+            "when": date(2024, 1, 1),
+            "items": ("a", "b"),
+        }
+
+        assert default_registry.serialize(value, repr) == {
+            "count": 3,
+            "ratio": 0.5,
+            "flag": True,
+            "missing": None,
+            "when": "2024-01-01",
+            "items": ["a", "b"],
+        }
+
+    def test_unknown_type_uses_fallback(self) -> None:
+        """Test objects without an encoder are passed to the fallback."""
+
+        class Opaque:
+            pass
+
+        calls: list[Any] = []
+
+        def fallback(obj: Any) -> str:
+            calls.append(obj)
+            return "fallback"
+
+        opaque = Opaque()
+        result = default_registry.serialize({"value": opaque}, fallback)
+
+        assert result == {"value": "fallback"}
+        assert calls == [opaque]
+
+    def test_subclass_of_inheritable_type(self) -> None:
+        """Test subclasses of dict resolve to the dict encoder."""
+
+        class AttrDict(dict):
+            pass
+
+        registry = create_default_registry()
+
+        assert registry.lookup(AttrDict) is registry.lookup(dict)
+
+    def test_exact_types_do_not_match_subclasses(self) -> None:
+        """Test encoders registered without subclasses stay exact."""
+
+        class MyStr(str):
+            pass
+
+        registry = SerializerRegistry()
+        registry.register(str, lambda obj, _serialize: obj)
+
+        assert registry.lookup(MyStr) is None
+
+    def test_register_invalidates_cached_lookup(self) -> None:
+        """Test registering a type clears previously cached resolutions."""
+
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+
+        registry = SerializerRegistry()
+        assert registry.lookup(Child) is None
+
+        def encoder(obj: Any, _serialize: Any) -> str:
+            return "base"
+
+        registry.register(Base, encoder, subclasses=True)
+
+        assert registry.lookup(Child) is encoder
@@ -4,6 +4,8 @@ import pytest
 
 from toady.parsers.graphql_parser import (
     GraphQLParser,
+    GraphQLSyntaxError,
+    tokenize,
 )
 
 
@@ -413,3 +415,181 @@ class TestGraphQLParser:
         # Verify structure is parsed
         assert len(operation.selections) == 1
         assert operation.selections[0].name == "repository"
+
+    def test_parse_input_object_arguments(self, parser):
+        """Test input objects are parsed into nested values."""
+        query = """
+        query {
+            issues(first: 10, orderBy: {field: CREATED_AT, direction: DESC}) {
+                nodes { id }
+            }
+        }
+        """
+        operation = parser.parse(query)
+
+        assert operation.selections[0].arguments == {
+            "first": 10,
+            "orderBy": {"field": "CREATED_AT", "direction": "DESC"},
+        }
+
+    def test_parse_argument_value_types(self, parser):
+        """Test lists, floats and strings with punctuation are parsed."""
+        query = """
+        query {
+            search(query: "is:pr { draft, }", ids: [$a, "b"], score: 1.5) {
+                id
+            }
+        }
+        """
+        operation = parser.parse(query)
+
+        assert operation.selections[0].arguments == {
+            "query": "is:pr { draft, }",
+            "ids": [{"variable": "a"}, "b"],
+            "score": 1.5,
+        }
+        assert operation.selections[0].selections[0].name == "id"
+
+    def test_parse_variable_types_and_defaults(self, parser):
+        """Test list types and default values in variable declarations."""
+        query = """
+        query($ids: [ID!]!, $first: Int = 10) {
+            nodes(ids: $ids) { id }
+        }
+        """
+        operation = parser.parse(query)
+
+        assert operation.variables == {"ids": "[ID!]!", "first": "Int"}
+
+    def test_parse_skips_directives(self, parser):
+        """Test directives on fields and fragments are ignored."""
+        query = """
+        query($full: Boolean!) {
+            user @include(if: $full) {
+                id
+                ... @skip(if: $full) { name }
+            }
+        }
+        """
+        operation = parser.parse(query)
+
+        user = operation.selections[0]
+        assert user.arguments == {}
+        assert [field.name for field in user.selections] == ["id", "name"]
+
+    def test_parse_named_fragments(self, parser):
+        """Test named fragment spreads resolve to fragment pseudo-fields."""
+        query = """
+        query {
+            node(id: "1") { ...CommentFields }
+        }
+
+        fragment CommentFields on Comment {
+            body
+            author { ...Author }
+        }
+
+        fragment Author on Actor { login }
+        """
+        operation = parser.parse(query)
+
+        fragment = operation.selections[0].selections[0]
+        assert fragment.name == "__fragment_Comment"
+        assert fragment.parent_type == "node"
+        assert [field.name for field in fragment.selections] == ["body", "author"]
+        author = fragment.selections[1].selections[0]
+        assert author.name == "__fragment_Actor"
+        assert author.selections[0].name == "login"
+
+    def test_parse_unknown_fragment(self, parser):
+        """Test spreading an undefined fragment is an error."""
+        with pytest.raises(GraphQLSyntaxError, match="Unknown fragment 'Missing'"):
+            parser.parse("query { viewer { ...Missing } }")
+
+    def test_parse_fragment_cycle(self, parser):
+        """Test fragments spreading each other in a cycle are rejected."""
+        query = """
+        query { viewer { ...A } }
+        fragment A on User { ...B }
+        fragment B on User { ...A }
+        """
+        with pytest.raises(GraphQLSyntaxError, match="spreads itself"):
+            parser.parse(query)
+
+    def test_syntax_error_position(self, parser):
+        """Test syntax errors report the line and column of the problem."""
+        query = "query {\n  user(id: ) {\n    id\n  }\n}"
+
+        with pytest.raises(GraphQLSyntaxError) as exc_info:
+            parser.parse(query)
+
+        assert exc_info.value.line == 2
+        assert exc_info.value.column == 12
+        assert "line 2, column 12" in str(exc_info.value)
+
+    def test_unmatched_brace_points_at_opening_brace(self, parser):
+        """Test an unclosed selection set reports where it was opened."""
+        with pytest.raises(GraphQLSyntaxError, match="Unmatched braces") as exc_info:
+            parser.parse("query {\n  user {\n    id\n")
+
+        assert (exc_info.value.line, exc_info.value.column) == (2, 8)
+
+    def test_unterminated_string(self, parser):
+        """Test an unterminated string is a syntax error."""
+        with pytest.raises(ValueError, match="Unterminated string"):
+            parser.parse('query { user(id: "1) { id } }')
+
+    def test_parse_deeply_nested_query(self, parser):
+        """Test deep nesting parses into the full depth of selections."""
+        depth = 200
+        query = "query { " + "f { " * depth + "id" + " }" * depth + " }"
+
+        field = parser.parse(query).selections[0]
+        for _ in range(depth - 1):
+            field = field.selections[0]
+
+        assert field.selections[0].name == "id"
+
+
+class TestTokenize:
+    """Test cases for the GraphQL tokenizer."""
+
+    def test_drops_ignored_text(self):
+        """Test whitespace, commas and comments produce no tokens."""
+        tokens = tokenize('{ a(x: 1, y: "s") # note\n ...on }')
+
+        assert [token.value for token in tokens] == [
+            "{",
+            "a",
+            "(",
+            "x",
+            ":",
+            "1",
+            "y",
+            ":",
+            '"s"',
+            ")",
+            "...",
+            "on",
+            "}",
+            "",
+        ]
+        assert tokens[-1].kind == "eof"
+
+    def test_token_kinds_and_positions(self):
+        """Test tokens record their kind and offset."""
+        tokens = tokenize('$id -1.5e3 """block""" name')
+
+        assert [(token.kind, token.start) for token in tokens] == [
+            ("punctuator", 0),
+            ("name", 1),
+            ("float", 4),
+            ("block_string", 11),
+            ("name", 23),
+            ("eof", 27),
+        ]
+
+    def test_unexpected_character(self):
+        """Test characters outside the GraphQL grammar are rejected."""
+        with pytest.raises(GraphQLSyntaxError, match="Unexpected character '%'"):
+            tokenize("{ a % b }")
@@ -0,0 +1,151 @@
+"""Tests for the GraphQL query registry."""
+
+import hashlib
+
+import pytest
+
+from toady.parsers.graphql_parser import GraphQLParser, tokenize
+from toady.parsers.graphql_queries import (
+    PullRequestQueryBuilder,
+    ReviewThreadQueryBuilder,
+)
+from toady.parsers.query_registry import (
+    RegisteredQuery,
+    bulk_reply_mutation,
+    bulk_resolve_mutation,
+    minify_query,
+    open_pull_requests_query,
+    registered_document,
+    registered_mutations,
+    registered_queries,
+    review_threads_query,
+)
+from toady.services.github_service import (
+    RESOLVE_THREAD_MUTATION,
+    build_bulk_reply_mutation,
+    build_bulk_resolve_mutation,
+)
+from toady.services.reply_service import REPLY_CONTEXT_QUERY
+
+
+class TestMinifyQuery:
+    """Test cases for minify_query."""
+
+    def test_drops_ignored_text(self):
+        """Test whitespace, commas and comments are removed."""
+        query = """
+        query GetUser($id: ID!, $first: Int) {
+          # the user
+          user(id: $id) {
+            ... on User { name }
+            repositories(first: 10, after: "a b") { totalCount }
+          }
+        }
+        """
+
+        assert minify_query(query) == (
+            "query GetUser($id:ID!$first:Int){user(id:$id){...on User{name}"
+            'repositories(first:10 after:"a b"){totalCount}}}'
+        )
+
+    def test_preserves_tokens(self):
+        """Test the minified document tokenizes exactly like the original."""
+        query = ReviewThreadQueryBuilder().build_query()
+
+        assert [t.value for t in tokenize(minify_query(query))] == [
+            t.value for t in tokenize(query)
+        ]
+
+
+class TestQueryRegistry:
+    """Test cases for the registered queries."""
+
+    @pytest.mark.parametrize(
+        ("registered", "builder"),
+        [
+            (review_threads_query(), ReviewThreadQueryBuilder()),
+            (
+                review_threads_query(25, 5),
+                ReviewThreadQueryBuilder().limit(25).comment_limit(5),
+            ),
+            (open_pull_requests_query(), PullRequestQueryBuilder()),
+            (open_pull_requests_query(10), PullRequestQueryBuilder().limit(10)),
+        ],
+    )
+    def test_matches_builder(self, registered, builder):
+        """Test registered documents parse like the builder's output."""
+        parser = GraphQLParser()
+        expected = parser.parse(builder.build_query())
+        actual = parser.parse(registered.document)
+
+        assert actual == expected
+        assert len(registered.document) < len(builder.build_query())
+
+    def test_rendered_once(self):
+        """Test the same configuration returns the same registered query."""
+        assert review_threads_query(50, 10) is review_threads_query(50, 10)
+        assert open_pull_requests_query(50) is open_pull_requests_query(50)
+
+    def test_stable_hash(self):
+        """Test the hash identifies the document."""
+        query = review_threads_query()
+
+        assert query.hash == hashlib.sha256(query.document.encode()).hexdigest()[:16]
+        assert query.hash != review_threads_query(limit=50).hash
+
+    def test_invalid_limit(self):
+        """Test out-of-range limits are rejected like the builders do."""
+        with pytest.raises(ValueError, match="Limit must be between 1 and 100"):
+            review_threads_query(limit=0)
+        with pytest.raises(ValueError, match="Comment limit must be between 1 and 50"):
+            review_threads_query(comment_limit=51)
+
+    def test_registered_queries(self):
+        """Test the default configurations are listed by name."""
+        queries = registered_queries()
+
+        assert set(queries) == {
+            "reviewThreads",
+            "pullRequests",
+            "replyContext",
+            "validateThreadsExist",
+        }
+        assert all(isinstance(q, RegisteredQuery) for q in queries.values())
+        assert queries["reviewThreads"] == review_threads_query()
+        assert queries["replyContext"].document == minify_query(REPLY_CONTEXT_QUERY)
+
+    def test_registered_mutations(self):
+        """Test the single-thread mutations are registered minified."""
+        mutations = registered_mutations()
+
+        assert set(mutations) == {
+            "resolveReviewThread",
+            "unresolveReviewThread",
+            "addPullRequestReviewThreadReply",
+            "addPullRequestReviewComment",
+            "replyAndResolveReviewThread",
+        }
+        assert mutations["resolveReviewThread"].document == minify_query(
+            RESOLVE_THREAD_MUTATION
+        )
+        assert mutations["resolveReviewThread"] is registered_document(
+            "resolveReviewThread", RESOLVE_THREAD_MUTATION
+        )
+
+    def test_bulk_mutations_rendered_once(self):
+        """Test batch mutations are rendered once per batch shape."""
+        resolve = bulk_resolve_mutation(3)
+        reply = bulk_reply_mutation(2, frozenset({1}))
+
+        assert resolve is bulk_resolve_mutation(3)
+        assert resolve is not bulk_resolve_mutation(3, undo=True)
+        assert resolve.document == minify_query(build_bulk_resolve_mutation(3))
+        assert reply is bulk_reply_mutation(2, frozenset({1}))
+        assert reply.document == minify_query(build_bulk_reply_mutation(2, {1}))
+
+    def test_bulk_mutation_invalid_count(self):
+        """Test empty batches are rejected like the builders do."""
+        with pytest.raises(ValueError, match="at least one thread"):
+            bulk_resolve_mutation(0)
+        with pytest.raises(ValueError, match="at least one reply"):
+            bulk_reply_mutation(0)
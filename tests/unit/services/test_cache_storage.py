@@ -0,0 +1,82 @@
+"""Tests for the shared cache storage primitives."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from toady.services.cache_storage import (
+    FileLock,
+    LockTimeoutError,
+    atomic_write_text,
+)
+
+
+@pytest.mark.service
+@pytest.mark.unit
+class TestAtomicWriteText:
+    """Test the atomic_write_text function."""
+
+    def test_replaces_contents(self, tmp_path: Path) -> None:
+        """Test the file is written and no temporary files remain."""
+        path = tmp_path / "cache" / "schema.json"
+
+        atomic_write_text(path, "old")
+        atomic_write_text(path, "new")
+
+        assert path.read_text() == "new"
+        assert [p.name for p in path.parent.iterdir()] == ["schema.json"]
+
+    def test_failed_write_keeps_previous_file(self, tmp_path: Path) -> None:
+        """Test a write that fails midway leaves the old contents intact."""
+        path = tmp_path / "schema.json"
+        atomic_write_text(path, "old")
+
+        with (
+            patch(
+                "toady.services.cache_storage.os.replace", side_effect=OSError("full")
+            ),
+            pytest.raises(OSError),
+        ):
+            atomic_write_text(path, "new")
+
+        assert path.read_text() == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["schema.json"]
+
+
+@pytest.mark.service
+@pytest.mark.unit
+class TestFileLock:
+    """Test the FileLock class."""
+
+    def test_exclusive_lock_excludes_others(self, tmp_path: Path) -> None:
+        """Test a held lock cannot be taken by another holder."""
+        lock_path = tmp_path / "schema.lock"
+
+        with FileLock(lock_path) as held:
+            assert held.locked
+            other = FileLock(lock_path)
+            assert other.acquire(blocking=False) is False
+            assert not other.locked
+
+        assert FileLock(lock_path).acquire(blocking=False) is True
+
+    def test_shared_locks_coexist(self, tmp_path: Path) -> None:
+        """Test readers can share the lock but a writer cannot join them."""
+        lock_path = tmp_path / "schema.lock"
+        first = FileLock(lock_path, shared=True)
+        second = FileLock(lock_path, shared=True)
+
+        assert first.acquire(blocking=False)
+        assert second.acquire(blocking=False)
+        assert FileLock(lock_path).acquire(blocking=False) is False
+
+        first.release()
+        second.release()
+
+    def test_timeout(self, tmp_path: Path) -> None:
+        """Test waiting for a held lock gives up after the timeout."""
+        lock_path = tmp_path / "schema.lock"
+
+        with FileLock(lock_path), pytest.raises(LockTimeoutError):
+            FileLock(lock_path).acquire(timeout=0.1)
@@ -0,0 +1,247 @@
+"""Tests for the local code context service."""
+
+from datetime import datetime
+from pathlib import Path
+import shutil
+import subprocess
+from typing import Any, Optional
+
+import pytest
+
+from toady.formatters.formatters import PrettyFormatter
+from toady.formatters.serializers import default_registry
+from toady.models.models import ReviewThread
+from toady.services.code_context import (
+    CodeContextError,
+    CodeContextProvider,
+    GitBlobReader,
+    attach_code_context,
+)
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("git") is None, reason="git executable not available"
+)
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Create a git repository with one committed file."""
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "Dev")
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "app.py").write_text(
+        "".join(f"line {number}\n" for number in range(1, 21))
+    )
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+def _make_thread(
+    line: Optional[int] = 10,
+    start_line: Optional[int] = None,
+    file_path: Optional[str] = "src/app.py",
+    diff_side: Optional[str] = "RIGHT",
+    **kwargs: Any,
+) -> ReviewThread:
+    return ReviewThread(
+        thread_id="PRRT_kwDOABcD12MAAAABcDE3fg",
+        title="Rename variable",
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 1, 13, 0, 0),
+        status="UNRESOLVED",
+        author="reviewer",
+        comments=[],
+        file_path=file_path,
+        line=line,
+        start_line=start_line,
+        diff_side=diff_side,
+        **kwargs,
+    )
+
+
+@pytest.mark.service
+@pytest.mark.unit
+class TestGitBlobReader:
+    """Test the GitBlobReader class."""
+
+    def test_read_blob(self, repo: Path) -> None:
+        """Test file contents are read at a revision."""
+        with GitBlobReader(str(repo)) as reader:
+            contents = reader.read("HEAD", "src/app.py")
+
+        assert contents is not None
+        assert contents.startswith(b"line 1\nline 2\n")
+
+    def test_missing_object_returns_none(self, repo: Path) -> None:
+        """Test a missing path returns None and keeps the process usable."""
+        with GitBlobReader(str(repo)) as reader:
+            assert reader.read("HEAD", "missing.py") is None
+            assert reader.read("HEAD", "src/app.py") is not None
+
+    def test_tree_returns_none(self, repo: Path) -> None:
+        """Test a directory path is not treated as a file."""
+        with GitBlobReader(str(repo)) as reader:
+            assert reader.read("HEAD", "src") is None
+            assert reader.read("HEAD", "src/app.py") is not None
+
+    def test_single_process_for_many_reads(self, repo: Path) -> None:
+        """Test repeated reads share one git process."""
+        reader = GitBlobReader(str(repo))
+        try:
+            reader.read("HEAD", "src/app.py")
+            process = reader._process
+            reader.read("HEAD", "missing.py")
+            reader.read("HEAD", "src/app.py")
+
+            assert reader._process is process
+        finally:
+            reader.close()
+
+        assert reader._process is None
+
+    def test_unknown_revision(self, repo: Path) -> None:
+        """Test a commit missing from the local repository is reported."""
+        revision = "0123456789abcdef0123456789abcdef01234567"
+
+        with GitBlobReader(str(repo)) as reader:
+            with pytest.raises(CodeContextError, match="run git fetch"):
+                reader.read(revision, "src/app.py")
+            assert reader.read("HEAD", "src/app.py") is not None
+
+    def test_git_not_startable(self, tmp_path: Path) -> None:
+        """Test failure to start git raises CodeContextError."""
+        reader = GitBlobReader(str(tmp_path / "does-not-exist"))
+
+        with pytest.raises(CodeContextError, match="Could not start git"):
+            reader.read("HEAD", "src/app.py")
+
+
+@pytest.mark.service
+@pytest.mark.unit
+class TestCodeContextProvider:
+    """Test the CodeContextProvider class."""
+
+    def test_context_around_line(self, repo: Path) -> None:
+        """Test context covers the configured lines around the comment."""
+        provider = CodeContextProvider(2, GitBlobReader(str(repo)))
+        try:
+            context = provider.get_context(_make_thread(line=10), "HEAD")
+        finally:
+            provider.close()
+
+        assert context == {
+            "commit": "HEAD",
+            "start_line": 8,
+            "end_line": 12,
+            "lines": ["line 8", "line 9", "line 10", "line 11", "line 12"],
+        }
+
+    def test_context_covers_multi_line_range(self, repo: Path) -> None:
+        """Test context starts before start_line for multi-line comments."""
+        provider = CodeContextProvider(1, GitBlobReader(str(repo)))
+        try:
+            context = provider.get_context(_make_thread(line=6, start_line=4), "HEAD")
+        finally:
+            provider.close()
+
+        assert context is not None
+        assert (context["start_line"], context["end_line"]) == (3, 7)
+
+    def test_context_clamped_to_file(self, repo: Path) -> None:
+        """Test context does not extend past the start or end of the file."""
+        provider = CodeContextProvider(5, GitBlobReader(str(repo)))
+        try:
+            first = provider.get_context(_make_thread(line=1), "HEAD")
+            last = provider.get_context(_make_thread(line=20), "HEAD")
+        finally:
+            provider.close()
+
+        assert first is not None and last is not None
+        assert (first["start_line"], first["end_line"]) == (1, 6)
+        assert (last["start_line"], last["end_line"]) == (15, 20)
+
+    @pytest.mark.parametrize(
+        "thread_kwargs",
+        [
+            {"diff_side": "LEFT"},
+            {"line": None},
+            {"file_path": None},
+            {"file_path": "missing.py"},
+            {"line": 50},
+        ],
+    )
+    def test_no_context(self, repo: Path, thread_kwargs: dict[str, Any]) -> None:
+        """Test threads that cannot be located get no context."""
+        provider = CodeContextProvider(2, GitBlobReader(str(repo)))
+        try:
+            assert provider.get_context(_make_thread(**thread_kwargs), "HEAD") is None
+        finally:
+            provider.close()
+
+    def test_attach_code_context(self, repo: Path) -> None:
+        """Test attach_code_context updates threads and counts them."""
+        commit = _git(repo, "rev-parse", "HEAD")
+        threads = [_make_thread(line=3), _make_thread(diff_side="LEFT")]
+
+        attached = attach_code_context(
+            threads, commit, context_lines=0, repo_path=str(repo)
+        )
+
+        assert attached == 1
+        assert threads[0].code_context == {
+            "commit": commit,
+            "start_line": 3,
+            "end_line": 3,
+            "lines": ["line 3"],
+        }
+        assert threads[1].code_context is None
+
+
+@pytest.mark.model
+@pytest.mark.unit
+class TestCodeContextSerialization:
+    """Test code context in thread serialization and output."""
+
+    CONTEXT = {
+        "commit": "0123456789abcdef",
+        "start_line": 9,
+        "end_line": 11,
+        "lines": ["line 9", "line 10", "line 11"],
+    }
+
+    def test_omitted_when_not_loaded(self) -> None:
+        """Test threads without context serialize as before."""
+        thread = _make_thread()
+
+        assert "code_context" not in thread.to_dict()
+        assert "code_context" not in default_registry.serialize(thread, repr)
+
+    def test_included_when_loaded(self) -> None:
+        """Test context round-trips through to_dict and from_dict."""
+        thread = _make_thread(code_context=self.CONTEXT)
+
+        data = thread.to_dict()
+
+        assert data["code_context"] == self.CONTEXT
+        assert default_registry.serialize(thread, repr) == data
+        assert ReviewThread.from_dict(data).code_context == self.CONTEXT
+
+    def test_pretty_output_marks_commented_line(self) -> None:
+        """Test pretty output shows the code with the commented line marked."""
+        thread = _make_thread(code_context=self.CONTEXT)
+
+        output = PrettyFormatter.format_threads([thread])
+
+        assert "Code @ 0123456" in output
+        assert "> 10 │ line 10" in output
+        assert "   9 │ line 9" in output
@@ -0,0 +1,142 @@
+"""Tests for the local comment index."""
+
+from datetime import datetime
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from toady.models.models import Comment, ReviewThread
+from toady.services.comment_index import CommentIndex, CommentLocation
+
+CREATED = datetime(2024, 1, 1, 12, 0, 0)
+
+
+THREAD_ID = "PRRT_kwDOABcD12MAAAABcDE3fg"
+
+
+def _make_comment(database_id: int, repository: str = "owner/repo") -> Comment:
+    return Comment(
+        comment_id=f"PRRC_kwDOABcD12MAAAABcDE{database_id}",
+        content="Please rename this",
+        author="reviewer",
+        created_at=CREATED,
+        updated_at=CREATED,
+        parent_id=None,
+        thread_id=THREAD_ID,
+        review_id="PRR_kwDOABcD12MAAAABcDE3fr",
+        url=f"https://github.com/{repository}/pull/7#discussion_r{database_id}",
+    )
+
+
+def _make_thread(thread_id: str, *comments: Comment) -> ReviewThread:
+    return ReviewThread(
+        thread_id=thread_id,
+        title="Rename variable",
+        created_at=CREATED,
+        updated_at=CREATED,
+        status="UNRESOLVED",
+        author="reviewer",
+        comments=list(comments),
+    )
+
+
+@pytest.fixture
+def index_path(tmp_path: Path) -> Path:
+    """Location of a temporary index file."""
+    return tmp_path / "toady" / "comment_index.json"
+
+
+@pytest.mark.service
+@pytest.mark.unit
+class TestCommentIndex:
+    """Test the CommentIndex class."""
+
+    def test_record_and_lookup_across_instances(self, index_path: Path) -> None:
+        """Test fetched thread and numeric comment IDs are found later."""
+        thread = _make_thread(THREAD_ID, _make_comment(101), _make_comment(102))
+
+        assert CommentIndex(index_path).record_threads([thread]) == 3
+
+        index = CommentIndex(index_path)
+        location = CommentLocation("owner/repo", THREAD_ID)
+        assert index.lookup(THREAD_ID) == location
+        assert index.lookup("101") == location
+        assert index.lookup("102") == location
+        assert index.lookup("PRRC_kwDOABcD12MAAAABcDE101") is None
+        assert index.lookup("999") is None
+
+    def test_comments_without_url_skipped(self, index_path: Path) -> None:
+        """Test comments whose URL names no repository are not indexed."""
+        comment = _make_comment(101)
+        comment.url = None
+
+        assert (
+            CommentIndex(index_path).record_threads([_make_thread(THREAD_ID, comment)])
+            == 0
+        )
+        assert not index_path.exists()
+
+    def test_unchanged_threads_do_not_rewrite(self, index_path: Path) -> None:
+        """Test re-recording the same threads leaves the file untouched."""
+        thread = _make_thread(THREAD_ID, _make_comment(101))
+        index = CommentIndex(index_path)
+        index.record_threads([thread])
+
+        with patch("toady.services.comment_index.atomic_write_text") as mock_write:
+            assert index.record_threads([thread]) == 0
+            assert CommentIndex(index_path).record_threads([thread]) == 0
+
+        mock_write.assert_not_called()
+
+    def test_concurrent_fetches_merged(self, index_path: Path) -> None:
+        """Test entries saved by another process in the meantime are kept."""
+        first = CommentIndex(index_path)
+        first.lookup(THREAD_ID)
+        CommentIndex(index_path).record_threads(
+            [_make_thread("PRRT_other", _make_comment(201, "owner/other"))]
+        )
+
+        first.record_threads([_make_thread(THREAD_ID, _make_comment(101))])
+
+        index = CommentIndex(index_path)
+        assert index.lookup("201") == CommentLocation("owner/other", "PRRT_other")
+        assert index.lookup("101") == CommentLocation("owner/repo", THREAD_ID)
+
+    def test_oldest_entries_evicted(self, index_path: Path) -> None:
+        """Test the index keeps only the most recently recorded IDs."""
+        comments = [_make_comment(n) for n in range(1, 6)]
+
+        with patch("toady.services.comment_index.MAX_ENTRIES", 3):
+            CommentIndex(index_path).record_threads(
+                [_make_thread(THREAD_ID, *comments)]
+            )
+
+        stored = json.loads(index_path.read_text())["targets"]
+        assert list(stored) == ["4", "5", THREAD_ID]
+
+    @pytest.mark.parametrize(
+        "contents",
+        [
+            "{not json",
+            '{"version": 1, "comments": {"101": {"repository": "owner/repo"}}}',
+            "[]",
+        ],
+    )
+    def test_unusable_index_is_empty(self, index_path: Path, contents: str) -> None:
+        """Test a corrupt or incompatible index behaves as empty."""
+        index_path.parent.mkdir(parents=True)
+        index_path.write_text(contents)
+
+        assert CommentIndex(index_path).lookup("101") is None
+
+    def test_write_failure_is_not_raised(self, tmp_path: Path) -> None:
+        """Test failing to save the index never fails the caller."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        index = CommentIndex(blocker / "comment_index.json")
+        thread = _make_thread(THREAD_ID, _make_comment(101))
+
+        assert index.record_threads([thread]) == 2
+        assert index.lookup("101") is not None
@@ -0,0 +1,236 @@
+"""Tests for the toady serve daemon and its client."""
+
+from collections.abc import Iterator
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from toady import __version__
+from toady.services.daemon import (
+    FRAME_EXIT,
+    FRAME_REFUSED,
+    DaemonError,
+    DaemonServer,
+    _recv_frame,
+    _send_message,
+    default_socket_path,
+    forward_to_daemon,
+    should_forward,
+    stop_daemon,
+)
+from toady.services.github_service import GitHubService, get_shared_github_service
+
+
+@pytest.fixture
+def socket_path() -> Iterator[str]:
+    """Provide a socket path short enough for AF_UNIX address limits."""
+    directory = tempfile.mkdtemp(prefix="toady-", dir="/tmp")
+    yield os.path.join(directory, "daemon.sock")
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(socket_path: str) -> Iterator[DaemonServer]:
+    """Run a daemon in a background thread."""
+    server = DaemonServer(socket_path)
+    server.bind()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.stop()
+    thread.join(5)
+
+
+@pytest.mark.service
+@pytest.mark.unit
+class TestShouldForward:
+    """Test which invocations are sent to the daemon."""
+
+    @pytest.fixture(autouse=True)
+    def piped_stdin(self) -> Iterator[None]:
+        """Pretend stdin is not a terminal."""
+        with patch("sys.stdin") as stdin:
+            stdin.isatty.return_value = False
+            yield
+
+    def test_forwards_regular_commands(self) -> None:
+        """Test ordinary commands are forwarded."""
+        assert should_forward(["fetch", "--pr", "1"]) is True
+
+    def test_serve_runs_locally(self) -> None:
+        """Test the serve command itself is never forwarded."""
+        assert should_forward(["serve", "--stop"]) is False
+
+    def test_stdin_argument_runs_locally(self) -> None:
+        """Test commands reading stdin run in-process."""
+        assert should_forward(["schema", "check", "-"]) is False
+
+    def test_interactive_session_runs_locally(self) -> None:
+        """Test a terminal on stdin keeps prompts working."""
+        with patch("sys.stdin") as stdin:
+            stdin.isatty.return_value = True
+            assert should_forward(["resolve", "--all", "--pr", "1"]) is False
+
+    @pytest.mark.parametrize("value", ["1", "true", "YES"])
+    def test_disabled_by_environment(self, value: str) -> None:
+        """Test TOADY_NO_DAEMON turns forwarding off."""
+        with patch.dict(os.environ, {"TOADY_NO_DAEMON": value}):
+            assert should_forward(["fetch"]) is False
+
+    def test_socket_path_from_environment(self) -> None:
+        """Test TOADY_SOCKET overrides the default socket."""
+        with patch.dict(os.environ, {"TOADY_SOCKET": "/tmp/custom.sock"}):
+            assert default_socket_path() == "/tmp/custom.sock"
+        with patch.dict(os.environ, {"TOADY_SOCKET": ""}):
+            assert default_socket_path().endswith(os.path.join(".toady", "daemon.sock"))
+
+
+@pytest.mark.service
+@pytest.mark.unit
+class TestDaemonServer:
+    """Test running commands in the daemon."""
+
+    def test_forwards_output_and_exit_code(
+        self, daemon: DaemonServer, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test the client prints the command's output and returns its code."""
+        assert forward_to_daemon(["--version"], daemon.socket_path) == 0
+        assert __version__ in capsys.readouterr().out
+
+    def test_forwards_usage_errors(
+        self, daemon: DaemonServer, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test errors reach the client's stderr with click's exit code."""
+        assert forward_to_daemon(["no-such-command"], daemon.socket_path) == 2
+        assert "No such command" in capsys.readouterr().err
+
+    def test_runs_in_client_directory_and_environment(
+        self, daemon: DaemonServer, tmp_path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test the command sees the client's cwd and environment, then both
+        are restored in the daemon."""
+        seen = {}
+
+        def fake_main() -> None:
+            seen["cwd"] = os.getcwd()
+            seen["marker"] = os.environ.get("TOADY_TEST_MARKER")
+            print("done")
+
+        cwd = os.getcwd()
+        with (
+            patch("toady.cli.main", fake_main),
+            patch.dict(os.environ, {"TOADY_TEST_MARKER": "client"}),
+        ):
+            os.chdir(tmp_path)
+            try:
+                assert forward_to_daemon(["fetch"], daemon.socket_path) == 0
+            finally:
+                os.chdir(cwd)
+
+        assert seen == {"cwd": str(tmp_path), "marker": "client"}
+        assert capsys.readouterr().out == "done\n"
+        assert "TOADY_TEST_MARKER" not in os.environ
+
+    def test_response_cache_keyed_by_client_credentials(
+        self, daemon: DaemonServer, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test a client with another token never gets a cached response of the
+        previous client's account from the shared service."""
+        query = "query($number: Int!) { pullRequest(number: $number) { reviewThreads }}"
+        response = {"data": {"pullRequest": {"id": "PR_kwDOABcD12MAAAABcDE3fg"}}}
+
+        def fake_main() -> None:
+            get_shared_github_service().execute_graphql_query(query, {"number": 1})
+
+        with (
+            patch("toady.cli.main", fake_main),
+            patch.object(
+                GitHubService,
+                "_run_read_command",
+                return_value=Mock(stdout=json.dumps(response)),
+            ) as mock_read,
+        ):
+            for token in ["token-a", "token-b", "token-a"]:
+                with patch.dict(os.environ, {"GH_TOKEN": token, "TOADY_NO_CACHE": "0"}):
+                    assert forward_to_daemon(["fetch"], daemon.socket_path) == 0
+
+        # token-b misses the cache filled for token-a; token-a then hits it
+        assert mock_read.call_count == 2
+
+    def test_unhandled_exception_reported(
+        self, daemon: DaemonServer, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test a crash in a command fails that invocation only."""
+        with patch("toady.cli.main", side_effect=RuntimeError("boom")):
+            assert forward_to_daemon(["fetch"], daemon.socket_path) == 1
+        assert "RuntimeError: boom" in capsys.readouterr().err
+        assert forward_to_daemon(["--version"], daemon.socket_path) == 0
+
+    def test_refuses_other_versions(self, daemon: DaemonServer) -> None:
+        """Test a client of another version is told to run locally."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(daemon.socket_path)
+            request = {"version": "0.0.0", "argv": [], "cwd": "/", "env": {}}
+            _send_message(sock, json.dumps(request).encode("utf-8"))
+            with sock.makefile("rb") as stream:
+                kind, _ = _recv_frame(stream)
+        assert kind == FRAME_REFUSED
+
+    def test_no_daemon_runs_locally(self, socket_path: str) -> None:
+        """Test the client falls back when nothing is listening."""
+        assert forward_to_daemon(["--version"], socket_path) is None
+        assert stop_daemon(socket_path) is False
+
+    def test_stop(self, socket_path: str) -> None:
+        """Test a stop request shuts the daemon down and removes the socket."""
+        server = DaemonServer(socket_path)
+        server.bind()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        assert stop_daemon(socket_path) is True
+        thread.join(5)
+        assert not thread.is_alive()
+        assert not os.path.exists(socket_path)
+
+    def test_second_daemon_refused(self, daemon: DaemonServer) -> None:
+        """Test binding a socket another daemon serves fails."""
+        with pytest.raises(DaemonError, match="already serving"):
+            DaemonServer(daemon.socket_path).bind()
+
+    def test_stale_socket_replaced(self, socket_path: str) -> None:
+        """Test a socket left behind by a dead daemon is reused."""
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+
+        server = DaemonServer(socket_path)
+        server.bind()
+        try:
+            assert os.stat(socket_path).st_mode & 0o077 == 0
+        finally:
+            server.close()
+
+    def test_idle_timeout(self, socket_path: str) -> None:
+        """Test the daemon exits after idle_timeout seconds without requests."""
+        server = DaemonServer(socket_path, idle_timeout=0.1)
+        server.bind()
+        start = time.monotonic()
+        server.serve_forever()
+        assert time.monotonic() - start < 5
+        assert not os.path.exists(socket_path)
+
+    def test_stop_acknowledged_with_exit_frame(self, daemon: DaemonServer) -> None:
+        """Test the stop request is answered before the daemon exits."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(daemon.socket_path)
+            _send_message(sock, json.dumps({"op": "stop"}).encode("utf-8"))
+            with sock.makefile("rb") as stream:
+                assert _recv_frame(stream) == (FRAME_EXIT, b"0")
@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from toady.parsers.query_registry import review_threads_query
 from toady.services.fetch_service import FetchService, FetchServiceError
 from toady.services.github_service import (
     GitHubAPIError,
@@ -90,6 +91,8 @@ class TestFetchService:
         assert variables["owner"] == "testowner"
         assert variables["repo"] == "testrepo"
         assert variables["number"] == 123
+        # The precomputed, minified document is sent
+        assert call_args[0][0] == review_threads_query(limit=100).document
 
     def test_fetch_review_threads_with_resolved(self) -> None:
         """Test fetching review threads including resolved ones."""
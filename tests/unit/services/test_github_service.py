@@ -1,5 +1,8 @@
 """Tests for the GitHub service module."""
 
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -12,7 +15,9 @@ from toady.services.github_service import (
     GitHubService,
     GitHubServiceError,
     GitHubTimeoutError,
+    get_shared_github_service,
 )
+from toady.services.response_cache import ResponseCache
 
 
 class TestGitHubService:
@@ -106,6 +111,20 @@ class TestGitHubService:
         service = GitHubService()
         assert service.check_gh_installation() is False
 
+    @patch("subprocess.run")
+    def test_check_gh_installation_remembered_per_path(self, mock_run: Mock) -> None:
+        """Test a found gh is not probed again until PATH changes."""
+        mock_run.return_value = Mock(returncode=0)
+
+        service = GitHubService()
+        with patch.dict("os.environ", {"PATH": "/usr/bin"}):
+            assert service.check_gh_installation() is True
+            assert service.check_gh_installation() is True
+            assert mock_run.call_count == 1
+        with patch.dict("os.environ", {"PATH": "/opt/gh/bin"}):
+            assert service.check_gh_installation() is True
+            assert mock_run.call_count == 2
+
     @patch("subprocess.run")
     def test_get_gh_version_success(self, mock_run: Mock) -> None:
         """Test successful version retrieval."""
@@ -489,6 +508,55 @@ class TestGitHubService:
 
         assert "GraphQL query failed: Field not found" in str(exc_info.value)
 
+    @patch.object(GitHubService, "run_gh_command")
+    def test_execute_graphql_query_with_list_variable(self, mock_run: Mock) -> None:
+        """Test list variables are passed with gh's key[]= array syntax."""
+        mock_run.return_value = Mock(stdout='{"data": {"nodes": []}}')
+
+        service = GitHubService()
+        service.execute_graphql_query("query($ids: [ID!]!) { }", {"ids": ["a", "b"]})
+
+        mock_run.assert_called_once_with(
+            [
+                "api",
+                "graphql",
+                "-f",
+                "query=query($ids: [ID!]!) { }",
+                "-F",
+                "ids[]=a",
+                "-F",
+                "ids[]=b",
+            ]
+        )
+
+    @patch.object(GitHubService, "run_gh_command")
+    def test_execute_graphql_query_allow_partial_errors(self, mock_run: Mock) -> None:
+        """Test partial errors are returned alongside data when allowed."""
+        mock_result = Mock(
+            stdout='{"data": {"t0": null, "t1": {"thread": {"id": "x"}}}, '
+            '"errors": [{"message": "Not found", "path": ["t0"]}]}'
+        )
+        mock_run.return_value = mock_result
+
+        service = GitHubService()
+        response = service.execute_graphql_query(
+            "mutation { }", allow_partial_errors=True
+        )
+
+        assert response["data"]["t1"] == {"thread": {"id": "x"}}
+        assert response["errors"][0]["path"] == ["t0"]
+
+    @patch.object(GitHubService, "run_gh_command")
+    def test_execute_graphql_query_partial_errors_without_data(
+        self, mock_run: Mock
+    ) -> None:
+        """Test errors without any data still raise when partial errors allowed."""
+        mock_run.return_value = Mock(stdout='{"errors": [{"message": "Bad query"}]}')
+
+        service = GitHubService()
+        with pytest.raises(GitHubAPIError, match="Bad query"):
+            service.execute_graphql_query("mutation { }", allow_partial_errors=True)
+
     @patch.object(GitHubService, "run_gh_command")
     def test_execute_graphql_query_invalid_json(self, mock_run: Mock) -> None:
         """Test GraphQL query execution with invalid JSON response."""
@@ -593,6 +661,153 @@ class TestGitHubService:
         assert service.check_pr_exists("owner", "repo", 123) is False
 
 
+class TestGitHubServiceCoalescing:
+    """Test sharing of identical in-flight requests."""
+
+    @staticmethod
+    def _run_concurrently(calls, key, release):
+        """Start calls in threads, release the gh process once all joined."""
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            deadline = time.monotonic() + 5
+            while GitHubService._in_flight.waiting(key) < len(calls) - 1:
+                assert time.monotonic() < deadline, "callers never joined"
+                time.sleep(0.001)
+            release.set()
+            return [future.result() for future in futures]
+
+    def test_identical_queries_share_one_request(self) -> None:
+        """Test concurrent identical queries from separate clients run once."""
+        release = threading.Event()
+        runs = []
+
+        def run_gh_command(_args):
+            runs.append(1)
+            release.wait(5)
+            return Mock(stdout='{"data": {"viewer": {"login": "me"}}}')
+
+        services = [GitHubService() for _ in range(3)]
+        for service in services:
+            service.run_gh_command = run_gh_command
+
+        results = self._run_concurrently(
+            [
+                lambda s=service: s.execute_graphql_query(
+                    "query { viewer { login } }", {"n": 1}
+                )
+                for service in services
+            ],
+            (
+                "gh",
+                (
+                    "api",
+                    "graphql",
+                    "-f",
+                    "query=query { viewer { login } }",
+                    "-F",
+                    "n=1",
+                ),
+            ),
+            release,
+        )
+
+        assert len(runs) == 1
+        assert all(r == {"data": {"viewer": {"login": "me"}}} for r in results)
+        # Each caller gets its own parsed response
+        assert results[0] is not results[1]
+
+    def test_mutations_are_never_shared(self) -> None:
+        """Test identical mutations each run."""
+        service = GitHubService()
+        with (
+            patch.object(
+                service, "run_gh_command", return_value=Mock(stdout='{"data": {}}')
+            ) as mock_run,
+            patch.object(GitHubService._in_flight, "do") as mock_do,
+        ):
+            service.execute_graphql_query("mutation { x }")
+            service.execute_graphql_query("  mutation { x }")
+
+        assert mock_run.call_count == 2
+        mock_do.assert_not_called()
+
+    def test_read_helpers_are_coalesced(self) -> None:
+        """Test repository and PR lookups go through the shared group."""
+        service = GitHubService()
+        with patch.object(
+            GitHubService._in_flight,
+            "do",
+            return_value=Mock(stdout='{"nameWithOwner": "o/r"}'),
+        ) as mock_do:
+            assert service.get_current_repo() == "o/r"
+            assert service.check_pr_exists("o", "r", 7) is True
+
+        keys = [call.args[0] for call in mock_do.call_args_list]
+        assert keys[0] == ("gh", ("repo", "view", "--json", "nameWithOwner"))
+        assert keys[1][1][:3] == ("pr", "view", "7")
+
+    def test_shared_client(self) -> None:
+        """Test services default to the same client instance."""
+        from toady.services.fetch_service import FetchService
+        from toady.services.resolve_service import ResolveService
+
+        assert get_shared_github_service() is get_shared_github_service()
+        assert (
+            FetchService().github_service
+            is ResolveService().github_service
+            is get_shared_github_service()
+        )
+
+
+class TestGitHubServiceResponseCache:
+    """Test caching of GraphQL query responses."""
+
+    QUERY = "query($number: Int!) { pullRequest(number: $number) { reviewThreads } }"
+    RESPONSE = '{"data": {"pullRequest": {"reviewThreads": [{"id": "PRRT_1"}]}}}'
+
+    def test_repeated_query_served_from_cache(self, tmp_path) -> None:
+        """Test a second identical query does not run gh."""
+        service = GitHubService(response_cache=ResponseCache(tmp_path, enabled=True))
+        with patch.object(
+            service, "run_gh_command", return_value=Mock(stdout=self.RESPONSE)
+        ) as mock_run:
+            first = service.execute_graphql_query(self.QUERY, {"number": 1})
+            second = service.execute_graphql_query(self.QUERY, {"number": 1})
+            service.execute_graphql_query(self.QUERY, {"number": 1}, use_cache=False)
+
+        assert first == second
+        assert mock_run.call_count == 2
+
+    def test_mutation_invalidates_affected_responses(self, tmp_path) -> None:
+        """Test resolving a thread refetches the threads of its PR."""
+        service = GitHubService(response_cache=ResponseCache(tmp_path, enabled=True))
+        with patch.object(
+            service, "run_gh_command", return_value=Mock(stdout=self.RESPONSE)
+        ) as mock_run:
+            service.execute_graphql_query(self.QUERY, {"number": 1})
+            service.execute_graphql_query(
+                "mutation($threadId: ID!) { resolveReviewThread }",
+                {"threadId": "PRRT_1"},
+            )
+            service.execute_graphql_query(self.QUERY, {"number": 1})
+
+        assert mock_run.call_count == 3
+
+    def test_error_responses_not_cached(self, tmp_path) -> None:
+        """Test partial error responses are always refetched."""
+        service = GitHubService(response_cache=ResponseCache(tmp_path, enabled=True))
+        partial = '{"data": {"pullRequest": null}, "errors": [{"message": "x"}]}'
+        with patch.object(
+            service, "run_gh_command", return_value=Mock(stdout=partial)
+        ) as mock_run:
+            for _ in range(2):
+                service.execute_graphql_query(
+                    self.QUERY, {"number": 1}, allow_partial_errors=True
+                )
+
+        assert mock_run.call_count == 2
+
+
 class TestGitHubServiceExceptions:
     """Test GitHub service exception hierarchy."""
 
@@ -0,0 +1,168 @@
+"""Tests for the bulk operation journal."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from toady.services.journal import JournalError, JournalItem, OperationJournal
+
+OPERATION = {"command": "resolve", "pr_number": 123, "action": "resolve"}
+
+
+@pytest.fixture
+def journal(tmp_path: Path) -> OperationJournal:
+    """Create a journal in a temporary directory."""
+    return OperationJournal(OPERATION, journal_dir=tmp_path)
+
+
+def _start(journal: OperationJournal) -> None:
+    journal.start(
+        [JournalItem("t1", "First"), JournalItem("t2", "Second"), JournalItem("t3")]
+    )
+
+
+@pytest.mark.service
+@pytest.mark.unit
+class TestOperationJournal:
+    """Test the OperationJournal class."""
+
+    def test_path_depends_on_operation(self, tmp_path: Path) -> None:
+        """Test identical operations share a journal and others do not."""
+        first = OperationJournal(OPERATION, journal_dir=tmp_path)
+        same = OperationJournal(dict(reversed(OPERATION.items())), tmp_path)
+        other = OperationJournal({**OPERATION, "pr_number": 124}, tmp_path)
+
+        assert first.path == same.path
+        assert first.path != other.path
+        assert first.path.name.startswith("resolve-")
+
+    def test_start_record_and_load(self, journal: OperationJournal) -> None:
+        """Test recorded outcomes are reconstructed from the journal."""
+        _start(journal)
+        journal.record("t1", True)
+        journal.record("t2", False, "Timed out")
+        journal.close()
+
+        state = journal.load()
+
+        assert state.operation == OPERATION
+        assert [item.item_id for item in state.items] == ["t1", "t2", "t3"]
+        assert state.items[0].label == "First"
+        assert state.outcomes == {"t1": "succeeded", "t2": "failed"}
+        assert state.errors == {"t2": "Timed out"}
+        assert state.succeeded_count == 1
+        assert [item.item_id for item in state.pending_items] == ["t2", "t3"]
+
+    def test_unknown_outcome_not_pending(self, journal: OperationJournal) -> None:
+        """Test items of unknown outcome are reported but not processed again."""
+        _start(journal)
+        journal.record("t1", True)
+        journal.record_unknown("t2", "Timed out")
+        journal.close()
+
+        state = journal.load()
+
+        assert state.outcomes["t2"] == "unknown"
+        assert state.errors == {"t2": "Timed out"}
+        assert [item.item_id for item in state.pending_items] == ["t3"]
+        assert [item.item_id for item in state.unknown_items] == ["t2"]
+
+    def test_lines_are_flushed(self, journal: OperationJournal) -> None:
+        """Test outcomes reach the file before the journal is closed."""
+        _start(journal)
+        journal.record("t1", True)
+
+        lines = journal.path.read_text().splitlines()
+
+        assert json.loads(lines[0])["type"] == "plan"
+        assert json.loads(lines[1]) == {
+            "type": "result",
+            "id": "t1",
+            "status": "succeeded",
+        }
+        journal.close()
+
+    def test_resume_appends_outcomes(self, journal: OperationJournal) -> None:
+        """Test a resumed journal keeps earlier outcomes and adds new ones."""
+        _start(journal)
+        journal.record("t1", True)
+        journal.record("t2", False, "Timed out")
+        journal.close()
+
+        state = journal.resume()
+        journal.record("t2", True)
+        journal.close()
+
+        assert [item.item_id for item in state.pending_items] == ["t2", "t3"]
+        reloaded = journal.load()
+        assert [item.item_id for item in reloaded.pending_items] == ["t3"]
+        assert reloaded.errors == {}
+
+    def test_truncated_last_line_is_ignored(self, journal: OperationJournal) -> None:
+        """Test a partial line left by an interrupted write is tolerated."""
+        _start(journal)
+        journal.record("t1", True)
+        journal.close()
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"type": "result", "id": "t2", "sta')
+
+        state = journal.load()
+
+        assert [item.item_id for item in state.pending_items] == ["t2", "t3"]
+
+    def test_corrupt_line_raises(self, journal: OperationJournal) -> None:
+        """Test corruption before the last line is reported."""
+        _start(journal)
+        journal.close()
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write("not json\n")
+            f.write('{"type": "result", "id": "t1", "status": "succeeded"}\n')
+
+        with pytest.raises(JournalError, match="Corrupt journal"):
+            journal.load()
+
+    def test_different_operation_raises(
+        self, journal: OperationJournal, tmp_path: Path
+    ) -> None:
+        """Test a journal written for another operation is rejected."""
+        _start(journal)
+        journal.close()
+        other = OperationJournal({**OPERATION, "action": "unresolve"}, tmp_path)
+        other.path = journal.path
+
+        with pytest.raises(JournalError, match="different operation"):
+            other.load()
+
+    def test_missing_journal_raises(self, journal: OperationJournal) -> None:
+        """Test loading a journal that does not exist raises JournalError."""
+        assert not journal.exists()
+
+        with pytest.raises(JournalError, match="Cannot read journal"):
+            journal.load()
+
+    def test_complete_removes_journal(self, journal: OperationJournal) -> None:
+        """Test completing the operation removes its journal."""
+        _start(journal)
+        assert journal.exists()
+
+        journal.complete()
+
+        assert not journal.exists()
+
+    def test_start_unwritable_directory_raises(self, tmp_path: Path) -> None:
+        """Test failure to create the journal raises JournalError."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        journal = OperationJournal(OPERATION, journal_dir=blocker / "journals")
+
+        with pytest.raises(JournalError, match="Cannot create journal"):
+            _start(journal)
+
+    def test_record_without_open_journal_does_not_raise(
+        self, journal: OperationJournal
+    ) -> None:
+        """Test journaling failures never interrupt the operation."""
+        journal.record("t1", True)
+
+        assert not journal.exists()
@@ -5,6 +5,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from toady.services.comment_index import CommentIndex
 from toady.services.github_service import (
     GitHubAPIError,
     GitHubAuthenticationError,
@@ -16,6 +17,7 @@ from toady.services.reply_service import (
     ReplyService,
     ReplyServiceError,
 )
+from toady.services.response_cache import ResponseCache
 
 
 class TestReplyService:
@@ -276,6 +278,77 @@ class TestReplyService:
         assert result is not None
         mock_github_service.post_reply.assert_called_once()
 
+    @patch.object(ReplyService, "_get_repository_info")
+    def test_post_reply_uses_indexed_repository(
+        self, mock_get_repo_info: Mock, tmp_path
+    ) -> None:
+        """Test a comment recorded by fetch is replied to without a repo lookup."""
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.run_gh_command.return_value = Mock(
+            stdout=json.dumps({"id": 2, "html_url": "https://x", "user": {}})
+        )
+        index = CommentIndex(tmp_path / "comment_index.json")
+        index._entries = {
+            "123456": {"repository": "octo/widgets", "thread_id": "PRRT_1"}
+        }
+
+        service = ReplyService(mock_github_service, comment_index=index)
+        service.post_reply(ReplyRequest("123456", "Fixed it"))
+
+        mock_get_repo_info.assert_not_called()
+        mock_github_service.run_gh_command.assert_called_once()
+        args = mock_github_service.run_gh_command.call_args[0][0]
+        assert args[1] == "repos/octo/widgets/pulls/comments/123456/replies"
+
+    @patch.object(ReplyService, "_get_repository_info")
+    def test_post_reply_and_resolve_partial_failure(
+        self, mock_get_repo_info: Mock
+    ) -> None:
+        """Test a failed resolve is reported without losing the posted reply."""
+        mock_get_repo_info.return_value = ("owner", "repo")
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.post_reply.return_value = {
+            "data": {
+                "addPullRequestReviewThreadReply": {"comment": {"id": "C1"}},
+                "resolveReviewThread": None,
+            },
+            "errors": [
+                {"message": "Must have write access", "path": ["resolveReviewThread"]}
+            ],
+        }
+
+        service = ReplyService(mock_github_service)
+        result = service.post_reply(
+            ReplyRequest("PRRT_kwDOABcD12MAAAABcDE3fg", "Fixed it", resolve=True)
+        )
+
+        assert mock_github_service.post_reply.call_args.kwargs["resolve"] is True
+        assert result["reply_id"] == "C1"
+        assert result["thread_resolved"] is False
+        assert result["resolve_error"] == "Must have write access"
+
+    @patch.object(ReplyService, "_get_repository_info")
+    def test_post_reply_and_resolve_success(self, mock_get_repo_info: Mock) -> None:
+        """Test the resolved state is read from the same response."""
+        mock_get_repo_info.return_value = ("owner", "repo")
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.post_reply.return_value = {
+            "data": {
+                "addPullRequestReviewThreadReply": {"comment": {"id": "C1"}},
+                "resolveReviewThread": {
+                    "thread": {"id": "PRRT_kwDOABcD12MAAAABcDE3fg", "isResolved": True}
+                },
+            }
+        }
+
+        service = ReplyService(mock_github_service)
+        result = service.post_reply(
+            ReplyRequest("PRRT_kwDOABcD12MAAAABcDE3fg", "Fixed it", resolve=True)
+        )
+
+        assert result["thread_resolved"] is True
+        assert "resolve_error" not in result
+
     @patch.object(ReplyService, "_get_repository_info")
     def test_post_reply_numeric_id_fallback(self, mock_get_repo_info: Mock) -> None:
         """Test reply posting with numeric ID falls back to REST."""
@@ -543,6 +616,122 @@ class TestReplyService:
         )
         assert result["body_preview"] == "Test reply with context"
 
+    @patch.object(ReplyService, "_get_repository_info")
+    def test_verbose_thread_reply_single_request(self, mock_get_repo_info) -> None:
+        """Test verbose context comes from the mutation response itself."""
+        mock_get_repo_info.return_value = ("owner", "repo")
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.post_reply.return_value = {
+            "data": {
+                "addPullRequestReviewThreadReply": {
+                    "comment": {
+                        "id": "PRRC_kwDOABcD12MAAAABcDE3fz",
+                        "url": "https://github.com/owner/repo/pull/42#discussion_r9",
+                        "createdAt": "2024-01-01T12:00:00Z",
+                        "author": {"login": "me"},
+                        "pullRequestReview": {"id": "PRR_1", "databaseId": 111},
+                        "replyTo": {
+                            "id": "PRRC_kwDOABcD12MAAAABcDE3fa",
+                            "url": "https://github.com/owner/repo/pull/42#discussion_r1",
+                            "author": {"login": "reviewer123"},
+                        },
+                        "pullRequest": {
+                            "number": 42,
+                            "title": "Add awesome feature",
+                            "url": "https://github.com/owner/repo/pull/42",
+                        },
+                    }
+                }
+            }
+        }
+
+        service = ReplyService(mock_github_service)
+        result = service.post_reply(
+            ReplyRequest("PRRT_kwDOABcD12MAAAABcDE3fg", "Fixed"), fetch_context=True
+        )
+
+        mock_github_service.post_reply.assert_called_once()
+        mock_github_service.run_gh_command.assert_not_called()
+        mock_github_service.execute_graphql_query.assert_not_called()
+        assert result["pr_number"] == "42"
+        assert result["pr_title"] == "Add awesome feature"
+        assert result["pr_url"] == "https://github.com/owner/repo/pull/42"
+        assert result["parent_comment_author"] == "reviewer123"
+        assert (
+            result["thread_url"]
+            == "https://github.com/owner/repo/pull/42#pullrequestreview-111"
+        )
+
+    def test_verbose_rest_reply_one_context_query(self) -> None:
+        """Test a REST reply fetches its context with a single GraphQL query."""
+        mock_github_service = Mock(spec=GitHubService)
+        reply_response = Mock()
+        reply_response.stdout = json.dumps(
+            {
+                "id": 987654321,
+                "node_id": "PRRC_kwDOABcD12MAAAABcDE3fz",
+                "html_url": "https://github.com/owner/repo/pull/42#discussion_r9",
+                "created_at": "2024-01-01T12:00:00Z",
+                "user": {"login": "me"},
+            }
+        )
+        mock_github_service.run_gh_command.return_value = reply_response
+        mock_github_service.execute_graphql_query.return_value = {
+            "data": {
+                "node": {
+                    "url": "https://github.com/owner/repo/pull/42#discussion_r9",
+                    "pullRequestReview": {"databaseId": 111},
+                    "replyTo": {"author": {"login": "reviewer123"}},
+                    "pullRequest": {"number": 42, "title": "Add awesome feature"},
+                }
+            }
+        }
+
+        service = ReplyService(mock_github_service)
+        result = service.post_reply(
+            ReplyRequest("123456789", "Fixed", owner="owner", repo="repo"),
+            fetch_context=True,
+        )
+
+        mock_github_service.run_gh_command.assert_called_once()
+        query, variables = mock_github_service.execute_graphql_query.call_args[0]
+        assert query.startswith("query GetReplyContext(")
+        assert variables == {"replyId": "PRRC_kwDOABcD12MAAAABcDE3fz"}
+        assert result["pr_number"] == "42"
+        assert result["parent_comment_author"] == "reviewer123"
+        assert result["thread_url"].endswith("/pull/42#pullrequestreview-111")
+
+    def test_rest_reply_invalidates_cached_pull_request(self, tmp_path) -> None:
+        """Test a reply posted through REST drops cached threads of its PR."""
+        query = (
+            "query($owner: String!, $repo: String!, $number: Int!) { reviewThreads }"
+        )
+        variables = {"owner": "owner", "repo": "repo", "number": 42}
+        github_service = GitHubService(
+            response_cache=ResponseCache(tmp_path, enabled=True)
+        )
+        github_service.response_cache.put(
+            query, variables, {"data": {"id": "PR_kwDOABcD12MAAAABcDE3fg"}}
+        )
+        reply_response = Mock()
+        reply_response.stdout = json.dumps(
+            {
+                "id": 987654321,
+                "html_url": "https://github.com/owner/repo/pull/42#discussion_r9",
+                "pull_request_url": "https://api.github.com/repos/owner/repo/pulls/42",
+            }
+        )
+
+        service = ReplyService(github_service)
+        with patch.object(
+            github_service, "run_gh_command", return_value=reply_response
+        ):
+            service.post_reply(
+                ReplyRequest("123456789", "Fixed", owner="owner", repo="repo")
+            )
+
+        assert github_service.response_cache.get(query, variables) is None
+
     def test_post_reply_parent_info_failure(self) -> None:
         """Test posting reply when parent info fetch fails."""
         mock_github_service = Mock(spec=GitHubService)
@@ -661,6 +850,142 @@ class TestReplyService:
         assert result["body_preview"] == "x" * 100 + "..."
 
 
+class TestReplyServiceBatch:
+    """Test posting several replies with aliased mutations."""
+
+    THREADS = ["PRRT_kwDOABcD12MAAAABcDE3fg", "PRRT_kwDOABcD12MAAAABcDE3fh"]
+
+    def test_thread_replies_single_request(self) -> None:
+        """Test thread replies are aliases of one mutation document."""
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.execute_graphql_query.return_value = {
+            "data": {
+                f"r{i}": {
+                    "comment": {
+                        "id": f"C{i}",
+                        "url": f"https://github.com/o/r/pull/1#discussion_r{i}",
+                        "createdAt": "2024-01-01T00:00:00Z",
+                        "author": {"login": "bot"},
+                    }
+                }
+                for i in range(2)
+            }
+        }
+
+        service = ReplyService(mock_github_service)
+        results = service.post_replies(
+            [
+                ReplyRequest(thread, f"Reply {i}")
+                for i, thread in enumerate(self.THREADS)
+            ]
+        )
+
+        mock_github_service.execute_graphql_query.assert_called_once()
+        query, variables = mock_github_service.execute_graphql_query.call_args[0]
+        assert query.startswith("mutation BulkAddPullRequestReviewThreadReplies(")
+        assert query.count("addPullRequestReviewThreadReply(") == 2
+        assert variables == {
+            "t0": self.THREADS[0],
+            "b0": "Reply 0",
+            "t1": self.THREADS[1],
+            "b1": "Reply 1",
+        }
+        assert results[1] == {
+            "id": self.THREADS[1],
+            "success": True,
+            "reply_id": "C1",
+            "reply_url": "https://github.com/o/r/pull/1#discussion_r1",
+            "created_at": "2024-01-01T00:00:00Z",
+            "author": "bot",
+        }
+
+    def test_partial_failure_mapped_by_alias(self) -> None:
+        """Test errors are attributed to the reply whose alias failed."""
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.execute_graphql_query.return_value = {
+            "data": {"r0": None, "r1": {"comment": {"id": "C1"}}},
+            "errors": [{"message": "Thread is locked", "path": ["r0"]}],
+        }
+
+        service = ReplyService(mock_github_service)
+        results = service.post_replies(
+            [ReplyRequest(thread, "Fixed") for thread in self.THREADS]
+        )
+
+        assert [r["success"] for r in results] == [False, True]
+        assert results[0]["error"] == "Thread is locked"
+
+    def test_comment_replies_posted_individually(self) -> None:
+        """Test comment ID replies use post_reply and keep input order."""
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.execute_graphql_query.return_value = {
+            "data": {"r0": {"comment": {"id": "C0"}}}
+        }
+        service = ReplyService(mock_github_service)
+        requests = [
+            ReplyRequest("123456789", "Fixed"),
+            ReplyRequest(self.THREADS[0], "Done"),
+        ]
+
+        with patch.object(
+            service, "post_reply", side_effect=CommentNotFoundError("gone")
+        ) as mock_post_reply:
+            results = service.post_replies(requests)
+
+        mock_post_reply.assert_called_once_with(requests[0])
+        assert results[0] == {"id": "123456789", "success": False, "error": "gone"}
+        assert results[1]["success"] is True
+        variables = mock_github_service.execute_graphql_query.call_args[0][1]
+        assert variables == {"t0": self.THREADS[0], "b0": "Done"}
+
+    def test_resolve_aliases_follow_their_reply(self) -> None:
+        """Test resolves share the request and are reported per reply."""
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.execute_graphql_query.return_value = {
+            "data": {
+                "r0": {"comment": {"id": "C0"}},
+                "s0": {"thread": {"id": self.THREADS[0], "isResolved": True}},
+                "r1": {"comment": {"id": "C1"}},
+                "s1": None,
+            },
+            "errors": [{"message": "Thread is locked", "path": ["s1"]}],
+        }
+
+        service = ReplyService(mock_github_service)
+        results = service.post_replies(
+            [ReplyRequest(thread, "Fixed", resolve=True) for thread in self.THREADS]
+        )
+
+        query = mock_github_service.execute_graphql_query.call_args[0][0]
+        assert "s0:resolveReviewThread(input:{threadId:$t0})" in query
+        assert query.index("r1:") < query.index("s1:")
+        assert [r["success"] for r in results] == [True, True]
+        assert results[0]["thread_resolved"] is True
+        assert results[1]["thread_resolved"] is False
+        assert results[1]["resolve_error"] == "Thread is locked"
+
+    def test_resolve_only_requested_threads(self) -> None:
+        """Test threads without resolve get no resolve alias."""
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.execute_graphql_query.return_value = {
+            "data": {"r0": {"comment": {"id": "C0"}}, "r1": {"comment": {"id": "C1"}}}
+        }
+
+        service = ReplyService(mock_github_service)
+        results = service.post_replies(
+            [
+                ReplyRequest(self.THREADS[0], "Fixed"),
+                ReplyRequest(self.THREADS[1], "Fixed", resolve=True),
+            ]
+        )
+
+        query = mock_github_service.execute_graphql_query.call_args[0][0]
+        assert "s0:" not in query
+        assert "s1:resolveReviewThread" in query
+        assert "thread_resolved" not in results[0]
+        assert results[1]["resolve_error"] == "Thread was not resolved"
+
+
 class TestReplyServiceExceptions:
     """Test reply service exception hierarchy."""
 
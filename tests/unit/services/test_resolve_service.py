@@ -1,5 +1,6 @@
 """Tests for the resolve service module."""
 
+from typing import Any
 from unittest.mock import Mock
 
 import pytest
@@ -896,3 +897,329 @@ class TestResolveServiceErrorCoverage:
             GitHubAPIError, match="Failed to execute unresolve mutation"
         ):
             service.unresolve_thread("PRT_kwDOABcD12MAAAABcDE3fg")
+
+
+class TestResolveServiceBatch:
+    """Test batched resolution with aliased mutations."""
+
+    THREAD_IDS = [
+        "PRRT_kwDOABcD12MAAAABcDE3fg",
+        "PRRT_kwDOABcD12MAAAABcDE3fh",
+        "PRRT_kwDOABcD12MAAAABcDE3fi",
+    ]
+
+    def test_resolve_threads_single_request(self) -> None:
+        """Test all threads are sent as aliases of one mutation."""
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.execute_graphql_query.return_value = {
+            "data": {
+                f"t{i}": {"thread": {"id": thread_id, "isResolved": True}}
+                for i, thread_id in enumerate(self.THREAD_IDS)
+            }
+        }
+
+        service = ResolveService(mock_github_service)
+        results = service.resolve_threads(self.THREAD_IDS)
+
+        mock_github_service.execute_graphql_query.assert_called_once()
+        query, variables = mock_github_service.execute_graphql_query.call_args[0]
+        assert query.startswith("mutation BulkResolveReviewThreads(")
+        assert query.count("resolveReviewThread(") == 3
+        assert variables == {f"t{i}": tid for i, tid in enumerate(self.THREAD_IDS)}
+        assert mock_github_service.execute_graphql_query.call_args[1] == {
+            "allow_partial_errors": True
+        }
+        assert [r["success"] for r in results] == [True, True, True]
+        assert all(r["is_resolved"] is True for r in results)
+
+    def test_unresolve_threads_uses_unresolve_mutation(self) -> None:
+        """Test undo builds an unresolve document."""
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.execute_graphql_query.return_value = {
+            "data": {"t0": {"thread": {"id": "x", "isResolved": False}}}
+        }
+
+        service = ResolveService(mock_github_service)
+        results = service.resolve_threads(self.THREAD_IDS[:1], undo=True)
+
+        query = mock_github_service.execute_graphql_query.call_args[0][0]
+        assert "unresolveReviewThread(" in query
+        assert results == [
+            {
+                "thread_id": self.THREAD_IDS[0],
+                "action": "unresolve",
+                "success": True,
+                "is_resolved": False,
+            }
+        ]
+
+    def test_partial_failure_mapped_by_alias(self) -> None:
+        """Test errors are attributed to the thread whose alias failed."""
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.execute_graphql_query.return_value = {
+            "data": {
+                "t0": {"thread": {"id": "a", "isResolved": True}},
+                "t1": None,
+                "t2": {"thread": {"id": "c", "isResolved": True}},
+            },
+            "errors": [{"message": "Could not resolve to a node", "path": ["t1"]}],
+        }
+
+        service = ResolveService(mock_github_service)
+        results = service.resolve_threads(self.THREAD_IDS)
+
+        assert [r["success"] for r in results] == [True, False, True]
+        assert results[1]["error"] == "Could not resolve to a node"
+
+    def test_invalid_ids_not_sent(self) -> None:
+        """Test invalid IDs fail locally and valid ones are renumbered."""
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.execute_graphql_query.return_value = {
+            "data": {"t0": {"thread": {"id": "a", "isResolved": True}}}
+        }
+
+        service = ResolveService(mock_github_service)
+        results = service.resolve_threads(["bad id", self.THREAD_IDS[0]])
+
+        variables = mock_github_service.execute_graphql_query.call_args[0][1]
+        assert variables == {"t0": self.THREAD_IDS[0]}
+        assert results[0]["success"] is False
+        assert "Invalid thread ID format" in results[0]["error"]
+        assert results[1]["success"] is True
+
+    def test_all_invalid_ids_make_no_request(self) -> None:
+        """Test no request is made when no ID is valid."""
+        mock_github_service = Mock(spec=GitHubService)
+
+        service = ResolveService(mock_github_service)
+        results = service.resolve_threads(["bad id"])
+
+        mock_github_service.execute_graphql_query.assert_not_called()
+        assert results[0]["success"] is False
+
+    def test_request_failure_raises(self) -> None:
+        """Test a failure of the whole request propagates."""
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.execute_graphql_query.side_effect = GitHubAPIError("boom")
+
+        service = ResolveService(mock_github_service)
+        with pytest.raises(GitHubAPIError):
+            service.resolve_threads(self.THREAD_IDS)
+
+
+class TestResolveThreadInPullRequest:
+    """Test resolution with the ownership check before the mutation."""
+
+    THREAD_ID = "PRRT_kwDOABcD12MAAAABcDE3fg"
+
+    def _response(self, field: str) -> dict:
+        return {
+            "data": {
+                field: {
+                    "thread": {
+                        "id": self.THREAD_ID,
+                        "isResolved": field == "resolveReviewThread",
+                    }
+                }
+            }
+        }
+
+    def _lookup(self, number: int, name_with_owner: str) -> dict:
+        return {
+            "data": {
+                "nodes": [
+                    {
+                        "id": self.THREAD_ID,
+                        "pullRequest": {
+                            "number": number,
+                            "repository": {"nameWithOwner": name_with_owner},
+                        },
+                    }
+                ]
+            }
+        }
+
+    def _service(self, number: int, name_with_owner: str) -> ResolveService:
+        mock_github_service = Mock(spec=GitHubService)
+
+        def execute(query: str, variables: dict, **kwargs: Any) -> dict:
+            if "ValidateThreadsExist" in query:
+                return self._lookup(number, name_with_owner)
+            if "unresolveReviewThread" in query:
+                return self._response("unresolveReviewThread")
+            return self._response("resolveReviewThread")
+
+        mock_github_service.execute_graphql_query.side_effect = execute
+        return ResolveService(mock_github_service)
+
+    def _queries(self, service: ResolveService) -> list[str]:
+        return [
+            call.args[0]
+            for call in service.github_service.execute_graphql_query.call_args_list
+        ]
+
+    def test_matching_thread_checked_before_mutation(self) -> None:
+        """Test a thread in the expected PR is looked up, then resolved."""
+        service = self._service(123, "Owner/Repo")
+
+        result = service.resolve_thread_in_pull_request(
+            self.THREAD_ID, 123, owner="owner", repo="repo"
+        )
+
+        queries = self._queries(service)
+        assert len(queries) == 2
+        assert "ValidateThreadsExist" in queries[0]
+        assert "resolveReviewThread" in queries[1]
+        assert result["success"] is True
+        assert result["pr_number"] == 123
+        assert result["repository"] == "Owner/Repo"
+
+    def test_wrong_pull_request(self) -> None:
+        """Test a thread from another PR raises ThreadNotFoundError."""
+        service = self._service(7, "owner/repo")
+
+        with pytest.raises(ThreadNotFoundError) as exc_info:
+            service.resolve_thread_in_pull_request(self.THREAD_ID, 123)
+
+        assert "not found in PR #123" in str(exc_info.value)
+        assert "belongs to owner/repo#7" in str(exc_info.value)
+        assert exc_info.value.context["actual_pr_number"] == 7
+
+    def test_wrong_repository(self) -> None:
+        """Test a thread from another repository raises ThreadNotFoundError."""
+        service = self._service(123, "other/repo")
+
+        with pytest.raises(ThreadNotFoundError, match="not found in owner/repo#123"):
+            service.resolve_thread_in_pull_request(
+                self.THREAD_ID, 123, owner="owner", repo="repo"
+            )
+
+    @pytest.mark.parametrize("undo", [False, True])
+    def test_thread_elsewhere_not_changed(self, undo: bool) -> None:
+        """Test no mutation is sent for a thread in another repository."""
+        service = self._service(123, "other/repo")
+
+        with pytest.raises(ThreadNotFoundError, match="was not changed"):
+            service.resolve_thread_in_pull_request(
+                self.THREAD_ID, 123, owner="owner", repo="repo", undo=undo
+            )
+
+        queries = self._queries(service)
+        assert len(queries) == 1
+        assert "ValidateThreadsExist" in queries[0]
+
+    def test_unknown_thread(self) -> None:
+        """Test a thread ID that is not a review thread is not mutated."""
+        service = ResolveService(Mock(spec=GitHubService))
+        service.github_service.execute_graphql_query.return_value = {
+            "data": {"nodes": [None]},
+            "errors": [{"message": "Could not resolve to a node"}],
+        }
+
+        with pytest.raises(ThreadNotFoundError, match="not found in PR #123"):
+            service.resolve_thread_in_pull_request(self.THREAD_ID, 123)
+
+        service.github_service.execute_graphql_query.assert_called_once()
+
+    def test_repository_check_skipped_without_owner(self) -> None:
+        """Test only the PR number is checked when no repository is given."""
+        service = self._service(123, "other/repo")
+
+        result = service.resolve_thread_in_pull_request(self.THREAD_ID, 123)
+
+        assert result["repository"] == "other/repo"
+
+    def test_invalid_arguments(self) -> None:
+        """Test invalid PR numbers and thread IDs are rejected before any request."""
+        service = self._service(123, "owner/repo")
+
+        with pytest.raises(ValidationError):
+            service.resolve_thread_in_pull_request(self.THREAD_ID, 0)
+        with pytest.raises(ValidationError):
+            service.resolve_thread_in_pull_request("not-a-thread", 123)
+
+        service.github_service.execute_graphql_query.assert_not_called()
+
+
+class TestValidateThreadsExist:
+    """Test batch thread validation with nodes(ids:)."""
+
+    def _node(self, thread_id: str, number: int, name_with_owner: str) -> dict:
+        return {
+            "id": thread_id,
+            "pullRequest": {
+                "number": number,
+                "repository": {"nameWithOwner": name_with_owner},
+            },
+        }
+
+    def test_single_query_for_many_ids(self) -> None:
+        """Test all IDs are checked with one nodes query."""
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.execute_graphql_query.return_value = {
+            "data": {
+                "nodes": [
+                    self._node("PRRT_a", 123, "owner/repo"),
+                    None,
+                    self._node("PRRT_c", 7, "owner/repo"),
+                    self._node("PRRT_d", 123, "other/repo"),
+                    {},
+                ]
+            },
+            "errors": [
+                {"message": "Could not resolve to a node", "path": ["nodes", 1]}
+            ],
+        }
+        ids = ["PRRT_a", "PRRT_b", "PRRT_c", "PRRT_d", "PR_e"]
+
+        service = ResolveService(mock_github_service)
+        result = service.validate_threads_exist("owner", "repo", 123, ids)
+
+        mock_github_service.execute_graphql_query.assert_called_once()
+        _, variables = mock_github_service.execute_graphql_query.call_args[0]
+        assert variables == {"ids": ids}
+        assert result == {
+            "PRRT_a": True,
+            "PRRT_b": False,
+            "PRRT_c": False,
+            "PRRT_d": False,
+            "PR_e": False,
+        }
+
+    def test_batches_of_one_hundred(self) -> None:
+        """Test IDs are chunked to GitHub's nodes() limit and deduplicated."""
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.execute_graphql_query.side_effect = (
+            lambda query, variables, **_: {
+                "data": {
+                    "nodes": [
+                        self._node(thread_id, 123, "owner/repo")
+                        for thread_id in variables["ids"]
+                    ]
+                }
+            }
+        )
+        ids = [f"PRRT_{i}" for i in range(150)] + ["PRRT_0"]
+
+        service = ResolveService(mock_github_service)
+        result = service.validate_threads_exist("owner", "repo", 123, ids)
+
+        assert mock_github_service.execute_graphql_query.call_count == 2
+        assert len(result) == 150
+        assert all(result.values())
+
+    def test_missing_nodes_list(self) -> None:
+        """Test a response without nodes raises ResolveServiceError."""
+        mock_github_service = Mock(spec=GitHubService)
+        mock_github_service.execute_graphql_query.return_value = {"data": {}}
+
+        service = ResolveService(mock_github_service)
+        with pytest.raises(ResolveServiceError, match="no nodes list"):
+            service.validate_threads_exist("owner", "repo", 123, ["PRRT_a"])
+
+    def test_invalid_parameters(self) -> None:
+        """Test repository and PR parameters are validated."""
+        service = ResolveService(Mock(spec=GitHubService))
+
+        with pytest.raises(ValidationError):
+            service.validate_threads_exist("", "repo", 123, ["PRRT_a"])
@@ -0,0 +1,186 @@
+"""Tests for the GraphQL response cache."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from toady.services.response_cache import (
+    ResponseCache,
+    mutated_node_ids,
+    query_kind,
+)
+
+THREADS_QUERY = "query($number: Int!) { pullRequest(number: $number) { reviewThreads }}"
+THREADS_RESPONSE = {
+    "data": {
+        "pullRequest": {
+            "id": "PR_kwDOABcD12MAAAABcDE3fg",
+            "reviewThreads": {"nodes": [{"id": "PRRT_kwDOABcD12MAAAABcDE3fg"}]},
+        }
+    }
+}
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ResponseCache:
+    """Enabled cache in a temporary directory."""
+    return ResponseCache(tmp_path / "graphql", enabled=True)
+
+
+@pytest.mark.service
+@pytest.mark.unit
+class TestResponseCache:
+    """Test the ResponseCache class."""
+
+    def test_round_trip_across_instances(self, tmp_path: Path) -> None:
+        """Test a stored response is served to a later process."""
+        ResponseCache(tmp_path, enabled=True).put(
+            THREADS_QUERY, {"number": 1}, THREADS_RESPONSE
+        )
+
+        cache = ResponseCache(tmp_path, enabled=True)
+        assert cache.get(THREADS_QUERY, {"number": 1}) == THREADS_RESPONSE
+        assert cache.get(THREADS_QUERY, {"number": 2}) is None
+
+    def test_expired_entries_miss(self, cache: ResponseCache) -> None:
+        """Test entries are not served after their kind's TTL."""
+        cache.put(THREADS_QUERY, {"number": 1}, THREADS_RESPONSE)
+
+        with patch("toady.services.response_cache.time.time", return_value=1e12):
+            assert cache.get(THREADS_QUERY, {"number": 1}) is None
+
+    def test_uncacheable_kinds_are_not_stored(self, cache: ResponseCache) -> None:
+        """Test mutations, introspection and unknown queries bypass the cache."""
+        for query in [
+            "mutation { resolveReviewThread }",
+            "query { __schema { types { name } } }",
+            "query { viewer { login } }",
+        ]:
+            cache.put(query, None, {"data": {}})
+            assert cache.get(query, None) is None
+        assert not cache.index_path.exists()
+
+    def test_key_depends_on_host_and_identity(self, cache: ResponseCache) -> None:
+        """Test a different host or account never sees another's entries."""
+        with patch.dict(os.environ, {"GH_TOKEN": "token-a"}):
+            cache.put(THREADS_QUERY, {"number": 1}, THREADS_RESPONSE)
+            assert cache.get(THREADS_QUERY, {"number": 1}) is not None
+            with patch.dict(os.environ, {"GH_HOST": "github.example.com"}):
+                assert cache.get(THREADS_QUERY, {"number": 1}) is None
+
+        with patch.dict(os.environ, {"GH_TOKEN": "token-b"}):
+            other = ResponseCache(cache.cache_dir, enabled=True)
+            assert other.get(THREADS_QUERY, {"number": 1}) is None
+
+    def test_identity_read_on_every_lookup(self, cache: ResponseCache) -> None:
+        """Test one long-lived cache keeps accounts apart when the token changes."""
+        with patch.dict(os.environ, {"GH_TOKEN": "token-a"}):
+            cache.put(THREADS_QUERY, {"number": 1}, THREADS_RESPONSE)
+        with patch.dict(os.environ, {"GH_TOKEN": "token-b"}):
+            assert cache.get(THREADS_QUERY, {"number": 1}) is None
+        with patch.dict(os.environ, {"GH_TOKEN": "token-a"}):
+            assert cache.get(THREADS_QUERY, {"number": 1}) == THREADS_RESPONSE
+
+    def test_default_location_follows_home(self, tmp_path: Path) -> None:
+        """Test the default cache directory and switch follow the environment."""
+        cache = ResponseCache()
+        with patch.dict(os.environ, {"HOME": str(tmp_path / "a")}):
+            assert cache.cache_dir == tmp_path / "a" / ".toady" / "cache" / "graphql"
+        with patch.dict(
+            os.environ, {"HOME": str(tmp_path / "b"), "TOADY_NO_CACHE": "1"}
+        ):
+            assert cache.cache_dir == tmp_path / "b" / ".toady" / "cache" / "graphql"
+            assert cache.enabled is False
+
+    def test_invalidate_by_node_id(self, cache: ResponseCache) -> None:
+        """Test entries mentioning a mutated node are dropped, others kept."""
+        cache.put(THREADS_QUERY, {"number": 1}, THREADS_RESPONSE)
+        cache.put(THREADS_QUERY, {"number": 2}, {"data": {"id": "PR_other"}})
+
+        assert cache.invalidate({"PRRT_kwDOABcD12MAAAABcDE3fg"}) == 1
+
+        assert cache.get(THREADS_QUERY, {"number": 1}) is None
+        assert cache.get(THREADS_QUERY, {"number": 2}) is not None
+
+    def test_invalidate_pull_request(self, cache: ResponseCache) -> None:
+        """Test entries about a pull request are dropped, other PRs kept."""
+        variables = {"owner": "Owner", "repo": "repo", "number": 1}
+        cache.put(THREADS_QUERY, variables, THREADS_RESPONSE)
+        cache.put(THREADS_QUERY, dict(variables, number=2), THREADS_RESPONSE)
+
+        assert cache.invalidate_pull_request("owner", "repo", 1) == 1
+
+        assert cache.get(THREADS_QUERY, variables) is None
+        assert cache.get(THREADS_QUERY, dict(variables, number=2)) is not None
+
+    def test_least_recently_used_evicted(self, tmp_path: Path) -> None:
+        """Test the cache stays under its size limit, dropping stale entries."""
+        response = {"data": {"pullRequest": {"body": "x" * 200}}}
+        size = len(json.dumps(response)) + 100
+        cache = ResponseCache(tmp_path, max_bytes=2 * size, enabled=True)
+
+        cache.put(THREADS_QUERY, {"number": 1}, response)
+        cache.put(THREADS_QUERY, {"number": 2}, response)
+        # Make entry 2 the least recently used, then add a third
+        os.utime(cache._entry_path(cache.key(THREADS_QUERY, {"number": 2})), (0, 0))
+        cache.put(THREADS_QUERY, {"number": 3}, response)
+
+        assert cache.get(THREADS_QUERY, {"number": 1}) is not None
+        assert cache.get(THREADS_QUERY, {"number": 2}) is None
+        assert cache.get(THREADS_QUERY, {"number": 3}) is not None
+        assert len(list(tmp_path.glob("*.json"))) == 3  # two entries + index
+
+    def test_disabled_by_environment(self, tmp_path: Path) -> None:
+        """Test TOADY_NO_CACHE turns the cache off."""
+        cache = ResponseCache(tmp_path)
+        with patch.dict(os.environ, {"TOADY_NO_CACHE": "1"}):
+            cache.put(THREADS_QUERY, {"number": 1}, THREADS_RESPONSE)
+            assert cache.get(THREADS_QUERY, {"number": 1}) is None
+
+    def test_corrupt_entry_is_a_miss(self, cache: ResponseCache) -> None:
+        """Test unreadable files are ignored."""
+        cache.put(THREADS_QUERY, {"number": 1}, THREADS_RESPONSE)
+        cache._entry_path(cache.key(THREADS_QUERY, {"number": 1})).write_text("{")
+        cache.index_path.write_text("[]")
+
+        assert cache.get(THREADS_QUERY, {"number": 1}) is None
+        assert cache.invalidate({"PRRT_kwDOABcD12MAAAABcDE3fg"}) == 0
+
+
+@pytest.mark.service
+@pytest.mark.unit
+class TestCacheHelpers:
+    """Test query classification and node ID extraction."""
+
+    @pytest.mark.parametrize(
+        "query,kind",
+        [
+            ("  mutation X { a }", "mutation"),
+            ("query { __schema { types { name } } }", "introspection"),
+            (
+                "query { pullRequest(number: 1) { reviewThreads { id } } }",
+                "review_threads",
+            ),
+            ("query { repository { pullRequests(first: 5) { id } } }", "pull_requests"),
+            ("query { repository { pullRequest(number: 1) { id } } }", "pull_request"),
+            ("query { viewer { login } }", "other"),
+        ],
+    )
+    def test_query_kind(self, query: str, kind: str) -> None:
+        """Test documents are classified by what they read."""
+        assert query_kind(query) == kind
+
+    def test_mutated_node_ids(self) -> None:
+        """Test only ID-like variables are treated as mutated nodes."""
+        assert mutated_node_ids(
+            {
+                "t0": "PRRT_kwDOABcD12MAAAABcDE3fg",
+                "b0": "Fixed in ABC_123 and more",
+                "ids": ["IC_kwDOABcD12MAAAABcDE3fg"],
+                "number": 7,
+            }
+        ) == {"PRRT_kwDOABcD12MAAAABcDE3fg", "IC_kwDOABcD12MAAAABcDE3fg"}
+        assert mutated_node_ids(None) == set()
@@ -0,0 +1,76 @@
+"""Tests for single-flight call deduplication."""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+import pytest
+
+from toady.services.single_flight import SingleFlight
+
+
+def _wait_for_waiters(group: SingleFlight, key: str, count: int) -> None:
+    """Block until ``count`` callers have joined the call for ``key``."""
+    deadline = time.monotonic() + 5
+    while group.waiting(key) < count:
+        assert time.monotonic() < deadline, "callers never joined the call"
+        time.sleep(0.001)
+
+
+@pytest.mark.service
+@pytest.mark.unit
+class TestSingleFlight:
+    """Test the SingleFlight class."""
+
+    def test_concurrent_calls_share_one_execution(self) -> None:
+        """Test callers with the same key get the leader's result."""
+        group: SingleFlight[list[int]] = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def work() -> list[int]:
+            calls.append(1)
+            release.wait(5)
+            return [42]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(group.do, "key", work) for _ in range(4)]
+            _wait_for_waiters(group, "key", 3)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert group.waiting("key") == 0
+
+    def test_errors_reach_every_caller(self) -> None:
+        """Test an exception from the shared call is raised in all callers."""
+        group: SingleFlight[None] = SingleFlight()
+        release = threading.Event()
+
+        def work() -> None:
+            release.wait(5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(group.do, "key", work) for _ in range(2)]
+            _wait_for_waiters(group, "key", 1)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError, match="boom"):
+                    future.result()
+
+    def test_results_are_not_cached(self) -> None:
+        """Test sequential calls each run the function."""
+        group: SingleFlight[int] = SingleFlight()
+        counter = iter(range(10))
+
+        assert group.do("key", lambda: next(counter)) == 0
+        assert group.do("key", lambda: next(counter)) == 1
+
+    def test_different_keys_run_separately(self) -> None:
+        """Test only equal keys are coalesced."""
+        group: SingleFlight[str] = SingleFlight()
+
+        assert group.do(("q", "a"), lambda: "a") == "a"
+        assert group.do(("q", "b"), lambda: "b") == "b"
@@ -0,0 +1,186 @@
+"""Tests for the thread filter predicates."""
+
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+
+from toady.models.models import ReviewThread
+from toady.services.thread_filter import ThreadFilter, parse_duration
+
+NOW = datetime(2024, 3, 1, 12, 0, 0)
+
+
+def _make_thread(**kwargs: Any) -> ReviewThread:
+    values: dict[str, Any] = {
+        "thread_id": "PRRT_kwDOABcD12MAAAABcDE3fg",
+        "title": "Fix typo",
+        "created_at": NOW - timedelta(days=30),
+        "updated_at": NOW - timedelta(days=10),
+        "status": "UNRESOLVED",
+        "author": "alice",
+        "comments": [],
+        "file_path": "docs/guide/intro.md",
+        "line": 3,
+    }
+    values.update(kwargs)
+    return ReviewThread(**values)
+
+
+@pytest.mark.unit
+class TestParseDuration:
+    """Test duration parsing."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("30s", timedelta(seconds=30)),
+            ("15m", timedelta(minutes=15)),
+            ("12h", timedelta(hours=12)),
+            ("7d", timedelta(days=7)),
+            ("2W", timedelta(weeks=2)),
+        ],
+    )
+    def test_valid_durations(self, value: str, expected: timedelta) -> None:
+        """Test supported units are parsed."""
+        assert parse_duration(value) == expected
+
+    @pytest.mark.parametrize("value", ["", "7", "d", "1.5d", "-1d", "3y"])
+    def test_invalid_durations(self, value: str) -> None:
+        """Test malformed durations are rejected."""
+        with pytest.raises(ValueError, match="Invalid duration"):
+            parse_duration(value)
+
+
+@pytest.mark.unit
+class TestThreadFilterParsing:
+    """Test building filters from --where clauses."""
+
+    def test_all_keys(self) -> None:
+        """Test every filter key is parsed."""
+        thread_filter = ThreadFilter.from_clauses(
+            ["path=docs/**", "author=@Alice, bob", "outdated", "older-than=7d"]
+        )
+
+        assert thread_filter == ThreadFilter(
+            paths=["docs/**"],
+            authors=["alice", "bob"],
+            outdated=True,
+            older_than=timedelta(days=7),
+        )
+
+    def test_outdated_false(self) -> None:
+        """Test outdated can select current threads."""
+        assert ThreadFilter.from_clauses(["outdated=false"]).outdated is False
+
+    @pytest.mark.parametrize(
+        ("clause", "message"),
+        [
+            ("label=bug", "Unknown filter 'label'"),
+            ("path=", "requires a value"),
+            ("outdated=maybe", "Invalid boolean"),
+            ("older-than=soon", "Invalid duration"),
+        ],
+    )
+    def test_invalid_clauses(self, clause: str, message: str) -> None:
+        """Test invalid clauses raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            ThreadFilter.from_clauses([clause])
+
+    def test_describe_round_trips(self) -> None:
+        """Test describe produces clauses that parse to the same filter."""
+        thread_filter = ThreadFilter.from_clauses(
+            ["path=docs/", "path=*.md", "author=alice", "outdated=false"]
+        )
+
+        described = thread_filter.describe()
+
+        assert described == "path=docs/ path=*.md author=alice outdated=false"
+        assert ThreadFilter.from_clauses(described.split()) == thread_filter
+
+    def test_describe_duration(self) -> None:
+        """Test durations are described with the largest whole unit."""
+        thread_filter = ThreadFilter.from_clauses(["older-than=48h"])
+
+        assert thread_filter.describe() == "older-than=2d"
+
+
+@pytest.mark.unit
+class TestThreadFilterMatching:
+    """Test evaluating filters against threads."""
+
+    @pytest.mark.parametrize(
+        ("glob", "expected"),
+        [
+            ("docs/**", True),
+            ("docs/*", True),
+            ("docs/", True),
+            ("*.md", True),
+            ("docs/guide/*.py", False),
+            ("src/", False),
+            ("Docs/**", False),
+        ],
+    )
+    def test_path(self, glob: str, expected: bool) -> None:
+        """Test path globs and directory prefixes."""
+        thread_filter = ThreadFilter(paths=[glob])
+
+        assert thread_filter.matches(_make_thread(), NOW) is expected
+
+    def test_repeated_paths_match_any(self) -> None:
+        """Test a thread matches if any path glob matches."""
+        thread_filter = ThreadFilter(paths=["src/*", "docs/*"])
+
+        assert thread_filter.matches(_make_thread(), NOW)
+
+    def test_path_filter_skips_threads_without_file(self) -> None:
+        """Test threads without a file never match a path filter."""
+        thread_filter = ThreadFilter(paths=["*"])
+
+        assert not thread_filter.matches(_make_thread(file_path=None), NOW)
+
+    def test_author_case_insensitive(self) -> None:
+        """Test author matching ignores case."""
+        assert ThreadFilter(authors=["alice"]).matches(
+            _make_thread(author="Alice"), NOW
+        )
+        assert not ThreadFilter(authors=["bob"]).matches(_make_thread(), NOW)
+
+    def test_outdated(self) -> None:
+        """Test outdated state must match when given."""
+        outdated = _make_thread(is_outdated=True, status="OUTDATED")
+
+        assert ThreadFilter(outdated=True).matches(outdated, NOW)
+        assert not ThreadFilter(outdated=True).matches(_make_thread(), NOW)
+        assert ThreadFilter(outdated=False).matches(_make_thread(), NOW)
+
+    def test_older_than_uses_last_activity(self) -> None:
+        """Test older-than compares against updated_at."""
+        thread = _make_thread()
+
+        assert ThreadFilter(older_than=timedelta(days=7)).matches(thread, NOW)
+        assert not ThreadFilter(older_than=timedelta(days=14)).matches(thread, NOW)
+
+    def test_apply_combines_predicates(self) -> None:
+        """Test apply keeps threads that satisfy every predicate, in order."""
+        threads = [
+            _make_thread(thread_id="PRRT_1", is_outdated=True, status="OUTDATED"),
+            _make_thread(thread_id="PRRT_2"),
+            _make_thread(
+                thread_id="PRRT_3",
+                is_outdated=True,
+                status="OUTDATED",
+                file_path="src/app.py",
+            ),
+            _make_thread(
+                thread_id="PRRT_4",
+                is_outdated=True,
+                status="OUTDATED",
+                file_path="docs/api.md",
+            ),
+        ]
+        thread_filter = ThreadFilter.from_clauses(["path=docs/", "outdated"])
+
+        result = thread_filter.apply(threads, NOW)
+
+        assert [thread.thread_id for thread in result] == ["PRRT_1", "PRRT_4"]
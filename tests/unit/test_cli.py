@@ -6,6 +6,8 @@ error handling, and the main entry point.
 """
 
 import os
+import subprocess
+import sys
 from unittest.mock import Mock, patch
 
 import click
@@ -13,7 +15,7 @@ from click.testing import CliRunner
 import pytest
 
 from toady import __version__
-from toady.cli import cli, main
+from toady.cli import LazyGroup, cli, main
 from toady.exceptions import (
     ToadyError,
 )
@@ -134,13 +136,13 @@ class TestCLICommandRegistration:
         result = runner.invoke(cli, ["--help"])
         assert result.exit_code == 0
 
-        expected_commands = ["fetch", "reply", "resolve", "schema"]
+        expected_commands = ["fetch", "reply", "resolve", "schema", "serve"]
         for command in expected_commands:
             assert command in result.output
 
     def test_registered_commands_are_callable(self):
         """Test that all registered commands are callable."""
-        expected_commands = ["fetch", "reply", "resolve", "schema"]
+        expected_commands = ["fetch", "reply", "resolve", "schema", "serve"]
         for command_name in expected_commands:
             command = cli.get_command(None, command_name)
             assert command is not None
@@ -148,12 +150,42 @@ class TestCLICommandRegistration:
 
     def test_command_help_accessible(self, runner):
         """Test that help is accessible for all registered commands."""
-        expected_commands = ["fetch", "reply", "resolve", "schema"]
+        expected_commands = ["fetch", "reply", "resolve", "schema", "serve"]
         for command_name in expected_commands:
             result = runner.invoke(cli, [command_name, "--help"])
             assert result.exit_code == 0
             assert "Usage:" in result.output
 
+    def test_commands_imported_on_first_use(self):
+        """Test command modules are only imported when a command is needed."""
+        script = (
+            "import sys\n"
+            "from toady.cli import cli\n"
+            "cli(['--version'], standalone_mode=False)\n"
+            "print(sorted(m for m in sys.modules if m.startswith('toady.commands.')))\n"
+            "cli.get_command(None, 'resolve')\n"
+            "print(sorted(m for m in sys.modules if m.startswith('toady.commands.')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.splitlines()[-2:] == [
+            "[]",
+            "['toady.commands.resolve']",
+        ]
+
+    def test_lazy_command_must_be_a_command(self):
+        """Test a lazy path naming something else raises TypeError."""
+        group = LazyGroup(lazy_commands={"version": "toady:__version__"})
+
+        with pytest.raises(TypeError, match="is not a click command"):
+            group.get_command(click.Context(group), "version")
+
     def test_invalid_command_handling(self, runner):
         """Test handling of invalid/unknown commands."""
         result = runner.invoke(cli, ["invalid-command"])
@@ -351,7 +383,7 @@ class TestCLIIntegration:
     def test_cli_with_real_commands(self, runner):
         """Test that CLI works with actual registered commands."""
         # Test that we can get help for each command
-        commands = ["fetch", "reply", "resolve", "schema"]
+        commands = ["fetch", "reply", "resolve", "schema", "serve"]
         for command in commands:
             result = runner.invoke(cli, [command, "--help"])
             assert result.exit_code == 0
@@ -389,10 +421,9 @@ class TestCLIIntegration:
         assert hasattr(cli, "callback")
         assert hasattr(cli, "help")
 
-        # Test that commands dictionary contains expected commands
-        expected_commands = ["fetch", "reply", "resolve", "schema"]
-        for command in expected_commands:
-            assert command in cli.commands
+        # Test that the group lists the expected commands
+        expected_commands = ["fetch", "reply", "resolve", "schema", "serve"]
+        assert cli.list_commands(click.Context(cli)) == expected_commands
 
 
 class TestCLIMainBehavior:
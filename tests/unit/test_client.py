@@ -0,0 +1,47 @@
+"""Tests for the toady entry point."""
+
+from unittest.mock import patch
+
+import pytest
+
+from toady.client import main
+
+
+class TestClientMain:
+    """Test choosing between the daemon and an in-process run."""
+
+    @patch("toady.cli.main")
+    @patch("toady.services.daemon.forward_to_daemon", return_value=3)
+    @patch("toady.services.daemon.should_forward", return_value=True)
+    def test_exits_with_daemon_result(self, _should, mock_forward, mock_cli) -> None:
+        """Test a forwarded command exits with the daemon's exit code."""
+        with patch("sys.argv", ["toady", "fetch", "--pr", "1"]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 3
+        mock_forward.assert_called_once_with(["fetch", "--pr", "1"])
+        mock_cli.assert_not_called()
+
+    @patch("toady.cli.main")
+    @patch("toady.services.daemon.forward_to_daemon", return_value=None)
+    @patch("toady.services.daemon.should_forward", return_value=True)
+    def test_runs_locally_without_daemon(self, _should, _forward, mock_cli) -> None:
+        """Test the CLI runs in-process when no daemon takes the command."""
+        with patch("sys.argv", ["toady", "--version"]):
+            main()
+
+        mock_cli.assert_called_once_with()
+
+    @patch("toady.cli.main")
+    @patch("toady.services.daemon.forward_to_daemon")
+    @patch("toady.services.daemon.should_forward", return_value=False)
+    def test_local_invocations_not_forwarded(
+        self, _should, mock_forward, mock_cli
+    ) -> None:
+        """Test invocations that must run locally never contact the daemon."""
+        with patch("sys.argv", ["toady", "serve"]):
+            main()
+
+        mock_forward.assert_not_called()
+        mock_cli.assert_called_once_with()
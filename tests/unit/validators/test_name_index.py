@@ -0,0 +1,62 @@
+"""Tests for the n-gram name index used for suggestions."""
+
+import pytest
+
+from toady.validators.name_index import NameIndex, ngrams
+
+
+@pytest.mark.unit
+class TestNgrams:
+    """Test splitting names into n-grams."""
+
+    def test_padded_and_lowercased(self) -> None:
+        """Test names are lowercased and padded at both ends."""
+        assert ngrams("Tit") == {"$ti", "tit", "it$"}
+
+    def test_short_names(self) -> None:
+        """Test names shorter than an n-gram still produce one."""
+        assert ngrams("") == {"$$"}
+        assert ngrams("a") == {"$a$"}
+
+
+@pytest.mark.unit
+class TestNameIndex:
+    """Test ranking similar names."""
+
+    @pytest.fixture
+    def index(self) -> NameIndex:
+        """Index a few pull request field names."""
+        return NameIndex(
+            ["title", "titleHTML", "body", "bodyText", "reviewThreads", "number"]
+        )
+
+    def test_typo_suggests_closest_first(self, index: NameIndex) -> None:
+        """Test the most similar name is suggested first."""
+        assert index.suggest("titel")[0] == "title"
+        assert index.suggest("reviewThread") == ["reviewThreads"]
+
+    def test_case_insensitive(self, index: NameIndex) -> None:
+        """Test differing case still matches."""
+        assert index.suggest("BODYTEXT")[0] == "bodyText"
+
+    def test_unrelated_name(self, index: NameIndex) -> None:
+        """Test names sharing too little produce no suggestions."""
+        assert index.suggest("zzz") == []
+
+    def test_exact_name_not_suggested(self, index: NameIndex) -> None:
+        """Test a name is not suggested as a correction of itself."""
+        assert "body" not in index.suggest("body")
+
+    def test_limit(self) -> None:
+        """Test at most ``limit`` suggestions are returned."""
+        index = NameIndex(f"field{i}" for i in range(20))
+
+        assert len(index.suggest("field", limit=3)) == 3
+        assert len(index) == 20
+
+    def test_duplicates_ignored(self) -> None:
+        """Test duplicate names are indexed once."""
+        index = NameIndex(["id", "id", "ids"])
+
+        assert len(index) == 2
+        assert index.suggest("idx") == ["id", "ids"]
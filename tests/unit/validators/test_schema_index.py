@@ -0,0 +1,117 @@
+"""Tests for the compiled schema index."""
+
+from pathlib import Path
+
+import pytest
+
+from toady.validators.schema_index import (
+    SchemaIndex,
+    SchemaIndexError,
+    compile_schema_index,
+    schema_hash,
+    write_schema_index,
+)
+
+
+@pytest.fixture
+def schema():
+    """Create a small introspection schema."""
+    return {
+        "queryType": {"name": "Query"},
+        "types": [
+            {
+                "kind": "OBJECT",
+                "name": "Query",
+                "description": "The query root",
+                "fields": [
+                    {
+                        "name": "viewer",
+                        "description": "The current user",
+                        "args": [],
+                        "type": {"name": "User"},
+                    }
+                ],
+            },
+            {
+                "kind": "OBJECT",
+                "name": "User",
+                "fields": [{"name": "login", "args": [], "type": {"name": "String"}}],
+            },
+            {"kind": "SCALAR", "name": "String"},
+            {"kind": "SCALAR", "name": "Boolean"},
+        ],
+    }
+
+
+@pytest.fixture
+def index_path(tmp_path: Path, schema) -> Path:
+    """Write the schema's index and return its path."""
+    path = tmp_path / "github_schema.idx"
+    write_schema_index(path, schema, schema_hash(schema))
+    return path
+
+
+@pytest.mark.unit
+class TestSchemaIndex:
+    """Test compiling and reading schema indexes."""
+
+    def test_round_trip(self, index_path: Path, schema) -> None:
+        """Test every type can be looked up after compiling."""
+        with SchemaIndex(index_path) as index:
+            assert index.type_count == 4
+            assert index.schema_hash == schema_hash(schema)
+            assert index.get_type("User") == schema["types"][1]
+            assert index.get_type("String") == {"kind": "SCALAR", "name": "String"}
+
+    def test_missing_type(self, index_path: Path) -> None:
+        """Test unknown types return None."""
+        with SchemaIndex(index_path) as index:
+            assert index.get_type("Repository") is None
+            assert index.get_type("") is None
+
+    def test_descriptions_are_stripped(self, index_path: Path) -> None:
+        """Test descriptions are left out of the compiled types."""
+        with SchemaIndex(index_path) as index:
+            query = index.get_type("Query")
+
+        assert query is not None
+        assert "description" not in query
+        assert "description" not in query["fields"][0]
+        assert query["fields"][0]["name"] == "viewer"
+
+    def test_type_names_sorted(self, index_path: Path) -> None:
+        """Test type names are listed in sorted order."""
+        with SchemaIndex(index_path) as index:
+            assert index.type_names() == ["Boolean", "Query", "String", "User"]
+
+    def test_compile_is_deterministic(self, schema) -> None:
+        """Test type order in the schema does not change the output."""
+        digest = schema_hash(schema)
+        reordered = dict(schema, types=list(reversed(schema["types"])))
+
+        assert compile_schema_index(schema, digest) == compile_schema_index(
+            reordered, digest
+        )
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test opening a missing index raises SchemaIndexError."""
+        with pytest.raises(SchemaIndexError):
+            SchemaIndex(tmp_path / "missing.idx")
+
+    @pytest.mark.parametrize(
+        "contents",
+        [
+            b"",
+            b"TDYS",
+            b"XXXX" + bytes(40),
+            # Valid header claiming more records than the file holds
+            b"TDYS\x01\x00\x00\x00\xff\x00\x00\x00" + bytes(32),
+        ],
+    )
+    def test_corrupt_file(self, tmp_path: Path, contents: bytes) -> None:
+        """Test truncated or foreign files raise SchemaIndexError."""
+        path = tmp_path / "github_schema.idx"
+        path.write_bytes(contents)
+
+        with pytest.raises(SchemaIndexError):
+            SchemaIndex(path)
@@ -4,13 +4,19 @@ from datetime import datetime, timedelta
 import json
 from pathlib import Path
 import tempfile
-from unittest.mock import Mock
+import threading
+from unittest.mock import Mock, patch
 
 import pytest
 
+from toady import __version__
+from toady.services.cache_storage import FileLock, atomic_write_text
+from toady.validators.name_index import NameIndex
 from toady.validators.schema_validator import (
     GitHubSchemaValidator,
     SchemaValidationError,
+    query_hash,
+    schema_fingerprint,
 )
 
 
@@ -385,6 +391,268 @@ class TestGitHubSchemaValidator:
         assert schema == mock_schema
         validator._github_service.run_gh_command.assert_called_once()
 
+    def test_expired_schema_used_while_another_process_refreshes(
+        self, validator, mock_schema
+    ):
+        """Test a stale schema is used instead of a second concurrent refresh."""
+        validator._save_schema_to_cache(mock_schema)
+        metadata_path = validator._get_cache_metadata_path()
+        metadata = json.loads(metadata_path.read_text())
+        metadata["timestamp"] = (datetime.now() - timedelta(days=2)).isoformat()
+        metadata_path.write_text(json.dumps(metadata))
+        validator._github_service.run_gh_command = Mock()
+
+        with FileLock(validator._get_cache_lock_path()):
+            schema = validator.fetch_schema()
+
+        assert schema == mock_schema
+        validator._github_service.run_gh_command.assert_not_called()
+
+    def test_waits_for_refreshing_process_without_cache(self, validator, mock_schema):
+        """Test a process with no cache waits for the refresher's result."""
+        validator._github_service.run_gh_command = Mock()
+        other_process = FileLock(validator._get_cache_lock_path())
+        other_process.acquire()
+        result = {}
+        worker = threading.Thread(
+            target=lambda: result.update(schema=validator.fetch_schema())
+        )
+
+        worker.start()
+        worker.join(0.2)
+        assert worker.is_alive()
+        validator._save_schema_to_cache(mock_schema)
+        other_process.release()
+        worker.join(5)
+
+        assert result["schema"] == mock_schema
+        validator._github_service.run_gh_command.assert_not_called()
+
+    def test_load_schema_uses_index(self, validator, temp_cache_dir, mock_schema):
+        """Test a cached index serves validation without reading the JSON."""
+        validator._save_schema_to_cache(mock_schema)
+        validator._get_cache_path().write_text("not json")
+        validator._github_service.run_gh_command = Mock()
+
+        fresh = GitHubSchemaValidator(cache_dir=temp_cache_dir)
+        fresh._github_service = validator._github_service
+        errors = fresh.validate_query("query { repository { id } }")
+
+        assert fresh._schema is None
+        assert fresh._index is not None
+        assert fresh.get_type("Repository")["name"] == "Repository"
+        assert not [e for e in errors if "Unknown" in e.get("message", "")]
+        validator._github_service.run_gh_command.assert_not_called()
+
+    def test_load_schema_ignores_mismatched_index(self, validator, mock_schema):
+        """Test an index for a different schema falls back to the JSON cache."""
+        validator._save_schema_to_cache(mock_schema)
+        metadata_path = validator._get_cache_metadata_path()
+        metadata = json.loads(metadata_path.read_text())
+        metadata["schema_hash"] = "0" * 64
+        metadata_path.write_text(json.dumps(metadata))
+
+        validator.load_schema()
+
+        assert validator._index is None
+        assert validator._schema == mock_schema
+
+    def test_fetch_schema_writes_missing_index(self, validator, mock_schema):
+        """Test caches written before the index existed gain one."""
+        validator._save_schema_to_cache(mock_schema)
+        index_path = validator._get_index_path()
+        index_path.unlink()
+
+        validator.fetch_schema()
+
+        assert index_path.exists()
+        assert validator._load_schema_index() is not None
+
+    def _expire_cache(self, validator):
+        """Backdate the cache metadata past its TTL."""
+        metadata_path = validator._get_cache_metadata_path()
+        metadata = json.loads(metadata_path.read_text())
+        metadata["timestamp"] = (datetime.now() - timedelta(days=2)).isoformat()
+        metadata_path.write_text(json.dumps(metadata))
+
+    def test_expired_cache_extended_when_schema_unchanged(self, validator, mock_schema):
+        """Test an unchanged fingerprint renews the cache without a download."""
+        validator._save_schema_to_cache(mock_schema)
+        self._expire_cache(validator)
+        mock_result = Mock()
+        mock_result.stdout = json.dumps({"data": {"__schema": mock_schema}})
+        validator._github_service.run_gh_command = Mock(return_value=mock_result)
+
+        schema = validator.fetch_schema()
+
+        assert schema == mock_schema
+        validator._github_service.run_gh_command.assert_called_once()
+        args = validator._github_service.run_gh_command.call_args[0][0]
+        assert args[-1] == f"query={validator.FINGERPRINT_QUERY}"
+        assert validator._is_cache_valid()
+
+    def test_expired_cache_refetched_when_schema_changed(self, validator, mock_schema):
+        """Test a changed fingerprint downloads the full schema again."""
+        validator._save_schema_to_cache(mock_schema)
+        self._expire_cache(validator)
+        changed = dict(mock_schema, types=mock_schema["types"][:-1])
+        mock_result = Mock()
+        mock_result.stdout = json.dumps({"data": {"__schema": changed}})
+        validator._github_service.run_gh_command = Mock(return_value=mock_result)
+
+        schema = validator.fetch_schema()
+
+        assert schema == changed
+        assert validator._github_service.run_gh_command.call_count == 2
+        metadata = json.loads(validator._get_cache_metadata_path().read_text())
+        assert metadata["fingerprint"] == schema_fingerprint(changed)
+
+    def test_expired_cache_without_fingerprint_refetched(self, validator, mock_schema):
+        """Test caches from before fingerprints skip the cheap check."""
+        validator._save_schema_to_cache(mock_schema)
+        metadata_path = validator._get_cache_metadata_path()
+        metadata = json.loads(metadata_path.read_text())
+        del metadata["fingerprint"]
+        metadata["timestamp"] = (datetime.now() - timedelta(days=2)).isoformat()
+        metadata_path.write_text(json.dumps(metadata))
+        mock_result = Mock()
+        mock_result.stdout = json.dumps({"data": {"__schema": mock_schema}})
+        validator._github_service.run_gh_command = Mock(return_value=mock_result)
+
+        validator.fetch_schema()
+
+        args = validator._github_service.run_gh_command.call_args[0][0]
+        assert args[-1] == f"query={validator.INTROSPECTION_QUERY}"
+        validator._github_service.run_gh_command.assert_called_once()
+
+    def test_schema_fingerprint_ignores_descriptions_and_order(self, mock_schema):
+        """Test the fingerprint only reflects names and deprecation."""
+        light = {
+            "types": [
+                {
+                    "name": type_def["name"],
+                    "fields": [
+                        {
+                            "name": field["name"],
+                            "isDeprecated": field.get("isDeprecated", False),
+                            "args": [{"name": a["name"]} for a in field["args"]],
+                        }
+                        for field in type_def.get("fields") or []
+                    ],
+                }
+                for type_def in reversed(mock_schema["types"])
+            ]
+        }
+
+        assert schema_fingerprint(light) == schema_fingerprint(mock_schema)
+
+    def test_validation_results_cached_per_schema(
+        self, validator, temp_cache_dir, mock_schema
+    ):
+        """Test repeated validation of a query reuses the stored result."""
+        validator._save_schema_to_cache(mock_schema)
+        query = 'query { repository(owner: "a", name: "b") { id } }'
+        first = validator.validate_query(query)
+
+        fresh = GitHubSchemaValidator(cache_dir=temp_cache_dir)
+        fresh._validate_query_against_schema = Mock()
+        # Formatting and comments do not change the cache key
+        second = fresh.validate_query(
+            'query {\n  # repo\n  repository(owner: "a" name: "b") {\n id }\n}'
+        )
+
+        assert second == first
+        fresh._validate_query_against_schema.assert_not_called()
+
+    def test_validation_results_invalidated_by_new_schema(
+        self, validator, temp_cache_dir, mock_schema
+    ):
+        """Test results recorded for another schema are not reused."""
+        validator._save_schema_to_cache(mock_schema)
+        query = 'query { repository(owner: "a", name: "b") { id } }'
+        first = validator.validate_query(query)
+
+        changed = json.loads(json.dumps(mock_schema))
+        changed["types"][0]["fields"][0]["name"] = "repo"
+        validator._save_schema_to_cache(changed)
+        fresh = GitHubSchemaValidator(cache_dir=temp_cache_dir)
+        second = fresh.validate_query(query)
+
+        assert second != first
+        assert "Field 'repository' not found" in second[0]["message"]
+
+    def test_validate_operations_writes_cache_once(self, validator, mock_schema):
+        """Test a batch persists its validation results in a single write."""
+        validator._save_schema_to_cache(mock_schema)
+        operations = {
+            f"op{i}": f'query {{ r{i}: repository(owner: "a", name: "b") {{ id }} }}'
+            for i in range(5)
+        }
+
+        with patch(
+            "toady.validators.schema_validator.atomic_write_text",
+            wraps=atomic_write_text,
+        ) as mock_write:
+            validator.validate_operations(operations)
+            validator.validate_operations(operations)
+
+        writes = [
+            call
+            for call in mock_write.call_args_list
+            if call.args[0] == validator._get_validation_cache_path()
+        ]
+        assert len(writes) == 1
+
+    def test_saved_results_merged_with_other_processes(
+        self, validator, temp_cache_dir, mock_schema
+    ):
+        """Test saving keeps results another validator wrote in the meantime."""
+        validator._save_schema_to_cache(mock_schema)
+        other = GitHubSchemaValidator(cache_dir=temp_cache_dir)
+        first = 'query { repository(owner: "a", name: "b") { id } }'
+        second = 'query { repository(owner: "a", name: "b") { name } }'
+
+        validator.validate_query(first)
+        other.validate_query(second)
+
+        with open(validator._get_validation_cache_path()) as f:
+            cached = json.load(f)["results"]
+        assert set(cached) == {query_hash(first), query_hash(second)}
+
+    def test_validation_results_of_older_format_ignored(self, validator, mock_schema):
+        """Test results cached before a validation change are not reused."""
+        validator._save_schema_to_cache(mock_schema)
+        validator.load_schema()
+        query = "query { unknownField }"
+        digest = validator._current_schema_hash()
+        stale = {
+            # Written before unknown argument and inline fragment type checks
+            "version": 1,
+            "toady_version": __version__,
+            "schema_hash": digest,
+            "results": {query_hash(query): []},
+        }
+        validator._get_validation_cache_path().write_text(json.dumps(stale))
+
+        errors = validator.validate_query(query)
+
+        assert errors[0]["type"] == "unknown_field"
+
+    def test_cached_validation_result_is_a_copy(self, validator, mock_schema):
+        """Test callers cannot alter the stored validation result."""
+        validator._save_schema_to_cache(mock_schema)
+        query = "query { unknownField }"
+
+        validator.validate_query(query).clear()
+
+        assert validator.validate_query(query)
+
+    def test_query_hash_ignores_formatting(self):
+        """Test query hashes only depend on the query's tokens."""
+        assert query_hash("query{a,b}") == query_hash("query {\n  a # x\n  b\n}")
+        assert query_hash("query { a }") != query_hash("query { b }")
+        assert query_hash('query { a(s: "x') == query_hash('query { a(s: "x')
+
     def test_fetch_schema_api_error(self, validator):
         """Test schema fetching with API error."""
 
@@ -544,6 +812,71 @@ class TestGitHubSchemaValidator:
         suggestions = validator.get_field_suggestions("UnknownType", "field")
         assert len(suggestions) == 0
 
+    def test_field_suggestions_index_built_once(self, validator, mock_schema):
+        """Test a type's field index is reused for every lookup."""
+        validator._schema = mock_schema
+
+        with patch(
+            "toady.validators.schema_validator.NameIndex",
+            wraps=NameIndex,
+        ) as index_class:
+            validator.get_field_suggestions("PullRequest", "titel")
+            validator.get_field_suggestions("PullRequest", "numbr")
+
+        assert index_class.call_count == 1
+
+    def test_field_suggestions_rebuilt_for_new_schema(self, validator, mock_schema):
+        """Test suggestions follow a schema change."""
+        validator._schema = mock_schema
+        assert validator.get_field_suggestions("PullRequest", "titel") == ["title"]
+
+        changed = json.loads(json.dumps(mock_schema))
+        for type_def in changed["types"]:
+            if type_def["name"] == "PullRequest":
+                type_def["fields"][2]["name"] = "headline"
+        validator._schema = changed
+        validator._build_type_map()
+
+        assert validator.get_field_suggestions("PullRequest", "titel") == []
+
+    def test_get_argument_suggestions(self, validator, mock_schema):
+        """Test suggesting arguments of a field."""
+        validator._schema = mock_schema
+
+        assert validator.get_argument_suggestions(
+            "PullRequest", "reviewThreads", "frst"
+        ) == ["first"]
+        assert validator.get_argument_suggestions("PullRequest", "missing", "x") == []
+        assert validator.get_argument_suggestions("Missing", "field", "x") == []
+
+    def test_get_type_suggestions(self, validator, mock_schema):
+        """Test suggesting type names."""
+        validator._schema = mock_schema
+
+        assert validator.get_type_suggestions("PullReqest")[0] == "PullRequest"
+
+    def test_unknown_argument_has_suggestions(self, validator, mock_schema):
+        """Test unknown argument errors suggest the closest arguments."""
+        validator._schema = mock_schema
+
+        errors = validator.validate_query(
+            'query { repository(owner: "a", nam: "b") { name } }'
+        )
+
+        unknown = [e for e in errors if e["type"] == "unknown_argument"]
+        assert unknown[0]["suggestions"] == ["name"]
+
+    def test_unknown_fragment_type(self, validator, mock_schema):
+        """Test inline fragments on unknown types are reported."""
+        validator._schema = mock_schema
+
+        errors = validator.validate_query(
+            'query { repository(owner: "a", name: "b") { ... on Repo { name } } }'
+        )
+
+        assert errors[0]["type"] == "unknown_type"
+        assert "Repository" in errors[0]["suggestions"]
+
     def test_validate_mutations(self, validator, mock_schema):
         """Test validating mutations from codebase."""
         validator._schema = mock_schema
@@ -561,6 +894,7 @@ class TestGitHubSchemaValidator:
                 "unresolveReviewThread",
                 "addPullRequestReviewThreadReply",
                 "addPullRequestReviewComment",
+                "replyAndResolveReviewThread",
             ]
 
     def test_validate_queries_from_codebase(self, validator, mock_schema):
@@ -595,6 +929,81 @@ class TestGitHubSchemaValidator:
         assert "deprecations" in report
         assert "recommendations" in report
 
+    def test_validate_operations_timings(self, validator, mock_schema):
+        """Test every operation is timed and only failures report errors."""
+        validator._schema = mock_schema
+
+        errors, timings = validator.validate_operations(
+            {
+                "valid": 'query { repository(owner: "a", name: "b") { name } }',
+                "invalid": "query { unknownField }",
+            }
+        )
+
+        assert list(timings) == ["valid", "invalid"]
+        assert all(ms >= 0 for ms in timings.values())
+        assert list(errors) == ["invalid"]
+        assert errors["invalid"][0]["type"] == "unknown_field"
+
+    def test_validate_operations_matches_validate_query(self, validator, mock_schema):
+        """Test batch validation gives the same errors as validating one by one."""
+        validator._schema = mock_schema
+        operations = validator._query_operations()
+        operations.update(validator._mutation_operations())
+
+        errors, _ = validator.validate_operations(operations)
+
+        assert errors == {
+            name: validator.validate_query(query)
+            for name, query in operations.items()
+            if validator.validate_query(query)
+        }
+
+    def test_validate_operations_caches_every_result(self, validator, mock_schema):
+        """Test every validated operation is recorded in the cache."""
+        validator._schema = mock_schema
+        operations = {
+            f"op{i}": f'query {{ r{i}: repository(owner: "a", name: "b") {{ name }} }}'
+            for i in range(20)
+        }
+
+        validator.validate_operations(operations)
+
+        with open(validator._get_validation_cache_path()) as f:
+            cached = json.load(f)["results"]
+        assert set(cached) == {query_hash(query) for query in operations.values()}
+
+    def test_validate_operations_empty(self, validator, mock_schema):
+        """Test validating no operations returns empty results."""
+        validator._schema = mock_schema
+
+        assert validator.validate_operations({}) == ({}, {})
+
+    def test_compatibility_report_timings(self, validator, mock_schema):
+        """Test the report times every registered query and mutation."""
+        validator._schema = mock_schema
+
+        report = validator.generate_compatibility_report()
+
+        timings = report["timings"]
+        assert set(timings["queries"]) == set(validator._query_operations())
+        assert set(timings["mutations"]) == set(validator._mutation_operations())
+        assert timings["total_ms"] >= 0
+        assert set(report["queries"]) <= set(timings["queries"])
+        assert set(report["mutations"]) <= set(timings["mutations"])
+
+    def test_compatibility_report_recommends_on_any_error(self, validator, mock_schema):
+        """Test errors in any mutation produce a recommendation."""
+        validator._schema = mock_schema
+        broken = {"addPullRequestReviewComment": "mutation { unknownMutation }"}
+
+        with patch.object(validator, "_mutation_operations", return_value=broken):
+            with patch.object(validator, "_query_operations", return_value={}):
+                report = validator.generate_compatibility_report()
+
+        assert list(report["mutations"]) == ["addPullRequestReviewComment"]
+        assert report["recommendations"]
+
     def test_schema_validation_error(self):
         """Test SchemaValidationError class."""
         errors = [{"type": "test", "message": "Test error"}]